@@ -6,7 +6,9 @@ Identifies common code smells through heuristic analysis.
 Layer: Analysis Layer
 """
 
-from apps.analysis.data_classes import RepoStructure, PrincipleViolation
+from typing import Optional
+
+from apps.analysis.data_classes import RepoStructure, PrincipleViolation, MetricEstimate, FileSample
 
 
 class CodeSmellDetector:
@@ -25,13 +27,26 @@ class CodeSmellDetector:
     GOD_CLASS_SIZE = 1500
     DEAD_CODE_INDICATORS = ['old_', 'backup_', 'temp_', 'deprecated_']
     
-    def analyze(self, repo: RepoStructure) -> dict:
-        """Detect code smells."""
+    def analyze(self, repo: RepoStructure, sample: Optional[FileSample] = None) -> dict:
+        """
+        Detect code smells.
+        
+        Args:
+            repo: Repository structure
+            sample: Look for god classes in a stratified file sample only
+                (violations list sampled files; the score counts the
+                estimated number of god classes)
+        
+        Returns:
+            Violations, smells and score ('intervals' holds confidence
+            intervals when sampled)
+        """
         violations = []
         smells = []
+        intervals = {}
         
         # God Classes
-        god_violations = self._detect_god_classes(repo)
+        god_violations = self._detect_god_classes(repo, sample.files if sample else None)
         violations.extend(god_violations)
         if god_violations:
             smells.append("God Classes")
@@ -55,25 +70,41 @@ class CodeSmellDetector:
             smells.append("Magic Numbers")
         
         # Calculate score
-        score = self._calculate_score(len(violations))
+        if sample is not None:
+            ratio = sample.proportion(lambda f: (repo.get_line_count(f) or 0) > self.GOD_CLASS_SIZE)
+            other_count = len(violations) - len(god_violations)
+            
+            def count(god_ratio: float) -> int:
+                return round(god_ratio * sample.population) + other_count
+            
+            score = self._calculate_score(count(ratio.value))
+            intervals['god_class_ratio'] = ratio
+            intervals['smell_score'] = MetricEstimate(
+                value=score,
+                lower=self._calculate_score(count(ratio.upper)),
+                upper=self._calculate_score(count(ratio.lower)),
+                confidence=ratio.confidence,
+            )
+        else:
+            score = self._calculate_score(len(violations))
         
         return {
             'violations': violations,
             'smells': smells,
             'smell_score': score,
+            'intervals': intervals,
         }
     
-    def _detect_god_classes(self, repo: RepoStructure) -> list[PrincipleViolation]:
-        """Detect god classes (very large files)."""
+    def _detect_god_classes(self, repo: RepoStructure, files: Optional[list] = None) -> list[PrincipleViolation]:
+        """Detect god classes (very large files) among the given files, else all."""
         violations = []
-        code_files = [f for f in repo.files if f.is_file()]
+        code_files = files if files is not None else [f for f in repo.files if f.is_file()]
         
         for file in code_files:
-            if not file.size:
+            estimated_lines = repo.get_line_count(file)
+            if not estimated_lines:
                 continue
             
-            estimated_lines = file.size // 45
-            
             if estimated_lines > self.GOD_CLASS_SIZE:
                 violations.append(PrincipleViolation(
                     principle="God Class",
@@ -138,13 +169,7 @@ class CodeSmellDetector:
         """Detect missing configuration files (magic numbers risk)."""
         violations = []
         
-        config_patterns = ['config', 'settings', '.env', 'configuration']
-        has_config = any(
-            any(pattern in f.name.lower() for pattern in config_patterns)
-            for f in repo.files
-        )
-        
-        if not has_config:
+        if not repo.index.config_files:
             violations.append(PrincipleViolation(
                 principle="Magic Numbers",
                 severity="MEDIUM",
@@ -22,6 +22,14 @@ class CollaborationAnalyzer:
     KEY_CONTRIBUTOR_THRESHOLD = 0.20  # >20% of commits
     ACTIVE_CONTRIBUTOR_THRESHOLD = 0.05  # >5% of commits
     
+    # Bump when scoring changes (stored results are then recomputed)
+    VERSION = 1
+    
+    @property
+    def version(self) -> str:
+        """Version of the results."""
+        return str(self.VERSION)
+    
     def analyze(self, repo: RepoStructure) -> CollaborationMetrics:
         """Analyze collaboration metrics."""
         if not repo.commits:
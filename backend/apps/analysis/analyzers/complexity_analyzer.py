@@ -5,7 +5,9 @@ Layer: Analysis Layer
 """
 
 from statistics import mean, median
-from apps.analysis.data_classes import RepoStructure
+from typing import Optional
+
+from apps.analysis.data_classes import RepoStructure, MetricEstimate, FileSample
 
 
 class ComplexityAnalyzer:
@@ -15,14 +17,28 @@ class ComplexityAnalyzer:
     LARGE_SIZE = 500
     VERY_LARGE_SIZE = 1000
     
-    def analyze(self, repo: RepoStructure) -> dict:
-        """Analyze file complexity metrics."""
+    def analyze(self, repo: RepoStructure, sample: Optional[FileSample] = None) -> dict:
+        """
+        Analyze file complexity metrics.
+        
+        Args:
+            repo: Repository structure
+            sample: Measure a stratified file sample instead of every
+                file (totals and ratios are then estimates)
+        
+        Returns:
+            Complexity metrics ('intervals' holds confidence intervals
+            when sampled)
+        """
+        if sample is not None:
+            return self._analyze_sample(repo, sample)
+        
         code_files = [f for f in repo.files if f.is_file()]
         
         if not code_files:
             return self._empty_result()
         
-        file_lengths = self._get_lengths(code_files)
+        file_lengths = self._get_lengths(repo, code_files)
         total_files = len(code_files)
         large_files = sum(1 for l in file_lengths if l > self.LARGE_SIZE)
         very_large = sum(1 for l in file_lengths if l > self.VERY_LARGE_SIZE)
@@ -41,9 +57,57 @@ class ComplexityAnalyzer:
             'strengths': self._get_strengths(large_files, avg_len),
         }
     
-    def _get_lengths(self, files) -> list[int]:
-        """Estimate file lengths from size."""
-        return [f.size // 45 if f.size else 100 for f in files]
+    def _analyze_sample(self, repo: RepoStructure, sample: FileSample) -> dict:
+        """Estimate complexity metrics from a file sample."""
+        files = sample.files
+        lengths = dict(zip((f.path for f in files), self._get_lengths(repo, files)))
+        
+        def length(f) -> int:
+            return lengths[f.path]
+        
+        total = sample.population
+        avg = sample.mean(length)
+        large = sample.proportion(lambda f: length(f) > self.LARGE_SIZE)
+        very_large = sample.proportion(lambda f: length(f) > self.VERY_LARGE_SIZE)
+        total_lines = sample.total(length)
+        
+        # The score falls as each input grows, so the interval bounds
+        # come from the opposite ends of the input intervals
+        score = self._calc_score(total, large.value * total, very_large.value * total, avg.value)
+        score_interval = MetricEstimate(
+            value=score,
+            lower=self._calc_score(total, large.upper * total, very_large.upper * total, avg.upper),
+            upper=self._calc_score(total, large.lower * total, very_large.lower * total, avg.lower),
+            confidence=sample.confidence,
+        )
+        large_count = round(large.value * total)
+        very_large_count = round(very_large.value * total)
+        
+        # Median and max are of the sample (max is a lower bound)
+        return {
+            'total_files': total,
+            'total_lines': round(total_lines.value),
+            'avg_file_length': avg.value,
+            'median_file_length': median(lengths.values()),
+            'max_file_length': max(lengths.values()),
+            'large_files_count': large_count,
+            'very_large_files_count': very_large_count,
+            'complexity_score': score,
+            'issues': self._get_issues(large_count, very_large_count, avg.value),
+            'strengths': self._get_strengths(large_count, avg.value),
+            'intervals': {
+                'total_lines': total_lines,
+                'avg_file_length': avg,
+                'large_files_ratio': large,
+                'very_large_files_ratio': very_large,
+                'complexity_score': score_interval,
+            },
+        }
+    
+    def _get_lengths(self, repo: RepoStructure, files) -> list[int]:
+        """Get file lengths (counted from fetched contents, else estimated)."""
+        lengths = [repo.get_line_count(f) for f in files]
+        return [100 if length is None else length for length in lengths]
     
     def _calc_score(self, total: int, large: int, very_large: int, avg: float) -> float:
         """Calculate complexity score (0-100)."""
@@ -4,7 +4,7 @@ Documentation analyzer.
 Layer: Analysis Layer
 """
 
-from apps.analysis.data_classes import RepoStructure
+from apps.analysis.data_classes import RepoStructure, RepoIndex
 
 
 class DocumentationAnalyzer:
@@ -12,22 +12,22 @@ class DocumentationAnalyzer:
     
     README_FILES = ['readme.md', 'readme.txt', 'readme.rst', 'readme']
     DOC_DIRS = ['docs', 'doc', 'documentation', 'wiki']
-    DOC_EXTS = ['.md', '.rst', '.txt', '.adoc']
+    DOC_EXTS = sorted(RepoIndex.DOC_EXTENSIONS)
     IMPORTANT = ['contributing', 'license', 'changelog', 'code_of_conduct', 'security']
     
     def analyze(self, repo: RepoStructure) -> dict:
         """Analyze documentation."""
-        all_files = [f for f in repo.files if f.is_file()]
+        all_files = repo.index.files
         
         if not all_files:
             return self._empty()
         
-        has_readme = self._has_readme(all_files)
+        has_readme = self._has_readme(repo)
         has_docs = self._has_docs(repo)
-        doc_count = sum(1 for f in all_files if f.extension and f.extension.lower() in self.DOC_EXTS)
-        important = self._check_important(all_files)
+        doc_count = len(repo.index.doc_files)
+        important = self._check_important(repo)
         
-        code_files = [f for f in all_files if not self._is_test(f)]
+        code_files = all_files - self._test_files(repo)
         ratio = doc_count / len(code_files) if code_files else 0.0
         
         return {
@@ -43,33 +43,36 @@ class DocumentationAnalyzer:
             'strengths': self._get_strengths(has_readme, has_docs, important, doc_count),
         }
     
-    def _has_readme(self, files) -> bool:
+    def _has_readme(self, repo) -> bool:
         """Check for README."""
-        return any(f.name.lower() in self.README_FILES for f in files)
+        return any(name in repo.index.file_names for name in self.README_FILES)
     
     def _has_docs(self, repo) -> bool:
         """Check for docs folder."""
-        for f in repo.files:
-            if f.is_directory() and f.name.lower() in self.DOC_DIRS:
-                return True
-        return False
+        return any(name in repo.index.directory_names for name in self.DOC_DIRS)
     
-    def _check_important(self, files) -> list[str]:
+    def _check_important(self, repo) -> list[str]:
         """Check for important docs."""
         found = []
-        for f in files:
-            name_low = f.name.lower()
+        for name_low in sorted(repo.index.file_names):
             for doc in self.IMPORTANT:
                 if doc in name_low and doc not in found:
                     found.append(doc)
         return found
     
-    def _is_test(self, file) -> bool:
-        """Check if test file."""
-        patterns = ['test_', '_test.', '.test.', '/test/', '/tests/']
-        name_low = file.name.lower()
-        path_low = file.path.lower()
-        return any(p in name_low or p in path_low for p in patterns)
+    def _test_files(self, repo):
+        """Get test files (bitset over repo.files, cached in repo.index)."""
+        patterns = ['test_', '_test.', '.test.']
+        test_dirs = repo.index.path_trie.directories_within(['test', 'tests'], min_depth=1)
+        
+        def is_test(file) -> bool:
+            path_low = file.path.lower()
+            return (
+                any(p in path_low for p in patterns) or
+                path_low.rpartition('/')[0] in test_dirs
+            )
+        
+        return repo.index.select('documentation_test_files', is_test)
     
     def _calc_score(self, has_readme: bool, has_docs: bool, ratio: float, important: list) -> float:
         """Calculate doc score (0-100)."""
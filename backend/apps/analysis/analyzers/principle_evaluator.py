@@ -7,7 +7,14 @@ principle adherence.
 Layer: Analysis Layer
 """
 
-from apps.analysis.data_classes import RepoStructure, PrincipleEvaluationResult
+from typing import Optional
+
+from apps.analysis.data_classes import (
+    RepoStructure,
+    PrincipleEvaluationResult,
+    MetricEstimate,
+    StratifiedFileSampler,
+)
 from apps.analysis.analyzers.solid_analyzer import SOLIDAnalyzer
 from apps.analysis.analyzers.code_smell_detector import CodeSmellDetector
 
@@ -22,15 +29,28 @@ class PrincipleEvaluator:
     Scoring weights:
     - SOLID principles: 60%
     - Code smells: 40%
+    
+    Large repositories (given a sampler): the size-based checks (SRP,
+    god classes) run on a stratified file sample and the scores carry
+    confidence intervals.
     """
     
     SOLID_WEIGHT = 0.60
     SMELL_WEIGHT = 0.40
     
-    def __init__(self):
+    # Bump when scoring changes (stored results are then recomputed)
+    VERSION = 1
+    
+    def __init__(self, sampler: Optional[StratifiedFileSampler] = None):
+        self.sampler = sampler
         self.solid_analyzer = SOLIDAnalyzer()
         self.smell_detector = CodeSmellDetector()
     
+    @property
+    def version(self) -> str:
+        """Version of the results (scoring and sample settings)."""
+        return f"{self.VERSION}:{self.sampler.key if self.sampler else 'exact'}"
+    
     def evaluate(self, repo: RepoStructure) -> PrincipleEvaluationResult:
         """
         Evaluate principle adherence.
@@ -41,11 +61,14 @@ class PrincipleEvaluator:
         Returns:
             PrincipleEvaluationResult with violations and scores
         """
+        # Size-based checks on a sample for large repos
+        sample = repo.index.sample(self.sampler) if self.sampler else None
+        
         # Run SOLID analysis
-        solid_results = self.solid_analyzer.analyze(repo)
+        solid_results = self.solid_analyzer.analyze(repo, sample)
         
         # Run code smell detection
-        smell_results = self.smell_detector.analyze(repo)
+        smell_results = self.smell_detector.analyze(repo, sample)
         
         # Combine violations
         all_violations = []
@@ -58,6 +81,19 @@ class PrincipleEvaluator:
         overall_score = (solid_score * self.SOLID_WEIGHT + 
                         smell_score * self.SMELL_WEIGHT)
         
+        intervals = {**solid_results.get('intervals', {}), **smell_results.get('intervals', {})}
+        if sample is not None:
+            solid_interval = intervals.get('solid_score')
+            smell_interval = intervals.get('smell_score')
+            intervals['principle_score'] = MetricEstimate(
+                value=overall_score,
+                lower=(solid_interval.lower * self.SOLID_WEIGHT +
+                       smell_interval.lower * self.SMELL_WEIGHT),
+                upper=(solid_interval.upper * self.SOLID_WEIGHT +
+                       smell_interval.upper * self.SMELL_WEIGHT),
+                confidence=sample.confidence,
+            )
+        
         # Count severity
         high_severity = sum(1 for v in all_violations if v.severity == "HIGH")
         
@@ -68,4 +104,6 @@ class PrincipleEvaluator:
             code_smells=smell_results['smells'],
             total_violations=len(all_violations),
             high_severity_count=high_severity,
+            sample_size=sample.size if sample else None,
+            confidence_intervals=intervals,
         )
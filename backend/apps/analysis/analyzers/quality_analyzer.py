@@ -6,7 +6,14 @@ Coordinates all quality analyzers and produces final quality metrics.
 Layer: Analysis Layer
 """
 
-from apps.analysis.data_classes import RepoStructure, QualityMetrics
+from typing import Optional
+
+from apps.analysis.data_classes import (
+    RepoStructure,
+    QualityMetrics,
+    MetricEstimate,
+    StratifiedFileSampler,
+)
 from .complexity_analyzer import ComplexityAnalyzer
 from .test_coverage_analyzer import TestCoverageAnalyzer
 from .documentation_analyzer import DocumentationAnalyzer
@@ -34,6 +41,10 @@ class QualityAnalyzer:
     - Tests prevent regressions and enable refactoring
     - Docs help but code speaks loudest
     
+    Large repositories (given a sampler): file metrics come from a
+    stratified file sample and carry confidence intervals; test and
+    documentation metrics only need paths and stay exact.
+    
     Usage:
         analyzer = QualityAnalyzer()
         metrics = analyzer.analyze(repo_structure)
@@ -46,12 +57,27 @@ class QualityAnalyzer:
     TEST_WEIGHT = 0.35
     DOCUMENTATION_WEIGHT = 0.25
     
-    def __init__(self):
-        """Initialize all sub-analyzers."""
+    # Bump when scoring changes (stored results are then recomputed)
+    VERSION = 1
+    
+    def __init__(self, sampler: Optional[StratifiedFileSampler] = None):
+        """
+        Initialize all sub-analyzers.
+        
+        Args:
+            sampler: Samples repositories above its file count threshold
+                (None to always measure every file)
+        """
+        self.sampler = sampler
         self.complexity_analyzer = ComplexityAnalyzer()
         self.test_analyzer = TestCoverageAnalyzer()
         self.doc_analyzer = DocumentationAnalyzer()
     
+    @property
+    def version(self) -> str:
+        """Version of the results (scoring and sample settings)."""
+        return f"{self.VERSION}:{self.sampler.key if self.sampler else 'exact'}"
+    
     def analyze(self, repo: RepoStructure) -> QualityMetrics:
         """
         Analyze repository code quality.
@@ -62,8 +88,9 @@ class QualityAnalyzer:
         Returns:
             QualityMetrics with all quality scores and metrics
         """
-        # Run all analyzers
-        complexity_results = self.complexity_analyzer.analyze(repo)
+        # Run all analyzers (file metrics on a sample for large repos)
+        sample = repo.index.sample(self.sampler) if self.sampler else None
+        complexity_results = self.complexity_analyzer.analyze(repo, sample)
         test_results = self.test_analyzer.analyze(repo)
         doc_results = self.doc_analyzer.analyze(repo)
         
@@ -74,6 +101,24 @@ class QualityAnalyzer:
             doc_results['documentation_score']
         )
         
+        intervals = dict(complexity_results.get('intervals', {}))
+        complexity_interval = intervals.get('complexity_score')
+        if complexity_interval is not None:
+            intervals['overall_quality_score'] = MetricEstimate(
+                value=overall_score,
+                lower=self._calculate_overall_score(
+                    complexity_interval.lower,
+                    test_results['test_score'],
+                    doc_results['documentation_score'],
+                ),
+                upper=self._calculate_overall_score(
+                    complexity_interval.upper,
+                    test_results['test_score'],
+                    doc_results['documentation_score'],
+                ),
+                confidence=complexity_interval.confidence,
+            )
+        
         # Aggregate issues and strengths
         all_issues = (
             complexity_results.get('issues', []) +
@@ -117,6 +162,10 @@ class QualityAnalyzer:
             # Insights
             issues=all_issues,
             strengths=all_strengths,
+            
+            # Sampling
+            sample_size=sample.size if sample else None,
+            confidence_intervals=intervals,
         )
     
     def _calculate_overall_score(
@@ -6,7 +6,9 @@ Detects potential SOLID principle violations through heuristics.
 Layer: Analysis Layer
 """
 
-from apps.analysis.data_classes import RepoStructure, PrincipleViolation
+from typing import Optional
+
+from apps.analysis.data_classes import RepoStructure, PrincipleViolation, MetricEstimate, FileSample
 
 
 class SOLIDAnalyzer:
@@ -25,12 +27,24 @@ class SOLIDAnalyzer:
     VERY_LARGE_FILE = 1000  # Likely SRP violation
     LARGE_FILE = 500  # Possible SRP violation
     
-    def analyze(self, repo: RepoStructure) -> dict:
-        """Analyze SOLID principles."""
+    def analyze(self, repo: RepoStructure, sample: Optional[FileSample] = None) -> dict:
+        """
+        Analyze SOLID principles.
+        
+        Args:
+            repo: Repository structure
+            sample: Check SRP on a stratified file sample only (violations
+                list sampled files; the SRP score is an estimate)
+        
+        Returns:
+            Violations and scores ('intervals' holds confidence intervals
+            when sampled)
+        """
         violations = []
+        intervals = {}
         
         # Single Responsibility Principle
-        srp_violations = self._check_srp(repo)
+        srp_violations = self._check_srp(repo, sample.files if sample else None)
         violations.extend(srp_violations)
         
         # Dependency Inversion Principle
@@ -38,7 +52,18 @@ class SOLIDAnalyzer:
         violations.extend(dip_violations)
         
         # Calculate scores
-        srp_score = self._calc_srp_score(repo, len(srp_violations))
+        if sample is not None:
+            ratio = sample.proportion(lambda f: (repo.get_line_count(f) or 0) > self.LARGE_FILE)
+            srp_score = self._score_violation_ratio(ratio.value)
+            intervals['srp_violation_ratio'] = ratio
+            intervals['single_responsibility'] = MetricEstimate(
+                value=srp_score,
+                lower=self._score_violation_ratio(ratio.upper),
+                upper=self._score_violation_ratio(ratio.lower),
+                confidence=ratio.confidence,
+            )
+        else:
+            srp_score = self._calc_srp_score(repo, len(srp_violations))
         dip_score = self._calc_dip_score(repo, len(dip_violations))
         
         # Other principles scored neutrally (need AST for accurate detection)
@@ -49,6 +74,15 @@ class SOLIDAnalyzer:
         overall_score = (srp_score * 0.4 + dip_score * 0.3 + ocp_score * 0.1 + 
                         lsp_score * 0.1 + isp_score * 0.1)
         
+        srp_interval = intervals.get('single_responsibility')
+        if srp_interval is not None:
+            intervals['solid_score'] = MetricEstimate(
+                value=overall_score,
+                lower=overall_score - (srp_score - srp_interval.lower) * 0.4,
+                upper=overall_score + (srp_interval.upper - srp_score) * 0.4,
+                confidence=srp_interval.confidence,
+            )
+        
         return {
             'violations': violations,
             'solid_scores': {
@@ -59,19 +93,19 @@ class SOLIDAnalyzer:
                 'dependency_inversion': dip_score,
             },
             'overall_score': overall_score,
+            'intervals': intervals,
         }
     
-    def _check_srp(self, repo: RepoStructure) -> list[PrincipleViolation]:
-        """Check Single Responsibility Principle."""
+    def _check_srp(self, repo: RepoStructure, files: Optional[list] = None) -> list[PrincipleViolation]:
+        """Check Single Responsibility Principle (on the given files, else all)."""
         violations = []
-        code_files = [f for f in repo.files if f.is_file()]
+        code_files = files if files is not None else [f for f in repo.files if f.is_file()]
         
         for file in code_files:
-            if not file.size:
+            estimated_lines = repo.get_line_count(file)
+            if not estimated_lines:
                 continue
             
-            estimated_lines = file.size // 45
-            
             if estimated_lines > self.VERY_LARGE_FILE:
                 violations.append(PrincipleViolation(
                     principle="Single Responsibility Principle",
@@ -96,8 +130,8 @@ class SOLIDAnalyzer:
         violations = []
         
         # Check for proper layer separation
-        has_domain = any(f.is_directory() and 'domain' in f.name.lower() for f in repo.files)
-        has_infra = any(f.is_directory() and 'infrastructure' in f.name.lower() for f in repo.files)
+        has_domain = any('domain' in name for name in repo.index.directory_names)
+        has_infra = any('infrastructure' in name for name in repo.index.directory_names)
         
         # If has layered architecture but no clear separation, flag it
         if has_infra and not has_domain:
@@ -116,8 +150,10 @@ class SOLIDAnalyzer:
         if not code_files:
             return 100.0
         
-        # Penalty based on violation ratio
-        violation_ratio = violation_count / len(code_files)
+        return self._score_violation_ratio(violation_count / len(code_files))
+    
+    def _score_violation_ratio(self, violation_ratio: float) -> float:
+        """Calculate SRP score from the share of violating files."""
         score = 100.0 - (violation_ratio * 200)  # Heavy penalty
         
         return max(score, 0.0)
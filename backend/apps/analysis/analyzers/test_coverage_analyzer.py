@@ -16,14 +16,14 @@ class TestCoverageAnalyzer:
     
     def analyze(self, repo: RepoStructure) -> dict:
         """Analyze test coverage."""
-        all_files = [f for f in repo.files if f.is_file()]
+        all_files = repo.index.files
         
         if not all_files:
             return self._empty()
         
-        test_files = self._detect_test_files(all_files)
+        test_files = self._detect_test_files(repo)
         has_test_dirs = self._has_test_dirs(repo)
-        has_config = self._has_config(all_files)
+        has_config = self._has_config(repo)
         
         total = len(all_files)
         count = len(test_files)
@@ -40,31 +40,29 @@ class TestCoverageAnalyzer:
             'strengths': self._get_strengths(count, ratio, has_test_dirs),
         }
     
-    def _detect_test_files(self, files) -> list:
-        """Detect test files."""
-        test_files = []
-        for f in files:
+    def _detect_test_files(self, repo):
+        """Detect test files (bitset over repo.files, cached in repo.index)."""
+        # Folders below the top level named like test dirs ("src/tests/...")
+        test_dirs = repo.index.path_trie.directories_within(self.TEST_DIRS, min_depth=1)
+        patterns = [p.lower() for p in self.TEST_PATTERNS]
+        
+        def is_test_file(f) -> bool:
+            if not f.is_file():
+                return False
             name_low = f.name.lower()
-            path_low = f.path.lower()
-            
-            is_test = any(p.lower() in name_low for p in self.TEST_PATTERNS)
-            in_test_dir = any(f'/{d}/' in path_low for d in self.TEST_DIRS)
-            
-            if is_test or in_test_dir:
-                test_files.append(f)
-        return test_files
+            is_test = any(p in name_low for p in patterns)
+            in_test_dir = f.path.lower().rpartition('/')[0] in test_dirs
+            return is_test or in_test_dir
+        
+        return repo.index.select('coverage_test_files', is_test_file)
     
     def _has_test_dirs(self, repo) -> bool:
         """Check for test directories."""
-        for f in repo.files:
-            if f.is_directory() and f.name.lower() in self.TEST_DIRS:
-                return True
-        return False
+        return any(d in repo.index.directory_names for d in self.TEST_DIRS)
     
-    def _has_config(self, files) -> bool:
+    def _has_config(self, repo) -> bool:
         """Check for test config."""
-        configs_low = [c.lower() for c in self.TEST_CONFIGS]
-        return any(f.name.lower() in configs_low for f in files)
+        return any(c.lower() in repo.index.file_names for c in self.TEST_CONFIGS)
     
     def _calc_score(self, ratio: float, has_dirs: bool, has_cfg: bool) -> float:
         """Calculate test score (0-100)."""
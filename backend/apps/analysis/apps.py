@@ -7,3 +7,8 @@ class AnalysisConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.analysis'
     verbose_name = 'Analysis Layer'
+    
+    def ready(self):
+        # Compile the architecture rule packs once per process
+        from apps.analysis.detectors import get_detector_engine
+        get_detector_engine()
@@ -5,10 +5,16 @@ Exports repository structure data classes for use across analysis components.
 """
 
 from .file_node import FileNode
+from .file_table import FileTable
 from .commit_info import CommitInfo, ContributorInfo
+from .path_trie import PathTrie
+from .repo_index import FileBitset, RepoIndex
 from .repo_structure import RepoStructure
+from .repo_change_set import RepoChangeSet
 from .architecture_signal import ArchitectureSignal
 from .architecture_analysis_result import ArchitectureAnalysisResult
+from .metric_estimate import MetricEstimate
+from .file_sampler import FileSample, StratifiedFileSampler, get_file_sampler
 from .quality_metrics import QualityMetrics
 from .principle_evaluation_result import (
     PrincipleViolation,
@@ -21,11 +27,20 @@ from .collaboration_metrics import (
 
 __all__ = [
     'FileNode',
+    'FileTable',
     'CommitInfo',
     'ContributorInfo',
+    'PathTrie',
+    'FileBitset',
+    'RepoIndex',
     'RepoStructure',
+    'RepoChangeSet',
     'ArchitectureSignal',
     'ArchitectureAnalysisResult',
+    'MetricEstimate',
+    'FileSample',
+    'StratifiedFileSampler',
+    'get_file_sampler',
     'QualityMetrics',
     'PrincipleViolation',
     'PrincipleEvaluationResult',
@@ -7,7 +7,7 @@ Layer: Analysis Layer
 Dependencies: None (pure Python)
 """
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import Optional
 
@@ -48,6 +48,17 @@ class CommitInfo:
     def get_short_sha(self) -> str:
         """Get abbreviated commit hash (first 7 chars)."""
         return self.sha[:7] if len(self.sha) >= 7 else self.sha
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        data = asdict(self)
+        data['date'] = self.date.isoformat()
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "CommitInfo":
+        """Rebuild from to_dict() output."""
+        return cls(**{**data, 'date': datetime.fromisoformat(data['date'])})
 
 
 @dataclass
@@ -98,3 +109,12 @@ class ContributorInfo:
         if total_commits == 0:
             return 0.0
         return (self.commit_count / total_commits) * 100
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "ContributorInfo":
+        """Rebuild from to_dict() output."""
+        return cls(**data)
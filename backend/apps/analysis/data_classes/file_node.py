@@ -7,7 +7,7 @@ Layer: Analysis Layer
 Dependencies: None (pure Python)
 """
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Optional
 
 
@@ -17,7 +17,8 @@ class FileNode:
     Represents a single file or directory in the repository.
     
     This is a lightweight structure for tracking file metadata.
-    We don't store file content (security + size concerns).
+    We don't store file content here (security + size concerns);
+    ingestion modes that fetch content keep it in RepoStructure.
     
     Attributes:
         path: Relative path from repo root (e.g., "src/models/user.py")
@@ -25,6 +26,7 @@ class FileNode:
         type: Either "file" or "dir"
         size: File size in bytes (None for directories)
         extension: File extension (e.g., ".py", ".js") or None
+        sha: Git object SHA (blob SHA for files, tree SHA for directories)
         
     Example:
         >>> node = FileNode(
@@ -40,6 +42,16 @@ class FileNode:
     type: str  # "file" or "dir"
     size: Optional[int] = None
     extension: Optional[str] = None
+    sha: Optional[str] = None
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "FileNode":
+        """Rebuild from to_dict() output."""
+        return cls(**data)
     
     def is_file(self) -> bool:
         """Check if this node represents a file."""
@@ -0,0 +1,287 @@
+"""
+Stratified file sampler.
+
+Draws a fixed-size sample of a large repository's files, stratified by
+top-level directory and extension, and estimates repository metrics
+from it with confidence intervals.
+
+Layer: Analysis Layer
+Dependencies: FileNode, MetricEstimate
+"""
+
+import hashlib
+import math
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional
+
+from .file_node import FileNode
+from .metric_estimate import MetricEstimate
+
+
+@dataclass
+class Stratum:
+    """
+    Files sharing a top-level directory and extension.
+    
+    Attributes:
+        key: (top-level directory, extension); ('*', '*') collects
+            strata too small to get two sample files of their own
+        population: Number of files in the stratum
+        files: Sampled files
+    """
+    key: tuple[str, str]
+    population: int
+    files: list[FileNode] = field(default_factory=list)
+
+
+@dataclass
+class FileSample:
+    """
+    Stratified sample of a repository's files.
+    
+    Estimates use the stratified mean: each stratum's sample mean is
+    weighted by its share of the population, and the variance includes
+    the finite population correction, so the interval shrinks to zero
+    as the sample approaches the population.
+    
+    Attributes:
+        population: Number of files sampled from
+        strata: Strata with their sampled files
+        confidence: Confidence level of the intervals
+    """
+    population: int
+    strata: list[Stratum]
+    confidence: float = 0.95
+    
+    # Two-sided normal quantiles
+    Z_SCORES = {0.90: 1.645, 0.95: 1.96, 0.99: 2.576}
+    
+    @property
+    def files(self) -> list[FileNode]:
+        """All sampled files."""
+        return [node for stratum in self.strata for node in stratum.files]
+    
+    @property
+    def size(self) -> int:
+        """Number of sampled files."""
+        return sum(len(stratum.files) for stratum in self.strata)
+    
+    def mean(self, value: Callable[[FileNode], float]) -> MetricEstimate:
+        """
+        Estimate the mean of a per-file value over the population.
+        
+        Args:
+            value: Per-file measurement (called on sampled files only)
+        
+        Returns:
+            Stratified mean with its confidence interval
+        """
+        estimate = 0.0
+        variance = 0.0
+        
+        for stratum in self.strata:
+            n = len(stratum.files)
+            if n == 0:
+                continue
+            weight = stratum.population / self.population
+            values = [value(node) for node in stratum.files]
+            stratum_mean = sum(values) / n
+            estimate += weight * stratum_mean
+            
+            # n == 1 only for a one-file stratum, which is then exact
+            if n > 1:
+                s2 = sum((v - stratum_mean) ** 2 for v in values) / (n - 1)
+                fpc = 1 - n / stratum.population
+                variance += weight ** 2 * fpc * s2 / n
+        
+        margin = self.Z_SCORES.get(self.confidence, 1.96) * math.sqrt(variance)
+        return MetricEstimate(
+            value=estimate,
+            lower=estimate - margin,
+            upper=estimate + margin,
+            confidence=self.confidence,
+        )
+    
+    def proportion(self, predicate: Callable[[FileNode], bool]) -> MetricEstimate:
+        """
+        Estimate the share of files matching a predicate.
+        
+        Args:
+            predicate: Per-file test (called on sampled files only)
+        
+        Returns:
+            Stratified proportion with its interval, clipped to [0, 1]
+        """
+        estimate = self.mean(lambda node: 1.0 if predicate(node) else 0.0)
+        estimate.lower = max(estimate.lower, 0.0)
+        estimate.upper = min(estimate.upper, 1.0)
+        return estimate
+    
+    def total(self, value: Callable[[FileNode], float]) -> MetricEstimate:
+        """
+        Estimate the sum of a per-file value over the population.
+        
+        Args:
+            value: Per-file measurement
+        
+        Returns:
+            Population total with its interval
+        """
+        estimate = self.mean(value)
+        return MetricEstimate(
+            value=estimate.value * self.population,
+            lower=estimate.lower * self.population,
+            upper=estimate.upper * self.population,
+            confidence=self.confidence,
+        )
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for logging/serialization."""
+        return {
+            'population': self.population,
+            'sample_size': self.size,
+            'strata': len(self.strata),
+            'confidence': self.confidence,
+        }
+
+
+class StratifiedFileSampler:
+    """
+    Fixed-size stratified sampling of repository files.
+    
+    Why sample?
+    - Above ~20,000 files, line counts, SRP and god class checks over
+      every file (and fetching their contents) cost time and memory
+      proportional to the repository, while a 2,000-file sample
+      estimates the same averages and ratios to within a few percent
+    - Analysis cost then stays roughly flat as repositories grow
+    
+    Why stratify?
+    - Directories and file types differ systematically (vendored
+      JavaScript vs. Python services vs. tests); sampling each
+      (top-level directory, extension) group in proportion guarantees
+      every large group is represented and narrows the intervals
+    
+    Selection:
+    - Proportional allocation with at least two files per stratum;
+      strata whose share is under two files are pooled into one
+      residual stratum (a stratum sampled once has no variance
+      estimate, so many of them would collapse the intervals)
+    - Within a stratum, files are ordered by a seeded hash of their
+      path, so the same repository yields the same sample on every run
+      (and re-analyses compare like with like)
+    
+    Path-only analyzers (tests, documentation) stay exact; they do not
+    need file contents.
+    
+    Example:
+        >>> sampler = StratifiedFileSampler(sample_size=2000, threshold=20000)
+        >>> sample = repo.index.sample(sampler)
+        >>> sample.size if sample else 'exact'
+        2000
+        >>> sample.mean(lambda f: repo.get_line_count(f) or 0)
+        MetricEstimate(value=182.0, lower=170.0, upper=194.0, confidence=0.95)
+    """
+    
+    RESIDUAL = ('*', '*')
+    
+    # Sampled files per stratum (a stratum needs two for a variance)
+    MIN_ALLOCATION = 2
+    
+    DEFAULT_SAMPLE_SIZE = 2000
+    DEFAULT_THRESHOLD = 20000
+    
+    def __init__(
+        self,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        threshold: int = DEFAULT_THRESHOLD,
+        confidence: float = 0.95,
+        seed: str = 'repolense'
+    ):
+        """
+        Initialize sampler.
+        
+        Args:
+            sample_size: Files to sample
+            threshold: Smallest file count that is sampled (smaller
+                repositories are analyzed exactly)
+            confidence: Confidence level of the intervals
+            seed: Hash seed for the within-stratum order
+        """
+        self.sample_size = sample_size
+        self.threshold = threshold
+        self.confidence = confidence
+        self.seed = seed.encode()
+    
+    @property
+    def key(self) -> tuple:
+        """Parameters that determine the sample (see RepoIndex.sample)."""
+        return self.sample_size, self.threshold, self.confidence, self.seed.decode()
+    
+    def should_sample(self, file_count: int) -> bool:
+        """Check if a repository with this many files is sampled."""
+        return file_count >= self.threshold and file_count > self.sample_size
+    
+    def stratum_key(self, node: FileNode) -> tuple[str, str]:
+        """Get the (top-level directory, extension) stratum of a file."""
+        directory = node.path.split('/', 1)[0] if '/' in node.path else ''
+        return directory, (node.extension or '').lower()
+    
+    def sample(self, files: Iterable[FileNode]) -> Optional[FileSample]:
+        """
+        Draw a stratified sample of the files.
+        
+        Args:
+            files: Repository file nodes (directories are ignored)
+        
+        Returns:
+            File sample, or None if the repository is below the threshold
+        """
+        groups: dict[tuple[str, str], list[FileNode]] = {}
+        population = 0
+        for node in files:
+            if node.is_file():
+                groups.setdefault(self.stratum_key(node), []).append(node)
+                population += 1
+        
+        if not self.should_sample(population):
+            return None
+        
+        # Pool strata too small for MIN_ALLOCATION sample files
+        min_population = self.MIN_ALLOCATION * population / self.sample_size
+        residual = []
+        for key in [key for key, nodes in groups.items() if len(nodes) < min_population]:
+            residual.extend(groups.pop(key))
+        if residual:
+            groups[self.RESIDUAL] = residual
+        
+        strata = []
+        for key, nodes in sorted(groups.items()):
+            allocation = max(self.MIN_ALLOCATION, round(self.sample_size * len(nodes) / population))
+            nodes.sort(key=self._order)
+            strata.append(Stratum(key=key, population=len(nodes), files=nodes[:allocation]))
+        
+        return FileSample(population=population, strata=strata, confidence=self.confidence)
+    
+    def _order(self, node: FileNode) -> bytes:
+        """Seeded hash order of a file (stable across runs and processes)."""
+        return hashlib.blake2b(node.path.encode(), key=self.seed, digest_size=8).digest()
+
+
+def get_file_sampler() -> StratifiedFileSampler:
+    """
+    Create a file sampler with limits from Django settings.
+    
+    Settings:
+    - ANALYSIS_SAMPLE_THRESHOLD: Smallest file count that is sampled
+    - ANALYSIS_SAMPLE_SIZE: Files analyzed per sampled repository
+    
+    Returns:
+        File sampler
+    """
+    from django.conf import settings
+    
+    return StratifiedFileSampler(
+        sample_size=getattr(settings, 'ANALYSIS_SAMPLE_SIZE', StratifiedFileSampler.DEFAULT_SAMPLE_SIZE),
+        threshold=getattr(settings, 'ANALYSIS_SAMPLE_THRESHOLD', StratifiedFileSampler.DEFAULT_THRESHOLD),
+    )
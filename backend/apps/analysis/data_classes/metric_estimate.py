@@ -0,0 +1,47 @@
+"""
+Metric estimate data class.
+
+Stores a metric measured on a file sample together with its
+confidence interval.
+
+Layer: Analysis Layer
+Dependencies: None (pure Python)
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class MetricEstimate:
+    """
+    Sample estimate of a repository metric.
+    
+    Attributes:
+        value: Point estimate
+        lower: Lower bound of the confidence interval
+        upper: Upper bound of the confidence interval
+        confidence: Confidence level of the interval (e.g. 0.95)
+    
+    Example:
+        >>> estimate = MetricEstimate(value=182.0, lower=170.0, upper=194.0)
+        >>> estimate.margin
+        12.0
+    """
+    value: float
+    lower: float
+    upper: float
+    confidence: float = 0.95
+    
+    @property
+    def margin(self) -> float:
+        """Half-width of the interval."""
+        return (self.upper - self.lower) / 2
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            'value': round(self.value, 2),
+            'lower': round(self.lower, 2),
+            'upper': round(self.upper, 2),
+            'confidence': self.confidence,
+        }
@@ -9,6 +9,8 @@ Layer: Analysis Layer
 from dataclasses import dataclass, field
 from typing import Optional
 
+from .metric_estimate import MetricEstimate
+
 
 @dataclass
 class PrincipleViolation:
@@ -43,6 +45,10 @@ class PrincipleEvaluationResult:
         code_smells: List of code smell detections
         total_violations: Total number of violations
         high_severity_count: Count of high severity issues
+        sample_size: Files checked when size-based violations were
+            looked for in a stratified sample (None when exact; only
+            sampled files are listed in violations)
+        confidence_intervals: Intervals of the estimated scores by name
     """
     violations: list[PrincipleViolation] = field(default_factory=list)
     principle_score: float = 0.0
@@ -50,6 +56,12 @@ class PrincipleEvaluationResult:
     code_smells: list[str] = field(default_factory=list)
     total_violations: int = 0
     high_severity_count: int = 0
+    sample_size: Optional[int] = None
+    confidence_intervals: dict[str, MetricEstimate] = field(default_factory=dict)
+    
+    def is_sampled(self) -> bool:
+        """Check if the scores are sample estimates."""
+        return self.sample_size is not None
     
     def get_grade(self) -> str:
         """Get letter grade for principle adherence."""
@@ -113,4 +125,8 @@ class PrincipleEvaluationResult:
                 }
                 for v in self.violations
             ],
+            'sampling': {
+                'sample_size': self.sample_size,
+                'intervals': {k: v.to_dict() for k, v in self.confidence_intervals.items()},
+            } if self.is_sampled() else None,
         }
@@ -10,6 +10,8 @@ Dependencies: None (pure Python)
 from dataclasses import dataclass, field
 from typing import Optional
 
+from .metric_estimate import MetricEstimate
+
 
 @dataclass
 class QualityMetrics:
@@ -46,6 +48,10 @@ class QualityMetrics:
         documentation_score: Documentation score (0-100)
         overall_quality_score: Weighted average of all scores
         
+        sample_size: Files measured when the file metrics were estimated
+            from a stratified sample (None when exact)
+        confidence_intervals: Intervals of the estimated metrics by name
+        
     Example:
         >>> metrics = QualityMetrics(
         ...     total_files=100,
@@ -85,6 +91,14 @@ class QualityMetrics:
     issues: list[str] = field(default_factory=list)
     strengths: list[str] = field(default_factory=list)
     
+    # Sampling (large repositories)
+    sample_size: Optional[int] = None
+    confidence_intervals: dict[str, MetricEstimate] = field(default_factory=dict)
+    
+    def is_sampled(self) -> bool:
+        """Check if the file metrics are sample estimates."""
+        return self.sample_size is not None
+    
     def get_quality_grade(self) -> str:
         """
         Get letter grade for overall quality.
@@ -185,4 +199,9 @@ class QualityMetrics:
             'quality_level': self.get_quality_level(),
             'issues': self.issues,
             'strengths': self.strengths,
+            'sampling': {
+                'sample_size': self.sample_size,
+                'population': self.total_files,
+                'intervals': {k: v.to_dict() for k, v in self.confidence_intervals.items()},
+            } if self.is_sampled() else None,
         }
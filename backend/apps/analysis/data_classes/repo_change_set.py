@@ -0,0 +1,79 @@
+"""
+Repository change set data class.
+
+Describes what changed between two analysed commits of a repository.
+
+Layer: Analysis Layer
+Dependencies: None (pure Python)
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class RepoChangeSet:
+    """
+    Difference between a stored RepoStructure and the current HEAD.
+    
+    Produced by incremental ingestion and used to decide which
+    metrics need recomputing.
+    
+    Attributes:
+        base_sha: Previously analysed commit (None on first analysis)
+        head_sha: Current commit
+        added: Paths of added files
+        removed: Paths of removed files
+        modified: Paths of modified files
+        renamed: (old_path, new_path) pairs
+        new_commits: Commits between base and head
+        full_refresh: True if the structure was re-ingested from scratch
+            (first analysis, force push, or diff too large)
+        
+    Example:
+        >>> changes = RepoChangeSet(base_sha="abc", head_sha="def", modified=["app.py"])
+        >>> changes.structure_changed
+        False
+        >>> changes.files_changed
+        True
+    """
+    base_sha: Optional[str]
+    head_sha: Optional[str]
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    modified: list[str] = field(default_factory=list)
+    renamed: list[tuple[str, str]] = field(default_factory=list)
+    new_commits: int = 0
+    full_refresh: bool = False
+    
+    @property
+    def structure_changed(self) -> bool:
+        """Check if the set of paths changed (inputs of path-based detectors)."""
+        return self.full_refresh or bool(self.added or self.removed or self.renamed)
+    
+    @property
+    def files_changed(self) -> bool:
+        """Check if any file path, size or content changed."""
+        return self.structure_changed or bool(self.modified)
+    
+    @property
+    def commits_changed(self) -> bool:
+        """Check if commit history changed (inputs of collaboration analysis)."""
+        return self.full_refresh or self.new_commits > 0
+    
+    def is_empty(self) -> bool:
+        """Check if nothing changed since the base commit."""
+        return not (self.files_changed or self.commits_changed)
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            'base_sha': self.base_sha,
+            'head_sha': self.head_sha,
+            'added': len(self.added),
+            'removed': len(self.removed),
+            'modified': len(self.modified),
+            'renamed': len(self.renamed),
+            'new_commits': self.new_commits,
+            'full_refresh': self.full_refresh,
+        }
@@ -0,0 +1,247 @@
+"""
+Repository lookup indexes.
+
+Lazily built, cached indexes over a repository's file table, so folder,
+extension and classification lookups do not rescan every file.
+
+Layer: Analysis Layer
+Dependencies: FileNode, FileTable, PathTrie, StratifiedFileSampler
+"""
+
+from functools import cached_property
+from typing import Callable, Hashable, Iterable, Iterator, Optional
+
+from .file_node import FileNode
+from .file_sampler import FileSample, StratifiedFileSampler
+from .file_table import FileTable
+from .path_trie import PathTrie
+
+
+class FileBitset:
+    """
+    Set of file table entries, one bit per entry.
+    
+    Bitsets combine with &, | and - in one big-integer operation, so
+    e.g. "code files that are not tests" costs no scan.
+    
+    Example:
+        >>> tests = repo.index.test_files
+        >>> len(tests), 42 in tests
+        (120, False)
+        >>> len(repo.index.files - tests)
+        880
+    """
+    
+    __slots__ = ('bits',)
+    
+    def __init__(self, bits: int = 0):
+        self.bits = bits
+    
+    @classmethod
+    def from_indices(cls, indices: Iterable[int], size: int) -> "FileBitset":
+        """
+        Build a bitset from entry indices.
+        
+        Args:
+            indices: Entry indices to set
+            size: Number of entries in the table
+        
+        Returns:
+            Bitset
+        """
+        buffer = bytearray((size + 7) // 8)
+        for index in indices:
+            buffer[index >> 3] |= 1 << (index & 7)
+        return cls(int.from_bytes(buffer, 'little'))
+    
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+    
+    def __bool__(self) -> bool:
+        return self.bits != 0
+    
+    def __contains__(self, index: int) -> bool:
+        return (self.bits >> index) & 1 == 1
+    
+    def __iter__(self) -> Iterator[int]:
+        buffer = self.bits.to_bytes((self.bits.bit_length() + 7) // 8, 'little')
+        for position, byte in enumerate(buffer):
+            while byte:
+                low = byte & -byte
+                yield position * 8 + low.bit_length() - 1
+                byte ^= low
+    
+    def __and__(self, other: "FileBitset") -> "FileBitset":
+        return FileBitset(self.bits & other.bits)
+    
+    def __or__(self, other: "FileBitset") -> "FileBitset":
+        return FileBitset(self.bits | other.bits)
+    
+    def __sub__(self, other: "FileBitset") -> "FileBitset":
+        return FileBitset(self.bits & ~other.bits)
+    
+    def __eq__(self, other) -> bool:
+        return isinstance(other, FileBitset) and self.bits == other.bits
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"FileBitset({len(self)} entries)"
+
+
+class RepoIndex:
+    """
+    Cached lookup indexes over a file table.
+    
+    Why index?
+    - Detectors and analyzers ask dozens of questions per analysis
+      ("is there a models/ folder?", "how many .py files?"), and each
+      used to be a full scan: about 60 scans of every file
+    - Each index is built in one pass the first time it is used and
+      then answers in O(1) (sets and dicts) or with bit operations
+    
+    Indexes:
+    - folder_names / directory_names: lowercase folder names
+    - file_names: lowercase file names
+    - by_extension: entry indices per extension
+    - children: entry indices per parent directory path
+    - path_trie: folder, prefix and segment pattern queries
+    - files, test_files, doc_files, config_files: bitsets
+    - select(): bitsets for analyzer-specific rules, cached by key
+    - sample(): stratified file sample, drawn once per sampler settings
+      (ingestion plans contents for it, and the quality and principle
+      analyzers measure the same files)
+    
+    The index reflects the table at one version; RepoStructure.index
+    rebuilds it when files is replaced or appended to.
+    
+    Example:
+        >>> index = RepoIndex(repo.files)
+        >>> 'models' in index.folder_names
+        True
+        >>> [repo.files[i].path for i in index.by_extension['.toml']]
+        ['pyproject.toml']
+    """
+    
+    # Documentation files by extension
+    DOC_EXTENSIONS = frozenset({'.md', '.rst', '.txt', '.adoc'})
+    
+    # Configuration files by name fragment
+    CONFIG_PATTERNS = ('config', 'settings', '.env', 'configuration')
+    
+    def __init__(self, table: FileTable):
+        """
+        Create an index over a file table (nothing is built yet).
+        
+        Args:
+            table: Repository file table
+        """
+        self.table = table
+        self.version = table.version
+        self._selections: dict[Hashable, FileBitset] = {}
+        self._samples: dict[tuple, Optional[FileSample]] = {}
+    
+    @cached_property
+    def folder_names(self) -> frozenset[str]:
+        """Every segment of every directory path, lowercased."""
+        names = set()
+        for node in self.table:
+            if node.is_directory():
+                names.update(node.path.lower().split('/'))
+        return frozenset(names)
+    
+    @cached_property
+    def directory_names(self) -> frozenset[str]:
+        """Names of directory entries, lowercased."""
+        return frozenset(node.name.lower() for node in self.table if node.is_directory())
+    
+    @cached_property
+    def file_names(self) -> frozenset[str]:
+        """Names of file entries, lowercased."""
+        return frozenset(node.name.lower() for node in self.table if node.is_file())
+    
+    @cached_property
+    def by_extension(self) -> dict[Optional[str], list[int]]:
+        """Entry indices by extension (as stored, e.g. ".py" or None)."""
+        index: dict[Optional[str], list[int]] = {}
+        for position, node in enumerate(self.table):
+            index.setdefault(node.extension, []).append(position)
+        return index
+    
+    @cached_property
+    def children(self) -> dict[str, list[int]]:
+        """Entry indices by parent directory path ("" for the root)."""
+        index: dict[str, list[int]] = {}
+        for position, path in enumerate(self.table.paths()):
+            index.setdefault(path.rpartition('/')[0], []).append(position)
+        return index
+    
+    @cached_property
+    def path_trie(self) -> PathTrie:
+        """Index over every directory path (see PathTrie)."""
+        trie = PathTrie(self.table.directories())
+        for path in self.table.directory_entries():
+            trie.add(path)
+        return trie
+    
+    @cached_property
+    def files(self) -> FileBitset:
+        """File entries (not directories)."""
+        return self.select('files', FileNode.is_file)
+    
+    @cached_property
+    def test_files(self) -> FileBitset:
+        """Files named like tests (see FileNode.is_test_file)."""
+        return self.select('test_files', lambda node: node.is_file() and node.is_test_file())
+    
+    @cached_property
+    def doc_files(self) -> FileBitset:
+        """Files with a documentation extension."""
+        return self.select(
+            'doc_files',
+            lambda node: node.is_file() and (node.extension or '').lower() in self.DOC_EXTENSIONS,
+        )
+    
+    @cached_property
+    def config_files(self) -> FileBitset:
+        """Entries whose name suggests configuration."""
+        return self.select(
+            'config_files',
+            lambda node: any(pattern in node.name.lower() for pattern in self.CONFIG_PATTERNS),
+        )
+    
+    def select(self, key: Hashable, predicate: Callable[[FileNode], bool]) -> FileBitset:
+        """
+        Get the entries matching a rule, computing them once per key.
+        
+        Args:
+            key: Cache key identifying the rule
+            predicate: Test applied to every entry on the first call
+        
+        Returns:
+            Bitset of matching entries
+        """
+        selection = self._selections.get(key)
+        if selection is None:
+            matches = (position for position, node in enumerate(self.table) if predicate(node))
+            selection = FileBitset.from_indices(matches, len(self.table))
+            self._selections[key] = selection
+        return selection
+    
+    def sample(self, sampler: StratifiedFileSampler) -> Optional[FileSample]:
+        """
+        Get the stratified sample of the files, drawing it once per sampler.
+        
+        Args:
+            sampler: File sampler (samples with equal settings are shared)
+        
+        Returns:
+            File sample, or None if the repository is below the threshold
+        """
+        if sampler.key not in self._samples:
+            self._samples[sampler.key] = sampler.sample(self.table)
+        return self._samples[sampler.key]
+    
+    def nodes(self, entries: Iterable[int]) -> list[FileNode]:
+        """Get the FileNode views of entry indices."""
+        return [self.table[position] for position in entries]
@@ -4,15 +4,17 @@ Repository structure data class.
 Main data structure containing all repository metadata.
 
 Layer: Analysis Layer
-Dependencies: FileNode, CommitInfo, ContributorInfo
+Dependencies: FileNode, FileTable, RepoIndex, CommitInfo, ContributorInfo
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 from django.utils import timezone
 
 from .file_node import FileNode
+from .file_table import FileTable
+from .repo_index import RepoIndex
 from .commit_info import CommitInfo, ContributorInfo
 
 
@@ -36,7 +38,8 @@ class RepoStructure:
         description: Repository description
         primary_language: Main programming language
         languages: All languages with byte counts
-        files: List of all files and directories
+        files: All files and directories (any iterable of FileNode;
+            stored as a columnar FileTable)
         commits: Recent commit history (limited for performance)
         contributors: All contributors with stats
         stars: Number of GitHub stars
@@ -45,6 +48,9 @@ class RepoStructure:
         created_at: When repository was created
         updated_at: Last update timestamp
         default_branch: Main branch name (usually "main" or "master")
+        head_sha: Commit SHA of default_branch this structure reflects
+        file_contents: File contents by path (the files picked by the
+            content planner, or every file in archive mode; may be empty)
         
     Example:
         >>> repo = RepoStructure(
@@ -64,7 +70,7 @@ class RepoStructure:
     description: Optional[str]
     primary_language: Optional[str]
     languages: dict[str, int]  # language -> byte count
-    files: list[FileNode]
+    files: FileTable
     commits: list[CommitInfo]
     contributors: list[ContributorInfo]
     stars: int = 0
@@ -73,6 +79,49 @@ class RepoStructure:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     default_branch: str = "main"
+    head_sha: Optional[str] = None
+    file_contents: dict[str, bytes] = field(default_factory=dict)
+    _index: Optional[RepoIndex] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Average source line length, for line estimates from file sizes
+    BYTES_PER_LINE = 45
+    
+    def __setattr__(self, name, value):
+        """Store file nodes by column (see FileTable) and drop stale indexes."""
+        if name == 'files':
+            if not isinstance(value, FileTable):
+                value = FileTable(value)
+            object.__setattr__(self, '_index', None)
+        object.__setattr__(self, name, value)
+    
+    @property
+    def index(self) -> RepoIndex:
+        """
+        Lookup indexes over files (see RepoIndex).
+        
+        Built lazily; replaced when files is reassigned or appended to.
+        
+        Returns:
+            Repository index
+        """
+        if self._index is None or self._index.version != self.files.version:
+            self._index = RepoIndex(self.files)
+        return self._index
+    
+    @index.setter
+    def index(self, index: RepoIndex) -> None:
+        """
+        Adopt an index already built over files (keeping its caches).
+        
+        Args:
+            index: Index over this structure's file table
+        
+        Raises:
+            ValueError: If the index is over another table
+        """
+        if index.table is not self.files:
+            raise ValueError("Index is over a different file table")
+        object.__setattr__(self, '_index', index)
     
     def get_full_name(self) -> str:
         """
@@ -85,11 +134,11 @@ class RepoStructure:
     
     def get_total_files(self) -> int:
         """Count total number of files (excluding directories)."""
-        return sum(1 for f in self.files if f.is_file())
+        return self.files.count_type("file")
     
     def get_total_directories(self) -> int:
         """Count total number of directories."""
-        return sum(1 for f in self.files if f.is_directory())
+        return self.files.count_type("dir")
     
     def get_files_by_extension(self, extension: str) -> list[FileNode]:
         """
@@ -106,11 +155,55 @@ class RepoStructure:
             >>> len(python_files)
             150
         """
-        return [f for f in self.files if f.extension == extension]
+        return self.index.nodes(self.index.by_extension.get(extension, ()))
+    
+    def get_file_content(self, path: str) -> Optional[bytes]:
+        """
+        Get the content of a file, if it was fetched.
+        
+        Args:
+            path: File path from repo root
+            
+        Returns:
+            File bytes, or None if contents were not fetched
+        """
+        return self.file_contents.get(path)
+    
+    def get_line_count(self, node: FileNode) -> Optional[int]:
+        """
+        Count the lines of a file.
+        
+        Exact when the content was fetched; otherwise estimated from
+        the file size (BYTES_PER_LINE).
+        
+        Args:
+            node: File node
+            
+        Returns:
+            Line count, or None if neither content nor size is known
+        """
+        content = self.file_contents.get(node.path)
+        if content is not None:
+            return content.count(b'\n') + (1 if content and not content.endswith(b'\n') else 0)
+        if node.size:
+            return node.size // self.BYTES_PER_LINE
+        return None
     
     def get_test_files(self) -> list[FileNode]:
         """Get all files that appear to be test files."""
-        return [f for f in self.files if f.is_test_file()]
+        return self.index.nodes(self.index.test_files)
+    
+    def get_children(self, path: str) -> list[FileNode]:
+        """
+        Get the entries directly inside a directory.
+        
+        Args:
+            path: Directory path from repo root ("" for the root)
+            
+        Returns:
+            Files and directories whose parent is path
+        """
+        return self.index.nodes(self.index.children.get(path.strip('/'), ()))
     
     def get_language_distribution(self) -> dict[str, float]:
         """
@@ -164,3 +257,65 @@ class RepoStructure:
         
         delta = timezone.now() - self.created_at
         return delta.days
+    
+    def to_dict(self) -> dict:
+        """
+        Convert to dictionary for JSON serialization.
+        
+        File contents are not included (they can be large and are
+        re-fetched on demand).
+        
+        Returns:
+            JSON-compatible dictionary (see from_dict)
+        """
+        return {
+            'owner': self.owner,
+            'name': self.name,
+            'url': self.url,
+            'description': self.description,
+            'primary_language': self.primary_language,
+            'languages': self.languages,
+            'files': [f.to_dict() for f in self.files],
+            'commits': [c.to_dict() for c in self.commits],
+            'contributors': [c.to_dict() for c in self.contributors],
+            'stars': self.stars,
+            'forks': self.forks,
+            'open_issues': self.open_issues,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'default_branch': self.default_branch,
+            'head_sha': self.head_sha,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "RepoStructure":
+        """
+        Rebuild from to_dict() output.
+        
+        Args:
+            data: Dictionary produced by to_dict()
+            
+        Returns:
+            Repository structure (without file contents)
+        """
+        def parse_date(value: Optional[str]) -> Optional[datetime]:
+            return datetime.fromisoformat(value) if value else None
+        
+        return cls(
+            owner=data['owner'],
+            name=data['name'],
+            url=data['url'],
+            description=data.get('description'),
+            primary_language=data.get('primary_language'),
+            languages=data.get('languages', {}),
+            files=FileTable(FileNode.from_dict(f) for f in data.get('files', [])),
+            commits=[CommitInfo.from_dict(c) for c in data.get('commits', [])],
+            contributors=[ContributorInfo.from_dict(c) for c in data.get('contributors', [])],
+            stars=data.get('stars', 0),
+            forks=data.get('forks', 0),
+            open_issues=data.get('open_issues', 0),
+            created_at=parse_date(data.get('created_at')),
+            updated_at=parse_date(data.get('updated_at')),
+            default_branch=data.get('default_branch', 'main'),
+            head_sha=data.get('head_sha'),
+        )
@@ -4,18 +4,31 @@ Architecture pattern detectors.
 Detects common architectural patterns from repository structure.
 """
 
+from .detector_engine import DetectorEngine, RuleMatches
+from .rule_pack import RuleIndicator, RulePack, load_rule_pack, load_rule_packs
+from .rule_scorer import RuleScorer
 from .base_detector import BaseDetector
+from .rule_pack_detector import RulePackDetector
 from .mvc_detector import MVCDetector
 from .clean_architecture_detector import CleanArchitectureDetector
 from .layered_detector import LayeredDetector
 from .feature_based_detector import FeatureBasedDetector
-from .architecture_analyzer import ArchitectureAnalyzer
+from .architecture_analyzer import ArchitectureAnalyzer, get_detector_engine
 
 __all__ = [
+    'DetectorEngine',
+    'RuleMatches',
+    'RuleIndicator',
+    'RulePack',
+    'load_rule_pack',
+    'load_rule_packs',
+    'RuleScorer',
     'BaseDetector',
+    'RulePackDetector',
     'MVCDetector',
     'CleanArchitectureDetector',
     'LayeredDetector',
     'FeatureBasedDetector',
     'ArchitectureAnalyzer',
+    'get_detector_engine',
 ]
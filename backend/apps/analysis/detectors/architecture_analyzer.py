@@ -4,19 +4,21 @@ Architecture pattern analyzer orchestrator.
 Runs all detectors and aggregates results.
 
 Layer: Analysis Layer
+Dependencies: DetectorEngine, rule packs
 """
 
-from typing import Dict
+import threading
+from pathlib import Path
+from typing import Dict, Optional
 
 from apps.analysis.data_classes import (
     RepoStructure,
     ArchitectureSignal,
     ArchitectureAnalysisResult
 )
-from .mvc_detector import MVCDetector
-from .clean_architecture_detector import CleanArchitectureDetector
-from .layered_detector import LayeredDetector
-from .feature_based_detector import FeatureBasedDetector
+from .detector_engine import DetectorEngine
+from .rule_pack import load_rule_packs
+from .rule_pack_detector import RulePackDetector
 
 
 class ArchitectureAnalyzer:
@@ -26,8 +28,14 @@ class ArchitectureAnalyzer:
     Runs all detectors, aggregates results, and determines
     the primary architectural pattern.
     
+    Detectors are the rule packs (built-in MVC, Clean Architecture,
+    Layered, Feature-Based, Hexagonal, MVVM, Microservices, plus any in
+    ARCHITECTURE_RULE_PACK_DIRS), compiled once per process by
+    get_detector_engine().
+    
     Detection strategy:
-    1. Run all detectors in parallel
+    1. Match every detector's rules in one pass (DetectorEngine) and
+       score all packs on the shared matches (RuleScorer)
     2. Collect confidence scores
     3. Select primary pattern (highest confidence)
     4. Return all detected patterns above threshold
@@ -47,14 +55,24 @@ class ArchitectureAnalyzer:
     # Minimum confidence to consider pattern "detected"
     DETECTION_THRESHOLD = 30.0
     
-    def __init__(self):
-        """Initialize all detectors."""
-        self.detectors = [
-            MVCDetector(),
-            CleanArchitectureDetector(),
-            LayeredDetector(),
-            FeatureBasedDetector()
-        ]
+    # Bump when aggregation changes (rule changes are in engine.version)
+    VERSION = 1
+    
+    def __init__(self, engine: Optional[DetectorEngine] = None):
+        """
+        Initialize all detectors.
+        
+        Args:
+            engine: Compiled detectors (defaults to the shared engine
+                built from the configured rule packs)
+        """
+        self.engine = engine or get_detector_engine()
+        self.detectors = self.engine.detectors
+    
+    @property
+    def version(self) -> str:
+        """Version of the results (analyzer and rule packs)."""
+        return f"{self.VERSION}:{self.engine.version}"
     
     def analyze(self, repo: RepoStructure) -> ArchitectureAnalysisResult:
         """
@@ -83,11 +101,7 @@ class ArchitectureAnalyzer:
         Returns:
             List of ArchitectureSignals from all detectors
         """
-        signals = []
-        for detector in self.detectors:
-            signal = detector.detect(repo)
-            signals.append(signal)
-        return signals
+        return self.engine.run(repo)
     
     def _determine_primary_pattern(
         self,
@@ -154,3 +168,34 @@ class ArchitectureAnalyzer:
             for signal in signals
             if signal.confidence >= self.DETECTION_THRESHOLD
         }
+
+
+_default_engine: Optional[DetectorEngine] = None
+_default_engine_lock = threading.Lock()
+
+
+def get_detector_engine() -> DetectorEngine:
+    """
+    Get the process-wide detector engine compiled from the rule packs.
+    
+    Packs are loaded, validated and compiled on first use (the analysis
+    app does this at startup, so a malformed pack fails fast).
+    
+    Settings:
+    - ARCHITECTURE_RULE_PACK_DIRS: Extra directories of .json rule packs
+      (a pack replaces the built-in pack with the same file name)
+    
+    Returns:
+        Shared DetectorEngine
+    """
+    global _default_engine
+    
+    from django.conf import settings
+    
+    with _default_engine_lock:
+        if _default_engine is None:
+            directories = [Path(d) for d in getattr(settings, 'ARCHITECTURE_RULE_PACK_DIRS', []) if d]
+            _default_engine = DetectorEngine(
+                [RulePackDetector(pack) for pack in load_rule_packs(directories)]
+            )
+        return _default_engine
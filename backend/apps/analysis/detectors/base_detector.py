@@ -4,19 +4,28 @@ Base detector for architecture pattern detection.
 Provides common utilities for all architecture detectors.
 
 Layer: Analysis Layer  
-Dependencies: RepoStructure, ArchitectureSignal
+Dependencies: RepoStructure, ArchitectureSignal, DetectorEngine
 """
 
 from abc import ABC, abstractmethod
+from typing import Optional
+
 from apps.analysis.data_classes import RepoStructure, ArchitectureSignal
+from .detector_engine import DetectorEngine, RuleMatches
 
 
 class BaseDetector(ABC):
     """
     Abstract base class for architecture pattern detectors.
     
-    Provides common helper methods for folder/file checking that
-    all detectors need. Each concrete detector implements detect().
+    Each concrete detector declares the folders and path patterns it
+    looks for (FOLDERS, PATH_PATTERNS) and implements evaluate() on the
+    matches. DetectorEngine compiles the rules of all detectors and
+    finds them in one pass; detect() runs an engine for one detector.
+    Most detectors are declared as data instead (RulePackDetector).
+    
+    The has_folder()/has_path_pattern() helpers remain for ad-hoc
+    checks; they use repo.index, so they are lookups rather than scans.
     
     Why abstract base class?
     - Enforces consistent interface across all detectors
@@ -25,20 +34,41 @@ class BaseDetector(ABC):
     
     Example:
         >>> class MVCDetector(BaseDetector):
-        ...     def detect(self, repo: RepoStructure) -> ArchitectureSignal:
-        ...         if self.has_folder(repo, "models"):
+        ...     FOLDERS = ("models", "views")
+        ...     def evaluate(self, matches: RuleMatches) -> ArchitectureSignal:
+        ...         if matches.has_folder("models"):
         ...             # ... detection logic
     """
     
-    @abstractmethod
-    def detect(self, repo: RepoStructure) -> ArchitectureSignal:
+    # Rules compiled by DetectorEngine
+    FOLDERS: tuple[str, ...] = ()
+    PATH_PATTERNS: tuple[str, ...] = ()
+    
+    def detect(self, repo: RepoStructure, matches: Optional[RuleMatches] = None) -> ArchitectureSignal:
         """
         Detect architecture pattern in repository.
         
+        Args:
+            repo: Repository structure to analyze
+            matches: Rules already matched by a shared DetectorEngine
+                (matched here if omitted)
+            
+        Returns:
+            ArchitectureSignal with confidence and evidence
+        """
+        if matches is None:
+            matches = DetectorEngine([self]).match(repo)
+        return self.evaluate(matches)
+    
+    @abstractmethod
+    def evaluate(self, matches: RuleMatches) -> ArchitectureSignal:
+        """
+        Score the pattern from matched rules.
+        
         Each concrete detector must implement this method.
         
         Args:
-            repo: Repository structure to analyze
+            matches: This detector's FOLDERS/PATH_PATTERNS found in the repo
             
         Returns:
             ArchitectureSignal with confidence and evidence
@@ -54,28 +84,22 @@ class BaseDetector(ABC):
             folder_name: Folder name to search for
             
         Returns:
-            True if f older exists
+            True if folder exists
             
         Example:
             >>> self.has_folder(repo, "models")
             True
         """
-        folder_name_lower = folder_name.lower()
-        
-        for file_node in repo.files:
-            if file_node.is_directory():
-                # Check exact match or nested match
-                path_parts = file_node.path.lower().split('/')
-                if folder_name_lower in path_parts:
-                    return True
-        
-        return False
-
+        return folder_name.lower() in repo.index.folder_names
+    
     def has_path_pattern(self, repo: RepoStructure, pattern: str) -> bool:
         """
-        Check if any file path contains the specified pattern.
+        Check if any directory path contains the specified segments.
         
-        More flexible than has_folder() - can match partial paths like "apps/domain".
+        More flexible than has_folder() - can match partial paths like
+        "apps/domain". Answered by repo.index.path_trie with one set
+        lookup for patterns of up to PathTrie.MAX_PATTERN_SEGMENTS
+        segments; segments match whole folder names.
         
         Args:
             repo: Repository structure
@@ -88,14 +112,8 @@ class BaseDetector(ABC):
             >>> self.has_path_pattern(repo, "apps/domain")  # matches "backend/apps/domain/models.py"
             True
         """
-        pattern_lower = pattern.lower()
-        
-        for file_node in repo.files:
-            if pattern_lower in file_node.path.lower():
-                return True
-        
-        return False
-
+        return repo.index.path_trie.contains(pattern)
+    
     def has_any_folder(self, repo: RepoStructure, folder_names: list[str]) -> bool:
         """
         Check if repository has any of the specified folders.
@@ -136,10 +154,4 @@ class BaseDetector(ABC):
         Returns:
             Set of folder names
         """
-        folders = set()
-        for file_node in repo.files:
-            if file_node.is_directory():
-                # Add all parts of the path
-                parts = file_node.path.lower().split('/')
-                folders.update(parts)
-        return folders
+        return set(repo.index.folder_names)
@@ -0,0 +1,180 @@
+"""
+Compiled detector rule engine.
+
+Matches every detector's folder and path rules in one pass over the
+repository's directories and hands each detector its matched
+indicators. Rule pack detectors are scored together by one
+RuleScorer.
+
+Layer: Analysis Layer
+Dependencies: RepoStructure, ArchitectureSignal, PathTrie, RuleScorer
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Iterable
+
+from apps.analysis.data_classes import RepoStructure, ArchitectureSignal, PathTrie
+from .rule_scorer import RuleScorer
+
+
+@dataclass(frozen=True)
+class RuleMatches:
+    """
+    Folder and path rules found in a repository.
+    
+    Attributes:
+        folders: Matched folder names (lowercase)
+        paths: Matched path patterns (lowercase segment tuples)
+    
+    Example:
+        >>> matches.has_folder("models")
+        True
+        >>> matches.has_path("apps/domain")
+        False
+    """
+    folders: frozenset[str]
+    paths: frozenset[tuple[str, ...]]
+    
+    def has_folder(self, name: str) -> bool:
+        """Check if a folder rule matched."""
+        return name.lower() in self.folders
+    
+    def has_any_folder(self, names: Iterable[str]) -> bool:
+        """Check if any of the folder rules matched."""
+        return any(self.has_folder(name) for name in names)
+    
+    def count_folders(self, names: Iterable[str]) -> int:
+        """Count the folder rules that matched."""
+        return sum(1 for name in names if self.has_folder(name))
+    
+    def has_path(self, pattern: str) -> bool:
+        """Check if a path pattern rule matched."""
+        return PathTrie.split(pattern) in self.paths
+
+
+class DetectorEngine:
+    """
+    Single-pass evaluation of all detectors' rules.
+    
+    Why compile?
+    - Each detector used to ask has_folder()/has_path_pattern() several
+      times; with four detectors that is a few dozen lookups per
+      analysis, and more with every detector added
+    - Detectors declare their rules (FOLDERS, PATH_PATTERNS); the engine
+      merges them into segment hash tables once, then makes one pass
+      over the repository's directories for all of them
+    
+    Matching:
+    - Every parent of a directory is itself in the file table's
+      directory table, so only each directory's last segment needs a
+      lookup: folder rules are one set lookup, and path patterns are
+      keyed by their last segment and checked against the directory's
+      trailing segments
+    - Work per directory is constant whatever the number of rules (a
+      pattern is only compared when its last segment matches)
+    
+    Scoring:
+    - Detectors defined by rule packs (RulePackDetector) are compiled
+      into one RuleScorer and scored together; other detectors run
+      their own evaluate() on the same matches
+    
+    Example:
+        >>> engine = DetectorEngine([MVCDetector(), LayeredDetector()])
+        >>> signals = engine.run(repo)
+        >>> [s.pattern for s in signals]
+        ['MVC', 'Layered Architecture']
+    """
+    
+    def __init__(self, detectors: list):
+        """
+        Compile the detectors' rules.
+        
+        Args:
+            detectors: BaseDetector instances
+        """
+        self.detectors = detectors
+        
+        folders: set[str] = set()
+        patterns: dict[str, set[tuple[str, ...]]] = {}
+        for detector in detectors:
+            folders.update(name.lower() for name in detector.FOLDERS)
+            for pattern in detector.PATH_PATTERNS:
+                segments = PathTrie.split(pattern)
+                if segments:
+                    patterns.setdefault(segments[-1], set()).add(segments)
+        
+        self._folders = frozenset(folders)
+        self._patterns_by_tail = {tail: tuple(group) for tail, group in patterns.items()}
+        
+        self.scorer = RuleScorer(
+            detector.pack for detector in detectors if getattr(detector, 'pack', None) is not None
+        )
+    
+    @property
+    def version(self) -> str:
+        """
+        Fingerprint of the compiled detectors.
+        
+        Changes when a detector is added or removed or a rule pack's
+        rules, weights or evidence change, so stored results from
+        other rules are not reused.
+        """
+        digest = hashlib.sha256()
+        for detector in self.detectors:
+            digest.update(type(detector).__qualname__.encode())
+            digest.update(repr(getattr(detector, 'pack', None)).encode())
+        return digest.hexdigest()[:16]
+    
+    @property
+    def rule_count(self) -> int:
+        """Number of compiled folder and path rules."""
+        return len(self._folders) + sum(len(group) for group in self._patterns_by_tail.values())
+    
+    def match(self, repo: RepoStructure) -> RuleMatches:
+        """
+        Find every compiled rule in one pass over the directories.
+        
+        Args:
+            repo: Repository structure
+        
+        Returns:
+            Matched folders and path patterns
+        """
+        folders: set[str] = set()
+        paths: set[tuple[str, ...]] = set()
+        
+        directories = set(repo.files.directories())
+        directories.update(repo.files.directory_entries())
+        
+        for directory in directories:
+            segments = PathTrie.split(directory)
+            if not segments:
+                continue
+            tail = segments[-1]
+            
+            if tail in self._folders:
+                folders.add(tail)
+            
+            for pattern in self._patterns_by_tail.get(tail, ()):
+                if segments[-len(pattern):] == pattern:
+                    paths.add(pattern)
+        
+        return RuleMatches(folders=frozenset(folders), paths=frozenset(paths))
+    
+    def run(self, repo: RepoStructure) -> list[ArchitectureSignal]:
+        """
+        Run every detector on one set of matches.
+        
+        Args:
+            repo: Repository structure
+        
+        Returns:
+            One signal per detector, in detector order
+        """
+        matches = self.match(repo)
+        scored = iter(self.scorer.score(matches))
+        return [
+            next(scored) if getattr(detector, 'pack', None) is not None else detector.evaluate(matches)
+            for detector in self.detectors
+        ]
@@ -0,0 +1,245 @@
+"""
+Architecture rule packs.
+
+Declarative detector definitions: the folders and path patterns that
+indicate an architecture pattern, their weights and the evidence they
+produce. Packs are JSON files, so a new pattern ships as data.
+
+Layer: Analysis Layer
+Dependencies: None (pure Python)
+"""
+
+import json
+import string
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+# Rule packs shipped with RepoLense
+BUILTIN_RULE_PACK_DIR = Path(__file__).resolve().parent / 'rule_packs'
+
+
+@dataclass(frozen=True)
+class RuleIndicator:
+    """
+    One weighted indicator of an architecture pattern.
+    
+    The indicator fires when at least min_matches of its folders and
+    path patterns are found (and, if requires_any is set, when one of
+    those indicators fires too).
+    
+    Attributes:
+        id: Identifier (default indicator key)
+        weight: Confidence points added when the indicator fires
+        evidence: Evidence string; may use {count} (rules matched) and
+            {examples} (first three matches)
+        folders: Folder names matched at any depth
+        paths: Path patterns matched on whole segments (e.g. "apps/api")
+        min_matches: Rules that must match for the indicator to fire
+        requires_any: Indicator ids of which at least one must fire
+        record: Indicator keys to set, mapped to "flag" (True), "count"
+            or "matches" (list of matched rules)
+    """
+    id: str
+    weight: float
+    evidence: str
+    folders: tuple[str, ...] = ()
+    paths: tuple[str, ...] = ()
+    min_matches: int = 1
+    requires_any: tuple[str, ...] = ()
+    record: dict[str, str] = field(default_factory=dict)
+    
+    RECORD_KINDS = ('flag', 'count', 'matches')
+    EVIDENCE_FIELDS = ('count', 'examples')
+
+
+@dataclass(frozen=True)
+class RulePack:
+    """
+    A declarative architecture detector.
+    
+    Why rule packs?
+    - Weights, folder lists and evidence used to be hard-coded in each
+      detector's detect(); changing a weight meant changing code
+    - As data, a pack is validated and compiled once (RuleScorer), and
+      all packs are matched in the same pass over the directories
+      (DetectorEngine), so adding a pattern adds no work per repository
+    
+    Pack format (JSON):
+        {
+          "pattern": "MVC",
+          "order": 10,
+          "description": "...",
+          "fallback_evidence": "No MVC structure detected",
+          "indicators": [
+            {"id": "has_models", "folders": ["models"], "weight": 35,
+             "evidence": "Has models/ directory (data layer)"}
+          ]
+        }
+    
+    Attributes:
+        name: Pack name (file name without extension)
+        pattern: Architecture pattern name reported in signals
+        indicators: Indicators, in evidence order
+        fallback_evidence: Evidence when no indicator fires
+        order: Position among detectors (lower runs first and wins ties)
+        description: What the pattern looks like
+    
+    Example:
+        >>> pack = load_rule_pack(BUILTIN_RULE_PACK_DIR / 'mvc.json')
+        >>> pack.pattern, pack.folders[:2]
+        ('MVC', ('models', 'views'))
+    """
+    name: str
+    pattern: str
+    indicators: tuple[RuleIndicator, ...]
+    fallback_evidence: str
+    order: int = 100
+    description: str = ''
+    
+    @property
+    def folders(self) -> tuple[str, ...]:
+        """Folder names used by any indicator (first-use order)."""
+        names: dict[str, None] = {}
+        for indicator in self.indicators:
+            names.update(dict.fromkeys(indicator.folders))
+        return tuple(names)
+    
+    @property
+    def path_patterns(self) -> tuple[str, ...]:
+        """Path patterns used by any indicator (first-use order)."""
+        patterns: dict[str, None] = {}
+        for indicator in self.indicators:
+            patterns.update(dict.fromkeys(indicator.paths))
+        return tuple(patterns)
+    
+    @classmethod
+    def from_dict(cls, data: dict, name: str) -> 'RulePack':
+        """
+        Create and validate a pack from its JSON form.
+        
+        Args:
+            data: Parsed pack
+            name: Pack name
+        
+        Returns:
+            RulePack instance
+        
+        Raises:
+            ValueError: If the pack is malformed
+        """
+        def fail(message: str) -> ValueError:
+            return ValueError(f"Rule pack '{name}': {message}")
+        
+        for key in ('pattern', 'indicators'):
+            if key not in data:
+                raise fail(f"missing '{key}'")
+        if not data['indicators']:
+            raise fail("has no indicators")
+        
+        indicators = []
+        for item in data['indicators']:
+            if not isinstance(item, dict):
+                raise fail("indicators must be objects")
+            for key in ('id', 'weight', 'evidence'):
+                if key not in item:
+                    raise fail(f"indicator missing '{key}'")
+            
+            indicator_id = item['id']
+            folders = tuple(item.get('folders', ()))
+            paths = tuple(item.get('paths', ()))
+            if not folders and not paths:
+                raise fail(f"indicator '{indicator_id}' has no folders or paths")
+            
+            min_matches = int(item.get('min_matches', 1))
+            if not 1 <= min_matches <= len(folders) + len(paths):
+                raise fail(
+                    f"indicator '{indicator_id}' needs {min_matches} matches "
+                    f"of {len(folders) + len(paths)} rules"
+                )
+            
+            # Checked here so a bad pack fails on load, not when scored
+            try:
+                fields = [
+                    parsed[1] for parsed in string.Formatter().parse(item['evidence'])
+                    if parsed[1] is not None
+                ]
+            except ValueError as e:
+                raise fail(f"indicator '{indicator_id}' has malformed evidence: {e}")
+            for evidence_field in fields:
+                if evidence_field not in RuleIndicator.EVIDENCE_FIELDS:
+                    raise fail(
+                        f"indicator '{indicator_id}' evidence uses unknown "
+                        f"placeholder '{{{evidence_field}}}'"
+                    )
+            
+            record = dict(item.get('record', {indicator_id: 'flag'}))
+            for key, kind in record.items():
+                if kind not in RuleIndicator.RECORD_KINDS:
+                    raise fail(f"indicator '{indicator_id}' records '{key}' as unknown kind '{kind}'")
+            
+            indicators.append(RuleIndicator(
+                id=indicator_id,
+                weight=float(item['weight']),
+                evidence=item['evidence'],
+                folders=folders,
+                paths=paths,
+                min_matches=min_matches,
+                requires_any=tuple(item.get('requires_any', ())),
+                record=record,
+            ))
+        
+        ids = [indicator.id for indicator in indicators]
+        if len(set(ids)) != len(ids):
+            raise fail("indicator ids must be unique")
+        for indicator in indicators:
+            unknown = set(indicator.requires_any) - set(ids)
+            if unknown:
+                raise fail(f"indicator '{indicator.id}' requires unknown {sorted(unknown)}")
+        
+        return cls(
+            name=name,
+            pattern=data['pattern'],
+            indicators=tuple(indicators),
+            fallback_evidence=data.get('fallback_evidence', f"No {data['pattern']} structure detected"),
+            order=int(data.get('order', 100)),
+            description=data.get('description', ''),
+        )
+
+
+def load_rule_pack(path: Path) -> RulePack:
+    """
+    Load one rule pack file.
+    
+    Args:
+        path: Path to a .json pack
+    
+    Returns:
+        Validated RulePack (named after the file)
+    """
+    with open(path, encoding='utf-8') as handle:
+        data = json.load(handle)
+    return RulePack.from_dict(data, name=Path(path).stem)
+
+
+def load_rule_packs(directories: Optional[Iterable[Path]] = None) -> list[RulePack]:
+    """
+    Load the built-in rule packs and any extra pack directories.
+    
+    A pack in a later directory replaces an earlier pack of the same
+    file name, so deployments can re-weight built-in patterns.
+    
+    Args:
+        directories: Extra directories of .json packs
+    
+    Returns:
+        Packs sorted by order, then name
+    """
+    packs: dict[str, RulePack] = {}
+    for directory in [BUILTIN_RULE_PACK_DIR, *(directories or ())]:
+        for path in sorted(Path(directory).glob('*.json')):
+            pack = load_rule_pack(path)
+            packs[pack.name] = pack
+    
+    return sorted(packs.values(), key=lambda pack: (pack.order, pack.name))
@@ -0,0 +1,68 @@
+"""
+Rule pack detector.
+
+Architecture detector defined by a declarative rule pack.
+
+Layer: Analysis Layer
+Dependencies: RulePack, RuleScorer
+"""
+
+from typing import Optional
+
+from apps.analysis.data_classes import ArchitectureSignal
+from .base_detector import BaseDetector
+from .detector_engine import RuleMatches
+from .rule_pack import BUILTIN_RULE_PACK_DIR, RulePack, load_rule_pack
+from .rule_scorer import RuleScorer
+
+
+class RulePackDetector(BaseDetector):
+    """
+    Detects the architecture pattern described by a rule pack.
+    
+    The pack supplies the rules (FOLDERS, PATH_PATTERNS) and the
+    weights and evidence; evaluate() scores them with a RuleScorer
+    compiled when the detector is created. Inside a DetectorEngine,
+    all pack detectors share the engine's scorer instead.
+    
+    Subclasses name a built-in pack (PACK) to give it a class of its
+    own; any pack, including one loaded from a deployment's pack
+    directory, can be passed directly.
+    
+    Example:
+        >>> detector = RulePackDetector(load_rule_pack(path / 'mvvm.json'))
+        >>> detector.detect(repo).pattern
+        'MVVM'
+    """
+    
+    # Built-in pack file name (without .json) used when no pack is given
+    PACK: Optional[str] = None
+    
+    def __init__(self, pack: Optional[RulePack] = None):
+        """
+        Compile the detector's rule pack.
+        
+        Args:
+            pack: Rule pack (defaults to the built-in PACK)
+        """
+        if pack is None:
+            if self.PACK is None:
+                raise ValueError(f"{type(self).__name__} needs a rule pack")
+            pack = load_rule_pack(BUILTIN_RULE_PACK_DIR / f"{self.PACK}.json")
+        
+        self.pack = pack
+        self.FOLDERS = pack.folders
+        self.PATH_PATTERNS = pack.path_patterns
+        self._scorer = RuleScorer([pack])
+    
+    def evaluate(self, matches: RuleMatches) -> ArchitectureSignal:
+        """
+        Score the pack's indicators.
+        
+        Args:
+            matches: Matched rules
+        
+        Returns:
+            ArchitectureSignal with confidence and evidence
+        """
+        return self._scorer.score(matches)[0]
@@ -0,0 +1,151 @@
+"""
+Compiled rule pack scorer.
+
+Scores every rule pack's indicators against one set of matched rules
+using bit masks.
+
+Layer: Analysis Layer
+Dependencies: RulePack, ArchitectureSignal, PathTrie
+"""
+
+from typing import TYPE_CHECKING, Iterable
+
+from apps.analysis.data_classes import ArchitectureSignal, PathTrie
+from .rule_pack import RulePack
+
+if TYPE_CHECKING:
+    from .detector_engine import RuleMatches
+
+
+class RuleScorer:
+    """
+    Shared scorer for compiled rule packs.
+    
+    Why bit masks?
+    - Every folder and path rule of every pack gets one bit; each
+      indicator is the mask of its rules
+    - Matched rules become one integer, and an indicator's match count
+      is a single AND and popcount, so all indicators of all packs are
+      scored together in one flat pass whatever the number of packs
+    
+    Compiled once per set of packs; score() does no parsing or string
+    work beyond formatting the evidence of indicators that fire.
+    
+    Example:
+        >>> scorer = RuleScorer(load_rule_packs())
+        >>> signals = scorer.score(engine.match(repo))
+        >>> [s.pattern for s in signals][:2]
+        ['MVC', 'Clean Architecture']
+    """
+    
+    def __init__(self, packs: Iterable[RulePack]):
+        """
+        Compile the packs' indicators into bit masks.
+        
+        Args:
+            packs: Rule packs, in signal order
+        """
+        self.packs = tuple(packs)
+        self._bits: dict[tuple, int] = {}
+        
+        # Flat per-indicator columns, packs laid out one after another
+        self._masks: list[int] = []
+        self._min_matches: list[int] = []
+        self._requires: list[tuple[int, ...]] = []
+        self._labels: list[tuple[tuple[int, str], ...]] = []
+        self._spans: list[range] = []
+        
+        for pack in self.packs:
+            start = len(self._masks)
+            positions = {indicator.id: start + i for i, indicator in enumerate(pack.indicators)}
+            
+            for indicator in pack.indicators:
+                labels = [(self._bit(('folder', name.lower())), name) for name in indicator.folders]
+                labels += [(self._bit(('path', PathTrie.split(pattern))), pattern) for pattern in indicator.paths]
+                
+                mask = 0
+                for bit, _ in labels:
+                    mask |= bit
+                
+                self._masks.append(mask)
+                self._min_matches.append(indicator.min_matches)
+                self._requires.append(tuple(positions[required] for required in indicator.requires_any))
+                self._labels.append(tuple(labels))
+            
+            self._spans.append(range(start, len(self._masks)))
+    
+    def score(self, matches: 'RuleMatches') -> list[ArchitectureSignal]:
+        """
+        Score every pack.
+        
+        Args:
+            matches: Rules found in the repository
+        
+        Returns:
+            One signal per pack, in pack order
+        """
+        matched = 0
+        for name in matches.folders:
+            matched |= self._bits.get(('folder', name), 0)
+        for segments in matches.paths:
+            matched |= self._bits.get(('path', segments), 0)
+        
+        counts = [(matched & mask).bit_count() for mask in self._masks]
+        found = [count >= needed for count, needed in zip(counts, self._min_matches)]
+        fired = [
+            hit and (not requires or any(found[i] for i in requires))
+            for hit, requires in zip(found, self._requires)
+        ]
+        
+        return [
+            self._signal(pack, span, matched, counts, fired)
+            for pack, span in zip(self.packs, self._spans)
+        ]
+    
+    def _signal(
+        self,
+        pack: RulePack,
+        span: range,
+        matched: int,
+        counts: list[int],
+        fired: list[bool]
+    ) -> ArchitectureSignal:
+        """Build a pack's signal from the scored indicator columns."""
+        confidence = 0.0
+        evidence = []
+        indicators = {}
+        
+        for position, indicator in zip(span, pack.indicators):
+            if not fired[position]:
+                continue
+            
+            labels = [label for bit, label in self._labels[position] if matched & bit]
+            confidence += indicator.weight
+            evidence.append(indicator.evidence.format(
+                count=counts[position],
+                examples=', '.join(labels[:3]),
+            ))
+            
+            for key, kind in indicator.record.items():
+                if kind == 'count':
+                    indicators[key] = counts[position]
+                elif kind == 'matches':
+                    indicators[key] = labels
+                else:
+                    indicators[key] = True
+        
+        if not evidence:
+            evidence.append(pack.fallback_evidence)
+        
+        return ArchitectureSignal(
+            pattern=pack.pattern,
+            confidence=min(confidence, 100.0),
+            evidence=evidence,
+            indicators=indicators
+        )
+    
+    def _bit(self, rule: tuple) -> int:
+        """Get (assigning if new) the bit of a folder or path rule."""
+        if rule not in self._bits:
+            self._bits[rule] = 1 << len(self._bits)
+        return self._bits[rule]
@@ -5,15 +5,38 @@ Exports repository ingestion services for fetching data from GitHub.
 """
 
 from .repo_ingestion import RepoIngestionService
+from .ingestion_config import IngestionConfig
+from .local_clone_ingestion import LocalCloneIngestionService
+from .async_github_client import AsyncGitHubClient
+from .async_repo_ingestion import AsyncRepoIngestionService
+from .cassette import Cassette, CassetteMissError
+from .blob_store import BlobStore
+from .content_fetcher import BlobContentFetcher
+from .content_planner import ContentFetchPlanner
+from .language_classifier import LanguageClassifier
 from .exceptions import (
     RepoIngestionError,
     InvalidRepoUrlError,
     RepoAccessError,
+    RepoNotFoundError,
+    IngestionDeferredError,
 )
 
 __all__ = [
     'RepoIngestionService',
+    'IngestionConfig',
+    'LocalCloneIngestionService',
+    'AsyncGitHubClient',
+    'AsyncRepoIngestionService',
+    'Cassette',
+    'CassetteMissError',
+    'BlobStore',
+    'BlobContentFetcher',
+    'ContentFetchPlanner',
+    'LanguageClassifier',
     'RepoIngestionError',
     'InvalidRepoUrlError',
     'RepoAccessError',
+    'RepoNotFoundError',
+    'IngestionDeferredError',
 ]
@@ -0,0 +1,277 @@
+"""
+GitHub archive fetcher.
+
+Builds the file tree (and optionally file contents) from one streamed
+repository tarball instead of per-directory API calls.
+
+Layer: Analysis Layer
+Dependencies: PyGithub, requests, tarfile, BlobStore
+External Calls: GitHub REST API (1 request), codeload.github.com
+"""
+
+import hashlib
+import logging
+import tarfile
+import time
+from dataclasses import dataclass, field
+from typing import BinaryIO, Callable, Optional
+
+import requests
+import urllib3
+from github.Repository import Repository
+
+from apps.analysis.data_classes import FileNode
+from .blob_store import BlobStore, git_blob_sha
+from .github_data_fetcher import GitHubDataFetcher
+from .retry import RetryPolicy
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ArchiveSnapshot:
+    """
+    Result of reading a repository archive.
+    
+    Attributes:
+        files: All files and directories (excluded paths removed)
+        contents: File contents by path (only if requested, within caps)
+        skipped_contents: Files whose content was not kept (over a cap)
+        bytes_read: Uncompressed bytes streamed through
+    """
+    files: list[FileNode] = field(default_factory=list)
+    contents: dict[str, bytes] = field(default_factory=dict)
+    skipped_contents: int = 0
+    bytes_read: int = 0
+
+
+class GitHubArchiveFetcher:
+    """
+    Streams a repository tarball and decompresses it on the fly.
+    
+    Why a tarball?
+    - One API request replaces one get_contents() call per directory
+    - The download itself comes from codeload and is not rate limited
+    - File contents arrive in the same stream, so content analysis
+      needs no extra calls
+    
+    Nothing touches disk:
+    - tarfile reads the HTTP body in stream mode ("r|gz")
+    - Members are read in chunks and discarded unless contents are kept
+    
+    Bounded memory:
+    - Kept contents are capped per file and in total
+    - Files over a cap are still listed (with size and SHA)
+    
+    The download is retried like every GitHub call (RetryPolicy):
+    throttled and 5xx responses, and network errors before or during
+    the stream (a broken stream restarts the tarball from the start).
+    
+    Each file's git blob SHA is computed while streaming, so FileNodes
+    match those built from the Git Trees API. Kept contents are written
+    to the blob store (if given) under that SHA.
+    
+    Example:
+        >>> fetcher = GitHubArchiveFetcher(include_contents=True)
+        >>> snapshot = fetcher.fetch(repo)
+        >>> snapshot.contents["README.md"][:20]
+        b'# Django\\n\\nDjango is'
+    """
+    
+    DEFAULT_MAX_FILE_BYTES = 1024 * 1024
+    DEFAULT_MAX_TOTAL_BYTES = 64 * 1024 * 1024
+    
+    CHUNK_SIZE = 64 * 1024
+    DOWNLOAD_TIMEOUT_SECONDS = 60
+    
+    def __init__(
+        self,
+        include_contents: bool = False,
+        max_file_bytes: int = DEFAULT_MAX_FILE_BYTES,
+        max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES,
+        store: Optional[BlobStore] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize archive fetcher.
+        
+        Args:
+            include_contents: Keep file contents in the snapshot
+            max_file_bytes: Largest file whose content is kept
+            max_total_bytes: Total content kept across all files
+            store: Blob store receiving kept contents
+            retry_policy: Retry policy of the download (defaults to
+                RetryPolicy())
+            sleep: Sleep function (injectable for tests)
+        """
+        self.include_contents = include_contents
+        self.max_file_bytes = max_file_bytes
+        self.max_total_bytes = max_total_bytes
+        self.store = store
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.sleep = sleep
+    
+    def fetch(self, repo: Repository, ref: Optional[str] = None) -> ArchiveSnapshot:
+        """
+        Download and read the tarball of a branch.
+        
+        Args:
+            repo: GitHub repository object
+            ref: Branch, tag or commit (defaults to repo.default_branch)
+        
+        Returns:
+            Archive snapshot
+        
+        Raises:
+            GithubException: If the archive link cannot be resolved
+            requests.RequestException: If the download fails
+            tarfile.TarError: If the archive is corrupt
+        """
+        ref = ref or repo.default_branch
+        url = repo.get_archive_link("tarball", ref)
+        return self.download(url)
+    
+    def download(self, url: str) -> ArchiveSnapshot:
+        """
+        Stream and read a tarball, retrying transient failures.
+        
+        Args:
+            url: Archive URL (codeload redirect target or API link)
+        
+        Returns:
+            Archive snapshot
+        
+        Raises:
+            requests.RequestException: If the download still fails
+                after the policy's attempts
+            tarfile.TarError: If the archive is corrupt
+        """
+        attempt = 1
+        while True:
+            try:
+                with requests.get(url, stream=True, timeout=self.DOWNLOAD_TIMEOUT_SECONDS) as response:
+                    if response.ok:
+                        response.raw.decode_content = True
+                        return self.read_archive(response.raw)
+                    
+                    delay = self.retry_policy.retry_delay(response.status_code, response.headers, attempt)
+                    if delay is None or attempt >= self.retry_policy.max_attempts:
+                        response.raise_for_status()
+                    logger.warning(
+                        f"Archive download returned {response.status_code}, retrying in {delay:.1f}s"
+                    )
+            except (requests.ConnectionError, requests.Timeout, urllib3.exceptions.HTTPError) as e:
+                if attempt >= self.retry_policy.max_attempts:
+                    if isinstance(e, requests.RequestException):
+                        raise
+                    raise requests.ConnectionError(f"Archive stream failed: {e}") from e
+                delay = self.retry_policy.backoff(attempt, self.retry_policy.base_delay)
+                logger.warning(f"Archive download failed ({e}), retrying in {delay:.1f}s")
+            
+            self.sleep(delay)
+            attempt += 1
+    
+    def read_archive(self, stream: BinaryIO) -> ArchiveSnapshot:
+        """
+        Read a gzipped tarball from a non-seekable stream.
+        
+        GitHub archives wrap everything in one top-level directory
+        ("owner-repo-<sha>/"), which is stripped from paths.
+        
+        Args:
+            stream: File-like object yielding the .tar.gz bytes
+        
+        Returns:
+            Archive snapshot
+        """
+        snapshot = ArchiveSnapshot()
+        kept_bytes = 0
+        
+        with tarfile.open(fileobj=stream, mode="r|gz") as archive:
+            for member in archive:
+                path = member.name.split("/", 1)[1] if "/" in member.name else ""
+                path = path.rstrip("/")
+                
+                if not path or GitHubDataFetcher.should_exclude_path(path):
+                    continue
+                
+                name = path.rsplit("/", 1)[-1]
+                
+                if member.isdir():
+                    snapshot.files.append(FileNode(path=path, name=name, type="dir"))
+                    continue
+                
+                if member.issym():
+                    # Symlinks are blobs holding the link target (as in git)
+                    target = member.linkname.encode("utf-8")
+                    snapshot.files.append(
+                        self._file_node(path, name, len(target), git_blob_sha(target))
+                    )
+                    continue
+                
+                if not member.isfile():
+                    continue
+                
+                keep = (
+                    self.include_contents
+                    and member.size <= self.max_file_bytes
+                    and kept_bytes + member.size <= self.max_total_bytes
+                )
+                data, sha = self._read_member(archive, member, keep)
+                snapshot.bytes_read += member.size
+                
+                if keep:
+                    snapshot.contents[path] = data
+                    kept_bytes += member.size
+                    if self.store is not None:
+                        self.store.put(sha, data)
+                elif self.include_contents:
+                    snapshot.skipped_contents += 1
+                
+                snapshot.files.append(self._file_node(path, name, member.size, sha))
+        
+        return snapshot
+    
+    def _read_member(
+        self,
+        archive: tarfile.TarFile,
+        member: tarfile.TarInfo,
+        keep: bool
+    ) -> tuple[Optional[bytes], str]:
+        """
+        Stream one member, hashing it and optionally keeping its bytes.
+        
+        Returns:
+            Tuple of (content or None, git blob SHA)
+        """
+        reader = archive.extractfile(member)
+        chunks = []
+        digest = hashlib.sha1(f"blob {member.size}\0".encode("ascii"))
+        
+        while True:
+            chunk = reader.read(self.CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+            if keep:
+                chunks.append(chunk)
+        
+        return (b"".join(chunks) if keep else None), digest.hexdigest()
+    
+    @staticmethod
+    def _file_node(path: str, name: str, size: int, sha: str) -> FileNode:
+        """Build a file FileNode."""
+        extension = None
+        if "." in name:
+            extension = "." + name.rsplit(".", 1)[1]
+        
+        return FileNode(
+            path=path,
+            name=name,
+            type="file",
+            size=size,
+            extension=extension,
+            sha=sha,
+        )
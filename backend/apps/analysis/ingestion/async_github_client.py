@@ -0,0 +1,434 @@
+"""
+Asynchronous GitHub API client.
+
+asyncio counterpart of GitHubClient + GitHubDataFetcher for running
+many ingestions concurrently in one worker.
+
+Layer: Analysis Layer
+Dependencies: httpx, data classes
+External Calls: GitHub REST API
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Awaitable, Callable, Optional
+
+import httpx
+
+from apps.analysis.data_classes import (
+    FileNode,
+    CommitInfo,
+    ContributorInfo,
+)
+from .exceptions import RepoAccessError, RepoIngestionError, RepoNotFoundError
+from .github_data_fetcher import GitHubDataFetcher
+from .paginated_fetcher import ParallelPaginatedFetcher
+from .retry import RetryPolicy
+from .session_pool import GitHubSessionPool
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGitHubClient:
+    """
+    asyncio GitHub client for the ingestion hot path.
+    
+    Why not PyGithub?
+    - PyGithub is synchronous: every call blocks a thread
+    - Lazy attributes hide extra requests (contributor profiles,
+      commit details), which cannot be overlapped
+    - Here every request is explicit and awaitable
+    
+    Shared resources (one client per worker):
+    - One httpx connection pool (keep-alive, HTTP/1.1)
+    - One semaphore bounding in-flight requests across all ingestions
+    
+    Throttled and failed requests are retried with the same RetryPolicy
+    as the PyGithub transport (Retry-After, X-RateLimit-Reset, jittered
+    backoff for 5xx and network errors), without holding a concurrency
+    slot while waiting.
+    
+    Error handling matches GitHubClient / GitHubDataFetcher:
+    - get_repository() raises RepoAccessError / RepoIngestionError
+    - fetch_* methods log a warning and return empty data
+    
+    Example:
+        >>> async with AsyncGitHubClient(token) as client:
+        ...     repo = await client.get_repository("django", "django")
+        ...     files = await client.fetch_file_tree(repo)
+    """
+    
+    API_URL = "https://api.github.com"
+    PAGE_SIZE = GitHubSessionPool.PAGE_SIZE
+    MAX_COMMITS = GitHubDataFetcher.MAX_COMMITS
+    MAX_CONTRIBUTORS = GitHubDataFetcher.MAX_CONTRIBUTORS
+    MAX_PAGES = ParallelPaginatedFetcher.DEFAULT_MAX_PAGES
+    MAX_FILE_DEPTH = GitHubDataFetcher.MAX_FILE_DEPTH
+    
+    DEFAULT_MAX_CONCURRENCY = 16
+    DEFAULT_POOL_SIZE = GitHubSessionPool.DEFAULT_POOL_SIZE
+    TIMEOUT_SECONDS = 30
+    
+    def __init__(
+        self,
+        github_token: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ):
+        """
+        Initialize async GitHub client.
+        
+        Args:
+            github_token: Optional GitHub personal access token
+            max_concurrency: Maximum in-flight requests (all ingestions)
+            pool_size: Keep-alive connections kept open
+            transport: Custom httpx transport (tests, proxies)
+            retry_policy: Retry policy (defaults to RetryPolicy())
+            sleep: Async sleep function (injectable for tests)
+        """
+        token = github_token or os.getenv('GITHUB_TOKEN')
+        
+        headers = {
+            'Accept': 'application/vnd.github+json',
+            'User-Agent': 'RepoLense',
+        }
+        if token:
+            headers['Authorization'] = f'token {token}'
+        
+        self.fetcher = GitHubDataFetcher()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.sleep = sleep
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._http = httpx.AsyncClient(
+            base_url=self.API_URL,
+            headers=headers,
+            timeout=self.TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+            ),
+            transport=transport,
+        )
+    
+    async def __aenter__(self) -> "AsyncGitHubClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close pooled connections."""
+        await self._http.aclose()
+    
+    async def _request(self, path: str, params: Optional[dict] = None) -> httpx.Response:
+        """
+        Perform a GET request within the concurrency bound.
+        
+        Throttled (403/429 with a rate limit signal), 5xx and network
+        failures are retried per retry_policy.
+        
+        Raises:
+            RepoNotFoundError: For 404
+            RepoAccessError: For exhausted rate limits
+            RepoIngestionError: For other API and network errors
+        """
+        attempt = 1
+        while True:
+            try:
+                async with self._semaphore:
+                    response = await self._http.get(path, params=params)
+            except httpx.TransportError as e:
+                if attempt >= self.retry_policy.max_attempts:
+                    raise RepoIngestionError(f"GitHub request failed: {e}")
+                delay = self.retry_policy.backoff(attempt, self.retry_policy.base_delay)
+                logger.warning(f"GitHub request failed ({e}), retrying in {delay:.1f}s")
+            except httpx.HTTPError as e:
+                raise RepoIngestionError(f"GitHub request failed: {e}")
+            else:
+                if response.is_success:
+                    break
+                delay = self.retry_policy.retry_delay(
+                    response.status_code,
+                    response.headers,
+                    attempt,
+                    self._error_message(response) if response.status_code in (403, 429) else '',
+                )
+                if delay is None or attempt >= self.retry_policy.max_attempts:
+                    break
+                logger.warning(
+                    f"GitHub returned {response.status_code} for {path}, retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{self.retry_policy.max_attempts})"
+                )
+            
+            await self.sleep(delay)
+            attempt += 1
+        
+        if response.is_success:
+            return response
+        
+        message = self._error_message(response)
+        
+        if response.status_code == 404:
+            raise RepoNotFoundError(f"Not found: {path}")
+        
+        if response.status_code in (403, 429) and (
+            response.headers.get('X-RateLimit-Remaining') == '0'
+            or 'rate limit' in message.lower()
+        ):
+            raise RepoAccessError(
+                "GitHub API rate limit exceeded. "
+                "Please wait or provide an authentication token."
+            )
+        
+        raise RepoIngestionError(f"GitHub API error {response.status_code}: {message}")
+    
+    @staticmethod
+    def _error_message(response: httpx.Response) -> str:
+        """Extract GitHub's error message from a response."""
+        try:
+            return response.json().get('message', response.reason_phrase)
+        except ValueError:
+            return response.reason_phrase
+    
+    async def _get_json(self, path: str, params: Optional[dict] = None) -> Any:
+        """GET a path and decode JSON."""
+        response = await self._request(path, params)
+        return response.json()
+    
+    async def _get_pages(self, path: str, limit: Optional[int] = None) -> list[dict]:
+        """
+        GET a list endpoint, fetching pages 2..N concurrently.
+        
+        N is read from the first page's Link header (rel="last"),
+        capped by MAX_PAGES and by limit.
+        
+        Args:
+            path: List endpoint path
+            limit: Maximum items (None for up to MAX_PAGES pages)
+        
+        Returns:
+            Items of all fetched pages, in order
+        """
+        paging = ParallelPaginatedFetcher(max_pages=self.MAX_PAGES, page_size=self.PAGE_SIZE)
+        max_pages = paging.page_limit(limit)
+        if max_pages == 0:
+            return []
+        
+        def get_page(page: int):
+            return self._request(path, {'per_page': self.PAGE_SIZE, 'page': page})
+        
+        first = await get_page(1)
+        last_page = min(paging.parse_last_page(first.headers.get('link')), max_pages)
+        rest = await asyncio.gather(*(get_page(page) for page in range(2, last_page + 1)))
+        
+        items = [item for response in (first, *rest) for item in response.json() or []]
+        return items if limit is None else items[:limit]
+    
+    async def get_repository(self, owner: str, repo_name: str) -> dict:
+        """
+        Fetch repository metadata.
+        
+        Args:
+            owner: Repository owner (user or organization)
+            repo_name: Repository name
+        
+        Returns:
+            Repository JSON (as returned by GET /repos/{owner}/{repo})
+        
+        Raises:
+            RepoNotFoundError: If repository not found or not accessible
+            RepoAccessError: If the rate limit is exhausted
+            RepoIngestionError: For other GitHub API errors
+        """
+        try:
+            return await self._get_json(f"/repos/{owner}/{repo_name}")
+        except RepoNotFoundError:
+            raise RepoNotFoundError(
+                f"Repository '{owner}/{repo_name}' not found or not accessible. "
+                "It may be private, deleted, or the URL may be incorrect."
+            )
+        except RepoAccessError:
+            raise
+        except RepoIngestionError as e:
+            raise RepoIngestionError(f"Failed to access repository: {e}")
+    
+    async def check_rate_limit(self) -> dict:
+        """
+        Check current GitHub API rate limit status.
+        
+        Returns:
+            Dictionary with remaining, limit and reset (Unix timestamp)
+        """
+        core = (await self._get_json("/rate_limit"))['resources']['core']
+        return {
+            'remaining': core['remaining'],
+            'limit': core['limit'],
+            'reset': float(core['reset']),
+        }
+    
+    async def fetch_file_tree(self, repo: dict, ref: Optional[str] = None) -> list[FileNode]:
+        """
+        Fetch the complete file tree with the recursive Git Trees API.
+        
+        Truncated trees are split per directory, fetching sibling
+        subtrees concurrently.
+        
+        Args:
+            repo: Repository JSON
+            ref: Branch, tag or tree SHA (defaults to the default branch)
+        
+        Returns:
+            List of all files and directories (excluded paths removed)
+        """
+        ref = ref or repo['default_branch']
+        base = f"/repos/{repo['full_name']}/git/trees"
+        
+        try:
+            tree = await self._get_json(f"{base}/{ref}", {'recursive': 1})
+        except RepoIngestionError as e:
+            logger.warning(f"Failed to fetch git tree for '{ref}': {e}")
+            return []
+        
+        if tree.get('truncated'):
+            return await self._fetch_truncated_tree(base, tree['sha'])
+        
+        return self._build_nodes(tree['tree'])
+    
+    async def _fetch_truncated_tree(
+        self,
+        base: str,
+        tree_sha: str,
+        prefix: str = "",
+        depth: int = 0
+    ) -> list[FileNode]:
+        """Fallback for truncated trees (see GitHubDataFetcher._fetch_truncated_tree)."""
+        if depth > self.MAX_FILE_DEPTH:
+            return []
+        
+        try:
+            tree = await self._get_json(f"{base}/{tree_sha}")
+        except RepoIngestionError as e:
+            logger.warning(f"Failed to fetch tree '{prefix or '/'}': {e}")
+            return []
+        
+        files = self._build_nodes(tree['tree'], prefix)
+        directories = [node for node in files if node.is_directory()]
+        
+        async def fetch_subtree(node: FileNode) -> list[FileNode]:
+            try:
+                subtree = await self._get_json(f"{base}/{node.sha}", {'recursive': 1})
+            except RepoIngestionError as e:
+                logger.warning(f"Failed to fetch tree '{node.path}': {e}")
+                return []
+            
+            if subtree.get('truncated'):
+                return await self._fetch_truncated_tree(
+                    base, node.sha, prefix=node.path + "/", depth=depth + 1
+                )
+            return self._build_nodes(subtree['tree'], prefix=node.path + "/")
+        
+        for subtree_files in await asyncio.gather(*(fetch_subtree(d) for d in directories)):
+            files.extend(subtree_files)
+        
+        return files
+    
+    def _build_nodes(self, entries: list[dict], prefix: str = "") -> list[FileNode]:
+        """Convert raw tree entries into FileNodes."""
+        nodes = (
+            self.fetcher.tree_entry_to_node(
+                prefix + entry['path'], entry['type'], entry.get('sha'), entry.get('size')
+            )
+            for entry in entries
+        )
+        return [node for node in nodes if node is not None]
+    
+    async def fetch_commits(self, repo: dict) -> list[CommitInfo]:
+        """
+        Fetch recent commit history (up to MAX_COMMITS).
+        
+        Args:
+            repo: Repository JSON
+        
+        Returns:
+            List of recent commits, files_changed unset
+        """
+        try:
+            raw_commits = await self._get_pages(
+                f"/repos/{repo['full_name']}/commits",
+                limit=self.MAX_COMMITS,
+            )
+        except RepoIngestionError as e:
+            logger.warning(f"Failed to fetch commits: {e}")
+            return []
+        
+        return [self.fetcher.commit_from_raw(raw) for raw in raw_commits]
+    
+    async def fetch_contributors(
+        self,
+        repo: dict,
+        max_profiles: Optional[int] = None
+    ) -> list[ContributorInfo]:
+        """
+        Fetch contributors, looking up profiles (name/email) concurrently.
+        
+        Args:
+            repo: Repository JSON
+            max_profiles: Maximum profile lookups (None for all)
+        
+        Returns:
+            List of contributors sorted by contribution count
+        """
+        try:
+            raw_contributors = await self._get_pages(
+                f"/repos/{repo['full_name']}/contributors",
+                limit=self.MAX_CONTRIBUTORS,
+            )
+        except RepoIngestionError as e:
+            logger.warning(f"Failed to fetch contributors: {e}")
+            return []
+        
+        if max_profiles is not None:
+            with_profile = raw_contributors[:max_profiles]
+        else:
+            with_profile = raw_contributors
+        
+        async def fetch_profile(login: str) -> dict:
+            try:
+                return await self._get_json(f"/users/{login}")
+            except RepoIngestionError as e:
+                logger.warning(f"Failed to fetch profile '{login}': {e}")
+                return {}
+        
+        profiles = await asyncio.gather(*(fetch_profile(raw['login']) for raw in with_profile))
+        profiles += [{}] * (len(raw_contributors) - len(profiles))
+        
+        return [
+            ContributorInfo(
+                username=raw['login'],
+                name=profile.get('name'),
+                email=profile.get('email') or "",
+                commit_count=raw['contributions'],
+            )
+            for raw, profile in zip(raw_contributors, profiles)
+        ]
+    
+    async def fetch_languages(self, repo: dict) -> dict[str, int]:
+        """
+        Fetch programming languages used in repository.
+        
+        Args:
+            repo: Repository JSON
+        
+        Returns:
+            Dictionary mapping language to byte count
+        """
+        try:
+            return await self._get_json(f"/repos/{repo['full_name']}/languages")
+        except RepoIngestionError as e:
+            logger.warning(f"Failed to fetch languages: {e}")
+            return {}
@@ -0,0 +1,135 @@
+"""
+Asynchronous repository ingestion service.
+
+asyncio counterpart of RepoIngestionService for ingesting many
+repositories concurrently from one worker.
+
+Layer: Analysis Layer
+Dependencies: AsyncGitHubClient, GitHubUrlParser, LanguageClassifier, data classes
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Optional, Union
+
+from apps.analysis.data_classes import RepoStructure
+from .url_parser import GitHubUrlParser
+from .async_github_client import AsyncGitHubClient
+from .language_classifier import LanguageClassifier
+
+
+class AsyncRepoIngestionService:
+    """
+    Service for ingesting GitHub repositories on asyncio.
+    
+    Why a separate service?
+    - RepoIngestionService parallelizes one ingestion with threads;
+      a worker running dozens of ingestions would need hundreds
+    - Here all ingestions share one event loop, one connection pool
+      and one concurrency bound (owned by AsyncGitHubClient)
+    
+    Produces the same RepoStructure as RepoIngestionService with the
+    Git Trees API (files_changed is not fetched for commits).
+    
+    Example:
+        >>> async with AsyncGitHubClient(token) as client:
+        ...     service = AsyncRepoIngestionService(client)
+        ...     repos = await service.ingest_many(urls)
+    """
+    
+    def __init__(
+        self,
+        client: AsyncGitHubClient,
+        contributor_profiles: Optional[int] = None,
+        languages_api: bool = False
+    ):
+        """
+        Initialize async ingestion service.
+        
+        Args:
+            client: Shared async GitHub client
+            contributor_profiles: Maximum contributor profile lookups
+                (None for all)
+            languages_api: Fetch language stats from GitHub instead of
+                classifying the file tree locally
+        """
+        self.client = client
+        self.contributor_profiles = contributor_profiles
+        self.languages_api = languages_api
+        self.url_parser = GitHubUrlParser()
+        self.language_classifier = LanguageClassifier()
+    
+    async def ingest_repository(self, repo_url: str) -> RepoStructure:
+        """
+        Ingest complete repository structure from GitHub.
+        
+        Args:
+            repo_url: GitHub repository URL
+        
+        Returns:
+            Complete repository structure with all metadata
+        
+        Raises:
+            InvalidRepoUrlError: If URL format is invalid
+            RepoAccessError: If repository is not accessible
+            RepoIngestionError: For other fetching errors
+        """
+        owner, repo_name = self.url_parser.parse(repo_url)
+        
+        repo = await self.client.get_repository(owner, repo_name)
+        
+        files, commits, contributors, languages = await asyncio.gather(
+            self.client.fetch_file_tree(repo),
+            self.client.fetch_commits(repo),
+            self.client.fetch_contributors(repo, max_profiles=self.contributor_profiles),
+            self._fetch_languages(repo),
+        )
+        if languages is None:
+            languages = self.language_classifier.language_bytes(files)
+        
+        return RepoStructure(
+            owner=owner,
+            name=repo_name,
+            url=repo_url,
+            description=repo.get('description'),
+            primary_language=repo.get('language'),
+            languages=languages,
+            files=files,
+            commits=commits,
+            contributors=contributors,
+            stars=repo.get('stargazers_count', 0),
+            forks=repo.get('forks_count', 0),
+            open_issues=repo.get('open_issues_count', 0),
+            created_at=self._parse_date(repo.get('created_at')),
+            updated_at=self._parse_date(repo.get('updated_at')),
+            default_branch=repo['default_branch'],
+            head_sha=commits[0].sha if commits else None,
+        )
+    
+    async def ingest_many(self, repo_urls: list[str]) -> list[Union[RepoStructure, Exception]]:
+        """
+        Ingest several repositories concurrently.
+        
+        One failing repository does not cancel the others.
+        
+        Args:
+            repo_urls: GitHub repository URLs
+        
+        Returns:
+            Per URL (same order), the structure or the exception raised
+        """
+        return await asyncio.gather(
+            *(self.ingest_repository(url) for url in repo_urls),
+            return_exceptions=True,
+        )
+    
+    async def _fetch_languages(self, repo: dict) -> Optional[dict[str, int]]:
+        """Fetch language stats from GitHub (None to classify locally)."""
+        if not self.languages_api:
+            return None
+        return await self.client.fetch_languages(repo)
+    
+    @staticmethod
+    def _parse_date(value: Optional[str]) -> Optional[datetime]:
+        """Parse a GitHub ISO 8601 timestamp."""
+        return datetime.fromisoformat(value.replace('Z', '+00:00')) if value else None
@@ -0,0 +1,291 @@
+"""
+Content-addressed blob store.
+
+Keeps file contents keyed by git blob SHA, so the same content is
+downloaded once across repositories, forks, branches and re-analyses.
+
+Layer: Analysis Layer
+Dependencies: sqlite3, zlib
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Iterable, Optional
+
+
+def git_blob_sha(data: bytes) -> str:
+    """
+    Compute the git blob SHA of content (as `git hash-object` does).
+    
+    Args:
+        data: File content
+    
+    Returns:
+        Hex SHA-1 of "blob <size>\\0<data>"
+    """
+    return hashlib.sha1(f"blob {len(data)}\0".encode("ascii") + data).hexdigest()
+
+
+class BlobStore:
+    """
+    Persistent, byte-budgeted LRU store of file contents.
+    
+    Why content-addressed?
+    - A git blob SHA names its content exactly: the same SHA in a fork,
+      another branch or a later commit is the same bytes
+    - Entries never go stale, so no revalidation request is needed
+    - Analysing a fork of a stored repo only downloads changed files
+    
+    Storage:
+    - SQLite (like ConditionalRequestCache): persistent across restarts
+      and shared by worker processes
+    - Contents are zlib-compressed; the byte budget counts stored bytes
+    - Contents are verified against their SHA before they are stored
+    
+    Eviction:
+    - Least recently used blobs are dropped once the stored size
+      exceeds max_bytes
+    - put() keeps a running total instead of summing the table; the
+      total is re-read from the database only when it crosses the
+      budget, which also picks up blobs stored by other processes
+    
+    Counters (per process, see stats()):
+    - hits / misses: lookups answered / not answered from the store
+    - stores: blobs written
+    - evictions: blobs dropped by the LRU policy
+    
+    Example:
+        >>> store = BlobStore("/tmp/blobs.sqlite3")
+        >>> store.put(git_blob_sha(b"hello\\n"), b"hello\\n")
+        True
+        >>> store.get("ce013625030ba8dba906f756967f9e9ca394464a")
+        b'hello\\n'
+    """
+    
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+    
+    # Seconds a write waits for another process's write lock
+    BUSY_TIMEOUT = 30.0
+    
+    # SQLite limits the number of bound parameters per statement
+    LOOKUP_BATCH = 500
+    
+    def __init__(self, path: str = ':memory:', max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Open (or create) the blob store.
+        
+        Args:
+            path: SQLite file path (":memory:" for a process-local store)
+            max_bytes: Maximum total size of stored (compressed) blobs
+        """
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+        
+        self._db = sqlite3.connect(
+            path,
+            timeout=self.BUSY_TIMEOUT,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        if path != ':memory:':
+            # Readers in other worker processes no longer block writers
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS blobs ("
+            " sha TEXT PRIMARY KEY,"
+            " data BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS blobs_last_used ON blobs (last_used)"
+        )
+        self._bytes = self._stored_bytes()
+    
+    def get(self, sha: str) -> Optional[bytes]:
+        """
+        Look up one blob and mark it as recently used.
+        
+        Args:
+            sha: Git blob SHA
+        
+        Returns:
+            Content, or None if not stored
+        """
+        return self.get_many([sha]).get(sha)
+    
+    def get_many(self, shas: Iterable[str]) -> dict[str, bytes]:
+        """
+        Look up several blobs and mark them as recently used.
+        
+        Args:
+            shas: Git blob SHAs
+        
+        Returns:
+            Contents by SHA (missing SHAs are left out)
+        """
+        wanted = list(dict.fromkeys(shas))
+        found: dict[str, bytes] = {}
+        
+        with self._lock:
+            for batch in self._batches(wanted):
+                placeholders = ','.join('?' * len(batch))
+                rows = self._db.execute(
+                    f"SELECT sha, data FROM blobs WHERE sha IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                found.update((sha, zlib.decompress(data)) for sha, data in rows)
+            
+            now = time.time()
+            self._db.executemany(
+                "UPDATE blobs SET last_used = ? WHERE sha = ?",
+                [(now, sha) for sha in found],
+            )
+            self._counters['hits'] += len(found)
+            self._counters['misses'] += len(wanted) - len(found)
+        
+        return found
+    
+    def missing(self, shas: Iterable[str]) -> set[str]:
+        """
+        Find which blobs are not stored (without touching recency).
+        
+        Args:
+            shas: Git blob SHAs
+        
+        Returns:
+            SHAs that would have to be downloaded
+        """
+        wanted = list(dict.fromkeys(shas))
+        present: set[str] = set()
+        
+        with self._lock:
+            for batch in self._batches(wanted):
+                placeholders = ','.join('?' * len(batch))
+                present.update(sha for (sha,) in self._db.execute(
+                    f"SELECT sha FROM blobs WHERE sha IN ({placeholders})",
+                    batch,
+                ))
+        
+        return set(wanted) - present
+    
+    def put(self, sha: str, data: bytes) -> bool:
+        """
+        Store a blob, evicting least recently used blobs if needed.
+        
+        Args:
+            sha: Git blob SHA claimed for the content
+            data: Content
+        
+        Returns:
+            True if stored; False if the content does not match the SHA
+            or is larger than the whole budget
+        """
+        if git_blob_sha(data) != sha:
+            return False
+        
+        compressed = zlib.compress(data)
+        if len(compressed) > self.max_bytes:
+            return False
+        
+        with self._lock:
+            replaced = self._db.execute("SELECT size FROM blobs WHERE sha = ?", (sha,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO blobs (sha, data, size, last_used) VALUES (?, ?, ?, ?)",
+                (sha, compressed, len(compressed), time.time()),
+            )
+            self._counters['stores'] += 1
+            self._bytes += len(compressed) - (replaced[0] if replaced else 0)
+            if self._bytes > self.max_bytes:
+                self._evict()
+        
+        return True
+    
+    def _stored_bytes(self) -> int:
+        """Sum the stored blob sizes (lock held)."""
+        (total_bytes,) = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM blobs"
+        ).fetchone()
+        return total_bytes
+    
+    def _evict(self) -> None:
+        """Drop least recently used blobs until within budget (lock held)."""
+        # Other processes may have stored or evicted blobs meanwhile
+        total_bytes = self._stored_bytes()
+        
+        if total_bytes <= self.max_bytes:
+            self._bytes = total_bytes
+            return
+        
+        victims = []
+        for sha, size in self._db.execute("SELECT sha, size FROM blobs ORDER BY last_used"):
+            if total_bytes <= self.max_bytes:
+                break
+            victims.append((sha,))
+            total_bytes -= size
+        
+        self._db.executemany("DELETE FROM blobs WHERE sha = ?", victims)
+        self._counters['evictions'] += len(victims)
+        self._bytes = total_bytes
+    
+    def _batches(self, items: list[str]) -> Iterable[list[str]]:
+        """Split a list into LOOKUP_BATCH sized chunks."""
+        for start in range(0, len(items), self.LOOKUP_BATCH):
+            yield items[start:start + self.LOOKUP_BATCH]
+    
+    def stats(self) -> dict[str, int]:
+        """
+        Get store counters and current size.
+        
+        Returns:
+            Dictionary with hits, misses, stores, evictions, entries, bytes
+        """
+        with self._lock:
+            total_bytes, count = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0), COUNT(*) FROM blobs"
+            ).fetchone()
+            return {**self._counters, 'entries': count, 'bytes': total_bytes}
+    
+    def clear(self) -> None:
+        """Remove all stored blobs (counters are kept)."""
+        with self._lock:
+            self._db.execute("DELETE FROM blobs")
+            self._bytes = 0
+
+
+_default_store: Optional[BlobStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_blob_store() -> Optional[BlobStore]:
+    """
+    Get the process-wide blob store configured in Django settings.
+    
+    Settings:
+    - GITHUB_BLOB_STORE_PATH: SQLite file ("" disables the store)
+    - GITHUB_BLOB_STORE_MAX_MB: Byte budget for stored blobs
+    
+    Returns:
+        Shared blob store, or None if disabled
+    """
+    global _default_store
+    
+    from django.conf import settings
+    
+    path = getattr(settings, 'GITHUB_BLOB_STORE_PATH', '')
+    if not path:
+        return None
+    
+    with _default_store_lock:
+        if _default_store is None:
+            max_mb = getattr(settings, 'GITHUB_BLOB_STORE_MAX_MB', 512)
+            _default_store = BlobStore(str(path), max_bytes=max_mb * 1024 * 1024)
+        return _default_store
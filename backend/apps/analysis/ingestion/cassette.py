@@ -0,0 +1,227 @@
+"""
+GitHub response cassettes.
+
+Records GitHub API responses to disk and replays them, so ingestions
+can be rerun offline and reproducibly.
+
+Layer: Analysis Layer
+Dependencies: requests
+"""
+
+import base64
+import gzip
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .exceptions import RepoIngestionError
+from .transport import TransportLayer
+
+
+class CassetteMissError(RepoIngestionError):
+    """Replay requested a response that was never recorded."""
+    pass
+
+
+class Cassette:
+    """
+    On-disk store of recorded GitHub responses.
+    
+    Format (compact, append-only):
+    - gzip-compressed JSON lines, one response per line
+    - Each line holds method, URL (path + sorted query), status,
+      the headers PyGithub and the transport layers read, and the body
+    - Authorization is never part of the key or the file
+    
+    Modes:
+    - "record": every response is appended as it arrives
+    - "replay": responses are served from the file in recorded order;
+      a request made several times gets its recordings in turn (the
+      last one repeats)
+    
+    Example:
+        >>> cassette = Cassette("cassettes/django.jsonl.gz", mode="record")
+        >>> RepoIngestionService(cassette=cassette).ingest_repository(url)
+        >>> replay = Cassette("cassettes/django.jsonl.gz", latency=0.05)
+        >>> RepoIngestionService(cassette=replay).ingest_repository(url)
+    """
+    
+    RECORD = "record"
+    REPLAY = "replay"
+    
+    # Headers kept in recordings (everything else is dropped)
+    KEPT_HEADERS = (
+        'Content-Type',
+        'ETag',
+        'Last-Modified',
+        'Link',
+        'Location',
+        'Retry-After',
+        'X-RateLimit-Limit',
+        'X-RateLimit-Remaining',
+        'X-RateLimit-Reset',
+        'X-RateLimit-Resource',
+        'X-RateLimit-Used',
+    )
+    
+    def __init__(self, path: str, mode: str = REPLAY, latency: float = 0.0):
+        """
+        Initialize cassette.
+        
+        Args:
+            path: Cassette file (.jsonl.gz)
+            mode: "record" or "replay"
+            latency: Seconds added to every replayed response
+                (simulates network round trips when benchmarking)
+        
+        Raises:
+            ValueError: If mode is unknown
+            FileNotFoundError: If a replay cassette does not exist
+        """
+        if mode not in (self.RECORD, self.REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._recordings: dict[str, list[dict]] = defaultdict(list)
+        self._served: dict[str, int] = defaultdict(int)
+        
+        if mode == self.REPLAY:
+            self._load()
+        else:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # A new recording replaces an old cassette
+            open(path, 'wb').close()
+    
+    @property
+    def recording(self) -> bool:
+        return self.mode == self.RECORD
+    
+    @staticmethod
+    def request_key(request: PreparedRequest) -> str:
+        """
+        Build the lookup key of a request.
+        
+        Query parameters are sorted, so parameter order does not matter.
+        """
+        url = urlsplit(request.url)
+        query = urlencode(sorted(parse_qsl(url.query, keep_blank_values=True)))
+        return f"{request.method} {url.path}?{query}"
+    
+    def record(self, request: PreparedRequest, response: Response) -> None:
+        """
+        Append a response to the cassette file.
+        
+        Args:
+            request: Request that was sent
+            response: Response received (body is read)
+        """
+        entry = {
+            'key': self.request_key(request),
+            'status': response.status_code,
+            'headers': {
+                name: response.headers[name]
+                for name in self.KEPT_HEADERS if name in response.headers
+            },
+            'body': base64.b64encode(response.content).decode('ascii'),
+        }
+        line = (json.dumps(entry, separators=(',', ':')) + '\n').encode('utf-8')
+        
+        with self._lock:
+            self._recordings[entry['key']].append(entry)
+            # Each append is a gzip member; concatenated members are one stream
+            with gzip.open(self.path, 'ab') as file:
+                file.write(line)
+    
+    def replay(self, request: PreparedRequest) -> Response:
+        """
+        Build the recorded response for a request.
+        
+        Args:
+            request: Request to answer
+        
+        Returns:
+            Response as recorded
+        
+        Raises:
+            CassetteMissError: If the request was never recorded
+        """
+        key = self.request_key(request)
+        
+        with self._lock:
+            entries = self._recordings.get(key)
+            if not entries:
+                raise CassetteMissError(f"No recorded response for {key} in {self.path}")
+            
+            index = min(self._served[key], len(entries) - 1)
+            self._served[key] += 1
+            entry = entries[index]
+        
+        if self.latency:
+            time.sleep(self.latency)
+        
+        response = Response()
+        response.status_code = entry['status']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = base64.b64decode(entry['body'])
+        response.url = request.url
+        response.request = request
+        response.encoding = 'utf-8'
+        response._content_consumed = True
+        return response
+    
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._recordings.values())
+    
+    def _load(self) -> None:
+        """Read all recordings of a cassette file."""
+        with gzip.open(self.path, 'rb') as file:
+            for line in file:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._recordings[entry['key']].append(entry)
+
+
+class CassetteLayer(TransportLayer):
+    """
+    Transport layer recording to or replaying from a cassette.
+    
+    Sits directly on PyGithub's HTTP adapter (innermost), so in replay
+    mode every layer above it (metrics, retries, ...) behaves exactly
+    as it did during recording, without any network access.
+    
+    Example:
+        >>> layers = [partial(CassetteLayer, cassette=cassette), ...]
+        >>> install_transport_layers(github, layers)
+    """
+    
+    def __init__(self, inner: BaseAdapter, cassette: Cassette):
+        """
+        Initialize cassette layer.
+        
+        Args:
+            inner: PyGithub's HTTP adapter
+            cassette: Cassette to record to or replay from
+        """
+        super().__init__(inner)
+        self.cassette = cassette
+    
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        """Replay a recorded response, or send and record."""
+        if not self.cassette.recording:
+            return self.cassette.replay(request)
+        
+        response = self.inner.send(request, **kwargs)
+        self.cassette.record(request, response)
+        return response
@@ -0,0 +1,390 @@
+"""
+Conditional request cache for GitHub API calls.
+
+Stores ETags and response bodies so repeated requests are revalidated
+with If-None-Match instead of re-downloaded.
+
+Layer: Analysis Layer
+Dependencies: sqlite3, requests
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from requests import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+
+from .transport import TransportLayer
+
+
+@dataclass
+class CachedResponse:
+    """
+    A stored GitHub response.
+    
+    Attributes:
+        etag: ETag returned by GitHub
+        status: HTTP status of the stored response (always 200)
+        headers: Response headers (without transfer-specific headers)
+        body: Decoded response body
+    """
+    etag: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+class ConditionalRequestCache:
+    """
+    Persistent, size-bounded LRU store for conditional requests.
+    
+    Why conditional requests?
+    - GitHub does not count 304 Not Modified against the rate limit
+    - Re-analysing an unchanged repo then costs almost no quota
+    
+    Why SQLite?
+    - Persistent across restarts and shared by worker processes
+      (write-ahead log, writers wait up to BUSY_TIMEOUT for a lock)
+    - Standard library, no extra service to run
+    
+    Eviction:
+    - Least recently used entries are dropped once the total body
+      size exceeds max_bytes or the entry count exceeds max_entries
+    - Running totals are kept per process, so a put only queries the
+      table totals when the limits look exceeded
+    
+    Counters (per process, see stats()):
+    - hits: 304 responses served from the cache
+    - misses: full responses fetched from GitHub
+    - stores: responses written to the cache
+    - evictions: entries dropped by the LRU policy
+    
+    Example:
+        >>> cache = ConditionalRequestCache("/tmp/github.sqlite3")
+        >>> cache.stats()
+        {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0, 'entries': 0, 'bytes': 0}
+    """
+    
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+    DEFAULT_MAX_ENTRIES = 50_000
+    
+    # Seconds a write waits for another process's write lock
+    BUSY_TIMEOUT = 30.0
+    
+    def __init__(
+        self,
+        path: str = ':memory:',
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            path: SQLite file path (":memory:" for a process-local cache)
+            max_bytes: Maximum total size of stored bodies
+            max_entries: Maximum number of stored responses
+        """
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+        
+        self._db = sqlite3.connect(
+            path,
+            timeout=self.BUSY_TIMEOUT,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        if path != ':memory:':
+            # Readers in other worker processes no longer block writers
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " etag TEXT NOT NULL,"
+            " status INTEGER NOT NULL,"
+            " headers TEXT NOT NULL,"
+            " body BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)"
+        )
+        self._bytes, self._count = self._stored_totals()
+    
+    @staticmethod
+    def make_key(request: PreparedRequest) -> str:
+        """
+        Build the cache key for a request.
+        
+        The Authorization header is part of the key: different tokens
+        may see different content (private repos) and GitHub varies
+        ETags on it.
+        
+        Args:
+            request: Outgoing request
+        
+        Returns:
+            Hex digest identifying (credentials, accept, url)
+        """
+        identity = '\n'.join((
+            request.headers.get('Authorization', ''),
+            request.headers.get('Accept', ''),
+            request.url or '',
+        ))
+        return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Look up a stored response and mark it as recently used.
+        
+        Args:
+            key: Cache key from make_key()
+        
+        Returns:
+            Stored response, or None if not cached
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT etag, status, headers, body FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            
+            if row is None:
+                return None
+            
+            self._db.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?",
+                (time.time(), key),
+            )
+        
+        etag, status, headers, body = row
+        return CachedResponse(etag=etag, status=status, headers=json.loads(headers), body=body)
+    
+    def put(self, key: str, entry: CachedResponse) -> None:
+        """
+        Store a response, evicting least recently used entries if needed.
+        
+        Args:
+            key: Cache key from make_key()
+            entry: Response to store
+        """
+        size = len(entry.body)
+        if size > self.max_bytes:
+            return
+        
+        with self._lock:
+            replaced = self._db.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, etag, status, headers, body, size, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, entry.etag, entry.status, json.dumps(entry.headers),
+                 entry.body, size, time.time()),
+            )
+            self._counters['stores'] += 1
+            if replaced:
+                self._bytes += size - replaced[0]
+            else:
+                self._bytes += size
+                self._count += 1
+            if self._bytes > self.max_bytes or self._count > self.max_entries:
+                self._evict()
+    
+    def _stored_totals(self) -> tuple[int, int]:
+        """Sum the stored body sizes and count the entries (lock held)."""
+        total_bytes, count = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0), COUNT(*) FROM responses"
+        ).fetchone()
+        return total_bytes, count
+    
+    def _evict(self) -> None:
+        """Drop least recently used entries until within limits (lock held)."""
+        # Other processes may have stored or evicted entries meanwhile
+        total_bytes, count = self._stored_totals()
+        
+        if total_bytes <= self.max_bytes and count <= self.max_entries:
+            self._bytes, self._count = total_bytes, count
+            return
+        
+        victims = []
+        for key, size in self._db.execute(
+            "SELECT key, size FROM responses ORDER BY last_used"
+        ):
+            if total_bytes <= self.max_bytes and count <= self.max_entries:
+                break
+            victims.append((key,))
+            total_bytes -= size
+            count -= 1
+        
+        self._db.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self._counters['evictions'] += len(victims)
+        self._bytes, self._count = total_bytes, count
+    
+    def record_hit(self) -> None:
+        """Count a response served from the cache."""
+        with self._lock:
+            self._counters['hits'] += 1
+    
+    def record_miss(self) -> None:
+        """Count a response fetched in full from GitHub."""
+        with self._lock:
+            self._counters['misses'] += 1
+    
+    def stats(self) -> dict[str, int]:
+        """
+        Get cache counters and current size.
+        
+        Returns:
+            Dictionary with hits, misses, stores, evictions, entries, bytes
+        """
+        with self._lock:
+            total_bytes, count = self._stored_totals()
+            return {**self._counters, 'entries': count, 'bytes': total_bytes}
+    
+    def clear(self) -> None:
+        """Remove all stored responses (counters are kept)."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._bytes = self._count = 0
+
+
+class ConditionalRequestLayer(TransportLayer):
+    """
+    Transport layer that revalidates cached GET responses with ETags.
+    
+    Flow for a GET request:
+        Cached? → add If-None-Match → 304? → replay stored body
+                                    → 200? → store body + ETag
+    
+    The replayed response carries the fresh rate-limit headers from
+    the 304, so PyGithub's rate limit tracking stays accurate.
+    """
+    
+    # Headers that describe the transfer, not the stored (decoded) body
+    TRANSFER_HEADERS = {'content-length', 'content-encoding', 'transfer-encoding'}
+    
+    def __init__(self, inner, cache: ConditionalRequestCache):
+        """
+        Initialize conditional request layer.
+        
+        Args:
+            inner: Wrapped adapter
+            cache: Store for ETags and bodies
+        """
+        super().__init__(inner)
+        self.cache = cache
+    
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        """Send request, revalidating against the cache when possible."""
+        if not self._is_cacheable(request, kwargs):
+            return self.inner.send(request, **kwargs)
+        
+        key = self.cache.make_key(request)
+        entry = self.cache.get(key)
+        
+        if entry is not None:
+            request.headers['If-None-Match'] = entry.etag
+        
+        response = self.inner.send(request, **kwargs)
+        
+        if entry is not None and response.status_code == 304:
+            self.cache.record_hit()
+            return self._replay(entry, response)
+        
+        self.cache.record_miss()
+        
+        etag = response.headers.get('ETag')
+        if response.status_code == 200 and etag:
+            self.cache.put(key, CachedResponse(
+                etag=etag,
+                status=response.status_code,
+                headers={
+                    name: value for name, value in response.headers.items()
+                    if name.lower() not in self.TRANSFER_HEADERS
+                },
+                body=response.content,
+            ))
+        
+        return response
+    
+    @staticmethod
+    def _is_cacheable(request: PreparedRequest, kwargs: dict) -> bool:
+        """Only plain (non-streamed, unconditional) GETs are cached."""
+        return (
+            request.method == 'GET'
+            and not kwargs.get('stream')
+            and 'If-None-Match' not in request.headers
+            and 'If-Modified-Since' not in request.headers
+        )
+    
+    def _replay(self, entry: CachedResponse, revalidation: Response) -> Response:
+        """
+        Turn a 304 response into the stored 200 response.
+        
+        Args:
+            entry: Stored response
+            revalidation: 304 response from GitHub
+        
+        Returns:
+            The 304 response object rewritten with stored status and body
+        """
+        headers = CaseInsensitiveDict(entry.headers)
+        for name, value in revalidation.headers.items():
+            if name.lower() not in self.TRANSFER_HEADERS:
+                headers[name] = value
+        
+        revalidation.status_code = entry.status
+        revalidation.reason = 'OK'
+        revalidation.headers = headers
+        revalidation._content = entry.body
+        revalidation._content_consumed = True
+        revalidation.encoding = 'utf-8'
+        
+        return revalidation
+
+
+_default_cache: Optional[ConditionalRequestCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> Optional[ConditionalRequestCache]:
+    """
+    Get the process-wide cache configured in Django settings.
+    
+    Settings:
+    - GITHUB_CACHE_PATH: SQLite file ("" disables the cache)
+    - GITHUB_CACHE_MAX_MB: Byte budget for stored bodies
+    
+    Returns:
+        Shared cache, or None if disabled
+    """
+    global _default_cache
+    
+    from django.conf import settings
+    
+    path = getattr(settings, 'GITHUB_CACHE_PATH', '')
+    if not path:
+        return None
+    
+    with _default_cache_lock:
+        if _default_cache is None:
+            max_mb = getattr(settings, 'GITHUB_CACHE_MAX_MB', 256)
+            _default_cache = ConditionalRequestCache(
+                str(path),
+                max_bytes=max_mb * 1024 * 1024,
+            )
+        return _default_cache
@@ -0,0 +1,151 @@
+"""
+Blob content fetcher.
+
+Fetches file contents by git blob SHA, reading through the blob store.
+
+Layer: Analysis Layer
+Dependencies: PyGithub, BlobStore, data classes
+External Calls: GitHub REST API (one request per missing blob)
+"""
+
+import base64
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+
+from github import GithubException
+from github.Repository import Repository
+
+from apps.analysis.data_classes import FileNode
+from .blob_store import BlobStore
+from .cassette import CassetteMissError
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ContentFetchResult:
+    """
+    Result of fetching file contents.
+    
+    Attributes:
+        contents: File contents by path
+        cached: Files served from the blob store
+        downloaded: Files downloaded from GitHub (one API call each)
+        skipped: Files not fetched (call budget exhausted or failed)
+    """
+    contents: dict[str, bytes] = field(default_factory=dict)
+    cached: int = 0
+    downloaded: int = 0
+    skipped: list[str] = field(default_factory=list)
+
+
+class BlobContentFetcher:
+    """
+    Fetches file contents via the Git Blobs API, store first.
+    
+    Flow:
+        files → look up SHAs in the blob store → download the missing
+        blobs concurrently (up to max_calls) → store them → contents
+    
+    Blobs with the same SHA (duplicated files) are downloaded once.
+    
+    Example:
+        >>> fetcher = BlobContentFetcher(get_blob_store(), max_calls=50)
+        >>> result = fetcher.fetch(repo, python_files)
+        >>> result.cached, result.downloaded
+        (112, 3)
+    """
+    
+    DEFAULT_MAX_CALLS = 100
+    DEFAULT_MAX_WORKERS = 8
+    
+    def __init__(
+        self,
+        store: Optional[BlobStore] = None,
+        max_calls: int = DEFAULT_MAX_CALLS,
+        max_workers: int = DEFAULT_MAX_WORKERS
+    ):
+        """
+        Initialize content fetcher.
+        
+        Args:
+            store: Blob store to read through (None disables caching)
+            max_calls: Maximum blob downloads per fetch
+            max_workers: Maximum concurrent downloads
+        """
+        self.store = store
+        self.max_calls = max_calls
+        self.max_workers = max_workers
+    
+    def fetch(
+        self,
+        repo: Repository,
+        files: list[FileNode],
+        max_calls: Optional[int] = None
+    ) -> ContentFetchResult:
+        """
+        Fetch the contents of files (in the given priority order).
+        
+        Args:
+            repo: GitHub repository object
+            files: File nodes with blob SHAs
+            max_calls: Override of the download budget for this fetch
+        
+        Returns:
+            Fetch result
+        """
+        result = ContentFetchResult()
+        by_sha: dict[str, list[str]] = {}
+        for node in files:
+            if node.is_file() and node.sha:
+                by_sha.setdefault(node.sha, []).append(node.path)
+        
+        stored = self.store.get_many(by_sha) if self.store is not None else {}
+        missing = [sha for sha in by_sha if sha not in stored]
+        budget = self.max_calls if max_calls is None else max_calls
+        to_download = missing[:max(budget, 0)]
+        
+        downloaded: dict[str, bytes] = {}
+        if to_download:
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="blob-fetch",
+            ) as executor:
+                for sha, data in zip(to_download, executor.map(
+                    lambda sha: self._download(repo, sha), to_download
+                )):
+                    if data is not None:
+                        downloaded[sha] = data
+                        if self.store is not None:
+                            self.store.put(sha, data)
+        
+        for sha, paths in by_sha.items():
+            data = stored.get(sha, downloaded.get(sha))
+            if data is None:
+                result.skipped.extend(paths)
+                continue
+            
+            for path in paths:
+                result.contents[path] = data
+            if sha in stored:
+                result.cached += len(paths)
+            else:
+                result.downloaded += len(paths)
+        
+        return result
+    
+    @staticmethod
+    def _download(repo: Repository, sha: str) -> Optional[bytes]:
+        """Download one blob (None on failure or if a replay lacks it)."""
+        try:
+            blob = repo.get_git_blob(sha)
+        except (GithubException, CassetteMissError) as e:
+            logger.warning(f"Failed to fetch blob '{sha[:7]}': {e}")
+            return None
+        
+        if blob.encoding == 'base64':
+            return base64.b64decode(blob.content)
+        return blob.content.encode('utf-8')
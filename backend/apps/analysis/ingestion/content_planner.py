@@ -0,0 +1,243 @@
+"""
+Content fetch planner.
+
+Chooses which file contents to fetch for analysis under a byte and
+request budget.
+
+Layer: Analysis Layer
+Dependencies: data classes
+"""
+
+import math
+import posixpath
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from apps.analysis.data_classes import FileNode, RepoStructure
+
+
+@dataclass
+class ContentPlan:
+    """
+    Files selected for content fetching.
+    
+    Attributes:
+        files: Selected files, highest priority first
+        bytes: Total size of the selected files
+        requests: Blob downloads needed (files not in the blob store)
+        skipped: Candidate files left out by a budget
+    """
+    files: list[FileNode] = field(default_factory=list)
+    bytes: int = 0
+    requests: int = 0
+    skipped: int = 0
+
+
+class ContentFetchPlanner:
+    """
+    Picks the files whose contents are worth fetching.
+    
+    Why plan?
+    - Contents cost one Git Blobs API call per file that is not yet in
+      the blob store, so fetching everything does not scale
+    - Analyzers get most value from a few files: manifests, entry
+      points and source code say more than assets or vendored code
+    
+    Priority (lower role first, then files whose size is nearest an
+    analyzer line threshold, then shallower paths):
+    1. Manifests (requirements.txt, package.json, pyproject.toml, ...)
+    2. Entry points (main.py, manage.py, index.ts, ...)
+    3. Source files
+    4. Tests
+    
+    Why near a threshold?
+    - Analyzers use contents only for line counts, compared against
+      500/1000/1500 lines (large files, SRP, god classes); every other
+      file gets a size-based estimate (RepoStructure.BYTES_PER_LINE)
+    - A 2 KB file is under every threshold whether counted or
+      estimated, while a 40 KB file may or may not be over 1000 lines:
+      its real count is the one that can change a result
+    
+    Budgets:
+    - max_bytes: Total content size selected
+    - max_requests: Blob downloads (files already stored are free)
+    - max_file_bytes: Larger files are never selected
+    
+    Example:
+        >>> planner = ContentFetchPlanner(max_bytes=2 * 1024 * 1024, max_requests=50)
+        >>> plan = planner.plan(files, stored=stored_shas)
+        >>> plan.requests
+        50
+    """
+    
+    DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+    DEFAULT_MAX_REQUESTS = 100
+    DEFAULT_MAX_FILE_BYTES = 256 * 1024
+    
+    # Line counts the analyzers compare against (ComplexityAnalyzer
+    # LARGE_SIZE/VERY_LARGE_SIZE, CodeSmellDetector GOD_CLASS_SIZE)
+    LINE_THRESHOLDS = (500, 1000, 1500)
+    
+    MANIFEST = 0
+    ENTRY_POINT = 1
+    SOURCE = 2
+    TEST = 3
+    
+    MANIFEST_NAMES = {
+        'requirements.txt', 'pyproject.toml', 'setup.py', 'setup.cfg', 'pipfile',
+        'package.json', 'go.mod', 'cargo.toml', 'pom.xml', 'build.gradle',
+        'build.gradle.kts', 'gemfile', 'composer.json', 'dockerfile',
+    }
+    
+    ENTRY_POINT_STEMS = {'main', 'app', 'index', 'server', 'manage', 'wsgi', 'asgi', 'program'}
+    
+    SOURCE_EXTENSIONS = {
+        '.py', '.js', '.jsx', '.ts', '.tsx', '.java', '.kt', '.go', '.rs',
+        '.rb', '.php', '.cs', '.c', '.h', '.cpp', '.hpp', '.swift', '.scala',
+        '.vue', '.svelte', '.dart',
+    }
+    
+    EXCLUDED_DIRECTORIES = {
+        'node_modules', 'vendor', 'third_party', 'dist', 'build',
+        '.git', '__pycache__', 'site-packages', 'migrations',
+    }
+    
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_requests: int = DEFAULT_MAX_REQUESTS,
+        max_file_bytes: int = DEFAULT_MAX_FILE_BYTES
+    ):
+        """
+        Initialize content planner.
+        
+        Args:
+            max_bytes: Total content bytes to select
+            max_requests: Blob downloads to allow
+            max_file_bytes: Largest file to select
+        """
+        self.max_bytes = max_bytes
+        self.max_requests = max_requests
+        self.max_file_bytes = max_file_bytes
+    
+    def role(self, node: FileNode) -> Optional[int]:
+        """
+        Classify a file by its role in the repository.
+        
+        Args:
+            node: File node
+        
+        Returns:
+            Role priority (MANIFEST, ENTRY_POINT, SOURCE, TEST), or None
+            if the file is not worth fetching
+        """
+        directories = node.path.lower().split('/')[:-1]
+        if self.EXCLUDED_DIRECTORIES.intersection(directories):
+            return None
+        
+        name = node.name.lower()
+        if name in self.MANIFEST_NAMES:
+            return self.MANIFEST
+        
+        extension = (node.extension or '').lower()
+        if extension not in self.SOURCE_EXTENSIONS:
+            return None
+        if node.is_test_file() or 'tests' in directories or 'test' in directories:
+            return self.TEST
+        if posixpath.splitext(name)[0] in self.ENTRY_POINT_STEMS:
+            return self.ENTRY_POINT
+        return self.SOURCE
+    
+    def threshold_distance(self, node: FileNode) -> float:
+        """
+        Measure how far a file's estimated line count is from a threshold.
+        
+        Args:
+            node: File node
+        
+        Returns:
+            Smallest ratio distance (|log(estimate / threshold)|) to any
+            of LINE_THRESHOLDS; infinite if the size is unknown
+        """
+        if not node.size:
+            return math.inf
+        lines = node.size / RepoStructure.BYTES_PER_LINE
+        return min(abs(math.log(lines / threshold)) for threshold in self.LINE_THRESHOLDS)
+    
+    def plan(
+        self,
+        files: Iterable[FileNode],
+        stored: Iterable[str] = (),
+        max_requests: Optional[int] = None
+    ) -> ContentPlan:
+        """
+        Select files within the budgets.
+        
+        Args:
+            files: Repository file nodes
+            stored: Blob SHAs already in the blob store (cost no request)
+            max_requests: Override of the request budget (e.g. after a
+                pre-flight downgrade)
+        
+        Returns:
+            Content plan
+        """
+        request_budget = self.max_requests if max_requests is None else max_requests
+        stored = set(stored)
+        
+        candidates = []
+        for node in files:
+            if not node.is_file() or not node.sha or (node.size or 0) > self.max_file_bytes:
+                continue
+            role = self.role(node)
+            if role is not None:
+                candidates.append((
+                    role,
+                    0.0 if role == self.MANIFEST else self.threshold_distance(node),
+                    node.path.count('/'),
+                    node.path,
+                    node,
+                ))
+        candidates.sort(key=lambda candidate: candidate[:4])
+        
+        plan = ContentPlan()
+        requested: set[str] = set()
+        for *_, node in candidates:
+            size = node.size or 0
+            # Duplicate content is downloaded once
+            needs_request = node.sha not in stored and node.sha not in requested
+            if (
+                plan.bytes + size > self.max_bytes
+                or (needs_request and plan.requests >= request_budget)
+            ):
+                plan.skipped += 1
+                continue
+            
+            plan.files.append(node)
+            plan.bytes += size
+            if needs_request:
+                requested.add(node.sha)
+                plan.requests += 1
+        
+        return plan
+
+
+def get_content_planner() -> ContentFetchPlanner:
+    """
+    Create a content planner with budgets from Django settings.
+    
+    Settings:
+    - GITHUB_CONTENT_MAX_KB: Total content fetched per analysis
+    - GITHUB_CONTENT_MAX_REQUESTS: Blob downloads per analysis
+    - GITHUB_CONTENT_MAX_FILE_KB: Largest file fetched
+    
+    Returns:
+        Content planner
+    """
+    from django.conf import settings
+    
+    return ContentFetchPlanner(
+        max_bytes=getattr(settings, 'GITHUB_CONTENT_MAX_KB', 4096) * 1024,
+        max_requests=getattr(settings, 'GITHUB_CONTENT_MAX_REQUESTS', ContentFetchPlanner.DEFAULT_MAX_REQUESTS),
+        max_file_bytes=getattr(settings, 'GITHUB_CONTENT_MAX_FILE_KB', 256) * 1024,
+    )
@@ -0,0 +1,414 @@
+"""
+Ingestion cost estimator.
+
+Estimates the GitHub API calls an ingestion will make and admits,
+downgrades or defers it against the remaining rate limit budget.
+
+Layer: Analysis Layer
+Dependencies: PyGithub
+External Calls: GitHub REST API (3 probe requests)
+"""
+
+import logging
+import math
+import time
+from dataclasses import dataclass, field, replace
+from typing import Optional
+
+from github import GithubException
+from github.GitTree import GitTree
+from github.Repository import Repository
+
+from .github_data_fetcher import GitHubDataFetcher
+from .session_pool import GitHubSessionPool
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IngestionPlan:
+    """
+    How deep an ingestion goes (the knobs that drive its API cost).
+    
+    Attributes:
+        use_git_tree: One recursive tree call instead of one call per directory
+        use_archive: Stream the tarball for the file tree (one call)
+        sampled_tree: Keep a truncated recursive tree as returned
+            instead of walking the missing subtrees (one call)
+        commit_files_budget: Per-commit detail requests for files_changed
+        contributor_profiles: Profile lookups for name/email (None for all)
+        content_requests: Blob downloads for file contents (0 disables them)
+        languages_api: Fetch language stats from GitHub instead of
+            classifying the file tree locally
+    """
+    use_git_tree: bool = True
+    use_archive: bool = False
+    sampled_tree: bool = False
+    commit_files_budget: int = 0
+    contributor_profiles: Optional[int] = None
+    content_requests: int = 0
+    languages_api: bool = False
+
+
+@dataclass
+class RepoProfile:
+    """
+    Size signals of a repository gathered before ingestion.
+    
+    Attributes:
+        size_kb: Repository size reported by GitHub
+        tree_entries: Entries in the default-branch tree (None if unknown)
+        directories: Directories in the default-branch tree
+        top_level_directories: Directories at the repository root
+        truncated: Whether the recursive tree was truncated by GitHub
+        commit_count: Commits on the default branch (None if unknown)
+        contributor_count: Contributors (None if unknown)
+        tree: The probe's recursive tree response, so the TREE and
+            SAMPLED strategies build the file tree from it instead of
+            requesting it again
+    """
+    size_kb: int
+    tree_entries: Optional[int] = None
+    directories: int = 0
+    top_level_directories: int = 0
+    truncated: bool = False
+    commit_count: Optional[int] = None
+    contributor_count: Optional[int] = None
+    tree: Optional[GitTree] = field(default=None, repr=False, compare=False)
+
+
+@dataclass
+class CostEstimate:
+    """
+    Estimated API calls per ingestion component.
+    
+    Attributes:
+        tree_calls: File tree requests
+        commit_calls: Commit list pages
+        commit_detail_calls: Per-commit detail requests (enrichment)
+        contributor_calls: Contributor list pages plus profile lookups
+        language_calls: Languages request (0 when classified locally)
+        content_calls: Blob downloads for file contents (upper bound;
+            blobs already in the blob store are free)
+    """
+    tree_calls: int
+    commit_calls: int
+    commit_detail_calls: int
+    contributor_calls: int
+    language_calls: int = 1
+    content_calls: int = 0
+    
+    @property
+    def total(self) -> int:
+        """Total estimated API calls."""
+        return (
+            self.tree_calls
+            + self.commit_calls
+            + self.commit_detail_calls
+            + self.contributor_calls
+            + self.language_calls
+            + self.content_calls
+        )
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for logging/serialization."""
+        return {
+            'tree_calls': self.tree_calls,
+            'commit_calls': self.commit_calls,
+            'commit_detail_calls': self.commit_detail_calls,
+            'contributor_calls': self.contributor_calls,
+            'language_calls': self.language_calls,
+            'content_calls': self.content_calls,
+            'total': self.total,
+        }
+
+
+@dataclass
+class AdmissionDecision:
+    """
+    Outcome of the pre-flight budget check.
+    
+    Attributes:
+        action: ADMIT, DOWNGRADE or DEFER
+        plan: Plan to ingest with (cheaper than requested if downgraded)
+        estimate: Estimated cost of that plan
+        remaining: Remaining API calls at decision time
+        reset: Unix timestamp when the rate limit resets
+        reason: Human-readable explanation
+    """
+    action: str
+    plan: IngestionPlan
+    estimate: CostEstimate
+    remaining: int
+    reset: float
+    reason: str
+    
+    ADMIT = 'admit'
+    DOWNGRADE = 'downgrade'
+    DEFER = 'defer'
+    
+    @property
+    def retry_after(self) -> float:
+        """Seconds until the rate limit resets (0 if already reset)."""
+        return max(self.reset - time.time(), 0.0)
+
+
+class IngestionCostEstimator:
+    """
+    Pre-flight API cost estimation and budget admission.
+    
+    Why pre-flight?
+    - Ingestion makes many calls across four endpoints
+    - Running out of quota halfway fails the analysis with a 403
+      after most of the budget is already spent
+    - A few cheap probes up front predict the cost well
+    
+    Probes (3 requests, revalidated for free by the ETag cache):
+    - Recursive default-branch tree (entries, directories, truncation);
+      the same request the tree ingestion makes next
+    - Commit count and contributor count (one-item pages)
+    
+    Downgrade order (cheapest loss of detail first):
+    1. Git Trees API instead of per-directory listing (no loss)
+    2. Fewer file content downloads (analyzers fall back to size estimates)
+    3. Fewer commit detail requests (files_changed enrichment)
+    4. Fewer contributor profile lookups (top contributors kept)
+    
+    If even the cheapest plan does not fit, the ingestion is deferred
+    until the rate limit resets.
+    
+    Example:
+        >>> estimator = IngestionCostEstimator()
+        >>> profile = estimator.probe(repo)
+        >>> decision = estimator.decide(profile, IngestionPlan(), client.check_rate_limit())
+        >>> decision.action
+        'admit'
+    """
+    
+    # Estimates are padded for retries and oversized subtrees
+    SAFETY_MARGIN = 1.2
+    
+    # Calls kept free for other analyses sharing the token
+    RESERVE_CALLS = 20
+    
+    # Directory density used when the tree could not be probed
+    KB_PER_DIRECTORY = 100
+    
+    def __init__(
+        self,
+        page_size: int = GitHubSessionPool.PAGE_SIZE,
+        max_commits: int = GitHubDataFetcher.MAX_COMMITS,
+        max_contributors: int = GitHubDataFetcher.MAX_CONTRIBUTORS
+    ):
+        """
+        Initialize cost estimator.
+        
+        Args:
+            page_size: Items per page of list endpoints
+            max_commits: Commits fetched per ingestion
+            max_contributors: Contributors fetched per ingestion
+        """
+        self.page_size = page_size
+        self.max_commits = max_commits
+        self.max_contributors = max_contributors
+    
+    def probe(self, repo: Repository) -> RepoProfile:
+        """
+        Gather size signals for a repository.
+        
+        Failed probes leave the signal unknown; estimate() then
+        assumes the worst case for that component.
+        
+        Args:
+            repo: GitHub repository object
+        
+        Returns:
+            Repository profile
+        """
+        profile = RepoProfile(size_kb=repo.size or 0)
+        
+        try:
+            tree = repo.get_git_tree(repo.default_branch, recursive=True)
+            directories = [e.path for e in tree.tree if e.type == 'tree']
+            
+            profile.tree_entries = len(tree.tree)
+            profile.directories = len(directories)
+            profile.top_level_directories = sum('/' not in path for path in directories)
+            profile.truncated = tree.truncated
+            profile.tree = tree
+        except GithubException as e:
+            logger.warning(f"Failed to probe git tree: {e}")
+        
+        try:
+            profile.commit_count = repo.get_commits().totalCount
+        except GithubException as e:
+            logger.warning(f"Failed to probe commit count: {e}")
+        
+        try:
+            profile.contributor_count = repo.get_contributors().totalCount
+        except GithubException as e:
+            logger.warning(f"Failed to probe contributor count: {e}")
+        
+        return profile
+    
+    def estimate(self, profile: RepoProfile, plan: IngestionPlan) -> CostEstimate:
+        """
+        Estimate the API calls of ingesting a repository with a plan.
+        
+        Args:
+            profile: Repository size signals
+            plan: Ingestion depth
+        
+        Returns:
+            Estimated calls per component
+        """
+        # File tree
+        if plan.use_archive:
+            tree_calls = 1  # archive link; the download is not rate limited
+        elif plan.sampled_tree:
+            tree_calls = 0 if profile.tree is not None else 1
+        elif profile.tree_entries is None:
+            directories = profile.size_kb // self.KB_PER_DIRECTORY
+            tree_calls = 1 + directories  # failed tree → per-directory fallback
+        elif not plan.use_git_tree:
+            tree_calls = 1 + profile.directories
+        elif profile.truncated:
+            # Root listing + one recursive call per top-level directory
+            tree_calls = 2 + profile.top_level_directories
+        else:
+            tree_calls = 0 if profile.tree is not None else 1
+        
+        # Commits
+        commits = self.max_commits
+        if profile.commit_count is not None:
+            commits = min(profile.commit_count, self.max_commits)
+        commit_calls = max(math.ceil(commits / self.page_size), 1)
+        commit_detail_calls = min(max(plan.commit_files_budget, 0), commits)
+        
+        # Contributors (list pages + one profile lookup each)
+        contributors = profile.contributor_count
+        if contributors is None:
+            contributors = self.page_size
+        contributors = min(contributors, self.max_contributors)
+        profiles = contributors
+        if plan.contributor_profiles is not None:
+            profiles = min(contributors, plan.contributor_profiles)
+        contributor_calls = max(math.ceil(contributors / self.page_size), 1) + profiles
+        
+        # File contents (one blob download per planned file at most)
+        content_calls = max(plan.content_requests, 0)
+        if profile.tree_entries is not None:
+            content_calls = min(content_calls, profile.tree_entries)
+        
+        return CostEstimate(
+            tree_calls=tree_calls,
+            commit_calls=commit_calls,
+            commit_detail_calls=commit_detail_calls,
+            contributor_calls=contributor_calls,
+            language_calls=1 if plan.languages_api else 0,
+            content_calls=content_calls,
+        )
+    
+    def decide(
+        self,
+        profile: RepoProfile,
+        plan: IngestionPlan,
+        rate_limit: dict
+    ) -> AdmissionDecision:
+        """
+        Admit, downgrade or defer an ingestion.
+        
+        Args:
+            profile: Repository size signals
+            plan: Requested ingestion depth
+            rate_limit: Output of GitHubClient.check_rate_limit()
+        
+        Returns:
+            Admission decision with the plan to use
+        """
+        remaining = rate_limit['remaining']
+        reset = rate_limit['reset']
+        budget = remaining - self.RESERVE_CALLS
+        
+        estimate = self.estimate(profile, plan)
+        if self._fits(estimate, budget):
+            return AdmissionDecision(
+                action=AdmissionDecision.ADMIT,
+                plan=plan,
+                estimate=estimate,
+                remaining=remaining,
+                reset=reset,
+                reason=f"Estimated {estimate.total} calls, {remaining} remaining",
+            )
+        
+        for cheaper in self._downgrades(profile, plan, budget):
+            cheaper_estimate = self.estimate(profile, cheaper)
+            if self._fits(cheaper_estimate, budget):
+                return AdmissionDecision(
+                    action=AdmissionDecision.DOWNGRADE,
+                    plan=cheaper,
+                    estimate=cheaper_estimate,
+                    remaining=remaining,
+                    reset=reset,
+                    reason=(
+                        f"Estimated {estimate.total} calls, {remaining} remaining; "
+                        f"reduced ingestion depth to {cheaper_estimate.total} calls"
+                    ),
+                )
+        
+        return AdmissionDecision(
+            action=AdmissionDecision.DEFER,
+            plan=plan,
+            estimate=estimate,
+            remaining=remaining,
+            reset=reset,
+            reason=(
+                f"Estimated {estimate.total} calls but only {remaining} remaining "
+                f"({self.RESERVE_CALLS} reserved)"
+            ),
+        )
+    
+    def _fits(self, estimate: CostEstimate, budget: int) -> bool:
+        """Check if a padded estimate fits in the budget."""
+        return math.ceil(estimate.total * self.SAFETY_MARGIN) <= budget
+    
+    def _downgrades(self, profile: RepoProfile, plan: IngestionPlan, budget: int):
+        """
+        Yield progressively cheaper plans.
+        
+        Each step keeps as much detail as still fits: the budget left
+        after the cheaper components goes to the one being reduced.
+        """
+        # Spendable calls before padding
+        spendable = math.floor(budget / self.SAFETY_MARGIN)
+        
+        # Step 1: recursive tree instead of per-directory listing (same data)
+        if not plan.use_git_tree and not plan.use_archive:
+            plan = replace(plan, use_git_tree=True)
+            yield plan
+        
+        # Step 2: shrink content downloads to what fits
+        if plan.content_requests > 0:
+            no_contents = replace(plan, content_requests=0)
+            spare = spendable - self.estimate(profile, no_contents).total
+            if spare >= 0:
+                yield replace(plan, content_requests=min(plan.content_requests, spare))
+                return
+            plan = no_contents
+        
+        # Step 3: shrink commit enrichment to what fits
+        if plan.commit_files_budget > 0:
+            no_details = replace(plan, commit_files_budget=0)
+            spare = spendable - self.estimate(profile, no_details).total
+            if spare >= 0:
+                yield replace(plan, commit_files_budget=min(plan.commit_files_budget, spare))
+                return
+            plan = no_details
+        
+        # Step 4: shrink contributor profile lookups (top contributors kept)
+        no_profiles = replace(plan, contributor_profiles=0)
+        spare = spendable - self.estimate(profile, no_profiles).total
+        if spare >= 0:
+            current = plan.contributor_profiles
+            yield replace(plan, contributor_profiles=spare if current is None else min(current, spare))
@@ -0,0 +1,271 @@
+"""
+Repository diff patcher.
+
+Applies a GitHub compare response to a stored RepoStructure.
+
+Layer: Analysis Layer
+Dependencies: data classes
+"""
+
+from dataclasses import replace
+from typing import Optional
+
+from apps.analysis.data_classes import (
+    FileNode,
+    CommitInfo,
+    ContributorInfo,
+    RepoChangeSet,
+    RepoStructure,
+)
+from .github_data_fetcher import GitHubDataFetcher
+
+
+class RepoDiffPatcher:
+    """
+    Patches a RepoStructure with the diff between two commits.
+    
+    Input is the raw JSON of GET /repos/{owner}/{repo}/compare/{base}...{head}
+    (one API call), which lists new commits and changed files.
+    
+    What is patched:
+    - files: added/removed/renamed/modified entries, parent directories
+    - commits: new commits prepended (capped at MAX_COMMITS)
+    - contributors: commit counts of known contributors bumped
+    
+    File sizes:
+    - The compare API has no blob sizes, only added/deleted lines and
+      the new blob SHA, so the caller passes blob sizes looked up by
+      SHA (blob store, refreshed Git tree)
+    - Only blobs it could not size are estimated: adjusted by
+      RepoStructure.BYTES_PER_LINE per added/deleted line
+    
+    Example:
+        >>> patcher = RepoDiffPatcher()
+        >>> if patcher.can_patch(comparison.raw_data):
+        ...     structure, changes = patcher.apply(previous, comparison.raw_data)
+    """
+    
+    MAX_COMMITS = GitHubDataFetcher.MAX_COMMITS
+    
+    # Compare responses list at most this many files / commits
+    MAX_COMPARE_FILES = 300
+    MAX_COMPARE_COMMITS = 250
+    
+    BYTES_PER_LINE = RepoStructure.BYTES_PER_LINE
+    
+    def can_patch(self, comparison: dict) -> bool:
+        """
+        Check if a compare response is complete enough to patch from.
+        
+        Not patchable:
+        - base is not an ancestor of head (force push, branch reset)
+        - file or commit list truncated by GitHub
+        
+        Args:
+            comparison: Raw compare response
+        
+        Returns:
+            True if apply() gives an exact file list
+        """
+        if comparison.get('status') not in ('ahead', 'identical'):
+            return False
+        
+        files = comparison.get('files', [])
+        commits = comparison.get('commits', [])
+        
+        return (
+            len(files) < self.MAX_COMPARE_FILES
+            and len(commits) == comparison.get('total_commits', len(commits))
+            and len(commits) < self.MAX_COMPARE_COMMITS
+        )
+    
+    def apply(
+        self,
+        structure: RepoStructure,
+        comparison: dict,
+        blob_sizes: Optional[dict[str, int]] = None
+    ) -> tuple[RepoStructure, RepoChangeSet]:
+        """
+        Apply a compare response to a stored structure.
+        
+        The input structure is not modified.
+        
+        Args:
+            structure: Structure at the base commit
+            comparison: Raw compare response (base...head)
+            blob_sizes: Exact sizes of changed blobs by SHA (blobs not
+                listed get a line-based estimate)
+        
+        Returns:
+            Tuple of (patched structure, change set)
+        """
+        raw_commits = comparison.get('commits', [])
+        head_sha = raw_commits[-1]['sha'] if raw_commits else structure.head_sha
+        
+        changes = RepoChangeSet(
+            base_sha=structure.head_sha,
+            head_sha=head_sha,
+            new_commits=len(raw_commits),
+        )
+        
+        files = self._patch_files(structure.files, comparison.get('files', []), changes, blob_sizes or {})
+        commits = self._patch_commits(structure.commits, raw_commits)
+        contributors = self._patch_contributors(structure.contributors, raw_commits)
+        
+        patched = replace(
+            structure,
+            files=files,
+            commits=commits,
+            contributors=contributors,
+            head_sha=head_sha,
+            file_contents={},
+        )
+        return patched, changes
+    
+    def new_contributor_logins(self, structure: RepoStructure, comparison: dict) -> set[str]:
+        """
+        Find commit authors not yet in the contributor list.
+        
+        Args:
+            structure: Structure at the base commit
+            comparison: Raw compare response
+        
+        Returns:
+            GitHub logins of first-time contributors
+        """
+        known = {c.username for c in structure.contributors}
+        logins = {
+            (commit.get('author') or {}).get('login')
+            for commit in comparison.get('commits', [])
+        }
+        return {login for login in logins if login and login not in known}
+    
+    def _patch_files(
+        self,
+        previous: list[FileNode],
+        diff_files: list[dict],
+        changes: RepoChangeSet,
+        blob_sizes: dict[str, int]
+    ) -> list[FileNode]:
+        """Apply file changes and keep parent directories consistent."""
+        nodes = {node.path: node for node in previous}
+        vacated: set[str] = set()
+        
+        for entry in diff_files:
+            path = entry['filename']
+            status = entry.get('status')
+            exact = blob_sizes.get(entry.get('sha'))
+            delta = (entry.get('additions', 0) - entry.get('deletions', 0)) * self.BYTES_PER_LINE
+            
+            if status == 'removed':
+                if nodes.pop(path, None) is not None:
+                    changes.removed.append(path)
+                    vacated.add(path)
+                continue
+            
+            if status == 'renamed':
+                old_path = entry.get('previous_filename', path)
+                old = nodes.pop(old_path, None)
+                vacated.add(old_path)
+                if exact is not None:
+                    size = exact
+                elif old is not None:
+                    size = max((old.size or 0) + delta, 0)
+                else:
+                    size = entry.get('additions', 0) * self.BYTES_PER_LINE
+                changes.renamed.append((old_path, path))
+                self._put_file(nodes, path, size, entry.get('sha'))
+                continue
+            
+            old = nodes.get(path)
+            if old is None or status in ('added', 'copied'):
+                size = exact if exact is not None else entry.get('additions', 0) * self.BYTES_PER_LINE
+                if self._put_file(nodes, path, size, entry.get('sha')):
+                    changes.added.append(path)
+            else:
+                size = exact if exact is not None else max((old.size or 0) + delta, 0)
+                nodes[path] = replace(old, size=size, sha=entry.get('sha'))
+                changes.modified.append(path)
+        
+        self._drop_empty_directories(nodes, vacated)
+        return list(nodes.values())
+    
+    def _put_file(
+        self,
+        nodes: dict[str, FileNode],
+        path: str,
+        size: int,
+        sha: Optional[str]
+    ) -> bool:
+        """Add or replace a file node and its parent directories."""
+        if GitHubDataFetcher.should_exclude_path(path):
+            return False
+        
+        parts = path.split('/')
+        for depth in range(1, len(parts)):
+            directory = '/'.join(parts[:depth])
+            if directory not in nodes:
+                nodes[directory] = FileNode(path=directory, name=parts[depth - 1], type='dir')
+        
+        name = parts[-1]
+        extension = "." + name.rsplit(".", 1)[1] if "." in name else None
+        nodes[path] = FileNode(
+            path=path,
+            name=name,
+            type='file',
+            size=size,
+            extension=extension,
+            sha=sha,
+        )
+        return True
+    
+    @staticmethod
+    def _drop_empty_directories(nodes: dict[str, FileNode], vacated: set[str]) -> None:
+        """Remove ancestor directories of removed files that became empty."""
+        if not vacated:
+            return
+        
+        occupied: set[str] = set()
+        for path in nodes:
+            parts = path.split('/')
+            occupied.update('/'.join(parts[:depth]) for depth in range(1, len(parts)))
+        
+        for path in vacated:
+            parts = path.split('/')
+            for depth in range(1, len(parts)):
+                directory = '/'.join(parts[:depth])
+                if directory not in occupied:
+                    nodes.pop(directory, None)
+    
+    def _patch_commits(
+        self,
+        previous: list[CommitInfo],
+        raw_commits: list[dict]
+    ) -> list[CommitInfo]:
+        """Prepend new commits (compare lists them oldest first)."""
+        known = {commit.sha for commit in previous}
+        new = [
+            GitHubDataFetcher.commit_from_raw(raw)
+            for raw in reversed(raw_commits)
+            if raw['sha'] not in known
+        ]
+        return (new + previous)[:self.MAX_COMMITS]
+    
+    @staticmethod
+    def _patch_contributors(
+        previous: list[ContributorInfo],
+        raw_commits: list[dict]
+    ) -> list[ContributorInfo]:
+        """Bump commit counts of known contributors."""
+        counts: dict[str, int] = {}
+        for raw in raw_commits:
+            login = (raw.get('author') or {}).get('login')
+            if login:
+                counts[login] = counts.get(login, 0) + 1
+        
+        contributors = [
+            replace(c, commit_count=c.commit_count + counts.get(c.username, 0))
+            for c in previous
+        ]
+        contributors.sort(key=lambda c: c.commit_count, reverse=True)
+        return contributors
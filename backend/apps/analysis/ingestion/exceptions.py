@@ -27,3 +27,21 @@ class InvalidRepoUrlError(RepoIngestionError):
 class RepoAccessError(RepoIngestionError):
     """Raised when repository is not accessible (private, deleted, etc)."""
     pass
+
+
+class RepoNotFoundError(RepoAccessError):
+    """Raised when GitHub answers 404 (missing, or private to this token)."""
+    pass
+
+
+class IngestionDeferredError(RepoAccessError):
+    """
+    Raised when the remaining API budget cannot cover an ingestion.
+    
+    Attributes:
+        retry_after: Seconds until the rate limit resets
+    """
+    
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -8,12 +8,15 @@ Dependencies: PyGithub
 External Calls: GitHub REST API
 """
 
-from github import Github, GithubException, UnknownObjectException
+from github import GithubException, RateLimitExceededException, UnknownObjectException
 from github.Repository import Repository
 from typing import Optional
 import os
 
-from .exceptions import RepoAccessError, RepoIngestionError
+from .cassette import Cassette
+from .exceptions import RepoAccessError, RepoIngestionError, RepoNotFoundError
+from .session_pool import GitHubSessionPool, get_session_pool
+from .token_pool import TokenPool, get_token_pool
 
 
 class GitHubClient:
@@ -25,6 +28,10 @@ class GitHubClient:
     - Repository retrieval
     - Access verification
     - Rate limit management (implicit via PyGithub)
+    - Conditional requests (ETag cache, 304s are free)
+    - Connection reuse (shared session pool)
+    - Token rotation (when several tokens are configured)
+    - Record/replay of responses (cassettes, for offline benchmarks)
     
     Example:
         >>> client = GitHubClient()
@@ -33,24 +40,57 @@ class GitHubClient:
         'django/django'
     """
     
-    def __init__(self, github_token: Optional[str] = None):
+    PAGE_SIZE = GitHubSessionPool.PAGE_SIZE
+    
+    def __init__(
+        self,
+        github_token: Optional[str] = None,
+        pool: Optional[GitHubSessionPool] = None,
+        token_pool: Optional[TokenPool] = None,
+        cassette: Optional[Cassette] = None
+    ):
         """
         Initialize GitHub API client.
         
+        The underlying PyGithub client comes from a process-wide pool,
+        so clients created per request still reuse keep-alive connections
+        and the ETag cache.
+        
         Args:
             github_token: Optional GitHub personal access token
+            pool: Session pool (defaults to the shared pool from settings)
+            token_pool: Tokens to rotate through (defaults to
+                GITHUB_ACCESS_TOKENS from settings)
+            cassette: Record every response to, or replay them from,
+                a cassette (a dedicated client without ETag cache or
+                token rotation)
             
         Rate Limits:
         - Without token: 60 requests/hour
         - With token: 5,000 requests/hour
+        - With N pooled tokens: N × 5,000 requests/hour
+        
+        A token that is not part of the token pool (e.g. supplied by
+        a user) gets its own client and is never rotated.
         """
         token = github_token or os.getenv('GITHUB_TOKEN')
         
-        if token:
-            self.github = Github(token)
+        self.pool = pool or get_session_pool()
+        self.token_pool = token_pool or get_token_pool()
+        self.cache = self.pool.cache
+        
+        self.rotating = (
+            cassette is None
+            and self.token_pool is not None
+            and (not token or token in self.token_pool)
+        )
+        
+        if cassette is not None:
+            self.github = self.pool.get_cassette(cassette, token)
+        elif self.rotating:
+            self.github = self.pool.get_rotating(self.token_pool)
         else:
-            # Anonymous access (limited, use only for testing)
-            self.github = Github()
+            self.github = self.pool.get(token)
     
     def get_repository(self, owner: str, repo_name: str) -> Repository:
         """
@@ -64,7 +104,8 @@ class GitHubClient:
             GitHub repository object
             
         Raises:
-            RepoAccessError: If repository not found or not accessible
+            RepoNotFoundError: If repository not found or not accessible
+            RepoAccessError: If the rate limit is exhausted
             RepoIngestionError: For other GitHub API errors
             
         Example:
@@ -82,15 +123,21 @@ class GitHubClient:
             return repo
             
         except UnknownObjectException:
-            raise RepoAccessError(
+            raise RepoNotFoundError(
                 f"Repository '{owner}/{repo_name}' not found or not accessible. "
                 "It may be private, deleted, or the URL may be incorrect."
             )
+        except RateLimitExceededException:
+            # Raised only after RetryLayer gave up (reset too far away)
+            raise RepoAccessError(
+                "GitHub API rate limit exceeded. "
+                "Please wait or provide an authentication token."
+            )
         except GithubException as e:
             if e.status == 403:
                 raise RepoAccessError(
-                    "GitHub API rate limit exceeded. "
-                    "Please wait or provide an authentication token."
+                    f"Access to repository '{owner}/{repo_name}' is forbidden: "
+                    f"{e.data.get('message', str(e))}"
                 )
             raise RepoIngestionError(
                 f"Failed to access repository: {e.data.get('message', str(e))}"
@@ -100,6 +147,9 @@ class GitHubClient:
         """
         Check current GitHub API rate limit status.
         
+        With token rotation the budget of all pooled tokens is summed
+        (the rate limit call itself refreshes the token it used).
+        
         Returns:
             Dictionary with rate limit information:
             - remaining: Requests remaining
@@ -112,7 +162,18 @@ class GitHubClient:
             >>> print(f"Remaining: {limits['remaining']}/{limits['limit']}")
         """
         rate_limit = self.github.get_rate_limit()
-        core_limit = rate_limit.core
+        core_limit = rate_limit.resources.core
+        
+        if self.rotating:
+            tokens = self.token_pool.stats()
+            return {
+                'remaining': sum(t['remaining'] for t in tokens),
+                'limit': sum(t['limit'] for t in tokens),
+                'reset': min(
+                    (t['reset'] for t in tokens if t['reset']),
+                    default=core_limit.reset.timestamp(),
+                ),
+            }
         
         return {
             'remaining': core_limit.remaining,
@@ -4,10 +4,18 @@ GitHub data fetcher.
 Fetches specific types of data from GitHub repositories.
 
 Layer: Analysis Layer
-Dependencies: PyGithub, data classes
+Dependencies: PyGithub, ParallelPaginatedFetcher, BreadthFirstTreeWalker,
+              data classes
 """
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional
+
 from github import GithubException
+from github.GitTree import GitTree
+from github.GitTreeElement import GitTreeElement
 from github.Repository import Repository
 
 from apps.analysis.data_classes import (
@@ -15,6 +23,11 @@ from apps.analysis.data_classes import (
     CommitInfo,
     ContributorInfo,
 )
+from .paginated_fetcher import ParallelPaginatedFetcher
+from .tree_walker import BreadthFirstTreeWalker, SubtreeTask, TreeWalkResult
+
+
+logger = logging.getLogger(__name__)
 
 
 class GitHubDataFetcher:
@@ -32,7 +45,11 @@ class GitHubDataFetcher:
     """
     
     MAX_COMMITS = 100  # Limit commit history
+    MAX_CONTRIBUTORS = 1000  # Top contributors kept (10 pages of 100)
+    MAX_COMMIT_DETAIL_CALLS = 30  # Default budget for enrich_commit_files()
+    MAX_ENRICHMENT_WORKERS = 8  # Concurrent commit detail requests
     MAX_FILE_DEPTH = 10  # Prevent infinite recursion
+    MAX_TREE_WORKERS = 8  # Concurrent directory listings per tree level
     
     # Files/directories to exclude from analysis (generated/build artifacts)
     EXCLUDED_PATHS = {
@@ -65,6 +82,36 @@ class GitHubDataFetcher:
         'Cargo.lock',
     }
     
+    # Git tree entry type -> FileNode type
+    TREE_ENTRY_TYPES = {
+        'blob': 'file',
+        'tree': 'dir',
+    }
+    
+    # Contents API type -> git tree entry type (submodules are dropped)
+    CONTENT_ENTRY_TYPES = {
+        'file': 'blob',
+        'symlink': 'blob',
+        'dir': 'tree',
+        'submodule': 'commit',
+    }
+    
+    def __init__(
+        self,
+        pages: Optional[ParallelPaginatedFetcher] = None,
+        max_tree_requests: Optional[int] = None
+    ):
+        """
+        Initialize data fetcher.
+        
+        Args:
+            pages: Paginated list fetcher for commits and contributors
+            max_tree_requests: Directory listing budget per tree walk
+                (None for no limit)
+        """
+        self.pages = pages or ParallelPaginatedFetcher()
+        self.max_tree_requests = max_tree_requests
+    
     @staticmethod
     def should_exclude_path(path: str) -> bool:
         """
@@ -97,11 +144,11 @@ class GitHubDataFetcher:
         depth: int = 0
     ) -> list[FileNode]:
         """
-        Recursively fetch complete file tree structure.
+        Fetch complete file tree structure with the contents API.
         
-        Why recursive?
-        - GitHub API returns one directory level at a time
-        - Must traverse directories to build complete tree
+        GitHub returns one directory level per request, so every
+        directory costs a request. Levels are listed breadth-first,
+        each level concurrently (see walk_contents_tree).
         
         Why depth limit?
         - Prevents infinite loops
@@ -110,134 +157,485 @@ class GitHubDataFetcher:
         
         Args:
             repo: GitHub repository object
-            path: Current path (for recursion)
-            depth: Current recursion depth
+            path: Directory to start from ("" for root)
+            depth: Depth of that directory
             
         Returns:
-            List of all  files and directories
+            List of all files and directories
         """
-        if depth > self.MAX_FILE_DEPTH:
-            return []
-        
-        files: list[FileNode] = []
+        return self._report(self.walk_contents_tree(repo, path, depth)).files
+    
+    def walk_contents_tree(
+        self,
+        repo: Repository,
+        path: str = "",
+        depth: int = 0
+    ) -> TreeWalkResult:
+        """
+        Walk the contents API tree breadth-first.
         
-        try:
-            contents = repo.get_contents(path)
+        Args:
+            repo: GitHub repository object
+            path: Directory to start from ("" for root)
+            depth: Depth of that directory
+            
+        Returns:
+            Walk result, including subtrees skipped by the depth or
+            request budget
+        """
+        def list_directory(task: SubtreeTask) -> tuple[list[FileNode], list[SubtreeTask]]:
+            contents = repo.get_contents(task.ref)
             
             # Handle single file or list
             if not isinstance(contents, list):
                 contents = [contents]
             
+            nodes = []
             for content in contents:
-                # Skip excluded paths (generated files, build artifacts)
-                if self.should_exclude_path(content.path):
-                    continue
-                
-                # Extract extension
-                extension = None
-                if content.type == "file" and "." in content.name:
-                    extension = "." + content.name.rsplit(".", 1)[1]
-                
-                # Create node
-                node = FileNode(
-                    path=content.path,
-                    name=content.name,
-                    type=content.type,
-                    size=content.size if content.type == "file" else None,
-                    extension=extension,
+                node = self.tree_entry_to_node(
+                    content.path,
+                    self.CONTENT_ENTRY_TYPES.get(content.type, content.type),
+                    content.sha,
+                    content.size,
                 )
-                
-                files.append(node)
-                
-                # Recurse into directories
-                if content.type == "dir":
-                    subdirectory_files = self.fetch_file_tree(
-                        repo,
-                        path=content.path,
-                        depth=depth + 1
-                    )
-                    files.extend(subdirectory_files)
+                if node is not None:
+                    nodes.append(node)
+            
+            children = [
+                SubtreeTask(node.path, node.path, task.depth + 1)
+                for node in nodes if node.is_directory()
+            ]
+            return nodes, children
+        
+        return self._walker().walk([SubtreeTask(path, path, depth)], list_directory)
+    
+    def fetch_file_tree_recursive(
+        self,
+        repo: Repository,
+        ref: Optional[str] = None,
+        tree: Optional[GitTree] = None
+    ) -> list[FileNode]:
+        """
+        Fetch complete file tree with a single recursive Git Trees API call.
+        
+        Why Git Trees API?
+        - One request returns every path on the branch
+        - fetch_file_tree() costs one request per directory
+        - Tree entries carry the blob SHA for free
+        
+        Truncation:
+        - GitHub truncates recursive trees above ~100,000 entries / 7 MB
+        - Truncated trees are re-fetched subtree by subtree
+          (see _fetch_truncated_tree)
+        
+        Args:
+            repo: GitHub repository object
+            ref: Branch, tag or tree SHA (defaults to repo.default_branch)
+            tree: Recursive tree of ref already fetched (e.g. by the
+                pre-flight probe); saves the call
+            
+        Returns:
+            List of all files and directories (same filtering as fetch_file_tree)
+        """
+        ref = ref or repo.default_branch
+        
+        try:
+            if tree is None:
+                tree = repo.get_git_tree(ref, recursive=True)
+        except GithubException as e:
+            logger.warning(f"Failed to fetch git tree for '{ref}': {e}")
+            return self.fetch_file_tree(repo)
+        
+        if tree.truncated:
+            logger.warning(
+                f"Git tree for '{ref}' is truncated, "
+                "fetching subtrees individually"
+            )
+            return self._fetch_truncated_tree(repo, tree.sha)
+        
+        return self._build_nodes_from_tree(tree.tree)
+    
+    def fetch_file_tree_sampled(
+        self,
+        repo: Repository,
+        ref: Optional[str] = None,
+        tree: Optional[GitTree] = None
+    ) -> list[FileNode]:
+        """
+        Fetch the file tree with exactly one recursive Git Trees API call.
+        
+        Unlike fetch_file_tree_recursive(), a truncated response is kept
+        as returned (about the first 100,000 entries) instead of being
+        completed subtree by subtree. Used for repositories too large to
+        list completely within the analysis time budget.
+        
+        Args:
+            repo: GitHub repository object
+            ref: Branch, tag or tree SHA (defaults to repo.default_branch)
+            tree: Recursive tree of ref already fetched (e.g. by the
+                pre-flight probe); saves the call
+            
+        Returns:
+            List of files and directories (possibly a partial listing)
+        """
+        ref = ref or repo.default_branch
         
+        try:
+            if tree is None:
+                tree = repo.get_git_tree(ref, recursive=True)
         except GithubException as e:
-            print(f"Warning: Failed to fetch path '{path}': {e}")
+            logger.warning(f"Failed to fetch git tree for '{ref}': {e}")
+            return []
+        
+        if tree.truncated:
+            logger.warning(
+                f"Git tree for '{ref}' is truncated, "
+                f"analysing the {len(tree.tree)} entries returned"
+            )
+        
+        return self._build_nodes_from_tree(tree.tree)
+    
+    def _fetch_truncated_tree(self, repo: Repository, tree_sha: str) -> list[FileNode]:
+        """
+        Fallback for truncated recursive trees.
+        
+        Lists the root level non-recursively, then requests each
+        subdirectory recursively. Only subtrees that are themselves
+        truncated are split further, so the request count grows with
+        the number of oversized directories, not the number of directories.
+        
+        Args:
+            repo: GitHub repository object
+            tree_sha: SHA of the root tree
+            
+        Returns:
+            List of all files and directories
+        """
+        return self._report(self.walk_git_tree(repo, tree_sha, split=True)).files
+    
+    def walk_git_tree(
+        self,
+        repo: Repository,
+        tree_sha: str,
+        split: bool = False
+    ) -> TreeWalkResult:
+        """
+        Walk a git tree breadth-first, splitting truncated subtrees.
+        
+        Each subtree is first requested recursively; a truncated one is
+        queued again to be listed one level deep (a request of its own,
+        counted against the budget) and its subdirectories are queued
+        for the level after. Sibling subtrees are requested concurrently.
+        
+        Args:
+            repo: GitHub repository object
+            tree_sha: SHA (or ref) of the tree to walk
+            split: The tree is known to be truncated (skip the recursive try)
+            
+        Returns:
+            Walk result, including subtrees skipped by the depth or
+            request budget
+        """
+        def list_subtree(task: SubtreeTask) -> tuple[list[FileNode], list[SubtreeTask]]:
+            prefix = task.path + "/" if task.path else ""
+            
+            if not task.split:
+                tree = repo.get_git_tree(task.ref, recursive=True)
+                if tree.truncated:
+                    return [], [SubtreeTask(task.path, task.ref, task.depth, split=True)]
+                return self._build_nodes_from_tree(tree.tree, prefix), []
+            
+            tree = repo.get_git_tree(task.ref)
+            nodes: list[FileNode] = []
+            children: list[SubtreeTask] = []
+            
+            for element in tree.tree:
+                node = self._tree_element_to_node(element, prefix + element.path)
+                if node is None:
+                    continue
+                
+                nodes.append(node)
+                if node.is_directory():
+                    children.append(SubtreeTask(node.path, element.sha, task.depth + 1))
+            
+            return nodes, children
+        
+        return self._walker().walk([SubtreeTask("", tree_sha, split=split)], list_subtree)
+    
+    def _walker(self) -> BreadthFirstTreeWalker:
+        """Create a tree walker with the fetcher's limits."""
+        return BreadthFirstTreeWalker(
+            max_depth=self.MAX_FILE_DEPTH,
+            max_requests=self.max_tree_requests,
+            max_workers=self.MAX_TREE_WORKERS,
+            exclude=self.should_exclude_path,
+        )
+    
+    @staticmethod
+    def _report(result: TreeWalkResult) -> TreeWalkResult:
+        """Warn about subtrees missing from a walk result."""
+        budget_skipped = [s.path for s in result.skipped if s.reason != "error"]
+        if budget_skipped:
+            logger.warning(
+                f"File tree incomplete, {len(budget_skipped)} subtrees "
+                f"skipped by depth/request limits: {', '.join(budget_skipped[:10])}"
+            )
+        return result
+    
+    def _build_nodes_from_tree(
+        self,
+        elements: list[GitTreeElement],
+        prefix: str = ""
+    ) -> list[FileNode]:
+        """
+        Convert Git tree entries into FileNodes.
+        
+        Args:
+            elements: Entries of a (recursive) git tree
+            prefix: Path prefix to prepend to each entry path
+            
+        Returns:
+            List of FileNodes with excluded paths removed
+        """
+        files: list[FileNode] = []
+        
+        for element in elements:
+            node = self._tree_element_to_node(element, prefix + element.path)
+            if node is not None:
+                files.append(node)
         
         return files
     
+    def _tree_element_to_node(
+        self,
+        element: GitTreeElement,
+        path: str
+    ) -> Optional[FileNode]:
+        """
+        Convert a single Git tree entry into a FileNode.
+        
+        Args:
+            element: Git tree entry ("blob", "tree" or "commit")
+            path: Full path of the entry from repo root
+            
+        Returns:
+            FileNode, or None for excluded paths and submodules
+        """
+        return self.tree_entry_to_node(path, element.type, element.sha, element.size)
+    
+    def tree_entry_to_node(
+        self,
+        path: str,
+        entry_type: str,
+        sha: Optional[str],
+        size: Optional[int]
+    ) -> Optional[FileNode]:
+        """
+        Convert Git tree entry fields into a FileNode.
+        
+        Shared by the PyGithub and raw JSON (async) code paths.
+        
+        Args:
+            path: Full path of the entry from repo root
+            entry_type: "blob", "tree" or "commit"
+            sha: Git object SHA
+            size: Blob size in bytes (None for trees)
+            
+        Returns:
+            FileNode, or None for excluded paths and submodules
+        """
+        # Submodules ("commit" entries) point into other repositories
+        if entry_type not in self.TREE_ENTRY_TYPES:
+            return None
+        
+        if self.should_exclude_path(path):
+            return None
+        
+        node_type = self.TREE_ENTRY_TYPES[entry_type]
+        name = path.rsplit("/", 1)[-1]
+        
+        extension = None
+        if node_type == "file" and "." in name:
+            extension = "." + name.rsplit(".", 1)[1]
+        
+        return FileNode(
+            path=path,
+            name=name,
+            type=node_type,
+            size=size if node_type == "file" else None,
+            extension=extension,
+            sha=sha,
+        )
+    
+    @staticmethod
+    def commit_from_raw(raw: dict) -> CommitInfo:
+        """
+        Build CommitInfo from a raw commit JSON object.
+        
+        Accepts entries of the commit list and compare endpoints.
+        
+        Args:
+            raw: Commit JSON ({"sha": ..., "commit": {"message", "author"}})
+            
+        Returns:
+            CommitInfo (files_changed unset)
+        """
+        author = raw['commit']['author'] or {}
+        return CommitInfo(
+            sha=raw['sha'],
+            message=raw['commit']['message'].split('\n')[0],
+            author=author.get('name') or "Unknown",
+            author_email=author.get('email') or "",
+            date=datetime.fromisoformat(author['date'].replace('Z', '+00:00')),
+        )
+    
     def fetch_commits(self, repo: Repository) -> list[CommitInfo]:
         """
         Fetch recent commit history.
         
         Why limit commits?
         - Large repos have 100K+ commits
-        - Each commit = API request
         - Recent commits more relevant
         
+        Why no files_changed?
+        - The commit list response has no file data
+        - Reading commit.files makes PyGithub fetch the full commit,
+          i.e. one extra API call per commit
+        - Use enrich_commit_files() to fill it in under a call budget
+        
+        With a page size of 100, MAX_COMMITS commits cost a single
+        API call.
+        
         Args:
             repo: GitHub repository object
             
         Returns:
-            List of recent commits (up to MAX_COMMITS)
+            List of recent commits (up to MAX_COMMITS), files_changed unset
         """
-        commits: list[CommitInfo] = []
-        
         try:
-            commit_iterator = repo.get_commits()
+            return [
+                self.commit_from_raw(raw)
+                for raw in self.pages.fetch(repo, "commits", max_items=self.MAX_COMMITS)
+            ]
+        except GithubException as e:
+            logger.warning(f"Failed to fetch commits: {e}")
+            return []
+    
+    def enrich_commit_files(
+        self,
+        repo: Repository,
+        commits: list[CommitInfo],
+        max_calls: int = MAX_COMMIT_DETAIL_CALLS,
+        max_workers: int = MAX_ENRICHMENT_WORKERS
+    ) -> int:
+        """
+        Fill in CommitInfo.files_changed from per-commit detail requests.
+        
+        Opt-in stage: costs one API call per commit, so it is bounded
+        by max_calls and runs the requests on a small thread pool.
+        Commits are enriched newest first; the rest keep files_changed=None.
+        
+        Note: GitHub lists at most 300 files per commit detail response,
+        so larger commits are reported as 300.
+        
+        Args:
+            repo: GitHub repository object
+            commits: Commits from fetch_commits() (updated in place)
+            max_calls: Maximum number of detail requests to issue
+            max_workers: Maximum number of concurrent requests
             
-            for i, commit in enumerate(commit_iterator):
-                if i >= self.MAX_COMMITS:
-                    break
-                
-                # Handle PaginatedList from PyGithub 2.x
-                files_count = None
-                if commit.files:
-                    try:
-                        files_count = len(list(commit.files))
-                    except Exception:
-                        files_count = commit.files.totalCount if hasattr(commit.files, 'totalCount') else None
-                
-                commit_info = CommitInfo(
-                    sha=commit.sha,
-                    message=commit.commit.message.split('\n')[0],
-                    author=commit.commit.author.name or "Unknown",
-                    author_email=commit.commit.author.email or "",
-                    date=commit.commit.author.date,
-                    files_changed=files_count,
-                )
-                
-                commits.append(commit_info)
+        Returns:
+            Number of API calls made
+        """
+        targets = [c for c in commits if c.files_changed is None][:max(max_calls, 0)]
         
-        except GithubException as e:
-            print(f"Warning: Failed to fetch commits: {e}")
+        if not targets:
+            return 0
+        
+        def fetch_files_changed(commit_info: CommitInfo) -> None:
+            try:
+                detail = repo.get_commit(commit_info.sha)
+                commit_info.files_changed = len(detail.raw_data.get('files', []))
+            except GithubException as e:
+                logger.warning(f"Failed to fetch commit '{commit_info.get_short_sha()}': {e}")
+        
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="commit-enrichment",
+        ) as executor:
+            list(executor.map(fetch_files_changed, targets))
         
-        return commits
+        return len(targets)
     
-    def fetch_contributors(self, repo: Repository) -> list[ContributorInfo]:
+    def fetch_contributors(
+        self,
+        repo: Repository,
+        max_profiles: Optional[int] = None,
+        max_workers: int = MAX_ENRICHMENT_WORKERS
+    ) -> list[ContributorInfo]:
         """
         Fetch repository contributors with statistics.
         
+        The contributor list pages are fetched in parallel and capped at
+        MAX_CONTRIBUTORS (GitHub lists them by contribution count, so the
+        cap drops the long tail).
+        
+        The list does not include name and email, so each profile costs
+        one extra API call (/users/{login}); lookups run on a small
+        thread pool.
+        
         Args:
             repo: GitHub repository object
+            max_profiles: Maximum profile lookups (None, the default,
+                for all); the remaining contributors get name=None and
+                no email, and the cut is logged
+            max_workers: Maximum concurrent profile lookups
             
         Returns:
             List of contributors sorted by contribution count
         """
-        contributors: list[ContributorInfo] = []
-        
         try:
-            for contrib in repo.get_contributors():
-                contributor_info = ContributorInfo(
-                    username=contrib.login,
-                    name=contrib.name,
-                    email=contrib.email or "",
-                    commit_count=contrib.contributions,
+            raw_contributors = list(
+                self.pages.fetch(repo, "contributors", max_items=self.MAX_CONTRIBUTORS)
+            )
+        except GithubException as e:
+            logger.warning(f"Failed to fetch contributors: {e}")
+            return []
+        
+        with_profile = raw_contributors
+        if max_profiles is not None:
+            with_profile = raw_contributors[:max(max_profiles, 0)]
+            if len(with_profile) < len(raw_contributors):
+                logger.info(
+                    f"Contributor profiles limited to {len(with_profile)} of "
+                    f"{len(raw_contributors)}; the rest have no name or email"
                 )
-                
-                contributors.append(contributor_info)
         
-        except GithubException as e:
-            print(f"Warning: Failed to fetch contributors: {e}")
+        def fetch_profile(login: str) -> dict:
+            try:
+                return repo.requester.requestJsonAndCheck("GET", f"/users/{login}")[1]
+            except GithubException as e:
+                logger.warning(f"Failed to fetch profile '{login}': {e}")
+                return {}
+        
+        profiles: list[dict] = []
+        if with_profile:
+            with ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="contributor-profiles",
+            ) as executor:
+                profiles = list(executor.map(fetch_profile, [c['login'] for c in with_profile]))
+        profiles += [{}] * (len(raw_contributors) - len(profiles))
         
-        return contributors
+        return [
+            ContributorInfo(
+                username=raw['login'],
+                name=profile.get('name'),
+                email=profile.get('email') or "",
+                commit_count=raw['contributions'],
+            )
+            for raw, profile in zip(raw_contributors, profiles)
+        ]
     
     def fetch_languages(self, repo: Repository) -> dict[str, int]:
         """
@@ -257,5 +655,5 @@ class GitHubDataFetcher:
         try:
             return repo.get_languages()
         except GithubException as e:
-            print(f"Warning: Failed to fetch languages: {e}")
+            logger.warning(f"Failed to fetch languages: {e}")
             return {}
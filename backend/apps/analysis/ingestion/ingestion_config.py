@@ -0,0 +1,136 @@
+"""
+Ingestion configuration.
+
+Options and collaborators of RepoIngestionService, grouped so the
+service is built from one object instead of a long argument list.
+
+Layer: Analysis Layer
+Dependencies: BlobStore, ContentFetchPlanner, IngestionStrategySelector,
+              StratifiedFileSampler, Cassette
+"""
+
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from apps.analysis.data_classes import StratifiedFileSampler, get_file_sampler
+from .blob_store import BlobStore, get_blob_store
+from .cassette import Cassette
+from .content_planner import ContentFetchPlanner, get_content_planner
+from .cost_estimator import IngestionPlan
+from .strategy_selector import IngestionStrategySelector, get_strategy_selector
+
+
+@dataclass
+class IngestionConfig:
+    """
+    How RepoIngestionService fetches a repository, and with what.
+    
+    Why a config object?
+    - The service had grown one keyword argument per option and per
+      collaborator; callers now change only the fields they need
+    - Defaults for the shared collaborators (blob store, planners,
+      sampler) and the cassette rules live in one place, resolve()
+    
+    Attributes:
+        use_git_tree: Fetch the file tree with one recursive Git Trees
+            API call instead of one get_contents() call per directory
+        use_archive: Build the file tree from one streamed tarball
+            (falls back to the Git Trees API if the download fails)
+        include_contents: Keep file contents in
+            RepoStructure.file_contents (archive mode only; served from
+            the blob store instead of the tarball when it already holds
+            nearly all of them)
+        concurrent: Fetch files, commits, contributors and languages in
+            parallel on a bounded thread pool
+        commit_files_budget: Maximum per-commit detail requests used to
+            fill CommitInfo.files_changed (0 disables enrichment)
+        contributor_profiles: Maximum contributor profile lookups for
+            name/email (None for all)
+        preflight: Estimate the API cost before fetching and admit,
+            downgrade or defer against the remaining rate limit
+        fetch_contents: Fetch the contents of the files analyzers learn
+            most from, within the content planner's budgets (modes that
+            already carry contents skip this)
+        languages_api: Fetch language stats from GitHub's languages
+            endpoint instead of classifying the file tree locally
+        select_strategy: Choose tree, archive, partial clone or sampled
+            tree from the repository size (overrides
+            use_git_tree/use_archive; see IngestionStrategySelector)
+        cassette: Record GitHub API responses to, or replay them from, a
+            cassette. Archive downloads and clones are not recorded, so
+            a cassette forces the Git Trees mode (no strategy
+            selection), and contents go through a private in-memory blob
+            store instead of blob_store: a replay then makes exactly the
+            recorded requests
+        blob_store: Content-addressed store for file contents (defaults
+            to the shared store from settings)
+        content_planner: Picks the files to fetch (defaults to the
+            budgets from settings)
+        strategy_selector: Size and time limits for the strategy choice
+            (defaults to MAX_REPO_SIZE_MB / ANALYSIS_TIMEOUT_SECONDS)
+        file_sampler: Large repositories are analyzed on a stratified
+            file sample, so contents are only planned for sampled files
+            (defaults to the sample limits from settings)
+    
+    Example:
+        >>> config = IngestionConfig(preflight=False, commit_files_budget=10)
+        >>> service = RepoIngestionService(token, config)
+    """
+    use_git_tree: bool = True
+    use_archive: bool = False
+    include_contents: bool = False
+    concurrent: bool = True
+    commit_files_budget: int = 0
+    contributor_profiles: Optional[int] = None
+    preflight: bool = True
+    fetch_contents: bool = True
+    languages_api: bool = False
+    select_strategy: bool = True
+    cassette: Optional[Cassette] = None
+    blob_store: Optional[BlobStore] = None
+    content_planner: Optional[ContentFetchPlanner] = None
+    strategy_selector: Optional[IngestionStrategySelector] = None
+    file_sampler: Optional[StratifiedFileSampler] = None
+    
+    def resolve(self) -> 'IngestionConfig':
+        """
+        Fill in default collaborators and apply the cassette rules.
+        
+        Returns:
+            Copy with every collaborator set
+        """
+        config = self
+        if config.cassette is not None:
+            # What is fetched must not depend on the shared store's
+            # contents or on unrecorded transports
+            config = replace(
+                config,
+                blob_store=BlobStore(),
+                select_strategy=False,
+                use_git_tree=True,
+                use_archive=False,
+            )
+        
+        return replace(
+            config,
+            blob_store=config.blob_store or get_blob_store(),
+            content_planner=config.content_planner or get_content_planner(),
+            strategy_selector=config.strategy_selector or get_strategy_selector(),
+            file_sampler=config.file_sampler or get_file_sampler(),
+        )
+    
+    def plan(self) -> IngestionPlan:
+        """
+        Build the plan the cost estimator and fetchers work from.
+        
+        Returns:
+            Plan with the fetch options (call after resolve())
+        """
+        return IngestionPlan(
+            use_git_tree=self.use_git_tree,
+            use_archive=self.use_archive,
+            commit_files_budget=self.commit_files_budget,
+            contributor_profiles=self.contributor_profiles,
+            content_requests=self.content_planner.max_requests if self.fetch_contents else 0,
+            languages_api=self.languages_api,
+        )
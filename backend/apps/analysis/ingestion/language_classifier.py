@@ -0,0 +1,176 @@
+"""
+Local language classifier.
+
+Computes per-language byte counts from the file tree, like GitHub's
+languages endpoint but without the API call and for any subdirectory.
+
+Layer: Analysis Layer
+Dependencies: data classes
+"""
+
+import re
+from typing import Iterable, Optional
+
+from apps.analysis.data_classes import FileNode
+
+
+class LanguageClassifier:
+    """
+    Extension and filename based language statistics.
+    
+    Why local?
+    - The tree already carries every file's size and extension, so
+      repo.get_languages() is one API call for data we have
+    - The endpoint only covers the whole repository; local stats work
+      for any subdirectory (e.g. backend/ vs frontend/)
+    
+    Linguist-style rules:
+    - Only programming and markup languages are counted (data and
+      prose such as JSON, YAML and Markdown are not)
+    - Vendored, generated and documentation paths are excluded
+    
+    Lookup:
+    - Exact filenames (Dockerfile, Makefile) are checked first, then
+      the longest matching extension
+    - Exclusions are compiled into one regular expression
+    
+    Counts are exact for the files GitHub counts by extension;
+    ambiguous extensions (".h") use the most common language.
+    
+    Example:
+        >>> classifier = LanguageClassifier()
+        >>> classifier.language_bytes(repo.files)
+        {'Python': 412000, 'TypeScript': 98000}
+        >>> classifier.language_bytes(repo.files, path='frontend')
+        {'TypeScript': 98000}
+    """
+    
+    EXTENSIONS = {
+        '.py': 'Python', '.pyi': 'Python', '.pyx': 'Cython',
+        '.js': 'JavaScript', '.jsx': 'JavaScript', '.mjs': 'JavaScript', '.cjs': 'JavaScript',
+        '.ts': 'TypeScript', '.tsx': 'TypeScript', '.mts': 'TypeScript', '.cts': 'TypeScript',
+        '.java': 'Java', '.kt': 'Kotlin', '.kts': 'Kotlin', '.scala': 'Scala', '.groovy': 'Groovy',
+        '.go': 'Go', '.rs': 'Rust', '.rb': 'Ruby', '.php': 'PHP', '.cs': 'C#', '.fs': 'F#',
+        '.c': 'C', '.h': 'C', '.cc': 'C++', '.cpp': 'C++', '.cxx': 'C++', '.hpp': 'C++', '.hh': 'C++',
+        '.m': 'Objective-C', '.mm': 'Objective-C++', '.swift': 'Swift', '.dart': 'Dart',
+        '.ex': 'Elixir', '.exs': 'Elixir', '.erl': 'Erlang', '.hs': 'Haskell', '.clj': 'Clojure',
+        '.lua': 'Lua', '.pl': 'Perl', '.r': 'R', '.jl': 'Julia', '.zig': 'Zig', '.nim': 'Nim',
+        '.sh': 'Shell', '.bash': 'Shell', '.zsh': 'Shell', '.ps1': 'PowerShell', '.bat': 'Batchfile',
+        '.html': 'HTML', '.htm': 'HTML', '.css': 'CSS', '.scss': 'SCSS',
+        '.sass': 'Sass', '.less': 'Less', '.vue': 'Vue', '.svelte': 'Svelte', '.astro': 'Astro',
+        '.tf': 'HCL', '.hcl': 'HCL', '.ipynb': 'Jupyter Notebook', '.sol': 'Solidity',
+    }
+    
+    FILENAMES = {
+        'dockerfile': 'Dockerfile', 'containerfile': 'Dockerfile',
+        'makefile': 'Makefile', 'gnumakefile': 'Makefile',
+        'rakefile': 'Ruby', 'gemfile': 'Ruby', 'vagrantfile': 'Ruby',
+        'cmakelists.txt': 'CMake', 'jenkinsfile': 'Groovy',
+    }
+    
+    # Linguist vendor.yml / generated / documentation rules (subset)
+    EXCLUDED_PATTERNS = (
+        r'(^|/)(node_modules|bower_components|vendor|vendors|third[_-]party|deps)/',
+        r'(^|/)(dist|build|out|target|coverage|\.next|\.nuxt|__pycache__)/',
+        r'(^|/)(\.venv|venv|env|site-packages)/',
+        r'(^|/)(docs?|documentation|examples?)/',
+        r'(^|/)\.[^/]+/',
+        r'\.min\.(js|css)$',
+        r'\.(bundle|chunk)\.js$',
+        r'\.d\.ts$',
+        r'(_pb2(_grpc)?\.py|\.pb\.go|\.pb\.(cc|h))$',
+        r'(^|/)(package-lock\.json|yarn\.lock|pnpm-lock\.yaml|poetry\.lock)$',
+        r'(^|/)(jquery|bootstrap)[^/]*\.js$',
+    )
+    
+    def __init__(self):
+        """Compile the exclusion rules."""
+        self._excluded = re.compile('|'.join(f'(?:{p})' for p in self.EXCLUDED_PATTERNS), re.IGNORECASE)
+    
+    def is_excluded(self, path: str) -> bool:
+        """Check if a path is vendored, generated or documentation."""
+        return self._excluded.search(path) is not None
+    
+    def classify(self, node: FileNode) -> Optional[str]:
+        """
+        Get the language of a file.
+        
+        Args:
+            node: File node
+        
+        Returns:
+            Language name, or None if the file is not counted
+        """
+        if not node.is_file() or self.is_excluded(node.path):
+            return None
+        
+        name = node.name.lower()
+        language = self.FILENAMES.get(name)
+        if language is not None:
+            return language
+        
+        # Try the longest extension first ("x.spec.ts": ".spec.ts", then ".ts")
+        dot = name.find('.', 1)
+        while dot != -1:
+            language = self.EXTENSIONS.get(name[dot:])
+            if language is not None:
+                return language
+            dot = name.find('.', dot + 1)
+        return None
+    
+    def language_bytes(self, files: Iterable[FileNode], path: Optional[str] = None) -> dict[str, int]:
+        """
+        Count bytes per language in one pass.
+        
+        Args:
+            files: Repository file nodes
+            path: Only count files under this directory (None for all)
+        
+        Returns:
+            Dictionary mapping language to byte count, largest first
+            (same shape as repo.get_languages())
+        """
+        prefix = path.strip('/') + '/' if path else ''
+        counts: dict[str, int] = {}
+        
+        for node in files:
+            if prefix and not node.path.startswith(prefix):
+                continue
+            language = self.classify(node)
+            if language is not None:
+                counts[language] = counts.get(language, 0) + (node.size or 0)
+        
+        return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+    
+    def language_bytes_by_directory(
+        self,
+        files: Iterable[FileNode],
+        depth: int = 1
+    ) -> dict[str, dict[str, int]]:
+        """
+        Count bytes per language for every directory at a depth, in one pass.
+        
+        Args:
+            files: Repository file nodes
+            depth: Directory depth to group by (1 for top-level directories)
+        
+        Returns:
+            Dictionary mapping directory path to language byte counts
+            (files above the depth are grouped under "")
+        """
+        by_directory: dict[str, dict[str, int]] = {}
+        
+        for node in files:
+            language = self.classify(node)
+            if language is None:
+                continue
+            
+            parts = node.path.split('/')[:-1]
+            directory = '/'.join(parts[:depth]) if len(parts) >= depth else ''
+            counts = by_directory.setdefault(directory, {})
+            counts[language] = counts.get(language, 0) + (node.size or 0)
+        
+        return {
+            directory: dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+            for directory, counts in sorted(by_directory.items())
+        }
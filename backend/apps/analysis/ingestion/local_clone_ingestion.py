@@ -0,0 +1,401 @@
+"""
+Local clone ingestion service.
+
+Builds RepoStructure from a partial clone instead of the GitHub REST API.
+
+Layer: Analysis Layer
+Dependencies: GitPython, git CLI, LanguageClassifier, data classes
+External Calls: git clone (no REST API calls)
+"""
+
+import base64
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from typing import Optional
+from urllib.parse import unquote, urlparse
+
+from git import Repo
+from git.exc import GitCommandError
+
+from apps.analysis.data_classes import (
+    FileNode,
+    CommitInfo,
+    ContributorInfo,
+    RepoStructure,
+)
+from .exceptions import RepoAccessError, RepoIngestionError
+from .github_data_fetcher import GitHubDataFetcher
+from .language_classifier import LanguageClassifier
+from .url_parser import GitHubUrlParser
+
+
+class LocalCloneIngestionService:
+    """
+    Alternative to RepoIngestionService backed by a local git clone.
+    
+    Why clone?
+    - One clone replaces per-directory and per-commit REST calls
+    - Git transport does not count against the REST rate limit
+    - Full history is available locally for commit analysis
+    
+    Why blobless?
+    - `--filter=blob:none` downloads commits and trees only
+    - Blobs are fetched for the checked-out HEAD, not for history
+    - Much smaller than a full clone for repos with long history
+    
+    Accepted sources:
+    - https://github.com/owner/repo (any format GitHubUrlParser accepts)
+    - file:///path/to/repo
+    - /path/to/repo (local working copy or bare repository)
+    
+    Local sources make the service usable offline for tests and benchmarks.
+    
+    The token never appears in the clone URL or the git command line:
+    it is sent as an HTTP header configured through the environment
+    (GIT_CONFIG_*), so it is neither visible in the process list nor
+    written to the clone's .git/config.
+    
+    Not available without the REST API (left at defaults):
+    - description, stars, forks, open_issues
+    
+    Languages are classified locally from the checked-out files
+    (LanguageClassifier); the primary language is the largest one.
+    
+    Example:
+        >>> service = LocalCloneIngestionService()
+        >>> repo = service.ingest_repository("https://github.com/django/django")
+        >>> print(f"Fetched {repo.get_total_files()} files")
+    """
+    
+    MAX_COMMITS = GitHubDataFetcher.MAX_COMMITS
+    
+    # Credentials are only sent to GitHub
+    GITHUB_ORIGIN = 'https://github.com/'
+    
+    # Field/record separators for `git log` output parsing
+    FIELD_SEPARATOR = '\x1f'
+    LOG_FORMAT = '%H%x1f%an%x1f%ae%x1f%aI%x1f%s'
+    
+    def __init__(
+        self,
+        github_token: Optional[str] = None,
+        blobless: bool = True,
+        shallow_depth: Optional[int] = None,
+        scratch_dir: Optional[str] = None
+    ):
+        """
+        Initialize local clone ingestion service.
+        
+        Args:
+            github_token: Optional GitHub token (needed for private repos)
+            blobless: Clone with --filter=blob:none (history without blobs)
+            shallow_depth: Clone with --depth N instead of full history.
+                Faster for huge histories, but created_at and contributor
+                counts then only reflect the last N commits.
+            scratch_dir: Parent directory for temporary clones
+                (defaults to the system temp directory)
+        """
+        self.url_parser = GitHubUrlParser()
+        self.language_classifier = LanguageClassifier()
+        self.github_token = github_token or os.getenv('GITHUB_TOKEN')
+        self.blobless = blobless
+        self.shallow_depth = shallow_depth
+        self.scratch_dir = scratch_dir
+    
+    def ingest_repository(self, repo_url: str) -> RepoStructure:
+        """
+        Clone repository into a scratch directory and build RepoStructure.
+        
+        Args:
+            repo_url: GitHub URL, file:// URL or local repository path
+        
+        Returns:
+            Repository structure built from the local checkout
+        
+        Raises:
+            InvalidRepoUrlError: If a GitHub URL is malformed
+            RepoAccessError: If the repository cannot be cloned
+            RepoIngestionError: For other git errors
+        
+        Flow:
+            Resolve source → Clone → Scan files → git log → Assemble → Cleanup
+        """
+        owner, repo_name, clone_url = self._resolve_source(repo_url)
+        
+        workdir = tempfile.mkdtemp(prefix='repolense-', dir=self.scratch_dir)
+        
+        try:
+            git_repo = self._clone(clone_url, workdir)
+            
+            commits = self.fetch_commits(git_repo)
+            files = self.fetch_file_tree(git_repo)
+            languages = self.language_classifier.language_bytes(files)
+            
+            return RepoStructure(
+                owner=owner,
+                name=repo_name,
+                url=repo_url,
+                description=None,
+                primary_language=next(iter(languages), None),
+                languages=languages,
+                files=files,
+                commits=commits,
+                contributors=self.fetch_contributors(git_repo),
+                created_at=self._get_root_commit_date(git_repo),
+                updated_at=commits[0].date if commits else None,
+                default_branch=self._get_default_branch(git_repo),
+                head_sha=commits[0].sha if commits else None,
+            )
+        
+        except GitCommandError as e:
+            raise RepoIngestionError(f"Failed to read cloned repository: {e.stderr.strip()}")
+        
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+    
+    def _resolve_source(self, repo_url: str) -> tuple[str, str, str]:
+        """
+        Resolve a URL or path into (owner, repo_name, clone_url).
+        
+        Args:
+            repo_url: GitHub URL, file:// URL or local path
+        
+        Returns:
+            Tuple of (owner, repo_name, clone_url)
+        
+        Raises:
+            InvalidRepoUrlError: If not a local source and not a GitHub URL
+        """
+        source = repo_url.strip()
+        
+        if source.startswith('file://'):
+            path = unquote(urlparse(source).path)
+            return 'local', self._local_repo_name(path), source
+        
+        if os.path.isdir(source):
+            path = os.path.abspath(source)
+            return 'local', self._local_repo_name(path), path
+        
+        owner, repo_name = self.url_parser.parse(source)
+        
+        return owner, repo_name, f"{self.GITHUB_ORIGIN}{owner}/{repo_name}.git"
+    
+    @staticmethod
+    def _local_repo_name(path: str) -> str:
+        """Derive repository name from a local path (strips .git suffix)."""
+        name = os.path.basename(os.path.normpath(path))
+        return name[:-4] if name.endswith('.git') else name
+    
+    def _git_env(self) -> dict[str, str]:
+        """
+        Build the environment for git commands.
+        
+        The token is passed as an Authorization header scoped to
+        GITHUB_ORIGIN via GIT_CONFIG_COUNT/KEY/VALUE (git 2.31+),
+        which git reads like `-c` options without them being in argv
+        or in the repository's config.
+        
+        Returns:
+            Variables added to the process environment
+        """
+        env = {
+            # Never block on a credentials prompt for missing repos
+            'GIT_TERMINAL_PROMPT': '0',
+        }
+        
+        if self.github_token:
+            credentials = base64.b64encode(f"x-access-token:{self.github_token}".encode()).decode()
+            env.update({
+                'GIT_CONFIG_COUNT': '1',
+                'GIT_CONFIG_KEY_0': f'http.{self.GITHUB_ORIGIN}.extraHeader',
+                'GIT_CONFIG_VALUE_0': f'Authorization: Basic {credentials}',
+            })
+        
+        return env
+    
+    def _clone(self, clone_url: str, workdir: str) -> Repo:
+        """
+        Clone repository into workdir.
+        
+        Args:
+            clone_url: URL or path to clone from
+            workdir: Empty scratch directory
+        
+        Returns:
+            GitPython Repo for the clone
+        
+        Raises:
+            RepoAccessError: If the repository cannot be cloned
+        """
+        options = ['--single-branch']
+        
+        if self.blobless:
+            options.append('--filter=blob:none')
+        if self.shallow_depth:
+            options.append(f'--depth={self.shallow_depth}')
+        
+        try:
+            return Repo.clone_from(
+                clone_url,
+                workdir,
+                multi_options=options,
+                env=self._git_env(),
+            )
+        except GitCommandError as e:
+            raise RepoAccessError(
+                f"Repository could not be cloned. "
+                f"It may be private, deleted, or the URL may be incorrect. ({e.stderr.strip()})"
+            )
+    
+    def fetch_file_tree(self, git_repo: Repo) -> list[FileNode]:
+        """
+        Build file tree from the local checkout with os.scandir.
+        
+        Applies the same exclusion rules as GitHubDataFetcher and
+        returns nodes in the same depth-first, name-sorted order as
+        the GitHub tree listing.
+        
+        Args:
+            git_repo: Cloned repository
+        
+        Returns:
+            List of all files and directories
+        """
+        root = git_repo.working_tree_dir
+        if root is None:
+            return []
+        
+        shas = self._get_object_shas(git_repo)
+        files: list[FileNode] = []
+        
+        # Iterative walk: stack of (absolute dir, relative prefix)
+        pending = [(root, '')]
+        
+        while pending:
+            directory, prefix = pending.pop()
+            
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    path = prefix + entry.name
+                    
+                    if entry.is_symlink() or GitHubDataFetcher.should_exclude_path(path):
+                        continue
+                    
+                    if entry.is_dir():
+                        files.append(FileNode(path=path, name=entry.name, type='dir', sha=shas.get(path)))
+                        pending.append((entry.path, path + '/'))
+                        continue
+                    
+                    extension = None
+                    if '.' in entry.name:
+                        extension = '.' + entry.name.rsplit('.', 1)[1]
+                    
+                    files.append(FileNode(
+                        path=path,
+                        name=entry.name,
+                        type='file',
+                        size=entry.stat().st_size,
+                        extension=extension,
+                        sha=shas.get(path),
+                    ))
+        
+        # Each directory followed by its contents, names sorted (git order)
+        files.sort(key=lambda f: f.path.split('/'))
+        
+        return files
+    
+    def _get_object_shas(self, git_repo: Repo) -> dict[str, str]:
+        """
+        Map every tracked path at HEAD to its git object SHA.
+        
+        `git ls-tree` reads trees only, so it works on blobless clones
+        without fetching any blobs.
+        """
+        shas: dict[str, str] = {}
+        
+        output = git_repo.git.ls_tree('-r', '-t', '-z', 'HEAD')
+        for record in output.split('\0'):
+            if not record:
+                continue
+            meta, path = record.split('\t', 1)
+            shas[path] = meta.split()[2]
+        
+        return shas
+    
+    def fetch_commits(self, git_repo: Repo) -> list[CommitInfo]:
+        """
+        Read recent commit history with `git log`.
+        
+        files_changed is left unset: computing it needs diffs, which
+        would fetch historic blobs in a blobless clone.
+        
+        Args:
+            git_repo: Cloned repository
+        
+        Returns:
+            List of recent commits (up to MAX_COMMITS), newest first
+        """
+        output = git_repo.git.log(
+            f'--max-count={self.MAX_COMMITS}',
+            f'--format={self.LOG_FORMAT}',
+        )
+        
+        commits: list[CommitInfo] = []
+        
+        for line in output.splitlines():
+            sha, author, email, date, message = line.split(self.FIELD_SEPARATOR, 4)
+            commits.append(CommitInfo(
+                sha=sha,
+                message=message,
+                author=author or "Unknown",
+                author_email=email,
+                date=datetime.fromisoformat(date),
+            ))
+        
+        return commits
+    
+    def fetch_contributors(self, git_repo: Repo) -> list[ContributorInfo]:
+        """
+        Aggregate contributors from the full local history.
+        
+        There are no GitHub logins in git history, so the author
+        name is used as the username.
+        
+        Args:
+            git_repo: Cloned repository
+        
+        Returns:
+            List of contributors sorted by commit count
+        """
+        output = git_repo.git.shortlog('-s', '-n', '-e', 'HEAD')
+        
+        contributors: list[ContributorInfo] = []
+        
+        for line in output.splitlines():
+            count, identity = line.strip().split('\t', 1)
+            name, _, email = identity.rpartition(' <')
+            contributors.append(ContributorInfo(
+                username=name,
+                name=name,
+                email=email.rstrip('>'),
+                commit_count=int(count),
+            ))
+        
+        return contributors
+    
+    def _get_root_commit_date(self, git_repo: Repo) -> Optional[datetime]:
+        """Get the author date of the oldest commit (repository creation)."""
+        output = git_repo.git.log('--max-parents=0', '--format=%aI', 'HEAD')
+        dates = [datetime.fromisoformat(d) for d in output.splitlines() if d]
+        return min(dates) if dates else None
+    
+    @staticmethod
+    def _get_default_branch(git_repo: Repo) -> str:
+        """Get the checked-out branch name (the remote's default branch)."""
+        try:
+            return git_repo.active_branch.name
+        except TypeError:
+            # Detached HEAD
+            return 'HEAD'
@@ -0,0 +1,176 @@
+"""
+Parallel paginated list fetcher.
+
+Fetches GitHub list endpoints (commits, contributors, ...) with the
+pages after the first requested concurrently.
+
+Layer: Analysis Layer
+Dependencies: PyGithub
+External Calls: GitHub REST API
+"""
+
+import math
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+from urllib.parse import parse_qs, urlparse
+
+from github.Repository import Repository
+
+from .session_pool import GitHubSessionPool
+
+
+class ParallelPaginatedFetcher:
+    """
+    Fetches list endpoints page by page in parallel.
+    
+    Why not PyGithub's PaginatedList?
+    - It follows rel="next" links, so pages are strictly sequential
+    - A list of 5,000 contributors costs 50 round trips one after another
+    
+    How it works:
+    1. Fetch page 1; its Link header names the last page (rel="last")
+    2. Fetch pages 2..N concurrently (N capped by max_pages / max_items)
+    3. Yield items in page order
+    
+    Requests go through the repository's PyGithub requester, so the
+    pooled session's transport layers (ETag cache, token rotation,
+    metrics) apply as for any other call.
+    
+    Example:
+        >>> pages = ParallelPaginatedFetcher(max_pages=10)
+        >>> for raw in pages.fetch(repo, "contributors"):
+        ...     print(raw["login"], raw["contributions"])
+    """
+    
+    PAGE_SIZE = GitHubSessionPool.PAGE_SIZE
+    
+    DEFAULT_MAX_PAGES = 50
+    DEFAULT_MAX_WORKERS = 8
+    
+    LAST_PAGE_PATTERN = re.compile(r'<([^>]+)>;\s*rel="last"')
+    
+    def __init__(
+        self,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        page_size: int = PAGE_SIZE
+    ):
+        """
+        Initialize paginated fetcher.
+        
+        Args:
+            max_pages: Maximum pages fetched per list (the cap)
+            max_workers: Maximum concurrent page requests
+            page_size: Items per page (GitHub maximum is 100)
+        """
+        self.max_pages = max_pages
+        self.max_workers = max_workers
+        self.page_size = page_size
+    
+    def fetch(
+        self,
+        repo: Repository,
+        path: str,
+        max_items: Optional[int] = None,
+        parameters: Optional[dict] = None
+    ) -> Iterator[dict]:
+        """
+        Yield the items of a repository list endpoint, in order.
+        
+        Args:
+            repo: GitHub repository object
+            path: Endpoint path below the repository (e.g. "commits")
+            max_items: Maximum items to yield (None for up to max_pages)
+            parameters: Extra query parameters
+        
+        Yields:
+            Raw JSON items
+        
+        Raises:
+            GithubException: If a page request fails
+        """
+        url = f"{repo.url}/{path}"
+        limit = self.page_limit(max_items)
+        if limit == 0:
+            return
+        
+        headers, first = self._get_page(repo, url, 1, parameters)
+        last_page = min(self.parse_last_page(headers.get('link')), limit)
+        
+        remaining = max_items
+        for items in self._pages(repo, url, first, last_page, parameters):
+            if remaining is not None:
+                items = items[:remaining]
+                remaining -= len(items)
+            yield from items
+            if remaining == 0:
+                return
+    
+    def page_limit(self, max_items: Optional[int] = None) -> int:
+        """
+        Number of pages needed for max_items, within max_pages.
+        
+        Args:
+            max_items: Maximum items (None for up to max_pages)
+        
+        Returns:
+            Page count cap
+        """
+        if max_items is None:
+            return self.max_pages
+        return min(math.ceil(max(max_items, 0) / self.page_size), self.max_pages)
+    
+    @classmethod
+    def parse_last_page(cls, link_header: Optional[str]) -> int:
+        """
+        Read the last page number from a Link header.
+        
+        Args:
+            link_header: Value of the Link response header (or None)
+        
+        Returns:
+            Last page number (1 if the list fits in one page)
+        """
+        match = cls.LAST_PAGE_PATTERN.search(link_header or "")
+        if not match:
+            return 1
+        
+        page = parse_qs(urlparse(match.group(1)).query).get('page', ['1'])[0]
+        return int(page) if page.isdigit() else 1
+    
+    def _pages(
+        self,
+        repo: Repository,
+        url: str,
+        first: list[dict],
+        last_page: int,
+        parameters: Optional[dict]
+    ) -> Iterator[list[dict]]:
+        """Yield page 1 and then pages 2..last_page, fetched concurrently."""
+        yield first
+        
+        if last_page < 2:
+            return
+        
+        def fetch_page(page: int) -> list[dict]:
+            return self._get_page(repo, url, page, parameters)[1]
+        
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, last_page - 1),
+            thread_name_prefix="paginated-fetch",
+        ) as executor:
+            # map() yields results in page order
+            yield from executor.map(fetch_page, range(2, last_page + 1))
+    
+    def _get_page(
+        self,
+        repo: Repository,
+        url: str,
+        page: int,
+        parameters: Optional[dict]
+    ) -> tuple[dict, list[dict]]:
+        """Request one page; returns (response headers, items)."""
+        query = {**(parameters or {}), 'per_page': self.page_size, 'page': page}
+        headers, data = repo.requester.requestJsonAndCheck("GET", url, parameters=query)
+        return headers, data or []
@@ -4,15 +4,48 @@ Repository ingestion service.
 Main orchestrator for fetching repository data from GitHub.
 
 Layer: Analysis Layer
-Dependencies: GitHubFetcher, GitHubUrlParser, data classes
+Dependencies: GitHubFetcher, GitHubArchiveFetcher, BlobContentFetcher,
+              IngestionConfig, LanguageClassifier, GitHubUrlParser,
+              IngestionCostEstimator, IngestionStrategySelector,
+              LocalCloneIngestionService, data classes
 """
 
+import logging
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import partial
 from typing import Optional
 
-from apps.analysis.data_classes import RepoStructure
+import requests
+from github import GithubException
+from github.GitTree import GitTree
+from github.Repository import Repository
+
+from apps.analysis.data_classes import (
+    FileNode,
+    CommitInfo,
+    ContributorInfo,
+    FileTable,
+    RepoChangeSet,
+    RepoIndex,
+    RepoStructure,
+)
 from .url_parser import GitHubUrlParser
 from .github_client import GitHubClient
 from .github_data_fetcher import GitHubDataFetcher
+from .archive_fetcher import GitHubArchiveFetcher
+from .content_fetcher import BlobContentFetcher
+from .language_classifier import LanguageClassifier
+from .local_clone_ingestion import LocalCloneIngestionService
+from .strategy_selector import IngestionStrategySelector, StrategyDecision
+from .ingestion_config import IngestionConfig
+from .diff_patcher import RepoDiffPatcher
+from .cost_estimator import AdmissionDecision, IngestionCostEstimator, IngestionPlan, RepoProfile
+from .exceptions import IngestionDeferredError
+
+
+logger = logging.getLogger(__name__)
 
 
 class RepoIngestionService:
@@ -29,25 +62,69 @@ class RepoIngestionService:
     
     Responsibility: Orchestration ONLY
     - Delegates URL parsing to GitHubUrlParser
-    - Delegates API calls to GitHubFetcher
+    - Delegates budget and strategy choices to IngestionCostEstimator
+      and IngestionStrategySelector
+    - Delegates API calls to GitHubDataFetcher, GitHubArchiveFetcher,
+      BlobContentFetcher (and LocalCloneIngestionService for clones)
     - Assembles final RepoStructure
     
+    Options and collaborators come from one IngestionConfig, which
+    also supplies the shared defaults from settings.
+    
     Example:
         >>> service = RepoIngestionService()
         >>> repo = service.ingest_repository("https://github.com/django/django")
         >>> print(f"Fetched {repo.get_total_files()} files")
     """
     
-    def __init__(self, github_token: Optional[str] = None):
+    # Upper bound on parallel GitHub requests per ingestion
+    MAX_INGESTION_WORKERS = 4
+    
+    def __init__(
+        self,
+        github_token: Optional[str] = None,
+        config: Optional[IngestionConfig] = None,
+        **options
+    ):
         """
         Initialize ingestion service.
         
         Args:
             github_token: Optional GitHub token for higher rate limits
+            config: Fetch options and collaborators (see IngestionConfig;
+                defaults from settings)
+            **options: IngestionConfig fields overriding config
+                (e.g. preflight=False)
+        
+        Raises:
+            TypeError: If an option is not an IngestionConfig field
         """
+        config = replace(config or IngestionConfig(), **options).resolve()
+        self.config = config
+        
         self.url_parser = GitHubUrlParser()
-        self.client = GitHubClient(github_token)
+        self.client = GitHubClient(github_token, cassette=config.cassette)
         self.fetcher = GitHubDataFetcher()
+        self.blob_store = config.blob_store
+        self.archive_fetcher = GitHubArchiveFetcher(
+            include_contents=config.include_contents,
+            store=self.blob_store,
+            retry_policy=self.client.pool.retry_policy,
+        )
+        self.content_fetcher = BlobContentFetcher(self.blob_store)
+        self.content_planner = config.content_planner
+        self.file_sampler = config.file_sampler
+        self.language_classifier = LanguageClassifier()
+        self.estimator = IngestionCostEstimator()
+        self.patcher = RepoDiffPatcher()
+        self.clone_service = LocalCloneIngestionService(github_token)
+        self.concurrent = config.concurrent
+        self.preflight = config.preflight
+        self.select_strategy = config.select_strategy
+        self.selector = config.strategy_selector
+        self.plan = config.plan()
+        self.admission: Optional[AdmissionDecision] = None
+        self.strategy: Optional[StrategyDecision] = None
     
     def ingest_repository(self, repo_url: str) -> RepoStructure:
         """
@@ -68,11 +145,16 @@ class RepoIngestionService:
         Raises:
             InvalidRepoUrlError: If URL format is invalid
             RepoAccessError: If repository is not accessible
+            IngestionDeferredError: If the API budget cannot cover it
             RepoIngestionError: For other fetching errors
             
         Flow:
-            URL → Parse → Fetch Repo → Fetch Files → Fetch Commits → 
-            Fetch Contributors → Fetch Languages → Assemble → Return
+            URL → Parse → Fetch Repo → Pre-flight (strategy, budget) →
+            (Files | Commits | Contributors, in parallel) → Languages →
+            Assemble → Return
+            
+        A partial clone strategy hands the ingestion to
+        LocalCloneIngestionService instead.
             
         Example:
             >>> service = RepoIngestionService()
@@ -86,14 +168,39 @@ class RepoIngestionService:
         # Step 2: Fetch repository object
         github_repo = self.client.get_repository(owner, repo_name)
         
-        # Step 3: Fetch all data components
-        # These could be parallelized in future for better performance
-        files = self.fetcher.fetch_file_tree(github_repo)
-        commits = self.fetcher.fetch_commits(github_repo)
-        contributors = self.fetcher.fetch_contributors(github_repo)
-        languages = self.fetcher.fetch_languages(github_repo)
+        # Step 3: Pick a strategy and check the API budget before spending it
+        profile = None
+        if self.preflight or self.select_strategy:
+            profile = self.estimator.probe(github_repo)
+        
+        plan = self.plan
+        if self.select_strategy:
+            self.strategy = self.selector.select(profile)
+            logger.info(f"Ingesting {owner}/{repo_name}: {self.strategy.to_dict()}")
+            if self.strategy.strategy == IngestionStrategySelector.PARTIAL_CLONE:
+                return self._ingest_clone(repo_url, github_repo)
+            plan = self.strategy.apply(plan)
+        
+        if self.preflight:
+            try:
+                plan = self._admit(profile, plan)
+            except IngestionDeferredError:
+                # A clone needs no REST calls; defer only if none can be made
+                clone = None
+                if self.select_strategy:
+                    clone = self.selector.for_clone(profile, reason="REST quota exhausted; cloning instead")
+                if clone is None:
+                    raise
+                self.strategy = clone
+                logger.warning(f"Ingesting {owner}/{repo_name}: {clone.to_dict()}")
+                return self._ingest_clone(repo_url, github_repo)
+        
+        # Step 4: Fetch all data components
+        (index, contents), commits, contributors, languages = self._fetch_components(
+            github_repo, plan, tree=profile.tree if profile is not None else None
+        )
         
-        # Step 4: Assemble complete structure
+        # Step 5: Assemble complete structure
         repo_structure = RepoStructure(
             owner=owner,
             name=repo_name,
@@ -101,7 +208,7 @@ class RepoIngestionService:
             description=github_repo.description,
             primary_language=github_repo.language,
             languages=languages,
-            files=files,
+            files=index.table,
             commits=commits,
             contributors=contributors,
             stars=github_repo.stargazers_count,
@@ -110,10 +217,470 @@ class RepoIngestionService:
             created_at=github_repo.created_at,
             updated_at=github_repo.updated_at,
             default_branch=github_repo.default_branch,
+            head_sha=commits[0].sha if commits else None,
+            file_contents=contents,
         )
+        # Keep the index (and the file sample drawn while planning contents)
+        repo_structure.index = index
         
         return repo_structure
     
+    def ingest_incremental(
+        self,
+        repo_url: str,
+        previous: RepoStructure,
+        strategy: Optional[str] = None,
+        refresh_contents: bool = False
+    ) -> tuple[RepoStructure, RepoChangeSet]:
+        """
+        Bring a previously ingested structure up to date.
+        
+        Fetches only the diff since previous.head_sha (one compare call)
+        and patches the stored structure. Falls back to a full
+        ingest_repository() when the diff cannot be applied exactly
+        (no stored SHA, force push, default branch changed, diff
+        truncated by GitHub).
+        
+        Extra calls only when needed:
+        - file sizes: one recursive Git Trees call at the head commit if
+          a changed blob is not in the blob store (only for structures
+          ingested with the TREE strategy: other strategies were chosen
+          because that listing is truncated or too large)
+        - languages: if any file changed (languages API only; otherwise
+          reclassified locally)
+        - contributors: if a new commit author is not yet listed
+        - file contents: if any file changed or refresh_contents is set
+          (unchanged blobs come from the blob store)
+        
+        Args:
+            repo_url: GitHub repository URL
+            previous: Structure from the last analysis
+            strategy: Strategy previous was ingested with (one of
+                IngestionStrategySelector.STRATEGIES); the update uses
+                the same plan. None uses this service's plan as is
+            refresh_contents: Fetch the planned contents even if no file
+                changed (the caller recomputes a content-based section,
+                e.g. after an analyzer version change)
+            
+        Returns:
+            Tuple of (current structure, change set)
+            
+        Example:
+            >>> structure, changes = service.ingest_incremental(url, previous, 'tree')
+            >>> changes.is_empty()
+            True
+        """
+        owner, repo_name = self.url_parser.parse(repo_url)
+        github_repo = self.client.get_repository(owner, repo_name)
+        
+        comparison = None
+        if previous.head_sha and previous.default_branch == github_repo.default_branch:
+            try:
+                comparison = github_repo.compare(
+                    previous.head_sha, github_repo.default_branch
+                ).raw_data
+            except GithubException as e:
+                logger.warning(f"Failed to compare with {previous.head_sha[:7]}: {e}")
+        
+        if comparison is None or not self.patcher.can_patch(comparison):
+            structure = self.ingest_repository(repo_url)
+            return structure, RepoChangeSet(
+                base_sha=previous.head_sha,
+                head_sha=structure.head_sha,
+                full_refresh=True,
+            )
+        
+        plan = self.plan
+        if strategy in IngestionStrategySelector.STRATEGIES:
+            plan = StrategyDecision(strategy, "Strategy of the stored structure", 0.0).apply(plan)
+        listable = strategy in (None, IngestionStrategySelector.TREE)
+        
+        structure, changes = self.patcher.apply(
+            previous, comparison, self._blob_sizes(github_repo, comparison, listable)
+        )
+        
+        # Repository metadata comes with get_repository() for free
+        structure.description = github_repo.description
+        structure.primary_language = github_repo.language
+        structure.stars = github_repo.stargazers_count
+        structure.forks = github_repo.forks_count
+        structure.open_issues = github_repo.open_issues_count
+        structure.updated_at = github_repo.updated_at
+        
+        if changes.files_changed:
+            structure.languages = self._fetch_languages(github_repo, plan, structure.files)
+        
+        if self.patcher.new_contributor_logins(previous, comparison):
+            structure.contributors = self._fetch_contributors(github_repo, plan)
+        
+        if (changes.files_changed or refresh_contents) and plan.content_requests > 0:
+            # Stored structures carry no contents; unchanged blobs come
+            # from the blob store, so only changed files are downloaded
+            structure.file_contents = self._fetch_planned_contents(
+                github_repo, structure.index, plan.content_requests
+            )
+        
+        return structure, changes
+    
+    def _blob_sizes(
+        self,
+        github_repo: Repository,
+        comparison: dict,
+        listable: bool = True
+    ) -> dict[str, int]:
+        """
+        Look up the sizes of the blobs a compare response changed.
+        
+        Stored blobs are sized from the blob store; the rest from one
+        recursive Git Trees call at the head commit. Blobs neither can
+        size are left out (the patcher then estimates them).
+        
+        Args:
+            github_repo: GitHub repository object
+            comparison: Raw compare response
+            listable: Whether the head tree fits in one tree call
+            
+        Returns:
+            Blob sizes by SHA
+        """
+        shas = {
+            entry['sha'] for entry in comparison.get('files', [])
+            if entry.get('sha') and entry.get('status') != 'removed'
+        }
+        if not shas:
+            return {}
+        
+        sizes: dict[str, int] = {}
+        if self.blob_store is not None:
+            sizes = {sha: len(data) for sha, data in self.blob_store.get_many(shas).items()}
+        
+        commits = comparison.get('commits', [])
+        if listable and shas - sizes.keys() and commits:
+            try:
+                tree = github_repo.get_git_tree(commits[-1]['sha'], recursive=True)
+            except GithubException as e:
+                logger.warning(f"Failed to fetch head tree for file sizes: {e}")
+            else:
+                for element in tree.tree:
+                    if element.sha in shas and element.size is not None:
+                        sizes.setdefault(element.sha, element.size)
+        
+        return sizes
+    
+    def _admit(self, profile: RepoProfile, plan: IngestionPlan) -> IngestionPlan:
+        """
+        Run the pre-flight cost check.
+        
+        Args:
+            profile: Repository size signals from the probe
+            plan: Requested ingestion depth
+            
+        Returns:
+            Plan to ingest with (possibly downgraded)
+            
+        Raises:
+            IngestionDeferredError: If even the cheapest plan does not fit
+        """
+        decision = self.estimator.decide(profile, plan, self.client.check_rate_limit())
+        self.admission = decision
+        
+        if decision.action == AdmissionDecision.DEFER:
+            raise IngestionDeferredError(
+                f"Analysis deferred: {decision.reason}. "
+                f"Retry in {int(decision.retry_after) + 1} seconds.",
+                retry_after=decision.retry_after,
+            )
+        
+        if decision.action == AdmissionDecision.DOWNGRADE:
+            logger.warning(f"{decision.reason}")
+        
+        return decision.plan
+    
+    def _ingest_clone(self, repo_url: str, github_repo: Repository) -> RepoStructure:
+        """
+        Ingest from a partial clone, keeping the REST repository metadata.
+        
+        Args:
+            repo_url: GitHub repository URL
+            github_repo: GitHub repository object (already fetched)
+            
+        Returns:
+            Repository structure built from the clone
+        """
+        structure = self.clone_service.ingest_repository(repo_url)
+        
+        # Not available from git; came with get_repository() for free
+        structure.description = github_repo.description
+        structure.primary_language = github_repo.language or structure.primary_language
+        structure.stars = github_repo.stargazers_count
+        structure.forks = github_repo.forks_count
+        structure.open_issues = github_repo.open_issues_count
+        structure.created_at = github_repo.created_at
+        
+        return structure
+    
+    def _fetch_components(
+        self,
+        github_repo: Repository,
+        plan: IngestionPlan,
+        tree: Optional[GitTree] = None
+    ) -> tuple[
+        tuple[RepoIndex, dict[str, bytes]],
+        list[CommitInfo],
+        list[ContributorInfo],
+        dict[str, int],
+    ]:
+        """
+        Fetch files, commits, contributors and languages.
+        
+        Why parallel?
+        - The endpoints share no data
+        - Each call is I/O bound (waiting on GitHub)
+        - Wall-clock time drops to the slowest call instead of the sum
+        
+        Languages are classified from the file tree once it arrives,
+        unless the plan asks for the languages endpoint.
+        
+        Partial failures degrade exactly as in the sequential path:
+        each fetcher method logs a warning and returns empty data.
+        
+        Args:
+            github_repo: GitHub repository object
+            plan: Ingestion depth
+            tree: Recursive default-branch tree from the pre-flight probe
+            
+        Returns:
+            Tuple of ((file index, contents), commits, contributors, languages)
+        """
+        tasks = [
+            partial(self._fetch_files, tree=tree),
+            self._fetch_commits,
+            self._fetch_contributors,
+        ]
+        if plan.languages_api:
+            tasks.append(self._fetch_languages)
+        
+        if not self.concurrent:
+            results = [task(github_repo, plan) for task in tasks]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=self.MAX_INGESTION_WORKERS,
+                thread_name_prefix="repo-ingestion",
+            ) as executor:
+                futures = [executor.submit(task, github_repo, plan) for task in tasks]
+                results = [future.result() for future in futures]
+        
+        if not plan.languages_api:
+            index, _ = results[0]
+            results.append(self.language_classifier.language_bytes(index.table))
+        
+        return tuple(results)
+    
+    def _fetch_commits(self, github_repo: Repository, plan: IngestionPlan) -> list[CommitInfo]:
+        """
+        Fetch commits, optionally enriched with files_changed.
+        
+        Args:
+            github_repo: GitHub repository object
+            plan: Ingestion depth
+            
+        Returns:
+            List of CommitInfo
+        """
+        commits = self.fetcher.fetch_commits(github_repo)
+        
+        if plan.commit_files_budget > 0:
+            self.fetcher.enrich_commit_files(
+                github_repo,
+                commits,
+                max_calls=plan.commit_files_budget,
+            )
+        
+        return commits
+    
+    def _fetch_contributors(
+        self,
+        github_repo: Repository,
+        plan: IngestionPlan
+    ) -> list[ContributorInfo]:
+        """
+        Fetch contributors within the plan's profile budget.
+        
+        Args:
+            github_repo: GitHub repository object
+            plan: Ingestion depth
+            
+        Returns:
+            List of ContributorInfo
+        """
+        return self.fetcher.fetch_contributors(
+            github_repo,
+            max_profiles=plan.contributor_profiles,
+        )
+    
+    def _fetch_languages(
+        self,
+        github_repo: Repository,
+        plan: IngestionPlan,
+        files: Optional[list[FileNode]] = None
+    ) -> dict[str, int]:
+        """
+        Get language byte counts.
+        
+        Args:
+            github_repo: GitHub repository object
+            plan: Ingestion depth
+            files: File tree to classify (ignored with the languages API)
+            
+        Returns:
+            Dictionary mapping language to byte count
+        """
+        if plan.languages_api or files is None:
+            return self.fetcher.fetch_languages(github_repo)
+        return self.language_classifier.language_bytes(files)
+    
+    def _fetch_files(
+        self,
+        github_repo: Repository,
+        plan: IngestionPlan,
+        tree: Optional[GitTree] = None
+    ) -> tuple[RepoIndex, dict[str, bytes]]:
+        """
+        Fetch file tree and planned file contents.
+        
+        Args:
+            github_repo: GitHub repository object
+            plan: Ingestion depth
+            tree: Recursive default-branch tree already fetched
+            
+        Returns:
+            Tuple of (index over the file table, file contents by path)
+        """
+        files, contents = self._fetch_file_tree(github_repo, plan, tree)
+        index = RepoIndex(FileTable(files))
+        
+        if not contents and plan.content_requests > 0:
+            contents = self._fetch_planned_contents(github_repo, index, plan.content_requests)
+        
+        return index, contents
+    
+    def _fetch_planned_contents(
+        self,
+        github_repo: Repository,
+        index: RepoIndex,
+        max_requests: int
+    ) -> dict[str, bytes]:
+        """
+        Fetch the contents the content planner selects.
+        
+        Blobs already in the blob store cost no request, so they do
+        not count against max_requests. For repositories the analyzers
+        sample, only the sampled files are candidates.
+        
+        Args:
+            github_repo: GitHub repository object
+            index: Index over the repository's file table (caches the sample)
+            max_requests: Blob downloads allowed
+            
+        Returns:
+            File contents by path
+        """
+        sample = index.sample(self.file_sampler)
+        files = sample.files if sample is not None else index.table
+        
+        stored: set[str] = set()
+        if self.blob_store is not None:
+            shas = {node.sha for node in files if node.is_file() and node.sha}
+            stored = shas - self.blob_store.missing(shas)
+        
+        content_plan = self.content_planner.plan(files, stored, max_requests)
+        result = self.content_fetcher.fetch(
+            github_repo,
+            content_plan.files,
+            max_calls=content_plan.requests,
+        )
+        return result.contents
+    
+    def _fetch_file_tree(
+        self,
+        github_repo: Repository,
+        plan: IngestionPlan,
+        tree: Optional[GitTree] = None
+    ) -> tuple[list[FileNode], dict[str, bytes]]:
+        """
+        Fetch file tree using the planned ingestion mode.
+        
+        Args:
+            github_repo: GitHub repository object
+            plan: Ingestion depth
+            tree: Recursive default-branch tree already fetched (used
+                instead of requesting it again)
+            
+        Returns:
+            Tuple of (FileNodes, file contents by path); contents are
+            only filled in archive mode
+        """
+        if plan.use_archive:
+            if self.archive_fetcher.include_contents and self.blob_store is not None:
+                stored = self._fetch_stored_contents(github_repo, tree)
+                if stored is not None:
+                    return stored
+            
+            try:
+                snapshot = self.archive_fetcher.fetch(github_repo)
+                return snapshot.files, snapshot.contents
+            except (GithubException, requests.RequestException, tarfile.TarError) as e:
+                logger.warning(f"Failed to stream archive, using git tree: {e}")
+                return self.fetcher.fetch_file_tree_recursive(github_repo, tree=tree), {}
+        
+        if plan.sampled_tree:
+            return self.fetcher.fetch_file_tree_sampled(github_repo, tree=tree), {}
+        if plan.use_git_tree:
+            return self.fetcher.fetch_file_tree_recursive(github_repo, tree=tree), {}
+        return self.fetcher.fetch_file_tree(github_repo), {}
+    
+    def _fetch_stored_contents(
+        self,
+        github_repo: Repository,
+        tree: Optional[GitTree] = None
+    ) -> Optional[tuple[list[FileNode], dict[str, bytes]]]:
+        """
+        Serve file contents from the blob store instead of the tarball.
+        
+        Lists the tree (one call, unless the probe's tree is given) and
+        checks which blobs the store lacks. Forks and re-analyses share almost every blob, so the
+        few missing ones are cheaper to fetch one by one than the whole
+        archive is to download.
+        
+        Args:
+            github_repo: GitHub repository object
+            tree: Recursive default-branch tree already fetched
+            
+        Returns:
+            Tuple of (FileNodes, file contents by path), or None if too
+            many blobs are missing (the caller streams the archive)
+        """
+        files = self.fetcher.fetch_file_tree_recursive(github_repo, tree=tree)
+        
+        wanted: list[FileNode] = []
+        total_bytes = 0
+        for node in files:
+            size = node.size or 0
+            if (
+                node.is_file()
+                and size <= self.archive_fetcher.max_file_bytes
+                and total_bytes + size <= self.archive_fetcher.max_total_bytes
+            ):
+                wanted.append(node)
+                total_bytes += size
+        
+        missing = self.blob_store.missing(node.sha for node in wanted if node.sha)
+        if not files or len(missing) > self.content_fetcher.max_calls:
+            return None
+        
+        result = self.content_fetcher.fetch(github_repo, wanted)
+        return files, result.contents
+    
     def validate_repository_url(self, repo_url: str) -> bool:
         """
         Validate URL format without fetching data.
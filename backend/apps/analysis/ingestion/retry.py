@@ -0,0 +1,216 @@
+"""
+GitHub retry transport layer.
+
+Retries throttled and failed GitHub API calls with backoff.
+
+Layer: Analysis Layer
+Dependencies: requests
+"""
+
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Mapping, Optional
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from requests.exceptions import ConnectionError, Timeout
+
+from .transport import TransportLayer
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a GitHub call.
+    
+    Attributes:
+        max_attempts: Total attempts per request (first try included)
+        base_delay: Backoff of the first retry for 5xx/network errors
+        secondary_base_delay: Backoff of the first retry for secondary
+            rate limits without Retry-After (GitHub asks for minutes,
+            not seconds)
+        max_delay: Cap of a single backoff
+        max_wait: Longest server-requested wait (Retry-After or
+            X-RateLimit-Reset) worth sleeping for; longer waits fail
+            immediately so the caller can defer the work
+    """
+    max_attempts: int = 4
+    base_delay: float = 1.0
+    secondary_base_delay: float = 15.0
+    max_delay: float = 60.0
+    max_wait: float = 60.0
+    
+    def backoff(self, attempt: int, base: float) -> float:
+        """
+        Jittered exponential backoff ("full jitter").
+        
+        Args:
+            attempt: Retry number (1 for the first retry)
+            base: Delay of the first retry
+        
+        Returns:
+            Seconds to wait, uniformly drawn from [0, base * 2^(attempt-1)]
+        """
+        return random.uniform(0, min(self.max_delay, base * 2 ** (attempt - 1)))
+    
+    def retry_delay(
+        self,
+        status: int,
+        headers: Mapping[str, str],
+        attempt: int,
+        message: str = ''
+    ) -> Optional[float]:
+        """
+        Decide whether a GitHub response is worth retrying.
+        
+        Shared by every HTTP client (RetryLayer for PyGithub, the async
+        client, the archive download), so all GitHub calls back off the
+        same way.
+        
+        Args:
+            status: HTTP status of the latest attempt
+            headers: Its response headers (case-insensitive mapping)
+            attempt: Attempt number of that response
+            message: GitHub's error message (secondary rate limits are
+                only recognisable by it)
+        
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        if status >= 500:
+            return self.backoff(attempt, self.base_delay)
+        
+        if status not in (403, 429):
+            return None
+        
+        retry_after = headers.get('Retry-After')
+        if retry_after is not None:
+            wait = float(retry_after) if retry_after.isdigit() else self.max_delay
+            return wait if wait <= self.max_wait else None
+        
+        if headers.get('X-RateLimit-Remaining') == '0':
+            if 'X-RateLimit-Reset' not in headers:
+                return None
+            wait = float(headers['X-RateLimit-Reset']) - time.time() + 1
+            return max(wait, 0.0) if wait <= self.max_wait else None
+        
+        if self.is_secondary_rate_limit(message):
+            return self.backoff(attempt, self.secondary_base_delay)
+        
+        return None
+    
+    @staticmethod
+    def is_secondary_rate_limit(message: str) -> bool:
+        """Check a 403/429 error message for GitHub's secondary rate limit."""
+        message = message.lower()
+        return 'secondary rate limit' in message or 'abuse' in message
+
+
+class RetryLayer(TransportLayer):
+    """
+    Transport layer retrying transient GitHub failures.
+    
+    What is retried (GET/HEAD only):
+    - Primary rate limit (403/429, X-RateLimit-Remaining: 0): wait until
+      X-RateLimit-Reset, if that is within max_wait
+    - Retry-After (secondary rate limits, abuse detection): wait as told,
+      if within max_wait
+    - Secondary rate limit without Retry-After: jittered exponential backoff
+    - 5xx responses, connection errors and timeouts: jittered exponential backoff
+    
+    What is not retried:
+    - 404 and every other 4xx (a missing repository stays missing)
+    - 403 without a rate limit signal (permissions)
+    
+    After the last attempt the final response (or network error) is
+    passed on unchanged, so PyGithub raises its usual exception.
+    
+    Why replace PyGithub's GithubRetry?
+    - It sleeps until the primary rate limit resets (up to an hour)
+    - Its backoff has no jitter, so throttled workers retry in lockstep
+    
+    Stacking: below the ETag cache (retried responses are cached as
+    usual) and above token rotation (a rotated token is tried before
+    any backoff).
+    
+    Example:
+        >>> layers = [..., partial(RetryLayer, policy=RetryPolicy(max_attempts=3))]
+        >>> install_transport_layers(github, layers)
+    """
+    
+    RETRYABLE_METHODS = {'GET', 'HEAD'}
+    
+    def __init__(
+        self,
+        inner: BaseAdapter,
+        policy: Optional[RetryPolicy] = None,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize retry layer.
+        
+        Args:
+            inner: Adapter that performs the request
+            policy: Retry policy (defaults to RetryPolicy())
+            sleep: Sleep function (injectable for tests)
+        """
+        super().__init__(inner)
+        self.policy = policy or RetryPolicy()
+        self.sleep = sleep
+    
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        """Send request, retrying transient failures."""
+        if request.method not in self.RETRYABLE_METHODS:
+            return self.inner.send(request, **kwargs)
+        
+        attempt = 1
+        while True:
+            try:
+                response = self.inner.send(request, **kwargs)
+            except (ConnectionError, Timeout) as e:
+                if attempt >= self.policy.max_attempts:
+                    raise
+                delay = self.policy.backoff(attempt, self.policy.base_delay)
+                logger.warning(f"GitHub request failed ({e}), retrying in {delay:.1f}s")
+            else:
+                delay = self.retry_delay(response, attempt)
+                if delay is None or attempt >= self.policy.max_attempts:
+                    return response
+                logger.warning(
+                    f"GitHub returned {response.status_code} for {request.path_url}, "
+                    f"retrying in {delay:.1f}s (attempt {attempt + 1}/{self.policy.max_attempts})"
+                )
+                response.close()
+            
+            self.sleep(delay)
+            attempt += 1
+    
+    def retry_delay(self, response: Response, attempt: int) -> Optional[float]:
+        """
+        Decide whether a response is worth retrying.
+        
+        Args:
+            response: Response of the latest attempt
+            attempt: Attempt number of that response
+        
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        message = ''
+        if response.status_code in (403, 429):
+            message = self.error_message(response)
+        return self.policy.retry_delay(response.status_code, response.headers, attempt, message)
+    
+    @staticmethod
+    def error_message(response: Response) -> str:
+        """Read GitHub's error message from a response body ('' if none)."""
+        try:
+            body = response.json()
+        except ValueError:
+            return ''
+        return str(body.get('message', '')) if isinstance(body, dict) else ''
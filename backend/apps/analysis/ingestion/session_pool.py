@@ -0,0 +1,352 @@
+"""
+Process-wide GitHub session pool.
+
+Shares keep-alive HTTP connections across analyses.
+
+Layer: Analysis Layer
+Dependencies: PyGithub, requests, conditional cache, token pool
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Optional
+
+from github import Auth, Github
+from requests import PreparedRequest, Response
+
+from .cassette import Cassette, CassetteLayer
+from .conditional_cache import (
+    ConditionalRequestCache,
+    ConditionalRequestLayer,
+    get_default_cache,
+)
+from .retry import RetryLayer, RetryPolicy
+from .token_pool import TokenPool, TokenRotationLayer
+from .transport import TransportLayer, install_transport_layers
+
+
+class ConnectionMetricsLayer(TransportLayer):
+    """
+    Transport layer counting network requests and opened connections.
+    
+    Wraps PyGithub's HTTPAdapter directly, so it sees exactly the
+    requests that go over the wire (including 304 revalidations).
+    """
+    
+    def __init__(self, inner):
+        super().__init__(inner)
+        self._lock = threading.Lock()
+        self.requests = 0
+    
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        """Count and forward request."""
+        with self._lock:
+            self.requests += 1
+        return self.inner.send(request, **kwargs)
+    
+    def connections_opened(self) -> int:
+        """
+        Count TCP/TLS connections opened by the wrapped adapter.
+        
+        Read from urllib3's per-host pools: each pool counts the
+        connections it had to create (reused ones are not counted).
+        """
+        poolmanager = getattr(self.inner, 'poolmanager', None)
+        if poolmanager is None:
+            return 0
+        
+        pools = poolmanager.pools
+        return sum(pools[key].num_connections for key in list(pools.keys()))
+
+
+@dataclass
+class PooledClient:
+    """
+    A shared PyGithub client for one token.
+    
+    Attributes:
+        github: PyGithub client (owns the keep-alive session)
+        token_id: Short, non-reversible token identifier for metrics
+        layers: Metrics layers of every connection the client created
+        last_used: Unix timestamp of the last checkout
+        token_pool: Tokens rotated through (rotating clients only)
+    """
+    github: Github
+    token_id: str
+    layers: list[ConnectionMetricsLayer] = field(default_factory=list)
+    last_used: float = field(default_factory=time.time)
+    token_pool: Optional[TokenPool] = None
+    
+    def track(self, layer: ConnectionMetricsLayer) -> ConnectionMetricsLayer:
+        """Register a metrics layer created for this client."""
+        self.layers.append(layer)
+        return layer
+    
+    def metrics(self) -> dict:
+        """Request and connection counters for this client."""
+        requests = sum(layer.requests for layer in self.layers)
+        opened = sum(layer.connections_opened() for layer in self.layers)
+        metrics = {
+            'token_id': self.token_id,
+            'requests': requests,
+            'connections_opened': opened,
+            'connection_reuse_ratio': _reuse_ratio(requests, opened),
+        }
+        if self.token_pool is not None:
+            metrics['quota'] = self.token_pool.stats()
+        return metrics
+
+
+def _reuse_ratio(requests: int, opened: int) -> float:
+    """Share of requests served on an already-open connection."""
+    if requests == 0:
+        return 0.0
+    return round(max(requests - opened, 0) / requests, 3)
+
+
+class GitHubSessionPool:
+    """
+    Thread-safe pool of PyGithub clients, one per token.
+    
+    Why a pool?
+    - A new Github object means a new HTTP session
+    - Every analysis then pays TCP + TLS setup again
+    - Shared clients keep connections alive across analyses
+    
+    Per-token isolation:
+    - Each token gets its own client, session and connection pool
+    - Rate limit state (tracked by PyGithub per client) never mixes
+    - Tokens are only stored hashed in the pool index
+    
+    Token rotation:
+    - get_rotating() returns one client for a whole TokenPool;
+      every request is sent with the token that has most headroom
+    
+    Retries:
+    - Throttled and failed calls are retried by a RetryLayer
+      (PyGithub's own GithubRetry is disabled)
+    
+    Bounded size:
+    - At most max_clients tokens are kept; the least recently used
+      client is closed when a new token arrives
+    
+    Example:
+        >>> pool = get_session_pool()
+        >>> github = pool.get("ghp_...")
+        >>> pool.metrics()['connection_reuse_ratio']
+        0.97
+    """
+    
+    # Items per page for list endpoints (GitHub maximum).
+    # Fewer pages = fewer API calls for commits and contributors.
+    PAGE_SIZE = 100
+    
+    DEFAULT_POOL_SIZE = 10
+    DEFAULT_MAX_CLIENTS = 32
+    
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_clients: int = DEFAULT_MAX_CLIENTS,
+        cache: Optional[ConditionalRequestCache] = None,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
+        """
+        Initialize session pool.
+        
+        Args:
+            pool_size: Keep-alive connections per token (per host)
+            max_clients: Maximum number of tokens with a live client
+            cache: ETag cache shared by all clients (None disables it)
+            retry_policy: Backoff policy for throttled/failed calls
+        """
+        self.pool_size = pool_size
+        self.max_clients = max_clients
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._clients: OrderedDict[str, PooledClient] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _token_key(token: Optional[str]) -> str:
+        """Hash token for use as pool key (anonymous clients share one key)."""
+        if not token:
+            return 'anonymous'
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+    
+    def get(self, token: Optional[str] = None) -> Github:
+        """
+        Get the shared client for a token, creating it if needed.
+        
+        Args:
+            token: GitHub token (None for anonymous access)
+        
+        Returns:
+            PyGithub client safe to use from multiple threads
+        """
+        key = self._token_key(token)
+        return self._checkout(key, lambda: self._create_client(token, key))
+    
+    def get_rotating(self, token_pool: TokenPool) -> Github:
+        """
+        Get the shared client that rotates through a pool of tokens.
+        
+        Args:
+            token_pool: Tokens to route requests over
+        
+        Returns:
+            PyGithub client safe to use from multiple threads
+        """
+        key = token_pool.key
+        return self._checkout(
+            key,
+            lambda: self._create_client(token_pool.tokens[0], key, token_pool),
+        )
+    
+    def get_cassette(self, cassette: Cassette, token: Optional[str] = None) -> Github:
+        """
+        Create a client that records to or replays from a cassette.
+        
+        Cassette clients are not shared (each belongs to one cassette)
+        and bypass the ETag cache, so a replay sees exactly the
+        recorded responses.
+        
+        Args:
+            cassette: Cassette to record to or replay from
+            token: GitHub token (only used while recording)
+        
+        Returns:
+            PyGithub client
+        """
+        return self._create_client(token, self._token_key(token), cassette=cassette).github
+    
+    def _checkout(self, key: str, create) -> Github:
+        """Return the client for a key, creating and caching it if needed."""
+        with self._lock:
+            client = self._clients.get(key)
+            
+            if client is None:
+                client = create()
+                self._clients[key] = client
+                self._evict()
+            
+            self._clients.move_to_end(key)
+            client.last_used = time.time()
+            return client.github
+    
+    def _create_client(
+        self,
+        token: Optional[str],
+        key: str,
+        token_pool: Optional[TokenPool] = None,
+        cassette: Optional[Cassette] = None
+    ) -> PooledClient:
+        """Create a PyGithub client with the pool's transport layers."""
+        # retry=None: retries are handled by RetryLayer
+        if token:
+            github = Github(
+                auth=Auth.Token(token),
+                per_page=self.PAGE_SIZE,
+                pool_size=self.pool_size,
+                retry=None,
+            )
+        else:
+            # Anonymous access (limited, use only for testing)
+            github = Github(per_page=self.PAGE_SIZE, pool_size=self.pool_size, retry=None)
+        
+        token_id = key if token_pool is not None else key[:8]
+        client = PooledClient(github=github, token_id=token_id, token_pool=token_pool)
+        
+        layers = [lambda inner: client.track(ConnectionMetricsLayer(inner))]
+        if cassette is not None:
+            # Innermost: replaces the network for every layer above
+            layers.insert(0, partial(CassetteLayer, cassette=cassette))
+        if token_pool is not None:
+            # Below the cache: cache keys stay stable while tokens rotate
+            layers.append(partial(TokenRotationLayer, token_pool=token_pool))
+        # Above rotation: another token is tried before backing off
+        layers.append(partial(RetryLayer, policy=self.retry_policy))
+        if self.cache is not None and cassette is None:
+            layers.append(partial(ConditionalRequestLayer, cache=self.cache))
+        
+        install_transport_layers(github, layers)
+        return client
+    
+    def _evict(self) -> None:
+        """Close least recently used clients beyond max_clients (lock held)."""
+        while len(self._clients) > self.max_clients:
+            _, client = self._clients.popitem(last=False)
+            client.github.close()
+    
+    def metrics(self) -> dict:
+        """
+        Get connection reuse metrics for this process.
+        
+        Returns:
+            Dictionary with totals, per-token breakdown and cache stats
+        """
+        with self._lock:
+            clients = [client.metrics() for client in self._clients.values()]
+        
+        requests = sum(c['requests'] for c in clients)
+        opened = sum(c['connections_opened'] for c in clients)
+        
+        return {
+            'pid': os.getpid(),
+            'pool_size': self.pool_size,
+            'clients': len(clients),
+            'requests': requests,
+            'connections_opened': opened,
+            'connection_reuse_ratio': _reuse_ratio(requests, opened),
+            'tokens': clients,
+            'cache': self.cache.stats() if self.cache is not None else None,
+        }
+    
+    def close(self) -> None:
+        """Close all clients and their connections."""
+        with self._lock:
+            for client in self._clients.values():
+                client.github.close()
+            self._clients.clear()
+
+
+_default_pool: Optional[GitHubSessionPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_session_pool() -> GitHubSessionPool:
+    """
+    Get the process-wide session pool configured in Django settings.
+    
+    Settings:
+    - GITHUB_POOL_SIZE: Keep-alive connections per token
+    - GITHUB_POOL_MAX_CLIENTS: Maximum number of tokens kept open
+    - GITHUB_RETRY_ATTEMPTS: Attempts per throttled/failed call
+    - GITHUB_RETRY_MAX_WAIT: Longest rate limit wait worth sleeping for
+    
+    Under gunicorn each worker process has its own pool.
+    
+    Returns:
+        Shared session pool
+    """
+    global _default_pool
+    
+    from django.conf import settings
+    
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = GitHubSessionPool(
+                pool_size=getattr(settings, 'GITHUB_POOL_SIZE', GitHubSessionPool.DEFAULT_POOL_SIZE),
+                max_clients=getattr(settings, 'GITHUB_POOL_MAX_CLIENTS', GitHubSessionPool.DEFAULT_MAX_CLIENTS),
+                cache=get_default_cache(),
+                retry_policy=RetryPolicy(
+                    max_attempts=getattr(settings, 'GITHUB_RETRY_ATTEMPTS', RetryPolicy.max_attempts),
+                    max_wait=getattr(settings, 'GITHUB_RETRY_MAX_WAIT', RetryPolicy.max_wait),
+                ),
+            )
+        return _default_pool
@@ -0,0 +1,241 @@
+"""
+Ingestion strategy selector.
+
+Picks how to ingest a repository (tree API, archive stream, partial
+clone or sampled tree) from its reported size and file count.
+
+Layer: Analysis Layer
+Dependencies: IngestionCostEstimator (RepoProfile, IngestionPlan)
+"""
+
+import shutil
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from .cost_estimator import IngestionPlan, RepoProfile
+
+
+@dataclass
+class StrategyDecision:
+    """
+    Chosen ingestion strategy.
+    
+    Attributes:
+        strategy: One of IngestionStrategySelector.STRATEGIES
+        reason: Human-readable explanation
+        estimated_seconds: Expected file tree ingestion time
+    """
+    strategy: str
+    reason: str
+    estimated_seconds: float
+    
+    def apply(self, plan: IngestionPlan) -> IngestionPlan:
+        """
+        Adjust an ingestion plan to the strategy.
+        
+        Args:
+            plan: Requested plan
+        
+        Returns:
+            Plan using the strategy's file tree mode (unchanged for
+            PARTIAL_CLONE, which does not use the REST API)
+        """
+        if self.strategy == IngestionStrategySelector.TREE:
+            return replace(plan, use_git_tree=True, use_archive=False, sampled_tree=False)
+        if self.strategy == IngestionStrategySelector.ARCHIVE:
+            return replace(plan, use_archive=True, sampled_tree=False)
+        if self.strategy == IngestionStrategySelector.SAMPLED:
+            return replace(plan, use_git_tree=True, use_archive=False, sampled_tree=True)
+        return plan
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for logging/serialization."""
+        return {
+            'strategy': self.strategy,
+            'reason': self.reason,
+            'estimated_seconds': round(self.estimated_seconds, 1),
+        }
+
+
+class IngestionStrategySelector:
+    """
+    Size-aware choice of ingestion strategy.
+    
+    Why select?
+    - A 10-file project and a 100,000-file monorepo have nothing in
+      common but the API: one recursive tree call lists the first,
+      while the second is truncated and would be walked subtree by
+      subtree
+    - The pre-flight probe already knows the tree size, truncation and
+      repository size, so choosing costs no extra calls
+    
+    Strategies (latency / memory / REST calls for the file tree):
+    - TREE: one recursive Git Trees call; ~1-3 s regardless of repo
+      size; memory O(entries); complete only if GitHub did not truncate
+    - ARCHIVE: one streamed tarball; ~size / ARCHIVE_MB_PER_SECOND;
+      constant memory (read in chunks, contents discarded unless kept);
+      1 call; complete for any number of files
+    - PARTIAL_CLONE: blobless clone of the default branch; ~size /
+      CLONE_MB_PER_SECOND + setup; memory small, disk O(checkout);
+      0 REST calls (commits and contributors come from git log too)
+    - SAMPLED: the truncated recursive listing as returned; ~1-3 s;
+      memory O(100,000 entries); 1 call; incomplete (GitHub returns
+      about the first 100,000 entries)
+    
+    Rules:
+    1. Tree not truncated → TREE (complete in one call, at any size)
+    2. Larger than max_repo_size_mb → SAMPLED (nothing is downloaded)
+    3. Archive fits the time budget → ARCHIVE
+    4. Clone fits the time budget (git available) → PARTIAL_CLONE
+    5. Otherwise → SAMPLED
+    
+    The time budget is INGESTION_TIME_SHARE of the analysis timeout;
+    the rest is left for analyzers and AI insights.
+    
+    Example:
+        >>> selector = get_strategy_selector()
+        >>> decision = selector.select(estimator.probe(repo))
+        >>> decision.strategy
+        'archive'
+    """
+    
+    TREE = 'tree'
+    ARCHIVE = 'archive'
+    PARTIAL_CLONE = 'partial_clone'
+    SAMPLED = 'sampled'
+    STRATEGIES = (TREE, ARCHIVE, PARTIAL_CLONE, SAMPLED)
+    
+    # Conservative throughput: codeload builds tarballs on the fly,
+    # while git serves precomputed packs
+    ARCHIVE_MB_PER_SECOND = 5.0
+    CLONE_MB_PER_SECOND = 20.0
+    CLONE_SETUP_SECONDS = 5.0
+    TREE_SECONDS = 2.0
+    
+    INGESTION_TIME_SHARE = 0.5
+    
+    DEFAULT_MAX_REPO_SIZE_MB = 100
+    DEFAULT_TIMEOUT_SECONDS = 300
+    
+    def __init__(
+        self,
+        max_repo_size_mb: int = DEFAULT_MAX_REPO_SIZE_MB,
+        timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        clone_available: Optional[bool] = None
+    ):
+        """
+        Initialize strategy selector.
+        
+        Args:
+            max_repo_size_mb: Largest repository to download (archive or clone)
+            timeout_seconds: Analysis timeout
+            clone_available: Whether partial clones can be made
+                (defaults to whether the git binary is installed)
+        """
+        self.max_repo_size_mb = max_repo_size_mb
+        self.timeout_seconds = timeout_seconds
+        if clone_available is None:
+            clone_available = shutil.which('git') is not None
+        self.clone_available = clone_available
+    
+    @property
+    def time_budget(self) -> float:
+        """Seconds the file tree ingestion may take."""
+        return self.timeout_seconds * self.INGESTION_TIME_SHARE
+    
+    def archive_seconds(self, size_mb: float) -> float:
+        """Estimated archive streaming time."""
+        return size_mb / self.ARCHIVE_MB_PER_SECOND
+    
+    def clone_seconds(self, size_mb: float) -> float:
+        """Estimated partial clone time."""
+        return self.CLONE_SETUP_SECONDS + size_mb / self.CLONE_MB_PER_SECOND
+    
+    def select(self, profile: RepoProfile) -> StrategyDecision:
+        """
+        Choose the ingestion strategy for a repository.
+        
+        Args:
+            profile: Repository size signals from the pre-flight probe
+        
+        Returns:
+            Strategy decision
+        """
+        size_mb = profile.size_kb / 1024
+        
+        if profile.tree_entries is not None and not profile.truncated:
+            return StrategyDecision(
+                strategy=self.TREE,
+                reason=f"{profile.tree_entries} entries fit in one tree call",
+                estimated_seconds=self.TREE_SECONDS,
+            )
+        
+        if size_mb > self.max_repo_size_mb:
+            return StrategyDecision(
+                strategy=self.SAMPLED,
+                reason=f"{size_mb:.0f} MB exceeds the {self.max_repo_size_mb} MB download limit",
+                estimated_seconds=self.TREE_SECONDS,
+            )
+        
+        archive_seconds = self.archive_seconds(size_mb)
+        if archive_seconds <= self.time_budget:
+            return StrategyDecision(
+                strategy=self.ARCHIVE,
+                reason=f"Tree not listable in one call; {size_mb:.0f} MB archive streams in ~{archive_seconds:.0f}s",
+                estimated_seconds=archive_seconds,
+            )
+        
+        clone = self.for_clone(profile)
+        if clone is not None and clone.estimated_seconds <= self.time_budget:
+            return clone
+        
+        return StrategyDecision(
+            strategy=self.SAMPLED,
+            reason=f"{size_mb:.0f} MB cannot be downloaded within {self.time_budget:.0f}s",
+            estimated_seconds=self.TREE_SECONDS,
+        )
+    
+    def for_clone(self, profile: RepoProfile, reason: Optional[str] = None) -> Optional[StrategyDecision]:
+        """
+        Decide on a partial clone, if one can be made.
+        
+        Also used when the REST quota cannot cover an ingestion: a
+        clone needs no REST calls.
+        
+        Args:
+            profile: Repository size signals
+            reason: Explanation (defaults to the size/time estimate)
+        
+        Returns:
+            PARTIAL_CLONE decision, or None if git is unavailable or
+            the repository exceeds the download limit
+        """
+        size_mb = profile.size_kb / 1024
+        if not self.clone_available or size_mb > self.max_repo_size_mb:
+            return None
+        
+        seconds = self.clone_seconds(size_mb)
+        return StrategyDecision(
+            strategy=self.PARTIAL_CLONE,
+            reason=reason or f"Tree not listable in one call; {size_mb:.0f} MB partial clone in ~{seconds:.0f}s",
+            estimated_seconds=seconds,
+        )
+
+
+def get_strategy_selector() -> IngestionStrategySelector:
+    """
+    Create a strategy selector with limits from Django settings.
+    
+    Settings:
+    - MAX_REPO_SIZE_MB: Largest repository to download
+    - ANALYSIS_TIMEOUT_SECONDS: Analysis timeout
+    
+    Returns:
+        Strategy selector
+    """
+    from django.conf import settings
+    
+    return IngestionStrategySelector(
+        max_repo_size_mb=getattr(settings, 'MAX_REPO_SIZE_MB', IngestionStrategySelector.DEFAULT_MAX_REPO_SIZE_MB),
+        timeout_seconds=getattr(settings, 'ANALYSIS_TIMEOUT_SECONDS', IngestionStrategySelector.DEFAULT_TIMEOUT_SECONDS),
+    )
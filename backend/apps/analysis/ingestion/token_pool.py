@@ -0,0 +1,309 @@
+"""
+GitHub token pool with rate-limit-aware rotation.
+
+Spreads API calls over several tokens to multiply the hourly budget.
+
+Layer: Analysis Layer
+Dependencies: requests
+"""
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from requests import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+
+from .exceptions import IngestionDeferredError
+from .transport import TransportLayer
+
+
+@dataclass
+class TokenState:
+    """
+    Quota bookkeeping for one token.
+    
+    Attributes:
+        token: GitHub token
+        token_id: Short, non-reversible identifier for logs and metrics
+        limit: Hourly request limit (from X-RateLimit-Limit)
+        remaining: Requests left in the current window
+        reset: Unix timestamp when the window resets
+        parked_until: Token is not used before this Unix timestamp
+        requests: Requests routed through this token (this process)
+    """
+    token: str
+    token_id: str
+    limit: int = 5000
+    remaining: int = 5000
+    reset: float = 0.0
+    parked_until: float = 0.0
+    requests: int = 0
+    
+    def is_parked(self, now: float) -> bool:
+        """Check if the token is waiting for its rate limit reset."""
+        return now < self.parked_until
+
+
+class TokenPool:
+    """
+    Rate-limit-aware pool of GitHub tokens.
+    
+    Scheduling:
+    - Always route to the token with the most remaining quota
+    - Remaining quota is reserved on checkout, so concurrent requests
+      spread across tokens instead of piling onto the same one
+    - Quota is corrected from X-RateLimit-* headers on every response
+    - A token that hits 0 is parked until its reset time
+    
+    With N tokens the hourly budget is N × 5,000 requests.
+    
+    Only the "core" REST budget is tracked (search and GraphQL
+    have separate limits and are not used by ingestion).
+    
+    Example:
+        >>> pool = TokenPool(["ghp_a...", "ghp_b..."])
+        >>> state = pool.acquire()
+        >>> pool.update(state, response.headers)
+    """
+    
+    def __init__(self, tokens: list[str]):
+        """
+        Initialize token pool.
+        
+        Args:
+            tokens: GitHub tokens (duplicates and blanks are ignored)
+        """
+        unique = list(dict.fromkeys(t.strip() for t in tokens if t and t.strip()))
+        if not unique:
+            raise ValueError("TokenPool needs at least one token")
+        
+        self._states = [
+            TokenState(token=token, token_id=self._token_id(token))
+            for token in unique
+        ]
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _token_id(token: str) -> str:
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()[:8]
+    
+    @property
+    def tokens(self) -> list[str]:
+        """All tokens in the pool."""
+        return [state.token for state in self._states]
+    
+    @property
+    def key(self) -> str:
+        """Stable identifier of this set of tokens."""
+        return 'rotation:' + self._token_id(','.join(sorted(self.tokens)))
+    
+    def __contains__(self, token: str) -> bool:
+        return any(state.token == token for state in self._states)
+    
+    def __len__(self) -> int:
+        return len(self._states)
+    
+    def acquire(self) -> TokenState:
+        """
+        Check out the token with the most headroom.
+        
+        Returns:
+            Token state (one request reserved from its quota)
+        
+        Raises:
+            IngestionDeferredError: If every token is parked
+                (retry_after: seconds until the first one resets)
+        """
+        with self._lock:
+            now = time.time()
+            
+            for state in self._states:
+                if state.reset and now >= state.reset:
+                    # Window rolled over: full budget again
+                    state.remaining = state.limit
+                    state.reset = 0.0
+            
+            available = [s for s in self._states if not s.is_parked(now)]
+            
+            if not available:
+                wait = min(s.parked_until for s in self._states) - now
+                raise IngestionDeferredError(
+                    f"GitHub API rate limit exceeded on all {len(self._states)} tokens. "
+                    f"Next token resets in {int(wait) + 1} seconds.",
+                    retry_after=wait,
+                )
+            
+            state = max(available, key=lambda s: s.remaining)
+            state.remaining = max(state.remaining - 1, 0)
+            state.requests += 1
+            return state
+    
+    def update(self, state: TokenState, headers) -> None:
+        """
+        Correct a token's quota from response headers.
+        
+        Args:
+            state: Token used for the request
+            headers: Response headers (X-RateLimit-*)
+        """
+        if headers.get('X-RateLimit-Resource', 'core') != 'core':
+            return
+        
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            return
+        
+        with self._lock:
+            state.remaining = int(remaining)
+            state.limit = int(headers.get('X-RateLimit-Limit', state.limit))
+            state.reset = float(headers.get('X-RateLimit-Reset', state.reset))
+            
+            if state.remaining <= 0:
+                self._park(state, state.reset)
+    
+    def park(self, state: TokenState, until: float) -> None:
+        """
+        Take a token out of rotation until a given time.
+        
+        Args:
+            state: Token to park
+            until: Unix timestamp when the token may be used again
+        """
+        with self._lock:
+            self._park(state, until)
+    
+    def _park(self, state: TokenState, until: float) -> None:
+        """Park token (lock held). Unknown reset times park for an hour."""
+        state.parked_until = until or time.time() + 3600
+    
+    def stats(self) -> list[dict]:
+        """
+        Get per-token quota state.
+        
+        Returns:
+            List of dictionaries (token ids only, never tokens)
+        """
+        now = time.time()
+        with self._lock:
+            return [
+                {
+                    'token_id': s.token_id,
+                    'remaining': s.remaining,
+                    'limit': s.limit,
+                    'reset': s.reset,
+                    'parked': s.is_parked(now),
+                    'requests': s.requests,
+                }
+                for s in self._states
+            ]
+
+
+class TokenRotationLayer(TransportLayer):
+    """
+    Transport layer that sends each request with the best token.
+    
+    Replaces the Authorization header chosen by PyGithub. If a token
+    turns out to be exhausted (403/429 with no remaining quota), it is
+    parked and the request is retried once per remaining token.
+    
+    When every token is parked, the layer answers itself with GitHub's
+    own primary rate limit response (403, X-RateLimit-Remaining: 0,
+    X-RateLimit-Reset of the first token to reset). RetryLayer above
+    then waits for that reset if it is within max_wait, and otherwise
+    PyGithub raises RateLimitExceededException, which fetchers already
+    handle like any GithubException.
+    """
+    
+    def __init__(self, inner, token_pool: TokenPool):
+        """
+        Initialize token rotation layer.
+        
+        Args:
+            inner: Wrapped adapter
+            token_pool: Tokens to rotate through
+        """
+        super().__init__(inner)
+        self.token_pool = token_pool
+    
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        """Send request with the token that has the most headroom."""
+        response: Optional[Response] = None
+        
+        for _ in range(len(self.token_pool)):
+            try:
+                state = self.token_pool.acquire()
+            except IngestionDeferredError as e:
+                return self._rate_limited(request, e.retry_after)
+            request.headers['Authorization'] = f'token {state.token}'
+            
+            response = self.inner.send(request, **kwargs)
+            self.token_pool.update(state, response.headers)
+            
+            if not self._is_exhausted(response):
+                return response
+        
+        return response
+    
+    def _rate_limited(self, request: PreparedRequest, retry_after: float) -> Response:
+        """Build the rate limit response for a request no token can send."""
+        response = Response()
+        response.status_code = 403
+        response.headers = CaseInsensitiveDict({
+            'Content-Type': 'application/json; charset=utf-8',
+            'X-RateLimit-Limit': str(sum(s['limit'] for s in self.token_pool.stats())),
+            'X-RateLimit-Remaining': '0',
+            'X-RateLimit-Reset': str(int(time.time() + retry_after) + 1),
+            'X-RateLimit-Resource': 'core',
+        })
+        response._content = json.dumps({
+            'message': f"API rate limit exceeded on all {len(self.token_pool)} pooled tokens.",
+        }).encode('utf-8')
+        response.url = request.url
+        response.request = request
+        response.encoding = 'utf-8'
+        return response
+    
+    @staticmethod
+    def _is_exhausted(response: Response) -> bool:
+        """Check if a response was rejected because the token ran out."""
+        return (
+            response.status_code in (403, 429)
+            and response.headers.get('X-RateLimit-Remaining') == '0'
+        )
+
+
+_default_token_pool: Optional[TokenPool] = None
+_default_token_pool_lock = threading.Lock()
+
+
+def get_token_pool() -> Optional[TokenPool]:
+    """
+    Get the process-wide token pool configured in Django settings.
+    
+    Settings:
+    - GITHUB_ACCESS_TOKENS: Comma-separated list of tokens
+    - GITHUB_ACCESS_TOKEN: Single token (added to the pool)
+    
+    Returns:
+        Shared token pool, or None if fewer than two tokens are configured
+    """
+    global _default_token_pool
+    
+    from django.conf import settings
+    
+    tokens = list(getattr(settings, 'GITHUB_ACCESS_TOKENS', []))
+    single = getattr(settings, 'GITHUB_ACCESS_TOKEN', None)
+    if single:
+        tokens.append(single)
+    
+    if len(set(tokens)) < 2:
+        return None
+    
+    with _default_token_pool_lock:
+        if _default_token_pool is None:
+            _default_token_pool = TokenPool(tokens)
+        return _default_token_pool
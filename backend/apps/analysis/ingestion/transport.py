@@ -0,0 +1,114 @@
+"""
+GitHub HTTP transport layers.
+
+Hooks custom request/response handling underneath PyGithub.
+
+Layer: Analysis Layer
+Dependencies: PyGithub, requests
+"""
+
+from functools import partial
+from typing import Callable, Iterable
+
+from github import Github
+from github.Requester import HTTPSRequestsConnectionClass
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+
+class TransportLayer(BaseAdapter):
+    """
+    Base class for a requests adapter that wraps another adapter.
+    
+    PyGithub sends every request through a requests.Session.
+    Layers sit between that session and the real HTTPAdapter, so they
+    see (and may answer) every GitHub API call without PyGithub knowing.
+    
+    Layers are stacked: the first factory wraps PyGithub's own adapter,
+    the next wraps that one, and so on. Subclasses override send().
+    
+    Example:
+        >>> class LoggingLayer(TransportLayer):
+        ...     def send(self, request, **kwargs):
+        ...         print(request.url)
+        ...         return self.inner.send(request, **kwargs)
+    """
+    
+    def __init__(self, inner: BaseAdapter):
+        """
+        Initialize transport layer.
+        
+        Args:
+            inner: Adapter that actually performs (or forwards) the request
+        """
+        super().__init__()
+        self.inner = inner
+    
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        """Forward request to the wrapped adapter."""
+        return self.inner.send(request, **kwargs)
+    
+    def close(self) -> None:
+        """Close the wrapped adapter."""
+        self.inner.close()
+
+
+# Callable building a layer around an inner adapter
+LayerFactory = Callable[[BaseAdapter], BaseAdapter]
+
+# PyGithub Requester internals (name-mangled; checked by install_transport_layers)
+CONNECTION_CLASS_ATTRIBUTE = '_Requester__connectionClass'
+CONNECTION_ATTRIBUTE = '_Requester__connection'
+
+
+class LayeredHTTPSConnection(HTTPSRequestsConnectionClass):
+    """
+    PyGithub HTTPS connection with transport layers mounted on its session.
+    """
+    
+    def __init__(self, host: str, port=None, *, layers: tuple = (), **kwargs):
+        super().__init__(host, port, **kwargs)
+        
+        adapter = self.adapter
+        for factory in layers:
+            adapter = factory(adapter)
+        
+        self.session.mount("https://", adapter)
+
+
+def install_transport_layers(github: Github, layers: Iterable[LayerFactory]) -> None:
+    """
+    Install transport layers on a PyGithub client.
+    
+    Must be called before the client makes its first request
+    (PyGithub creates its connection lazily on first use).
+    
+    Why reach into the Requester?
+    - PyGithub has no public hook for the HTTP session
+    - The connection class is the narrowest seam that survives
+      PyGithub re-creating its connection
+    - The attribute is private, so PyGithub is pinned in requirements
+      and a missing attribute raises instead of silently installing
+      nothing (every layer would be skipped)
+    
+    Args:
+        github: PyGithub client
+        layers: Layer factories, innermost first
+    
+    Raises:
+        RuntimeError: If this PyGithub version has no connection class
+            seam, or the client already opened its connection
+    """
+    requester = github.requester
+    if not hasattr(requester, CONNECTION_CLASS_ATTRIBUTE):
+        raise RuntimeError(
+            f"PyGithub's Requester has no {CONNECTION_CLASS_ATTRIBUTE}; "
+            f"transport layers cannot be installed on this PyGithub version"
+        )
+    if getattr(requester, CONNECTION_ATTRIBUTE, None) is not None:
+        raise RuntimeError("Transport layers must be installed before the first request")
+    
+    setattr(requester, CONNECTION_CLASS_ATTRIBUTE, partial(
+        LayeredHTTPSConnection,
+        layers=tuple(layers),
+    ))
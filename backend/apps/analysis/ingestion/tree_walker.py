@@ -0,0 +1,197 @@
+"""
+Breadth-first tree walker.
+
+Traverses a directory tree level by level, listing every directory of
+a level concurrently.
+
+Layer: Analysis Layer
+Dependencies: PyGithub, data classes
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import requests
+from github import GithubException
+
+from apps.analysis.data_classes import FileNode
+from .cassette import CassetteMissError
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SubtreeTask:
+    """
+    One directory waiting to be listed.
+    
+    Attributes:
+        path: Directory path from repo root ("" for root)
+        ref: What to request (content path or git tree SHA)
+        depth: Nesting depth (0 for root)
+        split: List one level only (the subtree is known to be too big
+            for a recursive request)
+    """
+    path: str
+    ref: str
+    depth: int = 0
+    split: bool = False
+
+
+@dataclass
+class SkippedSubtree:
+    """
+    A subtree that was not listed.
+    
+    Attributes:
+        path: Directory path from repo root
+        depth: Nesting depth
+        reason: "depth" (over max_depth), "budget" (over max_requests)
+            or "error" (the request failed)
+    """
+    path: str
+    depth: int
+    reason: str
+
+
+@dataclass
+class TreeWalkResult:
+    """
+    Result of a tree walk.
+    
+    Attributes:
+        files: All files and directories found (parents before children)
+        skipped: Subtrees whose contents are missing from files
+        requests: Directory listings issued
+    """
+    files: list[FileNode] = field(default_factory=list)
+    skipped: list[SkippedSubtree] = field(default_factory=list)
+    requests: int = 0
+    
+    @property
+    def complete(self) -> bool:
+        """True if no subtree was skipped."""
+        return not self.skipped
+
+
+# Lists one task with one request: (nodes found, tasks still to list)
+ListSubtree = Callable[[SubtreeTask], tuple[list[FileNode], list[SubtreeTask]]]
+
+
+class BreadthFirstTreeWalker:
+    """
+    Walks a tree breadth-first with a bounded worker pool.
+    
+    Why breadth-first?
+    - All directories of one level are independent, so they are listed
+      concurrently (depth-first recursion is serial)
+    - When the budget runs out, the shallow (most informative) part of
+      the tree is complete and only deep subtrees are missing
+    
+    Budget limits:
+    - max_depth: deeper subtrees are skipped
+    - max_requests: directory listings per walk
+    Every skipped subtree is reported with its reason, so callers know
+    exactly which parts of the file list are incomplete.
+    
+    Excluded paths are pruned before any request is issued. Each task
+    is one request: a list function that needs another request for the
+    same directory returns it as a task, so the budget counts it.
+    
+    The walker does not talk to GitHub itself: a list function turns a
+    SubtreeTask into nodes and child tasks (contents API, git trees, ...).
+    
+    Example:
+        >>> walker = BreadthFirstTreeWalker(max_depth=10, max_requests=500)
+        >>> result = walker.walk([SubtreeTask("", "main")], list_subtree)
+        >>> [s.path for s in result.skipped]
+        ['third_party/huge']
+    """
+    
+    DEFAULT_MAX_WORKERS = 8
+    
+    # Failures of one listing (the same family the fetchers catch)
+    LISTING_ERRORS = (GithubException, requests.RequestException, CassetteMissError)
+    
+    def __init__(
+        self,
+        max_depth: int,
+        max_requests: Optional[int] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        exclude: Optional[Callable[[str], bool]] = None
+    ):
+        """
+        Initialize tree walker.
+        
+        Args:
+            max_depth: Deepest directory level that is listed
+            max_requests: Maximum directory listings (None for no limit)
+            max_workers: Maximum concurrent listings
+            exclude: Predicate for paths that must not be listed
+        """
+        self.max_depth = max_depth
+        self.max_requests = max_requests
+        self.max_workers = max_workers
+        self.exclude = exclude or (lambda path: False)
+    
+    def walk(self, roots: list[SubtreeTask], list_subtree: ListSubtree) -> TreeWalkResult:
+        """
+        Walk the tree level by level.
+        
+        Args:
+            roots: Tasks of the first level
+            list_subtree: Lists one task with one request; raises one
+                of LISTING_ERRORS on failure
+        
+        Returns:
+            Walk result (files, skipped subtrees, request count)
+        """
+        result = TreeWalkResult()
+        level = roots
+        
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="tree-walk",
+        ) as executor:
+            while level:
+                runnable = self._admit(level, result)
+                
+                futures = [executor.submit(list_subtree, task) for task in runnable]
+                next_level: list[SubtreeTask] = []
+                
+                # Collected in submission order: output is deterministic
+                for task, future in zip(runnable, futures):
+                    try:
+                        nodes, children = future.result()
+                    except self.LISTING_ERRORS as e:
+                        logger.warning(f"Failed to fetch tree '{task.path or '/'}': {e}")
+                        result.skipped.append(SkippedSubtree(task.path, task.depth, "error"))
+                        continue
+                    
+                    result.files.extend(nodes)
+                    next_level.extend(children)
+                
+                level = next_level
+        
+        return result
+    
+    def _admit(self, level: list[SubtreeTask], result: TreeWalkResult) -> list[SubtreeTask]:
+        """Prune excluded tasks and split the rest into runnable and skipped."""
+        runnable: list[SubtreeTask] = []
+        
+        for task in level:
+            if task.path and self.exclude(task.path):
+                continue
+            
+            if task.depth > self.max_depth:
+                result.skipped.append(SkippedSubtree(task.path, task.depth, "depth"))
+            elif self.max_requests is not None and result.requests >= self.max_requests:
+                result.skipped.append(SkippedSubtree(task.path, task.depth, "budget"))
+            else:
+                result.requests += 1
+                runnable.append(task)
+        
+        return runnable
@@ -31,8 +31,13 @@ class AnalysisSerializer(serializers.ModelSerializer):
             'started_at',
             'completed_at',
             'error_message',
+            'head_sha',
+            'ingestion_strategy',
+        ]
+        read_only_fields = [
+            'id', 'status', 'started_at', 'completed_at', 'error_message', 'head_sha',
+            'ingestion_strategy',
         ]
-        read_only_fields = ['id', 'status', 'started_at', 'completed_at', 'error_message']
 
 
 class AnalysisCreateSerializer(serializers.Serializer):
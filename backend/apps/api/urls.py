@@ -7,6 +7,7 @@ This module defines all API endpoints.
 from django.urls import path
 from apps.api.views import (
     health_check,
+    github_health,
     AnalysisCreateView,
     AnalysisDetailView,
     AnalysisListView,
@@ -19,6 +20,7 @@ app_name = 'api'
 urlpatterns = [
     # Health check
     path('health/', health_check, name='health'),
+    path('health/github/', github_health, name='health-github'),
     
     # Analysis endpoints
     path('analyze/', AnalysisCreateView.as_view(), name='analysis-create'),
@@ -4,7 +4,7 @@ API views package.
 Exports all views for easy importing.
 """
 
-from .health_view import health_check
+from .health_view import health_check, github_health
 from .analysis_views import (
     AnalysisCreateView,
     AnalysisDetailView,
@@ -15,6 +15,7 @@ from .analysis_views import (
 
 __all__ = [
     'health_check',
+    'github_health',
     'AnalysisCreateView',
     'AnalysisDetailView',
     'AnalysisListView',
@@ -14,6 +14,7 @@ from django.conf import settings
 
 from apps.domain.models import Analysis, Report
 from apps.domain.services import AnalysisService
+from apps.analysis.ingestion import IngestionDeferredError
 from apps.api.serializers import (
     AnalysisSerializer,
     AnalysisCreateSerializer,
@@ -55,6 +56,14 @@ class AnalysisCreateView(APIView):
                 {'error': str(e)},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        except IngestionDeferredError as e:
+            # Not enough GitHub API budget: ask the client to retry later
+            retry_after = int(e.retry_after) + 1
+            return Response(
+                {'error': str(e), 'retry_after': retry_after},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={'Retry-After': str(retry_after)}
+            )
         except Exception as e:
             return Response(
                 {'error': f'Analysis failed: {str(e)}'},
@@ -8,6 +8,8 @@ from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
 
+from apps.analysis.ingestion.session_pool import get_session_pool
+
 
 @api_view(['GET'])
 def health_check(request):
@@ -25,3 +27,17 @@ def health_check(request):
         'version': '0.1.0',
         'message': 'RepoLense AI API'
     }, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+def github_health(request):
+    """
+    GitHub connection health endpoint.
+    
+    Returns connection reuse and ETag cache metrics for the
+    worker process that served the request (see 'pid').
+    
+    Returns:
+        Response with session pool metrics
+    """
+    return Response(get_session_pool().metrics(), status=status.HTTP_200_OK)
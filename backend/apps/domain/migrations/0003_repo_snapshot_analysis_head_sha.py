@@ -0,0 +1,86 @@
+# Generated by Django 5.1.5 on 2026-10-16 22:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "domain",
+            "0002_report_ai_confidence_score_report_ai_developer_guide_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="analysis",
+            name="head_sha",
+            field=models.CharField(
+                blank=True,
+                help_text="Commit SHA of the default branch that was analysed",
+                max_length=40,
+                null=True,
+            ),
+        ),
+        migrations.CreateModel(
+            name="RepoSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "repo_full_name",
+                    models.CharField(
+                        help_text="Normalized owner/repo identifier",
+                        max_length=255,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "head_sha",
+                    models.CharField(
+                        blank=True,
+                        help_text="Commit SHA the stored structure reflects",
+                        max_length=40,
+                        null=True,
+                    ),
+                ),
+                (
+                    "structure",
+                    models.JSONField(
+                        default=dict, help_text="Serialized RepoStructure at head_sha"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, help_text="When the snapshot was last replaced"
+                    ),
+                ),
+                (
+                    "analysis",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="Analysis whose report holds the stored results",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="domain.analysis",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Repository Snapshot",
+                "verbose_name_plural": "Repository Snapshots",
+                "db_table": "repo_snapshots",
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.5 on 2026-10-16 23:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("domain", "0003_repo_snapshot_analysis_head_sha"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="analysis",
+            name="ingestion_strategy",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("tree", "Git Trees API"),
+                    ("archive", "Archive stream"),
+                    ("partial_clone", "Partial clone"),
+                    ("sampled", "Sampled tree"),
+                    ("incremental", "Incremental diff"),
+                ],
+                help_text="How the repository data was ingested",
+                max_length=20,
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.5 on 2026-10-16 23:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("domain", "0004_analysis_ingestion_strategy"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reposnapshot",
+            name="ingestion_strategy",
+            field=models.CharField(
+                blank=True,
+                help_text="Strategy of the last full ingestion",
+                max_length=20,
+                null=True,
+            ),
+        ),
+    ]
@@ -4,11 +4,14 @@ Domain models package.
 Exports all domain models for easy importing.
 """
 
-from .analysis import Analysis, AnalysisStatus
+from .analysis import Analysis, AnalysisStatus, IngestionStrategy
 from .report import Report
+from .repo_snapshot import RepoSnapshot
 
 __all__ = [
     'Analysis',
     'AnalysisStatus',
+    'IngestionStrategy',
     'Report',
+    'RepoSnapshot',
 ]
@@ -23,6 +23,15 @@ class AnalysisStatus(models.TextChoices):
     FAILED = 'FAILED', 'Failed'
 
 
+class IngestionStrategy(models.TextChoices):
+    """How the repository data was ingested (see IngestionStrategySelector)."""
+    TREE = 'tree', 'Git Trees API'
+    ARCHIVE = 'archive', 'Archive stream'
+    PARTIAL_CLONE = 'partial_clone', 'Partial clone'
+    SAMPLED = 'sampled', 'Sampled tree'
+    INCREMENTAL = 'incremental', 'Incremental diff'
+
+
 class Analysis(models.Model):
     """
     Tracks repository analysis requests and their status.
@@ -40,6 +49,8 @@ class Analysis(models.Model):
         started_at: When analysis processing began
         completed_at: When analysis finished (success or failure)
         error_message: Error details if analysis failed
+        head_sha: Commit SHA of the default branch that was analysed
+        ingestion_strategy: How the repository data was ingested
     """
     
     id = models.UUIDField(
@@ -97,6 +108,21 @@ class Analysis(models.Model):
         help_text="Error details if analysis failed"
     )
     
+    head_sha = models.CharField(
+        max_length=40,
+        blank=True,
+        null=True,
+        help_text="Commit SHA of the default branch that was analysed"
+    )
+    
+    ingestion_strategy = models.CharField(
+        max_length=20,
+        choices=IngestionStrategy.choices,
+        blank=True,
+        null=True,
+        help_text="How the repository data was ingested"
+    )
+    
     class Meta:
         db_table = 'analyses'
         ordering = ['-created_at']
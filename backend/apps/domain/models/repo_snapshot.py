@@ -0,0 +1,77 @@
+"""
+Repository snapshot model for incremental re-analysis.
+
+This module defines the RepoSnapshot model which keeps the last ingested
+structure of each repository, so the next analysis only has to fetch the
+diff since the analysed commit.
+
+Layer: Domain Layer
+Dependencies: Django models, Analysis model
+"""
+
+from django.db import models
+
+
+class RepoSnapshot(models.Model):
+    """
+    Latest ingested structure of a repository.
+    
+    One row per repository. Updated after every successful analysis.
+    
+    Attributes:
+        repo_full_name: Normalized "owner/repo" identifier
+        head_sha: Commit SHA the stored structure reflects
+        structure: RepoStructure.to_dict() output
+        analysis: Analysis whose report holds the stored metric results
+        ingestion_strategy: Strategy of the last full ingestion (kept
+            across incremental updates, which reuse its plan)
+        updated_at: When the snapshot was last replaced
+    """
+    
+    repo_full_name = models.CharField(
+        max_length=255,
+        unique=True,
+        help_text="Normalized owner/repo identifier"
+    )
+    
+    head_sha = models.CharField(
+        max_length=40,
+        blank=True,
+        null=True,
+        help_text="Commit SHA the stored structure reflects"
+    )
+    
+    structure = models.JSONField(
+        default=dict,
+        help_text="Serialized RepoStructure at head_sha"
+    )
+    
+    analysis = models.ForeignKey(
+        'domain.Analysis',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text="Analysis whose report holds the stored results"
+    )
+    
+    ingestion_strategy = models.CharField(
+        max_length=20,
+        blank=True,
+        null=True,
+        help_text="Strategy of the last full ingestion"
+    )
+    
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="When the snapshot was last replaced"
+    )
+    
+    class Meta:
+        db_table = 'repo_snapshots'
+        verbose_name = 'Repository Snapshot'
+        verbose_name_plural = 'Repository Snapshots'
+    
+    def __str__(self) -> str:
+        """String representation showing repo and commit."""
+        return f"{self.repo_full_name}@{(self.head_sha or '')[:7]}"
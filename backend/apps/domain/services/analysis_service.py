@@ -8,7 +8,8 @@ from typing import Optional
 from django.db import transaction
 from django.utils import timezone
 
-from apps.domain.models import Analysis, AnalysisStatus, Report
+from apps.domain.models import Analysis, AnalysisStatus, IngestionStrategy, Report, RepoSnapshot
+from apps.analysis.data_classes import RepoChangeSet, RepoStructure, get_file_sampler
 from apps.analysis.ingestion import RepoIngestionService
 from apps.analysis.detectors import ArchitectureAnalyzer
 from apps.analysis.analyzers import QualityAnalyzer, PrincipleEvaluator, CollaborationAnalyzer
@@ -23,19 +24,51 @@ class AnalysisService:
     Orchestrates complete repository analysis.
     
     Workflow: Ingest -> Architecture -> Quality -> Principles -> Collaboration -> Save
+    
+    Re-analysis ingests only the diff since the last analysed commit
+    and recomputes only the sections whose inputs changed.
     """
     
+    # Sections computed from file contents (line counts, metrics)
+    CONTENT_SECTIONS = frozenset({'quality', 'principles'})
+    
     def __init__(self):
         # Note: RepoIngestionService is created per request to support custom tokens
         self.architecture_detector = ArchitectureAnalyzer()
-        self.quality_analyzer = QualityAnalyzer()
-        self.principle_evaluator = PrincipleEvaluator()
+        sampler = get_file_sampler()
+        self.quality_analyzer = QualityAnalyzer(sampler)
+        self.principle_evaluator = PrincipleEvaluator(sampler)
         self.collaboration_analyzer = CollaborationAnalyzer()
         self.ai_service = AIReasoningService()
+        
+        # Stored sections are reused only if computed by the same versions
+        self.section_versions = {
+            'architecture': self.architecture_detector.version,
+            'quality': self.quality_analyzer.version,
+            'principles': self.principle_evaluator.version,
+            'collaboration': self.collaboration_analyzer.version,
+        }
     
     @transaction.atomic
     def analyze_repository(self, repo_url: str, github_token: Optional[str] = None) -> Analysis:
-        """Analyze a GitHub repository. Returns Analysis object."""
+        """
+        Analyze a GitHub repository. Returns Analysis object.
+        
+        Re-analysis is incremental: if the repository was analysed before,
+        only the diff since the stored HEAD SHA is ingested, and each
+        section is recomputed only if its inputs changed:
+        - architecture: file paths added/removed/renamed
+        - quality, principles: any file changed (paths or sizes)
+        - collaboration: new commits
+        - AI insights: anything changed
+        A section is also recomputed if the stored one was produced by
+        another analyzer or rule pack version (see section_versions).
+        The diff is ingested with the strategy of the last full run
+        (RepoSnapshot.ingestion_strategy), so it matches the stored tree.
+        File contents are fetched whenever a CONTENT_SECTIONS section is
+        recomputed, even if no file changed, so its metrics match a
+        full run.
+        """
         
         analysis = Analysis.objects.create(
             repo_url=repo_url,
@@ -49,92 +82,109 @@ class AnalysisService:
             
             # Ingest repository data (create service with token for this request)
             github_service = RepoIngestionService(github_token=github_token)
-            repo_structure = github_service.ingest_repository(repo_url)
+            repo_full_name = '/'.join(self._parse_repo_url(repo_url)).lower()
+            snapshot = RepoSnapshot.objects.filter(repo_full_name=repo_full_name).first()
+            previous_report = self._get_reusable_report(snapshot)
+            previous = self._reusable_sections(previous_report)
             
-            # Run all analyzers
-            arch_result = self.architecture_detector.analyze(repo_structure)
-            quality_result = self.quality_analyzer.analyze(repo_structure)
-            principles_result = self.principle_evaluator.evaluate(repo_structure)
-            collab_result = self.collaboration_analyzer.analyze(repo_structure)
+            if previous_report is not None:
+                repo_structure, changes = github_service.ingest_incremental(
+                    repo_url,
+                    RepoStructure.from_dict(snapshot.structure),
+                    strategy=snapshot.ingestion_strategy,
+                    # Recomputed content sections must see the same
+                    # contents as a full run, not size estimates
+                    refresh_contents=not self.CONTENT_SECTIONS <= previous.keys(),
+                )
+            else:
+                repo_structure = github_service.ingest_repository(repo_url)
+                changes = RepoChangeSet(
+                    base_sha=None,
+                    head_sha=repo_structure.head_sha,
+                    full_refresh=True,
+                )
             
-            # Calculate overall score
-            overall = self._calc_overall_score(
-                quality_result.overall_quality_score,
-                principles_result.principle_score,
-                collab_result.collaboration_score,
-            )
-            
-            # Update analysis
-            analysis.status = AnalysisStatus.COMPLETED
-            analysis.completed_at = timezone.now()
-            analysis.save()
+            # Record how the data was ingested
+            base_strategy = None
+            if not changes.full_refresh:
+                analysis.ingestion_strategy = IngestionStrategy.INCREMENTAL
+                base_strategy = snapshot.ingestion_strategy
+            elif github_service.strategy is not None:
+                analysis.ingestion_strategy = github_service.strategy.strategy
+                base_strategy = analysis.ingestion_strategy
             
-            # Calculate architecture score from primary pattern confidence
-            primary_signal = arch_result.get_signal_by_pattern(arch_result.primary_pattern) if arch_result.primary_pattern else None
-            architecture_score = primary_signal.confidence if primary_signal else 0.0
+            logger.info(f"Analysing {repo_url} ({changes.to_dict()})")
             
-            # Prepare data for AI insights generation
-            architecture_data = arch_result.to_dict()
-            quality_data = quality_result.to_dict()
-            principles_data = principles_result.to_dict()
-            collaboration_data = collab_result.to_dict()
+            # Run analyzers whose inputs or versions changed, reuse the rest
+            if changes.structure_changed or 'architecture' not in previous:
+                arch_result = self.architecture_detector.analyze(repo_structure)
+                architecture_data = arch_result.to_dict()
+                # Calculate architecture score from primary pattern confidence
+                primary_signal = arch_result.get_signal_by_pattern(arch_result.primary_pattern) if arch_result.primary_pattern else None
+                architecture_score = primary_signal.confidence if primary_signal else 0.0
+            else:
+                architecture_data = previous['architecture']
+                architecture_score = previous_report.architecture_score
             
-            # Generate AI insights
-            logger.info(f"Generating AI insights for {repo_url}")
-            ai_results = self.ai_service.generate_all_insights(
-                architecture_data=architecture_data,
-                quality_data=quality_data,
-                principles_data=principles_data,
-                collaboration_data=collaboration_data
-            )
+            if changes.files_changed or 'quality' not in previous:
+                quality_result = self.quality_analyzer.analyze(repo_structure)
+                quality_data = quality_result.to_dict()
+                quality_score = quality_result.overall_quality_score
+            else:
+                quality_data = previous['quality']
+                quality_score = previous_report.quality_score
             
-            # Extract AI insights
-            insights = {}
-            if ai_results['architecture'].success:
-                insights['architecture'] = ai_results['architecture'].content
-            if ai_results['quality'].success:
-                insights['quality'] = ai_results['quality'].content
-            if ai_results['principles'].success:
-                insights['principles'] = ai_results['principles'].content
-            if ai_results['collaboration'].success:
-                insights['collaboration'] = ai_results['collaboration'].content
+            if changes.files_changed or 'principles' not in previous:
+                principles_result = self.principle_evaluator.evaluate(repo_structure)
+                principles_data = principles_result.to_dict()
+                principles_score = principles_result.principle_score
+            else:
+                principles_data = previous['principles']
+                principles_score = previous_report.principles_score
             
-            # Extract executive summary and developer guide
-            executive_summary = (
-                ai_results['executive_summary'].content.get('final_verdict', '')
-                if ai_results['executive_summary'].success else ''
-            )
+            if changes.commits_changed or 'collaboration' not in previous:
+                collab_result = self.collaboration_analyzer.analyze(repo_structure)
+                collaboration_data = collab_result.to_dict()
+                collaboration_score = collab_result.collaboration_score
+            else:
+                collaboration_data = previous['collaboration']
+                collaboration_score = previous_report.collaboration_score
             
-            developer_guide = (
-                ai_results['developer_guide'].content
-                if ai_results['developer_guide'].success else {}
+            # Calculate overall score
+            overall = self._calc_overall_score(
+                quality_score,
+                principles_score,
+                collaboration_score,
             )
             
-            # Extract hiring recommendation
-            hire_recommendation = ''
-            if ai_results['executive_summary'].success:
-                candidate_data = ai_results['executive_summary'].content.get('candidate_assessment', {})
-                hire_recommendation = candidate_data.get('hire_recommendation', '')
+            # Update analysis
+            analysis.status = AnalysisStatus.COMPLETED
+            analysis.completed_at = timezone.now()
+            analysis.head_sha = repo_structure.head_sha
+            analysis.save()
             
-            # Calculate totals
-            total_tokens = sum(r.tokens_used for r in ai_results.values())
-            total_processing_ms = sum(r.processing_time_ms for r in ai_results.values())
+            if changes.is_empty() and len(previous) == len(self.section_versions):
+                # Nothing changed: the previous insights still apply
+                ai_fields = self._reuse_ai_fields(previous_report)
+            else:
+                # Generate AI insights
+                logger.info(f"Generating AI insights for {repo_url}")
+                ai_fields = self._generate_ai_fields(
+                    architecture_data=architecture_data,
+                    quality_data=quality_data,
+                    principles_data=principles_data,
+                    collaboration_data=collaboration_data,
+                )
             
             # Create report with proper field mapping
             Report.objects.create(
                 analysis=analysis,
                 overall_score=overall,
                 architecture_score=architecture_score,
-                quality_score=quality_result.overall_quality_score,
-                principles_score=principles_result.principle_score,
-                collaboration_score=collab_result.collaboration_score,
-                insights=insights,
-                ai_executive_summary=executive_summary,
-                ai_developer_guide=developer_guide,
-                ai_hire_recommendation=hire_recommendation,
-                ai_total_tokens=total_tokens,
-                ai_processing_time_ms=total_processing_ms,
-                ai_provider_used='groq',  # Get from env in production
+                quality_score=quality_score,
+                principles_score=principles_score,
+                collaboration_score=collaboration_score,
+                **ai_fields,
                 raw_data={
                     'repository': {
                         'name': repo_structure.name,
@@ -144,14 +194,28 @@ class AnalysisService:
                         'stars': repo_structure.stars,
                         'forks': repo_structure.forks,
                         'description': repo_structure.description,
+                        'head_sha': repo_structure.head_sha,
                     },
-                    'architecture': arch_result.to_dict(),
-                    'quality': quality_result.to_dict(),
-                    'principles': principles_result.to_dict(),
-                    'collaboration': collab_result.to_dict(),
+                    'architecture': architecture_data,
+                    'quality': quality_data,
+                    'principles': principles_data,
+                    'collaboration': collaboration_data,
+                    'changes': changes.to_dict(),
+                    'versions': self.section_versions,
                 }
             )
             
+            # Store structure for the next (incremental) run
+            RepoSnapshot.objects.update_or_create(
+                repo_full_name=repo_full_name,
+                defaults={
+                    'head_sha': repo_structure.head_sha,
+                    'structure': repo_structure.to_dict(),
+                    'analysis': analysis,
+                    'ingestion_strategy': base_strategy,
+                },
+            )
+            
             return analysis
             
         except Exception as e:
@@ -161,6 +225,92 @@ class AnalysisService:
             analysis.save()
             raise
     
+    def _get_reusable_report(self, snapshot: Optional[RepoSnapshot]) -> Optional[Report]:
+        """Get the report of the snapshot's analysis, if it can seed a re-analysis."""
+        if snapshot is None or not snapshot.head_sha or snapshot.analysis_id is None:
+            return None
+        return self.get_report(snapshot.analysis_id)
+    
+    def _reusable_sections(self, report: Optional[Report]) -> dict:
+        """Get the stored sections computed by the current analyzer versions."""
+        if report is None:
+            return {}
+        versions = report.raw_data.get('versions', {})
+        return {
+            section: report.raw_data[section]
+            for section, version in self.section_versions.items()
+            if section in report.raw_data and versions.get(section) == version
+        }
+    
+    def _generate_ai_fields(
+        self,
+        architecture_data: dict,
+        quality_data: dict,
+        principles_data: dict,
+        collaboration_data: dict,
+    ) -> dict:
+        """Generate AI insights. Returns Report field values."""
+        ai_results = self.ai_service.generate_all_insights(
+            architecture_data=architecture_data,
+            quality_data=quality_data,
+            principles_data=principles_data,
+            collaboration_data=collaboration_data
+        )
+        
+        # Extract AI insights
+        insights = {}
+        if ai_results['architecture'].success:
+            insights['architecture'] = ai_results['architecture'].content
+        if ai_results['quality'].success:
+            insights['quality'] = ai_results['quality'].content
+        if ai_results['principles'].success:
+            insights['principles'] = ai_results['principles'].content
+        if ai_results['collaboration'].success:
+            insights['collaboration'] = ai_results['collaboration'].content
+        
+        # Extract executive summary and developer guide
+        executive_summary = (
+            ai_results['executive_summary'].content.get('final_verdict', '')
+            if ai_results['executive_summary'].success else ''
+        )
+        
+        developer_guide = (
+            ai_results['developer_guide'].content
+            if ai_results['developer_guide'].success else {}
+        )
+        
+        # Extract hiring recommendation
+        hire_recommendation = ''
+        if ai_results['executive_summary'].success:
+            candidate_data = ai_results['executive_summary'].content.get('candidate_assessment', {})
+            hire_recommendation = candidate_data.get('hire_recommendation', '')
+        
+        # Calculate totals
+        total_tokens = sum(r.tokens_used for r in ai_results.values())
+        total_processing_ms = sum(r.processing_time_ms for r in ai_results.values())
+        
+        return {
+            'insights': insights,
+            'ai_executive_summary': executive_summary,
+            'ai_developer_guide': developer_guide,
+            'ai_hire_recommendation': hire_recommendation,
+            'ai_total_tokens': total_tokens,
+            'ai_processing_time_ms': total_processing_ms,
+            'ai_provider_used': 'groq',  # Get from env in production
+        }
+    
+    def _reuse_ai_fields(self, report: Report) -> dict:
+        """Copy AI insights from a previous report. Returns Report field values."""
+        return {
+            'insights': report.insights,
+            'ai_executive_summary': report.ai_executive_summary,
+            'ai_developer_guide': report.ai_developer_guide,
+            'ai_hire_recommendation': report.ai_hire_recommendation,
+            'ai_total_tokens': 0,
+            'ai_processing_time_ms': 0.0,
+            'ai_provider_used': report.ai_provider_used,
+        }
+    
     def get_analysis(self, analysis_id: int) -> Optional[Analysis]:
         """Get analysis by ID."""
         try:
@@ -9,7 +9,7 @@ https://docs.djangoproject.com/en/5.0/topics/settings/
 """
 
 from pathlib import Path
-from decouple import config
+from decouple import Csv, config
 
 # Build paths
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -138,10 +138,47 @@ AI_PROVIDER = config('AI_PROVIDER', default='openai')  # 'openai' or 'anthropic'
 # GitHub Configuration
 GITHUB_ACCESS_TOKEN = config('GITHUB_ACCESS_TOKEN', default=None)
 
+# Extra tokens to rotate through (comma-separated); requests go to the
+# token with the most remaining quota
+GITHUB_ACCESS_TOKENS = config('GITHUB_ACCESS_TOKENS', default='', cast=Csv())
+
+# ETag cache for GitHub API responses (empty path disables it)
+GITHUB_CACHE_PATH = config('GITHUB_CACHE_PATH', default=str(BASE_DIR / '.cache' / 'github_responses.sqlite3'))
+GITHUB_CACHE_MAX_MB = config('GITHUB_CACHE_MAX_MB', default=256, cast=int)
+
+# File contents keyed by git blob SHA, shared across repos and forks
+# (empty path disables it)
+GITHUB_BLOB_STORE_PATH = config('GITHUB_BLOB_STORE_PATH', default=str(BASE_DIR / '.cache' / 'github_blobs.sqlite3'))
+GITHUB_BLOB_STORE_MAX_MB = config('GITHUB_BLOB_STORE_MAX_MB', default=512, cast=int)
+
+# File contents fetched for analysis (per analysis; blobs already in the
+# blob store do not count against the request budget)
+GITHUB_CONTENT_MAX_KB = config('GITHUB_CONTENT_MAX_KB', default=4096, cast=int)
+GITHUB_CONTENT_MAX_REQUESTS = config('GITHUB_CONTENT_MAX_REQUESTS', default=100, cast=int)
+GITHUB_CONTENT_MAX_FILE_KB = config('GITHUB_CONTENT_MAX_FILE_KB', default=256, cast=int)
+
+# Shared GitHub sessions (keep-alive connections per token, per worker process)
+GITHUB_POOL_SIZE = config('GITHUB_POOL_SIZE', default=10, cast=int)
+GITHUB_POOL_MAX_CLIENTS = config('GITHUB_POOL_MAX_CLIENTS', default=32, cast=int)
+
+# Retries of throttled (rate limit) and failed (5xx) GitHub calls; rate limit
+# waits longer than GITHUB_RETRY_MAX_WAIT seconds fail instead of blocking
+GITHUB_RETRY_ATTEMPTS = config('GITHUB_RETRY_ATTEMPTS', default=4, cast=int)
+GITHUB_RETRY_MAX_WAIT = config('GITHUB_RETRY_MAX_WAIT', default=60, cast=float)
+
 # Analysis settings
 MAX_REPO_SIZE_MB = config('MAX_REPO_SIZE_MB', default=100, cast=int)
 ANALYSIS_TIMEOUT_SECONDS = config('ANALYSIS_TIMEOUT_SECONDS', default=300, cast=int)
 
+# Repositories with at least ANALYSIS_SAMPLE_THRESHOLD files are analyzed on
+# a stratified sample of ANALYSIS_SAMPLE_SIZE files (with confidence intervals)
+ANALYSIS_SAMPLE_THRESHOLD = config('ANALYSIS_SAMPLE_THRESHOLD', default=20000, cast=int)
+ANALYSIS_SAMPLE_SIZE = config('ANALYSIS_SAMPLE_SIZE', default=2000, cast=int)
+
+# Extra directories of architecture rule packs (.json detector definitions,
+# compiled at startup; a pack replaces the built-in pack of the same name)
+ARCHITECTURE_RULE_PACK_DIRS = config('ARCHITECTURE_RULE_PACK_DIRS', default='', cast=Csv())
+
 # Celery (for async tasks) - Not needed for MVP, add later
 # CELERY_BROKER_URL = config('CELERY_BROKER_URL', default='redis://localhost:6379/0')
 # CELERY_RESULT_BACKEND = config('CELERY_RESULT_BACKEND', default='redis://localhost:6379/0')
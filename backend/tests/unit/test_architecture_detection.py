@@ -183,4 +183,4 @@ class TestArchitectureAnalyzer:
         assert "Feature-Based Architecture" in result.confidence_scores
         
         # Should have signals for all patterns tested
-        assert len(result.signals) == 4  # All 4 detectors ran
+        assert len(result.signals) == 7  # All 7 rule packs ran
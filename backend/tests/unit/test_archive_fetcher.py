@@ -0,0 +1,76 @@
+"""
+Unit tests for streamed tarball ingestion.
+"""
+
+import io
+import tarfile
+
+from apps.analysis.ingestion.archive_fetcher import GitHubArchiveFetcher
+
+
+class NonSeekableStream(io.RawIOBase):
+    """Forward-only stream, like an HTTP response body."""
+    
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, target):
+        chunk = self._buffer.read(len(target))
+        target[:len(chunk)] = chunk
+        return len(chunk)
+
+
+def make_tarball(entries: dict[str, bytes]) -> bytes:
+    """Build a GitHub-style archive (single top-level directory)."""
+    output = io.BytesIO()
+    with tarfile.open(fileobj=output, mode="w:gz") as archive:
+        for path, data in entries.items():
+            info = tarfile.TarInfo(f"owner-repo-abc123/{path}")
+            if data is None:
+                info.type = tarfile.DIRTYPE
+                archive.addfile(info)
+            else:
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+    return output.getvalue()
+
+
+class TestGitHubArchiveFetcher:
+    """Test streaming, filtering and content caps."""
+    
+    ARCHIVE = make_tarball({
+        "src": None,
+        "src/app.py": b"hello\n",
+        "src/big.bin": b"x" * 5000,
+        "node_modules/lib/index.js": b"ignored",
+        "README.md": b"# readme\n",
+    })
+    
+    def test_lists_files_with_git_blob_shas(self):
+        """Should strip the top-level dir, skip excluded paths, hash blobs."""
+        snapshot = GitHubArchiveFetcher().read_archive(NonSeekableStream(self.ARCHIVE))
+        
+        by_path = {node.path: node for node in snapshot.files}
+        assert set(by_path) == {"src", "src/app.py", "src/big.bin", "README.md"}
+        assert by_path["src"].is_directory()
+        assert by_path["src/app.py"].extension == ".py"
+        # `git hash-object` of "hello\n"
+        assert by_path["src/app.py"].sha == "ce013625030ba8dba906f756967f9e9ca394464a"
+        assert snapshot.contents == {}
+    
+    def test_keeps_contents_within_caps(self):
+        """Should keep small files only, up to the total budget."""
+        fetcher = GitHubArchiveFetcher(
+            include_contents=True,
+            max_file_bytes=1000,
+            max_total_bytes=8,
+        )
+        
+        snapshot = fetcher.read_archive(NonSeekableStream(self.ARCHIVE))
+        
+        assert snapshot.contents == {"src/app.py": b"hello\n"}
+        assert snapshot.skipped_contents == 2  # too big, over total budget
+        assert snapshot.bytes_read == 6 + 5000 + 9
@@ -0,0 +1,113 @@
+"""
+Unit tests for the asyncio GitHub client and ingestion service.
+"""
+
+import asyncio
+
+import httpx
+
+from apps.analysis.ingestion import RepoAccessError, RepoNotFoundError
+from apps.analysis.ingestion.async_github_client import AsyncGitHubClient
+from apps.analysis.ingestion.async_repo_ingestion import AsyncRepoIngestionService
+
+
+REPO = {
+    'full_name': 'octo/app',
+    'default_branch': 'main',
+    'description': 'demo',
+    'language': 'Python',
+    'stargazers_count': 3,
+    'forks_count': 1,
+    'open_issues_count': 0,
+    'created_at': '2020-01-01T00:00:00Z',
+    'updated_at': '2024-01-01T00:00:00Z',
+}
+
+
+def commit(sha: str) -> dict:
+    return {
+        'sha': sha,
+        'commit': {
+            'message': f'commit {sha}',
+            'author': {'name': 'Octo', 'email': 'o@x.io', 'date': '2024-01-01T00:00:00Z'},
+        },
+        'author': {'login': 'octo'},
+    }
+
+
+def github_api(request: httpx.Request) -> httpx.Response:
+    """Fake GitHub API for two repositories (octo/app and octo/gone)."""
+    path = request.url.path
+    
+    if path == '/repos/octo/app':
+        return httpx.Response(200, json=REPO)
+    if path == '/repos/octo/app/git/trees/main':
+        return httpx.Response(200, json={'sha': 't1', 'truncated': False, 'tree': [
+            {'path': 'src', 'type': 'tree', 'sha': 't2'},
+            {'path': 'src/app.py', 'type': 'blob', 'sha': 'b1', 'size': 120},
+            {'path': 'node_modules/x.js', 'type': 'blob', 'sha': 'b2', 'size': 5},
+        ]})
+    if path == '/repos/octo/app/commits':
+        return httpx.Response(200, json=[commit('c1'), commit('c2')])
+    if path == '/repos/octo/app/contributors':
+        if request.url.params.get('page') == '2':
+            return httpx.Response(200, json=[{'login': 'cat', 'contributions': 2}])
+        return httpx.Response(
+            200,
+            json=[{'login': 'octo', 'contributions': 10}],
+            headers={'Link': '<https://api.github.com/repos/octo/app/contributors?page=2>; rel="last"'},
+        )
+    if path == '/users/octo':
+        return httpx.Response(200, json={'name': 'Octo', 'email': None})
+    if path == '/repos/octo/app/languages':
+        return httpx.Response(200, json={'Python': 120})
+    if path == '/repos/octo/limited':
+        return httpx.Response(
+            403,
+            json={'message': 'API rate limit exceeded'},
+            headers={'X-RateLimit-Remaining': '0'},
+        )
+    
+    return httpx.Response(404, json={'message': 'Not Found'})
+
+
+def run_ingestion(urls: list[str]) -> list:
+    async def main():
+        async with AsyncGitHubClient('t', transport=httpx.MockTransport(github_api)) as client:
+            service = AsyncRepoIngestionService(client, contributor_profiles=1)
+            return await service.ingest_many(urls)
+    
+    return asyncio.run(main())
+
+
+class TestAsyncRepoIngestionService:
+    """Test concurrent ingestion and error mapping."""
+    
+    def test_ingests_same_structure_as_sync_path(self):
+        """Should page contributors, filter excluded paths and cap profile lookups."""
+        [structure] = run_ingestion(['https://github.com/octo/app'])
+        
+        assert {f.path for f in structure.files} == {'src', 'src/app.py'}
+        assert [c.sha for c in structure.commits] == ['c1', 'c2']
+        assert structure.head_sha == 'c1'
+        assert [(c.username, c.name) for c in structure.contributors] == [
+            ('octo', 'Octo'),
+            ('cat', None),
+        ]
+        assert structure.languages == {'Python': 120}
+        assert structure.created_at.year == 2020
+    
+    def test_failures_are_isolated_and_mapped(self):
+        """Should map 404 and rate limits to RepoAccessError per repository."""
+        ok, missing, limited = run_ingestion([
+            'https://github.com/octo/app',
+            'https://github.com/octo/gone',
+            'https://github.com/octo/limited',
+        ])
+        
+        assert ok.get_full_name() == 'octo/app'
+        assert isinstance(missing, RepoNotFoundError)
+        assert 'not found' in str(missing)
+        assert isinstance(limited, RepoAccessError)
+        assert not isinstance(limited, RepoNotFoundError)
+        assert 'rate limit' in str(limited)
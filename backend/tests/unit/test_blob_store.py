@@ -0,0 +1,94 @@
+"""
+Unit tests for the content-addressed blob store.
+"""
+
+import base64
+import zlib
+from types import SimpleNamespace
+
+from apps.analysis.data_classes import FileNode
+from apps.analysis.ingestion.blob_store import BlobStore, git_blob_sha
+from apps.analysis.ingestion.content_fetcher import BlobContentFetcher
+
+
+class FakeBlobRepo:
+    """Fake repository serving git blobs by SHA."""
+
+    def __init__(self, blobs: dict[str, bytes]):
+        self.blobs = {git_blob_sha(data): data for data in blobs.values()}
+        self.calls = []
+
+    def get_git_blob(self, sha):
+        self.calls.append(sha)
+        return SimpleNamespace(encoding='base64', content=base64.b64encode(self.blobs[sha]).decode())
+
+
+def make_files(blobs: dict[str, bytes]) -> list[FileNode]:
+    return [
+        FileNode(path=path, name=path.rsplit('/', 1)[-1], type='file', size=len(data), sha=git_blob_sha(data))
+        for path, data in blobs.items()
+    ]
+
+
+class TestBlobStore:
+    """Test verification and byte-budgeted LRU eviction."""
+
+    def test_rejects_content_not_matching_sha(self):
+        """Should only store content under its own git blob SHA."""
+        store = BlobStore()
+
+        assert store.put(git_blob_sha(b'a'), b'a')
+        assert not store.put(git_blob_sha(b'a'), b'b')
+        assert store.get(git_blob_sha(b'a')) == b'a'
+
+    def test_evicts_least_recently_used_over_budget(self):
+        """Should drop the coldest blobs once the byte budget is exceeded."""
+        blobs = [bytes([i]) * 4000 for i in range(3)]
+        budget = 2 * max(len(zlib.compress(b)) for b in blobs)
+        store = BlobStore(max_bytes=budget)
+
+        store.put(git_blob_sha(blobs[0]), blobs[0])
+        store.put(git_blob_sha(blobs[1]), blobs[1])
+        store.get(git_blob_sha(blobs[0]))  # blob 1 is now the coldest
+        store.put(git_blob_sha(blobs[2]), blobs[2])
+
+        assert store.missing(git_blob_sha(b) for b in blobs) == {git_blob_sha(blobs[1])}
+        assert store.stats()['evictions'] == 1
+
+    def test_running_total_tracks_the_table(self, tmp_path):
+        """Should count replaced blobs once and blobs stored by another process."""
+        blobs = [bytes([i]) * 4000 for i in range(3)]
+        budget = 2 * max(len(zlib.compress(b)) for b in blobs)
+        path = str(tmp_path / 'blobs.sqlite3')
+        first = BlobStore(path, max_bytes=budget)
+
+        for data in (blobs[0], blobs[0], blobs[1]):
+            first.put(git_blob_sha(data), data)
+        assert first._bytes == first.stats()['bytes'] <= budget
+        assert first.stats()['evictions'] == 0
+
+        second = BlobStore(path, max_bytes=budget)
+        second.put(git_blob_sha(blobs[2]), blobs[2])
+
+        assert second.stats()['evictions'] == 1
+        assert second._bytes == second.stats()['bytes'] <= budget
+
+
+class TestBlobContentFetcher:
+    """Test read-through fetching across repositories."""
+
+    def test_fork_downloads_only_changed_blobs(self):
+        """Should serve shared blobs from the store and download the rest once."""
+        upstream = {'src/app.py': b'print(1)\n', 'README.md': b'# app\n', 'copy.py': b'print(1)\n'}
+        fork = {**upstream, 'src/app.py': b'print(2)\n'}
+        fetcher = BlobContentFetcher(BlobStore())
+
+        first = fetcher.fetch(FakeBlobRepo(upstream), make_files(upstream))
+        fork_repo = FakeBlobRepo(fork)
+        second = fetcher.fetch(fork_repo, make_files(fork))
+
+        assert first.downloaded == 3 and first.cached == 0
+        assert first.contents['copy.py'] == b'print(1)\n'
+        assert fork_repo.calls == [git_blob_sha(b'print(2)\n')]
+        assert (second.cached, second.downloaded) == (2, 1)
+        assert second.contents['src/app.py'] == b'print(2)\n'
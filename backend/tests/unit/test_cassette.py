@@ -0,0 +1,167 @@
+"""
+Unit tests for GitHub response cassettes.
+"""
+
+import base64
+import io
+import json
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+from apps.analysis.data_classes import FileNode
+from apps.analysis.ingestion.blob_store import git_blob_sha
+from apps.analysis.ingestion.cassette import Cassette, CassetteLayer, CassetteMissError
+from apps.analysis.ingestion.content_fetcher import BlobContentFetcher
+from apps.analysis.ingestion.github_client import GitHubClient
+from apps.analysis.ingestion.repo_ingestion import RepoIngestionService
+from apps.analysis.ingestion.session_pool import GitHubSessionPool
+
+
+REPO = {'full_name': 'octo/app', 'name': 'app', 'default_branch': 'main', 'stargazers_count': 3}
+
+
+class FakeGitHub(BaseAdapter):
+    """Fake network answering every request with the repository JSON."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def send(self, request, **kwargs):
+        self.calls += 1
+        response = Response()
+        response.status_code = 200
+        response.headers.update({'Content-Type': 'application/json', 'X-Request-Id': 'dropped'})
+        response.raw = io.BytesIO(json.dumps(REPO).encode())
+        return response
+
+    def close(self):
+        pass
+
+
+API = 'https://api.github.com/repos/octo/app'
+SOURCES = {'app/main.py': b'print("hi")\n', 'app/util.py': b'def f():\n    return 1\n'}
+
+
+class FakeGitHubAPI(BaseAdapter):
+    """Fake network serving the endpoints of a full ingestion."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+        blobs = {path: git_blob_sha(data) for path, data in SOURCES.items()}
+        tree = [{'path': 'app', 'mode': '040000', 'type': 'tree', 'sha': 'd' * 40}]
+        tree += [
+            {'path': path, 'mode': '100644', 'type': 'blob', 'sha': sha, 'size': len(SOURCES[path])}
+            for path, sha in blobs.items()
+        ]
+        author = {'name': 'Ann', 'email': 'ann@example.com', 'date': '2024-01-01T00:00:00Z'}
+        self.routes = {
+            '/repos/octo/app': {
+                **REPO, 'owner': {'login': 'octo'}, 'url': API, 'size': 1, 'language': 'Python',
+                'forks_count': 0, 'open_issues_count': 0,
+            },
+            '/repos/octo/app/git/trees/main': {'sha': 't' * 40, 'tree': tree, 'truncated': False},
+            '/repos/octo/app/commits': [{'sha': 'c' * 40, 'commit': {'message': 'init', 'author': author}}],
+            '/repos/octo/app/contributors': [{'login': 'ann', 'contributions': 1}],
+            '/users/ann': {'login': 'ann', 'name': 'Ann', 'email': 'ann@example.com'},
+            '/rate_limit': {
+                'resources': {'core': {'limit': 5000, 'remaining': 4900, 'reset': 1900000000, 'used': 100}},
+                'rate': {'limit': 5000, 'remaining': 4900, 'reset': 1900000000, 'used': 100},
+            },
+        }
+        for path, sha in blobs.items():
+            self.routes[f'/repos/octo/app/git/blobs/{sha}'] = {
+                'sha': sha, 'encoding': 'base64', 'content': base64.b64encode(SOURCES[path]).decode(),
+            }
+
+    def send(self, request, **kwargs):
+        path = urlsplit(request.url).path
+        self.calls.append(path)
+        response = Response()
+        response.status_code = 200 if path in self.routes else 404
+        response.headers.update({'Content-Type': 'application/json'})
+        response.raw = io.BytesIO(json.dumps(self.routes.get(path, {'message': 'Not Found'})).encode())
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def make_request(url: str) -> PreparedRequest:
+    request = PreparedRequest()
+    request.prepare(method='GET', url=url, headers={'Authorization': 'token secret'})
+    return request
+
+
+class TestCassette:
+    """Test recording and offline replay."""
+
+    def test_replays_recording_through_pygithub(self, tmp_path):
+        """Should serve a recorded ingestion call without network access."""
+        path = str(tmp_path / 'octo.jsonl.gz')
+        network = FakeGitHub()
+        layer = CassetteLayer(network, Cassette(path, mode='record'))
+        layer.send(make_request('https://api.github.com/repos/octo/app?b=2&a=1'))
+        layer.send(make_request('https://api.github.com/repos/octo/app'))
+
+        replay = Cassette(path)
+        client = GitHubClient('t', pool=GitHubSessionPool(), cassette=replay)
+        repo = client.get_repository('octo', 'app')
+
+        assert repo.stargazers_count == 3
+        assert network.calls == 2
+        assert len(replay) == 2
+        # Query order is normalised; tokens and unused headers are not stored
+        assert replay.replay(make_request('https://api.github.com/repos/octo/app?a=1&b=2')).json() == REPO
+        with open(path, 'rb') as file:
+            assert b'secret' not in file.read()
+
+    def test_unrecorded_request_fails_loudly(self, tmp_path):
+        """Should raise instead of silently going to the network."""
+        path = str(tmp_path / 'empty.jsonl.gz')
+        Cassette(path, mode='record')
+
+        with pytest.raises(CassetteMissError):
+            Cassette(path).replay(make_request('https://api.github.com/repos/octo/app'))
+
+    def test_replays_full_ingestion_offline_on_a_cold_store(self, tmp_path, monkeypatch):
+        """Should replay an ingestion exactly, without network or the shared store."""
+        path = str(tmp_path / 'ingest.jsonl.gz')
+        network = FakeGitHubAPI()
+        with monkeypatch.context() as patch:
+            patch.setattr(requests.adapters, 'HTTPAdapter', lambda **kwargs: network)
+            recorded = RepoIngestionService('t', cassette=Cassette(path, mode='record')).ingest_repository(
+                'https://github.com/octo/app'
+            )
+        calls = len(network.calls)
+
+        service = RepoIngestionService('t', cassette=Cassette(path))
+        replayed = service.ingest_repository('https://github.com/octo/app')
+
+        assert len(network.calls) == calls
+        assert service.strategy is None and service.blob_store.stats()['entries'] == len(SOURCES)
+        assert replayed.to_dict() == recorded.to_dict()
+        assert replayed.file_contents == recorded.file_contents == SOURCES
+
+    def test_unrecorded_blob_is_skipped(self, tmp_path):
+        """Should degrade like a failed download when a replay lacks a blob."""
+        path = str(tmp_path / 'empty.jsonl.gz')
+        Cassette(path, mode='record')
+        replay = CassetteLayer(FakeGitHub(), Cassette(path))
+
+        class ReplayRepo:
+            def get_git_blob(self, sha):
+                replay.send(make_request(f'{API}/git/blobs/{sha}'))
+
+        data = SOURCES['app/main.py']
+        node = FileNode(path='app/main.py', name='main.py', type='file', size=len(data), sha=git_blob_sha(data))
+        result = BlobContentFetcher().fetch(ReplayRepo(), [node])
+
+        assert result.skipped == ['app/main.py'] and result.contents == {}
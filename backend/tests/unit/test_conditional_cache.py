@@ -0,0 +1,145 @@
+"""
+Unit tests for the GitHub conditional request cache.
+
+A fake adapter stands in for api.github.com (no network).
+"""
+
+import json
+from functools import partial
+
+from github import Github
+from requests import Response
+from requests.adapters import BaseAdapter
+
+from apps.analysis.ingestion.conditional_cache import (
+    CachedResponse,
+    ConditionalRequestCache,
+    ConditionalRequestLayer,
+)
+from apps.analysis.ingestion.transport import install_transport_layers
+
+
+class FakeGitHubAdapter(BaseAdapter):
+    """Serves JSON bodies with a fixed ETag and honours If-None-Match."""
+    
+    def __init__(self, etag='"v1"'):
+        super().__init__()
+        self.etag = etag
+        self.requests = []
+    
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = Response()
+        response.request = request
+        response.url = request.url
+        response.headers['ETag'] = self.etag
+        response.headers['X-RateLimit-Limit'] = '5000'
+        response.headers['X-RateLimit-Remaining'] = str(5000 - len(self.requests))
+        
+        if request.headers.get('If-None-Match') == self.etag:
+            response.status_code = 304
+            response._content = b''
+        else:
+            response.status_code = 200
+            response.headers['Content-Type'] = 'application/json'
+            response._content = json.dumps({
+                'full_name': request.url.split('/repos/')[-1],
+                'name': 'repo',
+            }).encode()
+        return response
+    
+    def close(self):
+        pass
+
+
+class TestConditionalRequestLayer:
+    """Test ETag revalidation through PyGithub."""
+    
+    def test_second_request_is_revalidated(self):
+        """Should send If-None-Match and replay the stored body on 304."""
+        fake = FakeGitHubAdapter()
+        cache = ConditionalRequestCache()
+        github = Github(per_page=100)
+        install_transport_layers(github, [
+            lambda inner: fake,
+            partial(ConditionalRequestLayer, cache=cache),
+        ])
+        
+        first = github.get_repo("owner/repo")
+        second = github.get_repo("owner/repo")
+        
+        assert first.full_name == second.full_name == "owner/repo"
+        assert 'If-None-Match' not in fake.requests[0].headers
+        assert fake.requests[1].headers['If-None-Match'] == '"v1"'
+        # Fresh rate limit headers from the 304 are passed through
+        assert github.requester.rate_limiting[0] == 4998
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+    
+    def test_changed_etag_refreshes_entry(self):
+        """Should store the new body when GitHub returns 200 again."""
+        fake = FakeGitHubAdapter()
+        cache = ConditionalRequestCache()
+        github = Github()
+        install_transport_layers(github, [
+            lambda inner: fake,
+            partial(ConditionalRequestLayer, cache=cache),
+        ])
+        
+        github.get_repo("owner/repo")
+        fake.etag = '"v2"'
+        github.get_repo("owner/repo")
+        github.get_repo("owner/repo")
+        
+        assert cache.stats()['misses'] == 2
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['entries'] == 1
+
+
+class TestConditionalRequestCache:
+    """Test LRU eviction."""
+    
+    def test_evicts_least_recently_used(self):
+        """Should drop the oldest entries once over the byte budget."""
+        cache = ConditionalRequestCache(max_bytes=25)
+        
+        for key in ("a", "b"):
+            cache.put(key, CachedResponse(etag=key, status=200, headers={}, body=b"x" * 10))
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", CachedResponse(etag="c", status=200, headers={}, body=b"x" * 10))
+        
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats()['evictions'] == 1
+        assert cache.stats()['bytes'] == 20
+    
+    def test_puts_within_limits_skip_the_totals_query(self):
+        """Should keep running totals instead of summing the table per put."""
+        cache = ConditionalRequestCache(max_bytes=100, max_entries=3)
+        statements = []
+        cache._db.set_trace_callback(statements.append)
+        
+        for key in ("a", "a", "b"):
+            cache.put(key, CachedResponse(etag=key, status=200, headers={}, body=b"x" * 10))
+        
+        assert not any("SUM(size)" in statement for statement in statements)
+        assert (cache._bytes, cache._count) == (20, 2)
+        
+        for key in ("c", "d"):
+            cache.put(key, CachedResponse(etag=key, status=200, headers={}, body=b"x" * 10))
+        
+        assert cache.stats()['evictions'] == 1
+        assert (cache._bytes, cache._count) == (30, 3)
+        assert (cache.stats()['bytes'], cache.stats()['entries']) == (30, 3)
+    
+    def test_file_cache_is_shared_between_connections(self, tmp_path):
+        """Should use a write-ahead log so worker processes share the file."""
+        path = str(tmp_path / "github.sqlite3")
+        writer, other = ConditionalRequestCache(path), ConditionalRequestCache(path)
+        
+        writer.put("a", CachedResponse(etag="a", status=200, headers={}, body=b"x"))
+        
+        assert other._db.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        assert other.get("a").etag == "a"
+        assert ConditionalRequestCache()._db.execute("PRAGMA journal_mode").fetchone() == ("memory",)
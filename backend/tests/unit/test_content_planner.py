@@ -0,0 +1,76 @@
+"""
+Unit tests for the budgeted content fetch planner.
+"""
+
+from apps.analysis.data_classes import FileNode, RepoStructure
+from apps.analysis.ingestion.content_planner import ContentFetchPlanner
+
+
+def node(path: str, size: int, sha: str = None) -> FileNode:
+    name = path.rsplit('/', 1)[-1]
+    extension = '.' + name.rsplit('.', 1)[-1] if '.' in name else None
+    return FileNode(path=path, name=name, type='file', size=size, extension=extension, sha=sha or path)
+
+
+class TestContentFetchPlanner:
+    """Test file selection under byte and request budgets."""
+
+    def setup_method(self):
+        self.files = [
+            node('tests/test_views.py', 100),
+            node('src/views.py', 300),
+            node('src/models.py', 200),
+            node('manage.py', 400),
+            node('requirements.txt', 50),
+            node('node_modules/lib/index.js', 10),
+            node('docs/logo.png', 20),
+            node('src/huge.py', 10_000),
+        ]
+
+    def test_orders_by_role_then_threshold_distance(self):
+        """Should prefer manifests, entry points, sources nearest a line threshold, then tests."""
+        plan = ContentFetchPlanner(max_file_bytes=5000).plan(self.files)
+
+        assert [f.path for f in plan.files] == [
+            'requirements.txt', 'manage.py', 'src/views.py', 'src/models.py', 'tests/test_views.py',
+        ]
+        assert plan.bytes == 1050
+        assert plan.requests == 5
+
+    def test_stored_blobs_do_not_use_request_budget(self):
+        """Should spend requests on missing blobs only and respect the byte budget."""
+        planner = ContentFetchPlanner(max_bytes=700, max_requests=1)
+
+        plan = planner.plan(self.files, stored={'requirements.txt', 'src/models.py'})
+
+        assert [f.path for f in plan.files] == ['requirements.txt', 'manage.py', 'src/models.py']
+        assert plan.requests == 1
+        assert plan.skipped == 3
+
+    def test_spends_requests_on_files_near_line_thresholds(self):
+        """Should fetch files whose line estimate is close to 500/1000/1500 first."""
+        files = [node(f'src/small_{i}.py', 2_000) for i in range(5)] + [
+            node('src/borderline.py', 45_500),
+            node('src/large.py', 24_000),
+            node('src/vast.py', 200_000),
+        ]
+
+        plan = ContentFetchPlanner(max_requests=2).plan(files)
+
+        assert [f.path for f in plan.files] == ['src/borderline.py', 'src/large.py']
+        assert plan.skipped == 6
+
+
+class TestLineCounts:
+    """Test analyzer line counts from fetched contents."""
+
+    def test_counts_fetched_lines_and_estimates_the_rest(self):
+        """Should count real lines when content is known, else estimate from size."""
+        files = [node('a.py', 4500), node('b.py', 4500), node('c.py', None)]
+        repo = RepoStructure(
+            owner='o', name='r', url='u', description=None, primary_language='Python',
+            languages={}, files=files, commits=[], contributors=[],
+            file_contents={'a.py': b'x = 1\ny = 2'},
+        )
+
+        assert [repo.get_line_count(f) for f in files] == [2, 100, None]
@@ -0,0 +1,91 @@
+"""
+Unit tests for the pre-flight ingestion cost estimator.
+"""
+
+from apps.analysis.ingestion.cost_estimator import (
+    AdmissionDecision,
+    IngestionCostEstimator,
+    IngestionPlan,
+    RepoProfile,
+)
+
+
+def rate_limit(remaining: int) -> dict:
+    return {'remaining': remaining, 'limit': 5000, 'reset': 0.0}
+
+
+class TestIngestionCostEstimator:
+    """Test cost estimation and admit/downgrade/defer decisions."""
+    
+    def setup_method(self):
+        self.estimator = IngestionCostEstimator()
+        self.profile = RepoProfile(
+            size_kb=5000,
+            tree_entries=800,
+            directories=120,
+            top_level_directories=8,
+            commit_count=2500,
+            contributor_count=250,
+        )
+    
+    def test_estimate_counts_pages_and_profiles(self):
+        """Should count tree, commit pages, enrichment and profile lookups."""
+        estimate = self.estimator.estimate(self.profile, IngestionPlan(commit_files_budget=30))
+        
+        assert estimate.tree_calls == 1
+        assert estimate.commit_calls == 1
+        assert estimate.commit_detail_calls == 30
+        assert estimate.contributor_calls == 3 + 250
+        assert estimate.language_calls == 0
+        assert estimate.total == 1 + 1 + 30 + 253
+        
+        with_languages = self.estimator.estimate(self.profile, IngestionPlan(languages_api=True))
+        assert with_languages.language_calls == 1
+        
+        per_directory = self.estimator.estimate(self.profile, IngestionPlan(use_git_tree=False))
+        assert per_directory.tree_calls == 121
+    
+    def test_probed_tree_is_not_counted_twice(self):
+        """Should not count the tree call when the probe kept the tree."""
+        self.profile.tree = object()
+        
+        assert self.estimator.estimate(self.profile, IngestionPlan()).tree_calls == 0
+        assert self.estimator.estimate(self.profile, IngestionPlan(sampled_tree=True)).tree_calls == 0
+    
+    def test_admits_when_budget_suffices(self):
+        """Should keep the requested plan when it fits."""
+        plan = IngestionPlan(commit_files_budget=30)
+        
+        decision = self.estimator.decide(self.profile, plan, rate_limit(5000))
+        
+        assert decision.action == AdmissionDecision.ADMIT
+        assert decision.plan == plan
+    
+    def test_downgrades_to_fit_budget(self):
+        """Should drop enrichment and trim contributor profiles to fit."""
+        plan = IngestionPlan(use_git_tree=False, commit_files_budget=30)
+        
+        decision = self.estimator.decide(self.profile, plan, rate_limit(150))
+        
+        assert decision.action == AdmissionDecision.DOWNGRADE
+        assert decision.plan.use_git_tree
+        assert decision.plan.commit_files_budget == 0
+        assert 0 < decision.plan.contributor_profiles < 250
+        assert decision.estimate.total * IngestionCostEstimator.SAFETY_MARGIN <= 150 - IngestionCostEstimator.RESERVE_CALLS
+    
+    def test_defers_when_nothing_fits(self):
+        """Should defer if even the cheapest plan exceeds the budget."""
+        decision = self.estimator.decide(self.profile, IngestionPlan(), rate_limit(25))
+        
+        assert decision.action == AdmissionDecision.DEFER
+    
+    def test_sheds_content_downloads_first(self):
+        """Should trim file content downloads before commit or contributor detail."""
+        plan = IngestionPlan(commit_files_budget=30, content_requests=100)
+        
+        decision = self.estimator.decide(self.profile, plan, rate_limit(400))
+        
+        assert decision.action == AdmissionDecision.DOWNGRADE
+        assert 0 < decision.plan.content_requests < 100
+        assert decision.plan.commit_files_budget == 30
+        assert decision.plan.contributor_profiles is None
@@ -0,0 +1,56 @@
+"""
+Unit tests for the compiled detector rule engine.
+"""
+
+from apps.analysis.data_classes import FileNode, RepoStructure
+from apps.analysis.detectors import ArchitectureAnalyzer, DetectorEngine
+
+
+def make_repo(paths: list[str]) -> RepoStructure:
+    files = [
+        FileNode(path=p, name=p.rsplit('/', 1)[-1], type='file', size=10, extension='.py')
+        for p in paths
+    ]
+    return RepoStructure(
+        owner='o', name='r', url='u', description=None, primary_language='Python',
+        languages={}, files=files, commits=[], contributors=[],
+    )
+
+
+class TestDetectorEngine:
+    """Test single-pass rule matching."""
+
+    def setup_method(self):
+        self.repo = make_repo([
+            'backend/apps/domain/services/analysis.py',
+            'backend/apps/API/views.py',
+            'web/Models/user.py',
+            'src/users/models.py',
+        ])
+        self.analyzer = ArchitectureAnalyzer()
+
+    def test_matches_folders_and_patterns_from_implied_directories(self):
+        """Should match rules against every directory, case-insensitively."""
+        matches = self.analyzer.engine.match(self.repo)
+
+        assert matches.has_folder('models') and matches.has_folder('users')
+        assert matches.has_folder('web') and not matches.has_folder('controllers')
+        assert matches.has_path('apps/domain/services') and matches.has_path('apps/api')
+        assert not matches.has_path('apps/analysis')
+
+    def test_shared_matches_equal_standalone_detection(self):
+        """Should give each detector the same signal as detecting on its own."""
+        signals = self.analyzer.engine.run(self.repo)
+
+        for detector, signal in zip(self.analyzer.detectors, signals):
+            assert detector.detect(self.repo).to_dict() == signal.to_dict()
+
+    def test_compiles_rules_of_all_detectors_once(self):
+        """Should merge duplicate rules across detectors."""
+        engine = self.analyzer.engine
+        folders = set()
+        for detector in self.analyzer.detectors:
+            folders.update(detector.FOLDERS)
+
+        assert engine.rule_count == len(folders) + 4
+        assert DetectorEngine([]).match(self.repo).folders == frozenset()
@@ -0,0 +1,108 @@
+"""
+Unit tests for incremental ingestion (compare diff patching).
+"""
+
+from datetime import datetime, timezone
+
+from apps.analysis.data_classes import (
+    FileNode,
+    CommitInfo,
+    ContributorInfo,
+    RepoStructure,
+)
+from apps.analysis.ingestion.diff_patcher import RepoDiffPatcher
+
+
+def make_structure() -> RepoStructure:
+    return RepoStructure(
+        owner="o",
+        name="r",
+        url="https://github.com/o/r",
+        description=None,
+        primary_language="Python",
+        languages={"Python": 100},
+        files=[
+            FileNode(path="src", name="src", type="dir"),
+            FileNode(path="src/app.py", name="app.py", type="file", size=900, extension=".py", sha="a1"),
+            FileNode(path="old", name="old", type="dir"),
+            FileNode(path="old/legacy.py", name="legacy.py", type="file", size=450, extension=".py", sha="b1"),
+        ],
+        commits=[
+            CommitInfo(sha="base", message="init", author="Ann", author_email="",
+                       date=datetime(2026, 1, 1, tzinfo=timezone.utc)),
+        ],
+        contributors=[ContributorInfo(username="ann", name="Ann", email="", commit_count=1)],
+        head_sha="base",
+    )
+
+
+def make_comparison() -> dict:
+    return {
+        'status': 'ahead',
+        'total_commits': 1,
+        'commits': [{
+            'sha': 'head',
+            'author': {'login': 'ann'},
+            'commit': {
+                'message': 'Move legacy code\n\nDetails',
+                'author': {'name': 'Ann', 'email': 'ann@x.io', 'date': '2026-02-01T10:00:00Z'},
+            },
+        }],
+        'files': [
+            {'filename': 'src/app.py', 'status': 'modified', 'additions': 4, 'deletions': 2, 'sha': 'a2'},
+            {'filename': 'lib/legacy.py', 'previous_filename': 'old/legacy.py',
+             'status': 'renamed', 'additions': 0, 'deletions': 0, 'sha': 'b1'},
+            {'filename': 'docs/guide.md', 'status': 'added', 'additions': 10, 'deletions': 0, 'sha': 'c1'},
+        ],
+    }
+
+
+class TestRepoDiffPatcher:
+    """Test patching files, commits and contributors from a compare diff."""
+    
+    def test_patches_files_and_directories(self):
+        """Should apply changes, add parents and drop emptied directories."""
+        previous = make_structure()
+        
+        patched, changes = RepoDiffPatcher().apply(previous, make_comparison())
+        
+        nodes = {node.path: node for node in patched.files}
+        assert set(nodes) == {"src", "src/app.py", "lib", "lib/legacy.py", "docs", "docs/guide.md"}
+        assert nodes["src/app.py"].size == 900 + 2 * RepoDiffPatcher.BYTES_PER_LINE
+        assert nodes["src/app.py"].sha == "a2"
+        assert nodes["lib/legacy.py"].size == 450
+        assert changes.renamed == [("old/legacy.py", "lib/legacy.py")]
+        assert changes.structure_changed and changes.commits_changed
+        assert len(previous.files) == 4  # input left untouched
+    
+    def test_uses_exact_blob_sizes_when_known(self):
+        """Should size changed files from blob sizes and estimate only the rest."""
+        patched, _ = RepoDiffPatcher().apply(make_structure(), make_comparison(), {'a2': 1234})
+        
+        nodes = {node.path: node for node in patched.files}
+        assert nodes["src/app.py"].size == 1234
+        assert nodes["docs/guide.md"].size == 10 * RepoDiffPatcher.BYTES_PER_LINE
+    
+    def test_prepends_commits_and_bumps_contributors(self):
+        """Should add new commits newest first and count them per login."""
+        patched, changes = RepoDiffPatcher().apply(make_structure(), make_comparison())
+        
+        assert patched.head_sha == "head"
+        assert [c.sha for c in patched.commits] == ["head", "base"]
+        assert patched.commits[0].message == "Move legacy code"
+        assert patched.contributors[0].commit_count == 2
+        assert changes.base_sha == "base"
+    
+    def test_rejects_incomplete_or_diverged_diffs(self):
+        """Should fall back to full ingestion when the diff is not exact."""
+        patcher = RepoDiffPatcher()
+        
+        assert patcher.can_patch(make_comparison())
+        assert not patcher.can_patch({**make_comparison(), 'status': 'diverged'})
+        assert not patcher.can_patch({**make_comparison(), 'total_commits': 400})
+    
+    def test_structure_round_trips_through_dict(self):
+        """Should serialize for snapshot storage without loss."""
+        structure = make_structure()
+        
+        assert RepoStructure.from_dict(structure.to_dict()) == structure
@@ -0,0 +1,133 @@
+"""
+Unit tests for stratified sampling of large repositories.
+"""
+
+from apps.analysis.analyzers import (
+    ComplexityAnalyzer,
+    PrincipleEvaluator,
+    QualityAnalyzer,
+)
+from apps.analysis.data_classes import FileNode, RepoStructure, StratifiedFileSampler
+
+
+def node(path: str, size: int) -> FileNode:
+    name = path.rsplit('/', 1)[-1]
+    extension = '.' + name.rsplit('.', 1)[-1] if '.' in name else None
+    return FileNode(path=path, name=name, type='file', size=size, extension=extension, sha=path)
+
+
+def make_repo(files: list[FileNode]) -> RepoStructure:
+    return RepoStructure(
+        owner='o', name='r', url='u', description=None, primary_language='Python',
+        languages={}, files=files, commits=[], contributors=[],
+    )
+
+
+class TestStratifiedFileSampler:
+    """Test sample selection and estimates."""
+
+    def setup_method(self):
+        # 3000 small Python files, 1000 large JavaScript files (~800 lines)
+        self.files = (
+            [node(f'src/module_{i}.py', 45 * (50 + i % 100)) for i in range(3000)] +
+            [node(f'web/bundle_{i}.js', 45 * 800) for i in range(1000)]
+        )
+        self.sampler = StratifiedFileSampler(sample_size=400, threshold=1000)
+
+    def test_small_repositories_are_not_sampled(self):
+        """Should analyze repositories below the threshold exactly."""
+        assert self.sampler.sample(self.files[:999]) is None
+
+    def test_allocates_in_proportion_and_is_deterministic(self):
+        """Should sample each stratum in proportion, identically on every run."""
+        sample = self.sampler.sample(self.files)
+
+        assert sample.population == 4000
+        assert [(s.key, len(s.files)) for s in sample.strata] == [
+            (('src', '.py'), 300), (('web', '.js'), 100),
+        ]
+        assert [f.path for f in sample.files] == [f.path for f in self.sampler.sample(self.files).files]
+
+    def test_interval_covers_the_exact_mean(self):
+        """Should estimate the mean line count with an interval covering the true value."""
+        repo = make_repo(self.files)
+        sample = self.sampler.sample(self.files)
+
+        estimate = sample.mean(lambda f: repo.get_line_count(f))
+        exact = sum(repo.get_line_count(f) for f in self.files) / len(self.files)
+
+        assert estimate.lower <= exact <= estimate.upper
+        assert estimate.margin < 0.05 * exact
+
+    def test_many_small_strata_keep_nominal_coverage(self):
+        """Should not collapse the interval when most strata are tiny."""
+        # 200 directories of 20 files (30% flagged) and one constant stratum:
+        # proportional shares are under two files, so all tiny strata pool
+        files = [node(f'd{d}/f{i}.py', 999 if i % 10 < 3 else 10) for d in range(200) for i in range(20)]
+        files += [node(f'big/f{i}.py', 10) for i in range(2000)]
+        truth = sum(f.size == 999 for f in files) / len(files)
+
+        covered = 0
+        for seed in range(60):
+            sampler = StratifiedFileSampler(sample_size=400, threshold=1000, seed=f's{seed}')
+            estimate = sampler.sample(files).proportion(lambda f: f.size == 999)
+            assert estimate.upper > estimate.lower
+            covered += estimate.lower <= truth <= estimate.upper
+
+        assert covered >= 51  # ~95% nominal; at least 85% observed
+
+
+class TestSampledAnalysis:
+    """Test analyzers reporting sample estimates."""
+
+    def setup_method(self):
+        self.files = (
+            [node(f'src/module_{i}.py', 45 * 100) for i in range(3000)] +
+            [node(f'src/big_{i}.py', 45 * 2000) for i in range(300)]
+        )
+        self.repo = make_repo(self.files)
+        self.sampler = StratifiedFileSampler(sample_size=500, threshold=1000)
+
+    def test_complexity_estimates_match_exact_analysis(self):
+        """Should estimate totals and counts close to a full analysis."""
+        exact = ComplexityAnalyzer().analyze(self.repo)
+
+        metrics = QualityAnalyzer(self.sampler).analyze(self.repo)
+
+        assert metrics.is_sampled()
+        assert metrics.sample_size == 500
+        assert metrics.total_files == exact['total_files']
+        interval = metrics.confidence_intervals['very_large_files_ratio']
+        assert interval.lower <= 300 / 3300 <= interval.upper
+        score = metrics.confidence_intervals['complexity_score']
+        assert score.lower <= exact['complexity_score'] <= score.upper
+        assert metrics.to_dict()['sampling']['population'] == 3300
+
+    def test_principle_violations_come_from_the_sample(self):
+        """Should list only sampled violations and report score intervals."""
+        result = PrincipleEvaluator(self.sampler).evaluate(self.repo)
+
+        srp = [v for v in result.violations if v.principle == "Single Responsibility Principle"]
+        assert 0 < len(srp) < 300
+        interval = result.confidence_intervals['principle_score']
+        assert interval.lower <= result.principle_score <= interval.upper
+        assert PrincipleEvaluator().evaluate(self.repo).to_dict()['sampling'] is None
+
+    def test_sample_is_drawn_once_per_repository(self):
+        """Should share one sample between analyzers with equal settings."""
+        draws = []
+
+        class CountingSampler(StratifiedFileSampler):
+            def sample(self, files):
+                draws.append(1)
+                return super().sample(files)
+
+        sampler = CountingSampler(sample_size=500, threshold=1000)
+        QualityAnalyzer(sampler).analyze(self.repo)
+        PrincipleEvaluator(CountingSampler(sample_size=500, threshold=1000)).evaluate(self.repo)
+
+        assert len(draws) == 1
+        assert self.repo.index.sample(sampler) is self.repo.index.sample(self.sampler)
+        self.repo.files = self.files[:-1]
+        assert self.repo.index.sample(sampler).population == 3299
+        assert len(draws) == 2
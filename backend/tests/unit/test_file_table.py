@@ -0,0 +1,76 @@
+"""
+Unit tests for the columnar file table.
+"""
+
+import hashlib
+import tracemalloc
+
+from apps.analysis.data_classes import FileNode, FileTable, RepoStructure
+
+
+def make_nodes(count: int):
+    for i in range(count):
+        name = f'module_{i}.py'
+        yield FileNode(
+            path=f'src/package_{i % 40}/sub_{i % 7}/{name}',
+            name=name,
+            type='file',
+            size=1000 + i,
+            extension=name[name.rfind('.'):],
+            sha=hashlib.sha1(str(i).encode()).hexdigest(),
+        )
+
+
+class TestFileTable:
+    """Test FileNode views and memory use."""
+
+    def test_views_equal_the_stored_nodes(self):
+        """Should rebuild every node exactly, including unusual values."""
+        nodes = [
+            FileNode(path='src', name='src', type='dir', sha='a' * 40),
+            FileNode(path='src/app.py', name='app.py', type='file', size=0, extension='.py', sha='b' * 40),
+            FileNode(path='src/über.md', name='über.md', type='file', size=None, extension='.md'),
+            FileNode(path='README', name='README', type='file', size=10, sha='README'),
+            FileNode(path='lib/link', name='renamed', type='symlink'),
+        ]
+
+        table = FileTable(nodes)
+
+        assert list(table) == nodes
+        assert table[-1] == nodes[-1]
+        assert table[1:3] == nodes[1:3]
+        assert list(table.paths()) == [n.path for n in nodes]
+        assert table.count_type('file') == 3
+
+    def test_repo_structure_stores_files_as_a_table(self):
+        """Should convert any iterable of nodes and keep list-like access."""
+        nodes = list(make_nodes(10))
+        repo = RepoStructure(
+            owner='o', name='r', url='u', description=None, primary_language=None,
+            languages={}, files=nodes, commits=[], contributors=[],
+        )
+
+        assert isinstance(repo.files, FileTable)
+        assert repo.files == nodes
+        assert repo.get_total_files() == 10
+        assert RepoStructure.from_dict(repo.to_dict()).files == nodes
+
+    def test_uses_at_least_five_times_less_memory(self):
+        """Should hold a large tree in a fifth of the memory of FileNode objects."""
+        count = 20_000
+
+        tracemalloc.start()
+        try:
+            nodes = list(make_nodes(count))
+            list_bytes = tracemalloc.get_traced_memory()[0]
+            del nodes
+            tracemalloc.reset_peak()
+
+            before = tracemalloc.get_traced_memory()[0]
+            table = FileTable(make_nodes(count))
+            table_bytes = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+
+        assert len(table) == count
+        assert list_bytes >= 5 * table_bytes
@@ -0,0 +1,231 @@
+"""
+Unit tests for GitHub data fetcher.
+
+Uses in-memory fakes instead of PyGithub objects (no network).
+"""
+
+from types import SimpleNamespace
+
+import requests
+
+from apps.analysis.data_classes import FileNode
+from apps.analysis.ingestion.github_data_fetcher import GitHubDataFetcher
+from apps.analysis.ingestion.paginated_fetcher import ParallelPaginatedFetcher
+from apps.analysis.ingestion.tree_walker import BreadthFirstTreeWalker, SubtreeTask
+
+
+def make_element(path, type="blob", size=100, sha=None):
+    """Build a fake git tree entry."""
+    return SimpleNamespace(path=path, type=type, size=size, sha=sha or f"sha-{path}")
+
+
+class FakeTreeRepo:
+    """Fake repository serving git trees from a dict keyed by (sha, recursive)."""
+
+    default_branch = "main"
+
+    def __init__(self, trees):
+        self.trees = trees
+        self.calls = []
+
+    def get_git_tree(self, sha, recursive=False):
+        self.calls.append((sha, recursive))
+        entries, truncated = self.trees[(sha, bool(recursive))]
+        return SimpleNamespace(sha=sha, tree=entries, truncated=truncated)
+
+
+class TestFetchFileTreeRecursive:
+    """Test single-call recursive tree ingestion."""
+
+    def test_builds_nodes_in_one_request(self):
+        """Should build filtered FileNodes from one recursive tree call."""
+        repo = FakeTreeRepo({
+            ("main", True): ([
+                make_element("src", type="tree", size=None),
+                make_element("src/app.py", size=450),
+                make_element("node_modules", type="tree", size=None),
+                make_element("node_modules/lib.js"),
+                make_element("package-lock.json"),
+                make_element("vendored", type="commit", size=None),
+            ], False),
+        })
+
+        files = GitHubDataFetcher().fetch_file_tree_recursive(repo)
+
+        assert repo.calls == [("main", True)]
+        assert [f.path for f in files] == ["src", "src/app.py"]
+        assert files[0].is_directory() and files[0].size is None
+        assert files[1].name == "app.py"
+        assert files[1].extension == ".py"
+        assert files[1].size == 450
+        assert files[1].sha == "sha-src/app.py"
+
+    def test_reuses_a_fetched_tree(self):
+        """Should build nodes from a tree already fetched by the probe."""
+        repo = FakeTreeRepo({})
+        tree = SimpleNamespace(sha="main", tree=[make_element("app.py")], truncated=False)
+
+        files = GitHubDataFetcher().fetch_file_tree_recursive(repo, tree=tree)
+        sampled = GitHubDataFetcher().fetch_file_tree_sampled(repo, tree=tree)
+
+        assert repo.calls == []
+        assert [f.path for f in files] == [f.path for f in sampled] == ["app.py"]
+
+    def test_truncated_tree_falls_back_to_subtrees(self):
+        """Should re-fetch subtrees individually when the tree is truncated."""
+        repo = FakeTreeRepo({
+            ("main", True): ([make_element("README.md")], True),
+            ("main", False): ([
+                make_element("README.md"),
+                make_element("lib", type="tree", size=None, sha="lib-sha"),
+                make_element("build", type="tree", size=None, sha="build-sha"),
+            ], False),
+            ("lib-sha", True): ([make_element("core/util.py")], False),
+        })
+
+        files = GitHubDataFetcher().fetch_file_tree_recursive(repo)
+
+        assert [f.path for f in files] == ["README.md", "lib", "lib/core/util.py"]
+        # Excluded directories are pruned before any request is made
+        assert ("build-sha", True) not in repo.calls
+
+    def test_walk_reports_subtrees_skipped_by_budget(self):
+        """Should list level by level and report what the budget cut off."""
+        repo = FakeTreeRepo({
+            ("main", False): ([
+                make_element("a", type="tree", size=None, sha="a-sha"),
+                make_element("b", type="tree", size=None, sha="b-sha"),
+            ], False),
+            ("a-sha", True): ([make_element("x.py")], True),
+            ("a-sha", False): ([make_element("deep", type="tree", size=None, sha="deep-sha")], False),
+            ("b-sha", True): ([make_element("y.py")], False),
+        })
+
+        result = GitHubDataFetcher(max_tree_requests=4).walk_git_tree(repo, "main", split=True)
+
+        assert [f.path for f in result.files] == ["a", "b", "b/y.py", "a/deep"]
+        assert [(s.path, s.depth, s.reason) for s in result.skipped] == [("a/deep", 2, "budget")]
+        # The truncated subtree's one-level listing is counted too
+        assert result.requests == len(repo.calls) == 4
+
+    def test_walk_skips_subtrees_that_fail(self):
+        """Should report network failures of a listing like API errors."""
+        def list_subtree(task):
+            if task.path == "b":
+                raise requests.ConnectionError("reset")
+            if task.path == "a":
+                return [FileNode(path="a/x.py", name="x.py", type="file")], []
+            return [], [SubtreeTask("a", "a-sha", 1), SubtreeTask("b", "b-sha", 1)]
+
+        result = BreadthFirstTreeWalker(max_depth=5).walk([SubtreeTask("", "main")], list_subtree)
+
+        assert [f.path for f in result.files] == ["a/x.py"]
+        assert [(s.path, s.reason) for s in result.skipped] == [("b", "error")]
+
+
+def make_commit(sha):
+    """Build a raw list-response commit (no file data)."""
+    author = {"name": "Jane", "email": "jane@example.com", "date": "2024-01-01T00:00:00Z"}
+    return {"sha": sha, "commit": {"message": f"{sha}\n\nbody", "author": author}}
+
+
+class FakeRequester:
+    """Fake PyGithub requester serving paginated lists and user profiles."""
+
+    API = "https://api.github.com/repos/octo/app"
+
+    def __init__(self, lists, profiles=None):
+        self.lists = lists
+        self.profiles = profiles or {}
+        self.calls = []
+
+    def requestJsonAndCheck(self, verb, url, parameters=None):
+        self.calls.append((url, (parameters or {}).get("page")))
+        if url.startswith("/users/"):
+            return {}, self.profiles[url[len("/users/"):]]
+
+        items = self.lists[url[len(self.API) + 1:]]
+        page, per_page = parameters["page"], parameters["per_page"]
+        last = max((len(items) + per_page - 1) // per_page, 1)
+        headers = {}
+        if last > 1:
+            headers["link"] = f'<{url}?per_page={per_page}&page={last}>; rel="last"'
+        return headers, items[(page - 1) * per_page:page * per_page]
+
+
+class FakeCommitRepo:
+    """Fake repository serving a commit list and commit details."""
+
+    url = FakeRequester.API
+
+    def __init__(self, count):
+        self.requester = FakeRequester({"commits": [make_commit(f"c{i}") for i in range(count)]})
+        self.detail_calls = []
+
+    def get_commit(self, sha):
+        self.detail_calls.append(sha)
+        return SimpleNamespace(raw_data={"files": [{}, {}, {}]})
+
+
+class TestFetchCommits:
+    """Test commit ingestion without per-commit detail requests."""
+
+    def test_builds_commits_from_list_response(self):
+        """Should not touch commit details and should cap at MAX_COMMITS."""
+        repo = FakeCommitRepo(GitHubDataFetcher.MAX_COMMITS + 20)
+
+        commits = GitHubDataFetcher().fetch_commits(repo)
+
+        assert len(commits) == GitHubDataFetcher.MAX_COMMITS
+        assert commits[0].message == "c0"
+        assert all(c.files_changed is None for c in commits)
+        assert repo.detail_calls == []
+
+    def test_enrichment_respects_call_budget(self):
+        """Should enrich only the newest commits within the budget."""
+        repo = FakeCommitRepo(10)
+        fetcher = GitHubDataFetcher()
+        commits = fetcher.fetch_commits(repo)
+
+        calls = fetcher.enrich_commit_files(repo, commits, max_calls=4)
+
+        assert calls == 4
+        assert sorted(repo.detail_calls) == ["c0", "c1", "c2", "c3"]
+        assert [c.files_changed for c in commits[:5]] == [3, 3, 3, 3, None]
+
+
+class TestParallelPaginatedFetcher:
+    """Test Link-header driven parallel pagination."""
+
+    def test_yields_all_pages_in_order_within_cap(self):
+        """Should read the last page from Link and stop at max_pages."""
+        items = [{"n": i} for i in range(250)]
+        repo = SimpleNamespace(url=FakeRequester.API, requester=FakeRequester({"stargazers": items}))
+
+        fetched = list(ParallelPaginatedFetcher(page_size=50).fetch(repo, "stargazers"))
+        capped = list(ParallelPaginatedFetcher(max_pages=2, page_size=50).fetch(repo, "stargazers"))
+
+        assert [i["n"] for i in fetched] == list(range(250))
+        assert [i["n"] for i in capped] == list(range(100))
+
+    def test_contributors_respect_profile_budget(self):
+        """Should page contributors and look up only the top profiles."""
+        contributors = [{"login": f"u{i}", "contributions": 300 - i} for i in range(250)]
+        requester = FakeRequester({"contributors": contributors}, profiles={"u0": {"name": "Zero"}})
+        repo = SimpleNamespace(url=FakeRequester.API, requester=requester)
+
+        result = GitHubDataFetcher().fetch_contributors(repo, max_profiles=1)
+
+        assert len(result) == 250
+        assert (result[0].name, result[1].name) == ("Zero", None)
+        assert sorted(page for url, page in requester.calls if page) == [1, 2, 3]
+
+    def test_contributors_look_up_every_profile_by_default(self):
+        """Should only skip profiles when a budget is passed explicitly."""
+        contributors = [{"login": f"u{i}", "contributions": 300 - i} for i in range(40)]
+        profiles = {f"u{i}": {"name": f"User {i}"} for i in range(40)}
+        repo = SimpleNamespace(url=FakeRequester.API, requester=FakeRequester({"contributors": contributors}, profiles=profiles))
+
+        result = GitHubDataFetcher().fetch_contributors(repo)
+
+        assert [c.name for c in result] == [f"User {i}" for i in range(40)]
@@ -0,0 +1,53 @@
+"""
+Unit tests for local language classification.
+"""
+
+from apps.analysis.data_classes import FileNode
+from apps.analysis.ingestion.language_classifier import LanguageClassifier
+
+
+def node(path: str, size: int) -> FileNode:
+    name = path.rsplit('/', 1)[-1]
+    extension = '.' + name.rsplit('.', 1)[-1] if '.' in name else None
+    return FileNode(path=path, name=name, type='file', size=size, extension=extension)
+
+
+FILES = [
+    node('backend/app/models.py', 4000),
+    node('backend/Dockerfile', 300),
+    node('backend/requirements.txt', 200),
+    node('frontend/src/App.tsx', 2500),
+    node('frontend/src/main.js', 500),
+    node('frontend/node_modules/react/index.js', 90000),
+    node('frontend/dist/bundle.min.js', 70000),
+    node('docs/conf.py', 800),
+    node('README.md', 1000),
+    node('setup.py', 100),
+    FileNode(path='backend', name='backend', type='dir'),
+]
+
+
+class TestLanguageClassifier:
+    """Test byte counts per language and per directory."""
+    
+    def setup_method(self):
+        self.classifier = LanguageClassifier()
+    
+    def test_counts_bytes_like_languages_endpoint(self):
+        """Should count code by extension and filename, skipping vendored, built and docs."""
+        languages = self.classifier.language_bytes(FILES)
+        
+        assert languages == {'Python': 4100, 'TypeScript': 2500, 'JavaScript': 500, 'Dockerfile': 300}
+        assert list(languages) == ['Python', 'TypeScript', 'JavaScript', 'Dockerfile']
+    
+    def test_subdirectory_stats(self):
+        """Should give stats for any directory, and for all top-level ones in one pass."""
+        assert self.classifier.language_bytes(FILES, path='frontend/') == {'TypeScript': 2500, 'JavaScript': 500}
+        
+        by_directory = self.classifier.language_bytes_by_directory(FILES)
+        
+        assert by_directory == {
+            '': {'Python': 100},
+            'backend': {'Python': 4000, 'Dockerfile': 300},
+            'frontend': {'TypeScript': 2500, 'JavaScript': 500},
+        }
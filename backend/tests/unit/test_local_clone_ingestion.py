@@ -0,0 +1,92 @@
+"""
+Unit tests for local clone ingestion.
+
+Builds a throwaway git repository on disk and ingests it offline.
+"""
+
+import pytest
+from git import Actor, Repo
+from git.cmd import Git
+
+from apps.analysis.ingestion import LocalCloneIngestionService, RepoAccessError
+
+
+@pytest.fixture
+def source_repo(tmp_path):
+    """Create a small git repository with two commits by two authors."""
+    path = tmp_path / "sample-app"
+    repo = Repo.init(path, initial_branch="main")
+    
+    (path / "src").mkdir()
+    (path / "src" / "app.py").write_text("print('hello')\n")
+    (path / "README.md").write_text("# Sample\n")
+    (path / "node_modules").mkdir()
+    (path / "node_modules" / "lib.js").write_text("module.exports = 1;\n")
+    repo.index.add(["src/app.py", "README.md", "node_modules/lib.js"])
+    repo.index.commit("Initial commit", author=Actor("Jane Doe", "jane@example.com"))
+    
+    (path / "src" / "models.py").write_text("class User:\n    pass\n")
+    repo.index.add(["src/models.py"])
+    repo.index.commit("Add models\n\nLonger body", author=Actor("John Roe", "john@example.com"))
+    
+    return path
+
+
+class TestLocalCloneIngestionService:
+    """Test ingestion from local paths and file:// URLs."""
+    
+    def test_ingests_local_path(self, source_repo):
+        """Should build files, commits and contributors from a clone."""
+        repo = LocalCloneIngestionService().ingest_repository(str(source_repo))
+        
+        assert repo.owner == "local"
+        assert repo.name == "sample-app"
+        assert repo.default_branch == "main"
+        assert [f.path for f in repo.files] == [
+            "README.md", "src", "src/app.py", "src/models.py"
+        ]
+        app = repo.files[2]
+        assert app.size == len("print('hello')\n")
+        assert app.extension == ".py"
+        assert len(app.sha) == 40
+        
+        assert [c.message for c in repo.commits] == ["Add models", "Initial commit"]
+        assert repo.commits[0].author == "John Roe"
+        assert repo.updated_at == repo.commits[0].date
+        assert repo.created_at == repo.commits[1].date
+        assert {c.email for c in repo.contributors} == {"jane@example.com", "john@example.com"}
+    
+    def test_ingests_file_url(self, source_repo):
+        """Should accept file:// URLs."""
+        repo = LocalCloneIngestionService().ingest_repository(source_repo.as_uri())
+        
+        assert repo.get_total_files() == 3
+        assert repo.get_commit_count() == 2
+    
+    def test_missing_repository_raises_access_error(self, tmp_path):
+        """Should map clone failures to RepoAccessError."""
+        with pytest.raises(RepoAccessError):
+            LocalCloneIngestionService().ingest_repository((tmp_path / "missing").as_uri())
+    
+    def test_token_stays_out_of_argv_and_config(self, source_repo, tmp_path, monkeypatch):
+        """Should send the token as a header, not in the URL or .git/config."""
+        token = "ghp_secret123"
+        commands = []
+        execute = Git.execute
+        
+        def spy(self, command, *args, **kwargs):
+            commands.append((list(command), {**self.environment(), **(kwargs.get("env") or {})}))
+            return execute(self, command, *args, **kwargs)
+        
+        monkeypatch.setattr(Git, "execute", spy)
+        service = LocalCloneIngestionService(github_token=token)
+        
+        _, _, clone_url = service._resolve_source("https://github.com/octo/app")
+        service._clone(str(source_repo), str(tmp_path / "clone"))
+        
+        assert clone_url == "https://github.com/octo/app.git"
+        assert commands and not any(token in arg for argv, _ in commands for arg in argv)
+        assert all(token not in value for _, env in commands for value in env.values())
+        [clone_env] = [env for argv, env in commands if "clone" in argv]
+        assert clone_env["GIT_CONFIG_KEY_0"] == "http.https://github.com/.extraHeader"
+        assert token not in (tmp_path / "clone" / ".git" / "config").read_text()
@@ -0,0 +1,79 @@
+"""
+Unit tests for path trie queries.
+"""
+
+from apps.analysis.analyzers import TestCoverageAnalyzer
+from apps.analysis.data_classes import FileNode, PathTrie, RepoStructure
+from apps.analysis.detectors import CleanArchitectureDetector
+
+
+class TestPathTrie:
+    """Test segment, prefix and pattern queries."""
+
+    def setup_method(self):
+        self.trie = PathTrie(['backend/apps/domain/services', 'backend/apps/API', 'frontend/src/tests'])
+
+    def test_segment_and_prefix_queries(self):
+        """Should find folders at any depth and anchored prefixes."""
+        assert self.trie.has_segment('domain')
+        assert self.trie.has_segment('api')
+        assert not self.trie.has_segment('apps/domain')
+        assert self.trie.has_prefix('backend/apps')
+        assert not self.trie.has_prefix('apps/domain')
+
+    def test_patterns_match_whole_consecutive_segments(self):
+        """Should match runs of segments anywhere, but not partial names."""
+        assert self.trie.contains('apps/domain/services')
+        assert self.trie.contains('/apps/api/')
+        assert not self.trie.contains('apps/services')
+        assert not self.trie.contains('app/domain')
+        assert not self.trie.contains('')
+
+    def test_repeated_segments(self):
+        """Should check every occurrence of a segment, anchored or not."""
+        trie = PathTrie(['src/app/lib/app/core', 'app'])
+
+        assert trie.contains('app/core') and trie.contains('app/lib/app')
+        assert not trie.contains('app/app')
+        assert trie.has_prefix('src/app/lib') and trie.has_prefix('app')
+        assert not trie.has_prefix('app/core')
+
+    def test_directories_within(self):
+        """Should list folders inside matching folders below the top level."""
+        assert self.trie.directories_within(['tests', 'backend'], min_depth=1) == {'frontend/src/tests'}
+
+        trie = PathTrie(['pkg/tests/unit/api', 'pkg/tests/e2e', 'tests/smoke', 'pkg/src'])
+        assert trie.directories_within(['tests'], min_depth=1) == {
+            'pkg/tests', 'pkg/tests/unit', 'pkg/tests/unit/api', 'pkg/tests/e2e',
+        }
+        assert trie.directories_within(['tests']) >= {'tests', 'tests/smoke'}
+
+    def test_patterns_longer_than_the_indexed_tails(self):
+        """Should match patterns of more than MAX_PATTERN_SEGMENTS segments."""
+        trie = PathTrie(['a/b/c/d/e/f', 'x/c/d/e/f'])
+
+        assert trie.contains('b/c/d/e/f') and trie.contains('a/b/c/d/e')
+        assert not trie.contains('x/b/c/d/e') and not trie.contains('a/c/d/e/f')
+
+
+class TestTrieConsumers:
+    """Test detectors and analyzers matching paths through the trie."""
+
+    def test_detectors_and_analyzers(self):
+        """Should match Django layer paths and nested test folders."""
+        paths = ['backend/apps/domain/services/a.py', 'backend/apps/api/v.py', 'tests/b.py', 'pkg/tests/c.py']
+        files = [
+            FileNode(path=p, name=p.rsplit('/', 1)[-1], type='file', size=10, extension='.py')
+            for p in paths
+        ]
+        repo = RepoStructure(
+            owner='o', name='r', url='u', description=None, primary_language='Python',
+            languages={}, files=files, commits=[], contributors=[],
+        )
+
+        signal = CleanArchitectureDetector().detect(repo)
+        coverage = TestCoverageAnalyzer().analyze(repo)
+
+        assert signal.indicators['has_domain'] and signal.indicators['has_application']
+        assert signal.indicators['has_interfaces']
+        assert coverage['test_files_count'] == 1
@@ -0,0 +1,75 @@
+"""
+Unit tests for the cached RepoStructure lookup indexes.
+"""
+
+from apps.analysis.analyzers import DocumentationAnalyzer, TestCoverageAnalyzer
+from apps.analysis.data_classes import FileNode, RepoStructure
+from apps.analysis.detectors import MVCDetector
+
+
+def file(path: str, size: int = 100) -> FileNode:
+    name = path.rsplit('/', 1)[-1]
+    extension = '.' + name.rsplit('.', 1)[-1] if '.' in name else None
+    return FileNode(path=path, name=name, type='file', size=size, extension=extension)
+
+
+def directory(path: str) -> FileNode:
+    return FileNode(path=path, name=path.rsplit('/', 1)[-1], type='dir')
+
+
+def make_repo() -> RepoStructure:
+    files = [
+        directory('app'), directory('app/Models'), directory('app/views'), directory('tests'),
+        file('README.md'), file('settings.py'), file('app/Models/user.py'),
+        file('app/views/home.py'), file('tests/test_user.py'), file('docs.txt'),
+    ]
+    return RepoStructure(
+        owner='o', name='r', url='u', description=None, primary_language='Python',
+        languages={}, files=files, commits=[], contributors=[],
+    )
+
+
+class TestRepoIndex:
+    """Test index contents and invalidation."""
+
+    def test_lookups(self):
+        """Should answer folder, extension, children and classification lookups."""
+        repo = make_repo()
+        index = repo.index
+
+        assert {'app', 'models', 'views', 'tests'} <= index.folder_names
+        assert [f.path for f in repo.get_files_by_extension('.py')] == [
+            'settings.py', 'app/Models/user.py', 'app/views/home.py', 'tests/test_user.py',
+        ]
+        assert [f.path for f in repo.get_children('app')] == ['app/Models', 'app/views']
+        assert [f.path for f in repo.get_test_files()] == ['tests/test_user.py']
+        assert len(index.files) == 6
+        assert len(index.doc_files) == 2
+        assert [repo.files[i].path for i in index.config_files] == ['settings.py']
+        assert repo.index is index
+
+    def test_rebuilt_when_files_change(self):
+        """Should drop the index when files is replaced or appended to."""
+        repo = make_repo()
+        stale = repo.index
+        assert 'controllers' not in stale.folder_names
+
+        repo.files.append(directory('app/controllers'))
+        assert 'controllers' in repo.index.folder_names
+
+        repo.files = [file('main.go')]
+        assert repo.index.folder_names == frozenset()
+        assert [f.path for f in repo.get_files_by_extension('.go')] == ['main.go']
+
+    def test_consumers_use_the_index(self):
+        """Should give detectors and analyzers the same answers as a scan."""
+        repo = make_repo()
+
+        assert MVCDetector().has_folder(repo, 'models')
+        coverage = TestCoverageAnalyzer().analyze(repo)
+        docs = DocumentationAnalyzer().analyze(repo)
+
+        assert coverage['test_files_count'] == 1
+        assert coverage['has_test_directories']
+        assert docs['has_readme'] and docs['doc_files_count'] == 2
+        assert docs['doc_ratio'] == 2 / 5
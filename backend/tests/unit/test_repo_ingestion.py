@@ -0,0 +1,167 @@
+"""
+Unit tests for the synchronous repository ingestion service.
+
+Uses an in-memory fake repository instead of PyGithub objects (no network).
+"""
+
+import base64
+import threading
+from dataclasses import replace
+from types import SimpleNamespace
+
+import pytest
+from github import GithubException
+
+from apps.analysis.data_classes import FileNode, RepoStructure
+from apps.analysis.ingestion import BlobStore, Cassette, IngestionConfig, RepoIngestionService
+from apps.analysis.ingestion.blob_store import git_blob_sha
+
+
+class FakeRepo:
+    """
+    Fake repository whose tree call waits for the contributors call.
+
+    The tree is listed first, so it only completes if the other
+    components run on the pool meanwhile. Commits always fail.
+    """
+
+    url = "https://api.github.com/repos/octo/app"
+    default_branch = "main"
+
+    def __init__(self):
+        self.contributors_served = threading.Event()
+        self.requester = self
+
+    def get_git_tree(self, sha, recursive=False):
+        assert self.contributors_served.wait(timeout=5), "components ran one after another"
+        entries = [SimpleNamespace(path="app.py", type="blob", size=120, sha="sha-app")]
+        return SimpleNamespace(sha=sha, tree=entries, truncated=False)
+
+    def requestJsonAndCheck(self, verb, url, parameters=None):
+        if url.endswith("/commits"):
+            raise GithubException(500, {"message": "Server Error"}, None)
+        if url.startswith("/users/"):
+            return {}, {"name": "Octo", "email": None}
+        self.contributors_served.set()
+        return {}, [{"login": "octo", "contributions": 10}]
+
+    def get_languages(self):
+        return {"Python": 120}
+
+
+class TestIngestionConfig:
+    """Test building the service from a config object."""
+
+    def test_options_override_the_config(self):
+        """Should apply keyword options on top of the config and fill in collaborators."""
+        store = BlobStore()
+        config = IngestionConfig(commit_files_budget=5, blob_store=store)
+
+        service = RepoIngestionService("t", config, preflight=False, fetch_contents=False)
+
+        assert (service.preflight, service.plan.commit_files_budget) == (False, 5)
+        assert service.plan.content_requests == 0
+        assert service.blob_store is store
+        assert service.selector is not None and service.file_sampler is not None
+        assert config.preflight is True
+
+    def test_cassette_forces_the_recorded_transport(self, tmp_path):
+        """Should use the Git Trees mode and a private blob store with a cassette."""
+        store = BlobStore()
+        config = IngestionConfig(
+            use_archive=True, blob_store=store, cassette=Cassette(str(tmp_path / "c.json"), mode="record"),
+        )
+
+        service = RepoIngestionService("t", config)
+
+        assert (service.plan.use_git_tree, service.plan.use_archive, service.select_strategy) == (True, False, False)
+        assert service.blob_store is not store
+
+    def test_unknown_option_raises(self):
+        """Should reject options that are not config fields."""
+        with pytest.raises(TypeError):
+            RepoIngestionService("t", use_gittree=False)
+
+
+class TestFetchComponents:
+    """Test fetching the repository components on the thread pool."""
+
+    def test_results_keep_order_and_failures_stay_isolated(self):
+        """Should return components in task order and degrade only the failed one."""
+        service = RepoIngestionService(
+            "t", preflight=False, select_strategy=False, fetch_contents=False, blob_store=BlobStore(),
+        )
+        plan = replace(service.plan, languages_api=True)
+
+        (index, contents), commits, contributors, languages = service._fetch_components(FakeRepo(), plan)
+
+        assert [f.path for f in index.table] == ["app.py"]
+        assert contents == {}
+        assert commits == []
+        assert [(c.username, c.name) for c in contributors] == [("octo", "Octo")]
+        assert languages == {"Python": 120}
+
+
+SOURCE = b"def main():\n    return 1\n"
+
+
+class FakeUnchangedRepo:
+    """Fake repository whose default branch has not moved since the last run."""
+
+    default_branch = "main"
+    description = None
+    language = "Python"
+    stargazers_count = forks_count = open_issues_count = 0
+    updated_at = None
+
+    def __init__(self):
+        self.blob_calls = []
+
+    def compare(self, base, head):
+        return SimpleNamespace(raw_data={'status': 'identical', 'total_commits': 0, 'commits': [], 'files': []})
+
+    def get_git_blob(self, sha):
+        self.blob_calls.append(sha)
+        return SimpleNamespace(encoding="base64", content=base64.b64encode(SOURCE).decode())
+
+
+class TestIngestIncremental:
+    """Test bringing a stored structure up to date."""
+
+    def make_service(self, repo):
+        service = RepoIngestionService("t", preflight=False, select_strategy=False, blob_store=BlobStore())
+        service.client = SimpleNamespace(get_repository=lambda owner, name: repo)
+        return service
+
+    def make_previous(self):
+        return RepoStructure(
+            owner="octo", name="app", url="https://github.com/octo/app", description=None,
+            primary_language="Python", languages={}, commits=[], contributors=[],
+            files=[FileNode(path="app.py", name="app.py", type="file", size=len(SOURCE),
+                            extension=".py", sha=git_blob_sha(SOURCE))],
+            head_sha="base", default_branch="main",
+        )
+
+    def test_unchanged_files_keep_no_contents_by_default(self):
+        """Should not download anything when nothing changed and no section needs contents."""
+        repo = FakeUnchangedRepo()
+
+        structure, changes = self.make_service(repo).ingest_incremental(
+            "https://github.com/octo/app", self.make_previous()
+        )
+
+        assert changes.is_empty()
+        assert structure.file_contents == {}
+        assert repo.blob_calls == []
+
+    def test_section_version_bump_refreshes_contents(self):
+        """Should fetch contents for recomputed sections even if files are unchanged."""
+        repo = FakeUnchangedRepo()
+
+        structure, changes = self.make_service(repo).ingest_incremental(
+            "https://github.com/octo/app", self.make_previous(), refresh_contents=True
+        )
+
+        assert not changes.files_changed
+        assert structure.file_contents == {"app.py": SOURCE}
+        assert structure.get_line_count(structure.files[0]) == 2
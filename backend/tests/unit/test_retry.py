@@ -0,0 +1,157 @@
+"""
+Unit tests for the GitHub retry transport layer.
+"""
+
+import asyncio
+import io
+import json
+import tarfile
+import time
+
+import httpx
+import requests
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+from apps.analysis.ingestion.archive_fetcher import GitHubArchiveFetcher
+from apps.analysis.ingestion.async_github_client import AsyncGitHubClient
+from apps.analysis.ingestion.retry import RetryLayer, RetryPolicy
+
+
+class ScriptedAdapter(BaseAdapter):
+    """Fake GitHub answering with a fixed sequence of responses."""
+
+    def __init__(self, *responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.calls = 0
+
+    def send(self, request, **kwargs):
+        self.calls += 1
+        status, headers, body = self.responses.pop(0)
+        response = Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response._content = json.dumps(body).encode()
+        response.raw = io.BytesIO(response._content)
+        return response
+
+    def close(self):
+        pass
+
+
+def make_request() -> PreparedRequest:
+    request = PreparedRequest()
+    request.prepare(method='GET', url='https://api.github.com/repos/o/r', headers={})
+    return request
+
+
+def make_layer(adapter: BaseAdapter, sleeps: list) -> RetryLayer:
+    return RetryLayer(adapter, RetryPolicy(max_attempts=3, max_wait=30), sleep=sleeps.append)
+
+
+class TestRetryLayer:
+    """Test which failures are retried and how long the layer waits."""
+
+    def test_honours_retry_after_and_backs_off_on_5xx(self):
+        """Should wait Retry-After seconds, then jittered backoff for a 502."""
+        adapter = ScriptedAdapter(
+            (403, {'Retry-After': '7'}, {'message': 'You have exceeded a secondary rate limit'}),
+            (502, {}, {'message': 'Bad Gateway'}),
+            (200, {}, {'full_name': 'o/r'}),
+        )
+        sleeps = []
+
+        response = make_layer(adapter, sleeps).send(make_request())
+
+        assert response.status_code == 200
+        assert adapter.calls == 3
+        assert sleeps[0] == 7.0
+        assert 0 <= sleeps[1] <= 2 * RetryPolicy.base_delay
+
+    def test_fails_fast_on_404_and_permission_403(self):
+        """Should not retry a missing repository or a plain forbidden."""
+        for status, body in ((404, {'message': 'Not Found'}), (403, {'message': 'Forbidden'})):
+            adapter = ScriptedAdapter((status, {}, body))
+            sleeps = []
+
+            response = make_layer(adapter, sleeps).send(make_request())
+
+            assert response.status_code == status
+            assert adapter.calls == 1
+            assert sleeps == []
+
+    def test_primary_rate_limit_waits_only_for_near_reset(self):
+        """Should sleep until a near reset, and give up on a distant one."""
+        near = {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(int(time.time()) + 5)}
+        far = {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(int(time.time()) + 3600)}
+
+        adapter = ScriptedAdapter((403, near, {}), (200, {}, {}))
+        sleeps = []
+        assert make_layer(adapter, sleeps).send(make_request()).status_code == 200
+        assert 0 < sleeps[0] <= 7
+
+        adapter = ScriptedAdapter((403, far, {}))
+        sleeps = []
+        assert make_layer(adapter, sleeps).send(make_request()).status_code == 403
+        assert sleeps == []
+
+
+class TestRetryOutsidePyGithub:
+    """Test the async client and the archive download with the same policy."""
+
+    def test_async_client_retries_throttled_and_failed_requests(self):
+        """Should wait Retry-After, back off on 5xx/network errors, then succeed."""
+        responses = [
+            httpx.Response(429, headers={'Retry-After': '3'}, json={'message': 'secondary rate limit'}),
+            httpx.ConnectError('reset'),
+            httpx.Response(503, json={'message': 'unavailable'}),
+            httpx.Response(200, json={'full_name': 'o/r'}),
+        ]
+        sleeps = []
+
+        def handler(request):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        async def sleep(delay):
+            sleeps.append(delay)
+
+        async def main():
+            async with AsyncGitHubClient(
+                't', transport=httpx.MockTransport(handler), retry_policy=RetryPolicy(max_attempts=4), sleep=sleep,
+            ) as client:
+                return await client.get_repository('o', 'r')
+
+        assert asyncio.run(main()) == {'full_name': 'o/r'}
+        assert responses == [] and sleeps[0] == 3.0 and len(sleeps) == 3
+
+    def test_archive_download_is_retried(self, monkeypatch):
+        """Should retry a 502 and a dropped connection before streaming."""
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode='w:gz') as archive:
+            info = tarfile.TarInfo('o-r-abc/src/app.py')
+            info.size = 6
+            archive.addfile(info, io.BytesIO(b'x = 1\n'))
+        tarball = buffer.getvalue()
+        outcomes = [502, requests.ConnectionError('reset'), 200]
+
+        def fake_get(url, **kwargs):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            response = Response()
+            response.status_code = outcome
+            response.raw = io.BytesIO(tarball if outcome == 200 else b'')
+            return response
+
+        monkeypatch.setattr(requests, 'get', fake_get)
+        sleeps = []
+        fetcher = GitHubArchiveFetcher(retry_policy=RetryPolicy(max_attempts=3), sleep=sleeps.append)
+
+        snapshot = fetcher.download('https://codeload.github.com/o/r/tar.gz/main')
+
+        assert [f.path for f in snapshot.files] == ['src/app.py']
+        assert len(sleeps) == 2 and outcomes == []
@@ -0,0 +1,137 @@
+"""
+Unit tests for declarative architecture rule packs.
+"""
+
+import json
+import re
+
+import pytest
+
+from apps.analysis.data_classes import FileNode, RepoStructure
+from apps.analysis.detectors import (
+    ArchitectureAnalyzer,
+    DetectorEngine,
+    RulePack,
+    RulePackDetector,
+    load_rule_packs,
+)
+
+
+def make_repo(directories: list[str]) -> RepoStructure:
+    files = [FileNode(path=d, name=d.rsplit('/', 1)[-1], type='dir') for d in directories]
+    return RepoStructure(
+        owner='o', name='r', url='u', description=None, primary_language='Python',
+        languages={}, files=files, commits=[], contributors=[],
+    )
+
+
+class TestRulePacks:
+    """Test loading, validating and extending rule packs."""
+
+    def test_builtin_packs(self):
+        """Should load every built-in pack in detector order."""
+        patterns = [pack.pattern for pack in load_rule_packs()]
+
+        assert patterns == [
+            'MVC', 'Clean Architecture', 'Layered Architecture', 'Feature-Based Architecture',
+            'Hexagonal Architecture', 'MVVM', 'Microservices',
+        ]
+
+    def test_rejects_malformed_packs(self):
+        """Should name the pack and the problem."""
+        with pytest.raises(ValueError, match="'bad'.*no folders or paths"):
+            RulePack.from_dict({'pattern': 'X', 'indicators': [{'id': 'a', 'weight': 1, 'evidence': 'e'}]}, 'bad')
+        with pytest.raises(ValueError, match="requires unknown"):
+            RulePack.from_dict({'pattern': 'X', 'indicators': [
+                {'id': 'a', 'folders': ['x'], 'weight': 1, 'evidence': 'e', 'requires_any': ['b']},
+            ]}, 'bad')
+
+    @pytest.mark.parametrize('indicator, problem', [
+        ({'evidence': 'Has {counts} folders'}, "unknown placeholder '{counts}'"),
+        ({'evidence': 'Has {examples!r:>5}'}, None),
+        ({'evidence': 'Has {0} folders'}, "unknown placeholder '{0}'"),
+        ({'evidence': 'Has {} folders'}, "unknown placeholder '{}'"),
+        ({'evidence': 'Has {count folders'}, "malformed evidence"),
+        ({'min_matches': 3}, "needs 3 matches of 2 rules"),
+        ({'min_matches': 0}, "needs 0 matches of 2 rules"),
+    ])
+    def test_rejects_unusable_indicators(self, indicator, problem):
+        """Should reject evidence and thresholds that could never score."""
+        data = {'pattern': 'X', 'indicators': [
+            {'id': 'a', 'folders': ['x'], 'paths': ['y/z'], 'weight': 1, 'evidence': 'e', **indicator},
+        ]}
+        if problem is None:
+            assert RulePack.from_dict(data, 'ok').indicators[0].evidence == indicator['evidence']
+        else:
+            with pytest.raises(ValueError, match=re.escape(problem)):
+                RulePack.from_dict(data, 'bad')
+
+    def test_new_pattern_ships_as_data(self, tmp_path):
+        """Should add and re-weight patterns from a pack directory."""
+        (tmp_path / 'mvc.json').write_text(json.dumps({
+            'pattern': 'MVC', 'order': 10,
+            'indicators': [{'id': 'has_models', 'folders': ['models'], 'weight': 90, 'evidence': 'models'}],
+        }))
+        (tmp_path / 'cqrs.json').write_text(json.dumps({
+            'pattern': 'CQRS',
+            'indicators': [
+                {'id': 'has_commands', 'folders': ['commands'], 'weight': 50, 'evidence': 'commands'},
+                {'id': 'has_queries', 'folders': ['queries'], 'weight': 50, 'evidence': 'queries'},
+            ],
+        }))
+        engine = DetectorEngine([RulePackDetector(pack) for pack in load_rule_packs([tmp_path])])
+
+        result = ArchitectureAnalyzer(engine).analyze(make_repo(['src/models', 'src/commands', 'src/queries']))
+
+        assert result.confidence_scores['MVC'] == 90
+        assert result.confidence_scores['CQRS'] == 100
+        assert len(result.signals) == 8
+
+    def test_version_follows_the_rules(self, tmp_path):
+        """Should change the analyzer version when a pack is re-weighted."""
+        builtin = ArchitectureAnalyzer(DetectorEngine([RulePackDetector(p) for p in load_rule_packs()]))
+        (tmp_path / 'mvc.json').write_text(json.dumps({
+            'pattern': 'MVC', 'order': 10,
+            'indicators': [{'id': 'has_models', 'folders': ['models'], 'weight': 90, 'evidence': 'models'}],
+        }))
+        custom = ArchitectureAnalyzer(DetectorEngine([RulePackDetector(p) for p in load_rule_packs([tmp_path])]))
+
+        assert builtin.version == ArchitectureAnalyzer().version
+        assert custom.version != builtin.version
+
+
+class TestRuleScorer:
+    """Test scoring packs on shared matches."""
+
+    def test_shared_scorer_equals_standalone_detectors(self):
+        """Should give the same signals scored together or one pack at a time."""
+        repo = make_repo([
+            'app', 'app/models', 'app/views', 'app/viewmodels', 'users', 'orders',
+            'core/ports', 'adapters/inbound', 'microservices', 'gateway', 'k8s',
+        ])
+        analyzer = ArchitectureAnalyzer()
+
+        signals = analyzer.engine.run(repo)
+
+        for detector, signal in zip(analyzer.detectors, signals):
+            assert detector.detect(repo).to_dict() == signal.to_dict()
+
+    def test_new_builtin_patterns(self):
+        """Should detect Hexagonal, MVVM and Microservices layouts."""
+        repo = make_repo(['core/ports', 'adapters/inbound', 'ui/viewmodels', 'ui/views', 'microservices', 'gateway'])
+        scores = ArchitectureAnalyzer().analyze(repo).confidence_scores
+
+        assert scores['Hexagonal Architecture'] == 100
+        assert scores['MVVM'] == 70
+        assert scores['Microservices'] == 65
+
+    def test_requirements_and_recorded_indicators(self):
+        """Should gate indicators on others and record counts and matches."""
+        signals = {s.pattern: s for s in ArchitectureAnalyzer().engine.run(make_repo(['views', 'users', 'orders']))}
+
+        assert signals['MVVM'].confidence == 0
+        assert signals['MVVM'].evidence == ['No MVVM structure detected']
+        assert signals['Feature-Based Architecture'].indicators == {
+            'feature_count': 2, 'features': ['users', 'orders'], 'has_domain_features': True,
+        }
+        assert signals['Feature-Based Architecture'].evidence[0] == 'Has 2 feature modules: users, orders'
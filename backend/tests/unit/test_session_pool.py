@@ -0,0 +1,42 @@
+"""
+Unit tests for the shared GitHub session pool.
+"""
+
+from apps.analysis.ingestion.session_pool import GitHubSessionPool
+
+
+class TestGitHubSessionPool:
+    """Test client sharing, token isolation and eviction."""
+    
+    def test_reuses_client_per_token(self):
+        """Should hand out the same client for the same token only."""
+        pool = GitHubSessionPool()
+        
+        first = pool.get("token-a")
+        
+        assert pool.get("token-a") is first
+        assert pool.get("token-b") is not first
+        assert pool.get(None) is pool.get("")
+    
+    def test_evicts_least_recently_used_token(self):
+        """Should keep at most max_clients clients."""
+        pool = GitHubSessionPool(max_clients=2)
+        
+        first = pool.get("token-a")
+        pool.get("token-b")
+        pool.get("token-a")
+        pool.get("token-c")
+        
+        metrics = pool.metrics()
+        assert metrics['clients'] == 2
+        assert pool.get("token-a") is first
+        assert "token-a" not in str(metrics)  # only hashed ids are exposed
+    
+    def test_clients_use_configured_pool_size(self):
+        """Should pass pool size and page size to PyGithub."""
+        pool = GitHubSessionPool(pool_size=4)
+        
+        github = pool.get("token-a")
+        
+        assert github.requester.per_page == GitHubSessionPool.PAGE_SIZE
+        assert github.requester.kwargs['pool_size'] == 4
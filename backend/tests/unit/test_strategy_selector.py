@@ -0,0 +1,49 @@
+"""
+Unit tests for size-aware ingestion strategy selection.
+"""
+
+from apps.analysis.ingestion.cost_estimator import IngestionPlan, RepoProfile
+from apps.analysis.ingestion.strategy_selector import IngestionStrategySelector
+
+
+MB = 1024  # size_kb per MB
+
+
+class TestIngestionStrategySelector:
+    """Test strategy rules and their effect on the ingestion plan."""
+    
+    def setup_method(self):
+        self.selector = IngestionStrategySelector(max_repo_size_mb=100, timeout_seconds=300, clone_available=True)
+    
+    def test_picks_strategy_by_size_and_truncation(self):
+        """Should list small trees, stream mid-size repos and sample huge ones."""
+        toy = RepoProfile(size_kb=40, tree_entries=10)
+        mid = RepoProfile(size_kb=80 * MB, tree_entries=100_000, truncated=True)
+        huge = RepoProfile(size_kb=4000 * MB, tree_entries=100_000, truncated=True)
+        big_but_listable = RepoProfile(size_kb=900 * MB, tree_entries=3000)
+        
+        assert self.selector.select(toy).strategy == IngestionStrategySelector.TREE
+        assert self.selector.select(mid).strategy == IngestionStrategySelector.ARCHIVE
+        assert self.selector.select(huge).strategy == IngestionStrategySelector.SAMPLED
+        assert self.selector.select(big_but_listable).strategy == IngestionStrategySelector.TREE
+    
+    def test_clones_when_archive_exceeds_time_budget(self):
+        """Should clone if the archive is too slow, and sample if git is missing."""
+        profile = RepoProfile(size_kb=90 * MB, truncated=True)
+        short_timeout = IngestionStrategySelector(max_repo_size_mb=100, timeout_seconds=30, clone_available=True)
+        no_git = IngestionStrategySelector(max_repo_size_mb=100, timeout_seconds=30, clone_available=False)
+        
+        assert short_timeout.select(profile).strategy == IngestionStrategySelector.PARTIAL_CLONE
+        assert no_git.select(profile).strategy == IngestionStrategySelector.SAMPLED
+        assert no_git.for_clone(profile) is None
+    
+    def test_apply_sets_tree_mode(self):
+        """Should translate the decision into the plan's file tree mode."""
+        plan = IngestionPlan(use_archive=True, commit_files_budget=5)
+        
+        tree = self.selector.select(RepoProfile(size_kb=1, tree_entries=1)).apply(plan)
+        sampled = self.selector.select(RepoProfile(size_kb=500 * MB, truncated=True)).apply(plan)
+        
+        assert (tree.use_git_tree, tree.use_archive, tree.sampled_tree) == (True, False, False)
+        assert (sampled.use_archive, sampled.sampled_tree) == (False, True)
+        assert sampled.commit_files_budget == 5
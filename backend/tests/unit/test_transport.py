@@ -0,0 +1,41 @@
+"""
+Unit tests for the GitHub transport layer hook.
+
+Checks the PyGithub internals the hook depends on (no network).
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from github import Github
+
+from apps.analysis.ingestion.transport import (
+    CONNECTION_CLASS_ATTRIBUTE,
+    LayeredHTTPSConnection,
+    TransportLayer,
+    install_transport_layers,
+)
+
+
+class TestInstallTransportLayers:
+    """Test installing layers on a PyGithub client."""
+
+    def test_installed_pygithub_exposes_the_connection_class(self):
+        """Should find the private attribute on the pinned PyGithub version."""
+        github = Github()
+        assert hasattr(github.requester, CONNECTION_CLASS_ATTRIBUTE)
+
+        install_transport_layers(github, [TransportLayer])
+
+        connection_class = getattr(github.requester, CONNECTION_CLASS_ATTRIBUTE)
+        assert connection_class.func is LayeredHTTPSConnection
+        assert connection_class.keywords == {"layers": (TransportLayer,)}
+
+    def test_missing_attribute_raises(self):
+        """Should fail loudly instead of skipping every layer."""
+        github = SimpleNamespace(requester=SimpleNamespace())
+
+        with pytest.raises(RuntimeError, match=CONNECTION_CLASS_ATTRIBUTE):
+            install_transport_layers(github, [TransportLayer])
+
+        assert not hasattr(github.requester, CONNECTION_CLASS_ATTRIBUTE)